@@ -1,4 +1,19 @@
+from .history import BenchmarkHistory, HistoryEntry, code_revision, hardware_fingerprint
+from .orchestrator import BenchmarkOrchestrator
+from .regression import RegressionCheck, detect_regression, mann_whitney_u
 from .report import BenchmarkReport, BenchmarkResult
 from .runner import BenchmarkRunner
 
-__all__ = ["BenchmarkReport", "BenchmarkResult", "BenchmarkRunner"]
+__all__ = [
+    "BenchmarkHistory",
+    "BenchmarkOrchestrator",
+    "BenchmarkReport",
+    "BenchmarkResult",
+    "BenchmarkRunner",
+    "HistoryEntry",
+    "RegressionCheck",
+    "code_revision",
+    "detect_regression",
+    "hardware_fingerprint",
+    "mann_whitney_u",
+]
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import struct
+import wave
+from pathlib import Path
+from typing import Any, Dict
+
+import numpy as np
+
+DEFAULT_SAMPLE_RATE = 16000
+SIGNAL_KINDS = ("sine", "chirp", "noise", "speech")
+
+
+def synthesize(
+    kind: str,
+    seconds: float,
+    *,
+    sample_rate: int = DEFAULT_SAMPLE_RATE,
+    amplitude: float = 0.2,
+    frequency: float | None = None,
+    end_frequency: float = 4000.0,
+    syllable_rate: float = 4.0,
+    seed: int = 0,
+) -> np.ndarray:
+    """Generate a float32 mono test signal in [-amplitude, amplitude].
+
+    ``frequency`` defaults to 440 Hz for ``sine`` and the start of a
+    ``chirp``. ``speech`` is a voiced-speech stand-in: a harmonic stack on
+    a wandering pitch around ``frequency`` (140 Hz by default), gated by a
+    syllable-rate envelope with short pauses, plus a little breath noise.
+    """
+    frames = int(sample_rate * seconds)
+    t = np.arange(frames, dtype=np.float64) / sample_rate
+    rng = np.random.default_rng(seed)
+    tone = 440.0 if frequency is None else frequency
+    if kind == "sine":
+        signal = np.sin(2 * np.pi * tone * t)
+    elif kind == "chirp":
+        # linear sweep: phase is the integral of the instantaneous frequency
+        rate = (end_frequency - tone) / max(seconds, 1e-9)
+        signal = np.sin(2 * np.pi * (tone * t + 0.5 * rate * t * t))
+    elif kind == "noise":
+        signal = rng.uniform(-1.0, 1.0, frames)
+    elif kind == "speech":
+        pitch = 140.0 if frequency is None else frequency
+        vibrato = 1.0 + 0.08 * np.sin(2 * np.pi * 0.7 * t + rng.uniform(0, np.pi))
+        phase = 2 * np.pi * np.cumsum(pitch * vibrato) / sample_rate
+        harmonics = sum(np.sin(k * phase) / k for k in range(1, 6))
+        envelope = np.clip(np.sin(np.pi * syllable_rate * t) ** 2, 0.0, 1.0)
+        pauses = rng.random(int(np.ceil(seconds * syllable_rate)) + 1) < 0.2
+        envelope *= ~pauses[(t * syllable_rate).astype(np.int64)]
+        signal = harmonics * envelope + 0.02 * rng.standard_normal(frames)
+    else:
+        raise ValueError(f"Unknown signal kind '{kind}'; expected one of {SIGNAL_KINDS}")
+    peak = float(np.max(np.abs(signal))) if frames else 0.0
+    if peak > 0:
+        signal = signal / peak
+    return (amplitude * signal).astype(np.float32)
+
+
+def write_wav(path: str | Path, samples: np.ndarray, sample_rate: int = DEFAULT_SAMPLE_RATE) -> Path:
+    """Write mono 16-bit PCM; the file is written to a temp name and renamed into place."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pcm = (np.clip(samples, -1.0, 1.0) * 32767).astype("<i2")
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with wave.open(str(tmp_path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        wf.writeframes(pcm.tobytes())
+    os.replace(tmp_path, path)
+    return path
+
+
+def _pcm16_layout(path: Path) -> tuple[int, int, int, int]:
+    """Return ``(data_offset, frame_count, channels, sample_rate)`` of a PCM16 WAV."""
+    with path.open("rb") as handle:
+        riff, _size, wave_id = struct.unpack("<4sI4s", handle.read(12))
+        if riff != b"RIFF" or wave_id != b"WAVE":
+            raise ValueError(f"{path} is not a RIFF/WAVE file")
+        channels = sample_rate = bits = None
+        while True:
+            header = handle.read(8)
+            if len(header) < 8:
+                raise ValueError(f"{path} has no data chunk")
+            chunk_id, chunk_size = struct.unpack("<4sI", header)
+            if chunk_id == b"fmt ":
+                fmt = handle.read(chunk_size)
+                audio_format, channels, sample_rate = struct.unpack("<HHI", fmt[:8])
+                bits = struct.unpack("<H", fmt[14:16])[0]
+                if audio_format != 1 or bits != 16:
+                    raise ValueError(f"{path} is not 16-bit PCM")
+                continue
+            if chunk_id == b"data":
+                if channels is None or sample_rate is None:
+                    raise ValueError(f"{path} has data before fmt chunk")
+                return handle.tell(), chunk_size // (2 * channels), channels, sample_rate
+            handle.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)
+
+
+def read_wav_segment(path: str | Path, seconds: float | None = None, offset: float = 0.0) -> np.ndarray:
+    """Read ``seconds`` of audio starting at ``offset`` as float32 in [-1, 1).
+
+    The data chunk is memory-mapped so only the requested window is paged
+    in; multi-channel files are downmixed to mono.
+    """
+    path = Path(path)
+    data_offset, frame_count, channels, sample_rate = _pcm16_layout(path)
+    start = min(frame_count, int(offset * sample_rate))
+    stop = frame_count if seconds is None else min(frame_count, start + int(seconds * sample_rate))
+    if stop <= start:
+        return np.zeros(0, dtype=np.float32)
+    pcm = np.memmap(path, dtype="<i2", mode="r", offset=data_offset, shape=(frame_count, channels))
+    window = pcm[start:stop]
+    mono = window[:, 0] if channels == 1 else window.mean(axis=1)
+    return (np.asarray(mono, dtype=np.float32) / 32768.0).astype(np.float32)
+
+
+def wav_duration_seconds(path: str | Path) -> float:
+    _offset, frame_count, _channels, sample_rate = _pcm16_layout(Path(path))
+    return frame_count / float(sample_rate)
+
+
+class FixtureCache:
+    """Directory of generated WAV fixtures keyed by their synthesis parameters.
+
+    A fixture is synthesized once and then reused by every benchmark that
+    asks for the same parameters, across processes.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+
+    @staticmethod
+    def key(kind: str, seconds: float, sample_rate: int, params: Dict[str, Any]) -> str:
+        payload = json.dumps(
+            {"kind": kind, "seconds": seconds, "sample_rate": sample_rate, **params},
+            sort_keys=True,
+        )
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+    def get(
+        self,
+        kind: str = "speech",
+        seconds: float = 5.0,
+        *,
+        sample_rate: int = DEFAULT_SAMPLE_RATE,
+        **params: Any,
+    ) -> Path:
+        path = self.directory / f"{kind}_{seconds:g}s_{self.key(kind, seconds, sample_rate, params)}.wav"
+        if not path.exists():
+            samples = synthesize(kind, seconds, sample_rate=sample_rate, **params)
+            write_wav(path, samples, sample_rate)
+        return path
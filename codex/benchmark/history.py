@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import platform
+import sqlite3
+import subprocess
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List
+
+from .regression import RegressionCheck, detect_regression
+from .report import HIGHER_IS_BETTER, LOWER_IS_BETTER, BenchmarkResult
+
+# Performance metrics ``compare`` checks, by direction. Bookkeeping values
+# stored next to them (runs, warmup_runs, ci_relative) are not compared.
+_HIGHER_IS_BETTER = frozenset(HIGHER_IS_BETTER)
+_LOWER_IS_BETTER = frozenset(LOWER_IS_BETTER | {"latency_ms", "peakrammb", "peakvrammb"})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    model TEXT NOT NULL,
+    model_type TEXT NOT NULL,
+    hardware TEXT NOT NULL,
+    revision TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    success INTEGER NOT NULL,
+    metrics TEXT NOT NULL,
+    samples TEXT NOT NULL,
+    metadata TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_model_hw ON runs (model, hardware, id);
+CREATE INDEX IF NOT EXISTS runs_model_rev ON runs (model, revision, id);
+CREATE TRIGGER IF NOT EXISTS runs_no_update BEFORE UPDATE ON runs
+BEGIN SELECT RAISE(ABORT, 'benchmark history is append-only'); END;
+CREATE TRIGGER IF NOT EXISTS runs_no_delete BEFORE DELETE ON runs
+BEGIN SELECT RAISE(ABORT, 'benchmark history is append-only'); END;
+"""
+
+
+def hardware_fingerprint(profile: Dict[str, Any] | None = None) -> str:
+    """Short stable hash of the machine characteristics that move benchmark numbers."""
+    profile = dict(profile or {})
+    profile.setdefault("machine", platform.machine())
+    profile.setdefault("processor", platform.processor())
+    profile.setdefault("system", platform.system())
+    profile.setdefault("cpu_count", os.cpu_count())
+    # frequency and free memory drift between runs; they are not identity
+    for volatile in ("cpu_mhz", "available_ram_gb", "platform"):
+        profile.pop(volatile, None)
+    digest = hashlib.sha1(json.dumps(profile, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()[:12]
+
+
+def code_revision(cwd: str | Path | None = None) -> str:
+    """Git revision of the working tree, ``CODEX_REVISION`` or ``"unknown"``."""
+    env_revision = os.getenv("CODEX_REVISION")
+    if env_revision:
+        return env_revision
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "--short=12", "HEAD"],
+            cwd=cwd or Path(__file__).resolve().parent,
+            capture_output=True,
+            text=True,
+            timeout=5,
+            check=True,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return "unknown"
+    return output.stdout.strip() or "unknown"
+
+
+@dataclass(frozen=True)
+class HistoryEntry:
+    run_id: int
+    model: str
+    model_type: str
+    hardware: str
+    revision: str
+    timestamp: str
+    success: bool
+    metrics: Dict[str, Any]
+    samples: Dict[str, List[float]] = field(default_factory=dict)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.run_id,
+            "model": self.model,
+            "type": self.model_type,
+            "hardware": self.hardware,
+            "revision": self.revision,
+            "timestamp": self.timestamp,
+            "success": self.success,
+            "metrics": dict(self.metrics),
+        }
+
+
+class BenchmarkHistory:
+    """Append-only SQLite log of benchmark runs.
+
+    Runs are keyed by model, hardware fingerprint and code revision, with
+    indexes for the per-model history and compare queries. Raw per-iteration
+    samples are stored alongside the summary metrics so runs can be
+    compared as distributions rather than means.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def record(
+        self,
+        result: BenchmarkResult,
+        *,
+        hardware: str | None = None,
+        revision: str | None = None,
+    ) -> int:
+        metadata = dict(result.metadata or {})
+        samples = metadata.pop("samples", {})
+        with self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO runs (model, model_type, hardware, revision, timestamp, success, metrics, samples, metadata)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    result.model,
+                    result.model_type,
+                    hardware or hardware_fingerprint(),
+                    revision or code_revision(),
+                    result.timestamp,
+                    int(result.success),
+                    json.dumps(result.metrics, sort_keys=True),
+                    json.dumps(samples, sort_keys=True),
+                    json.dumps(metadata, sort_keys=True, default=str),
+                ),
+            )
+        return int(cursor.lastrowid)
+
+    def history(
+        self,
+        model: str,
+        *,
+        hardware: str | None = None,
+        revision: str | None = None,
+        successful_only: bool = True,
+        limit: int | None = 50,
+    ) -> List[HistoryEntry]:
+        """Most recent runs first."""
+        clauses = ["model = ?"]
+        params: List[Any] = [model]
+        if hardware is not None:
+            clauses.append("hardware = ?")
+            params.append(hardware)
+        if revision is not None:
+            clauses.append("revision = ?")
+            params.append(revision)
+        if successful_only:
+            clauses.append("success = 1")
+        query = f"SELECT * FROM runs WHERE {' AND '.join(clauses)} ORDER BY id DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        return [self._entry(row) for row in self._conn.execute(query, params)]
+
+    def get(self, run_id: int) -> HistoryEntry | None:
+        row = self._conn.execute("SELECT * FROM runs WHERE id = ?", (run_id,)).fetchone()
+        return self._entry(row) if row else None
+
+    def models(self) -> List[str]:
+        return [row[0] for row in self._conn.execute("SELECT DISTINCT model FROM runs ORDER BY model")]
+
+    def compare(
+        self,
+        baseline: HistoryEntry,
+        candidate: HistoryEntry,
+        *,
+        alpha: float = 0.05,
+        min_effect: float = 0.05,
+    ) -> List[RegressionCheck]:
+        """Check every known performance metric with samples on both sides.
+
+        Without shared samples the summary values are compared instead; a
+        single value per side is reported as inconclusive.
+        """
+        checks: List[RegressionCheck] = []
+        for metric in sorted(set(baseline.samples) & set(candidate.samples)):
+            if _higher_is_better(metric) is None:
+                continue
+            checks.append(
+                detect_regression(
+                    metric,
+                    baseline.samples[metric],
+                    candidate.samples[metric],
+                    higher_is_better=_higher_is_better(metric),
+                    alpha=alpha,
+                    min_effect=min_effect,
+                )
+            )
+        if checks:
+            return checks
+        for metric in sorted(set(baseline.metrics) & set(candidate.metrics)):
+            if _higher_is_better(metric) is None:
+                continue
+            base, cand = baseline.metrics[metric], candidate.metrics[metric]
+            if isinstance(base, bool) or not isinstance(base, (int, float)) or not isinstance(cand, (int, float)):
+                continue
+            checks.append(
+                detect_regression(
+                    metric,
+                    [float(base)],
+                    [float(cand)],
+                    higher_is_better=_higher_is_better(metric),
+                    alpha=alpha,
+                    min_effect=min_effect,
+                )
+            )
+        return checks
+
+    def compare_latest(self, model: str, *, hardware: str | None = None, **kwargs: Any) -> List[RegressionCheck]:
+        """Compare the two most recent successful runs of ``model``."""
+        entries = self.history(model, hardware=hardware or hardware_fingerprint(), limit=2)
+        if len(entries) < 2:
+            return []
+        candidate, baseline = entries
+        return self.compare(baseline, candidate, **kwargs)
+
+    @staticmethod
+    def _entry(row: Any) -> HistoryEntry:
+        run_id, model, model_type, hardware, revision, timestamp, success, metrics, samples, metadata = row
+        return HistoryEntry(
+            run_id=run_id,
+            model=model,
+            model_type=model_type,
+            hardware=hardware,
+            revision=revision,
+            timestamp=timestamp,
+            success=bool(success),
+            metrics=json.loads(metrics),
+            samples=json.loads(samples),
+            metadata=json.loads(metadata),
+        )
+
+
+def _higher_is_better(metric: str) -> bool | None:
+    """Direction of a performance metric; None when it is not one."""
+    if metric in _HIGHER_IS_BETTER:
+        return True
+    if metric in _LOWER_IS_BETTER:
+        return False
+    return None
@@ -1,8 +1,16 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from statistics import fmean, pstdev
-from typing import Dict, Iterable
+import math
+from dataclasses import dataclass, field
+from statistics import fmean, pstdev, stdev
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+# Two-sided 95% Student t critical values by degrees of freedom; beyond the
+# table the normal approximation is within 2%.
+_T_95 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306,
+    9: 2.262, 10: 2.228, 12: 2.179, 15: 2.131, 20: 2.086, 25: 2.060, 30: 2.042,
+}
 
 
 def stability_score(samples: Iterable[float]) -> float:
@@ -19,6 +27,79 @@ def stability_score(samples: Iterable[float]) -> float:
     return round(score, 4)
 
 
+def percentile(samples: Sequence[float], q: float) -> float:
+    """Linear-interpolated percentile for ``q`` in [0, 100]."""
+    values = sorted(samples)
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return float(values[0])
+    rank = (len(values) - 1) * min(max(q, 0.0), 100.0) / 100.0
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    return float(values[low] + (values[high] - values[low]) * (rank - low))
+
+
+def latency_percentiles(samples: Sequence[float]) -> Dict[str, float]:
+    return {
+        "p50": round(percentile(samples, 50), 3),
+        "p90": round(percentile(samples, 90), 3),
+        "p99": round(percentile(samples, 99), 3),
+    }
+
+
+def _t_critical(dof: int) -> float:
+    if dof <= 0:
+        return math.inf
+    for bound in sorted(_T_95):
+        if dof <= bound:
+            return _T_95[bound]
+    return 1.96
+
+
+def confidence_interval(samples: Sequence[float]) -> Tuple[float, float]:
+    """Return ``(mean, half_width)`` of the 95% confidence interval of the mean."""
+    values = list(samples)
+    if not values:
+        return 0.0, math.inf
+    mean = fmean(values)
+    if len(values) < 2:
+        return mean, math.inf
+    return mean, _t_critical(len(values) - 1) * stdev(values) / math.sqrt(len(values))
+
+
+def relative_ci(samples: Sequence[float]) -> float:
+    """CI half-width as a fraction of the mean; ``inf`` when undefined."""
+    mean, half_width = confidence_interval(samples)
+    if mean == 0 or math.isinf(half_width):
+        return math.inf
+    return half_width / abs(mean)
+
+
+@dataclass(frozen=True)
+class RunStats:
+    """Samples from one adaptive measurement loop."""
+
+    samples: List[float]
+    warmup_runs: int
+    converged: bool
+
+    @property
+    def runs(self) -> int:
+        return len(self.samples)
+
+    def to_dict(self) -> Dict[str, float]:
+        payload: Dict[str, float] = {
+            "runs": self.runs,
+            "warmup_runs": self.warmup_runs,
+            "converged": self.converged,
+        }
+        rel = relative_ci(self.samples)
+        if math.isfinite(rel):
+            payload["ci_relative"] = round(rel, 4)
+        return payload
+
+
 @dataclass(frozen=True)
 class LLMMetrics:
     loadtimems: float
@@ -27,9 +108,12 @@ class LLMMetrics:
     peakrammb: float
     peakvrammb: float
     stability_score: float
+    latency_ms: Dict[str, float] = field(default_factory=dict)
+    tokenspersecond_samples: List[float] = field(default_factory=list)
+    run_stats: Dict[str, float] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, float]:
-        return {
+        payload = {
             "loadtimems": self.loadtimems,
             "firsttokenlatency_ms": self.firsttokenlatency_ms,
             "tokenspersecond": self.tokenspersecond,
@@ -37,6 +121,8 @@ class LLMMetrics:
             "peakvrammb": self.peakvrammb,
             "stability_score": self.stability_score,
         }
+        payload.update(_distribution_fields(self.latency_ms, self.tokenspersecond_samples, self.run_stats))
+        return payload
 
 
 @dataclass(frozen=True)
@@ -45,23 +131,53 @@ class STTMetrics:
     transcriptionlatencyms: float
     realtimefactor: float
     peakrammb: float
+    latency_ms: Dict[str, float] = field(default_factory=dict)
+    realtimefactor_p90: float | None = None
+    run_stats: Dict[str, float] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, float]:
-        return {
+        payload = {
             "loadtimems": self.loadtimems,
             "transcriptionlatencyms": self.transcriptionlatencyms,
             "realtimefactor": self.realtimefactor,
             "peakrammb": self.peakrammb,
         }
+        if self.realtimefactor_p90 is not None:
+            payload["realtimefactor_p90"] = self.realtimefactor_p90
+        payload.update(_distribution_fields(self.latency_ms, [], self.run_stats))
+        return payload
 
 
 @dataclass(frozen=True)
 class VADMetrics:
     loadtimems: float
     processinglatencyms: float
+    peakrammb: float | None = None
+    latency_ms: Dict[str, float] = field(default_factory=dict)
+    run_stats: Dict[str, float] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, float]:
-        return {
+        payload = {
             "loadtimems": self.loadtimems,
             "processinglatencyms": self.processinglatencyms,
         }
+        if self.peakrammb is not None:
+            payload["peakrammb"] = self.peakrammb
+        payload.update(_distribution_fields(self.latency_ms, [], self.run_stats))
+        return payload
+
+
+def _distribution_fields(
+    latency_ms: Dict[str, float],
+    samples: List[float],
+    run_stats: Dict[str, float],
+) -> Dict[str, float]:
+    # Flattened so report comparisons can rank on e.g. latency_p99_ms.
+    payload: Dict[str, float] = {}
+    for key, value in latency_ms.items():
+        payload[f"latency_{key}_ms"] = value
+    if samples:
+        payload["tokenspersecond_p50"] = round(percentile(samples, 50), 2)
+        payload["tokenspersecond_p10"] = round(percentile(samples, 10), 2)
+    payload.update(run_stats)
+    return payload
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence
+
+from codex.registry import ModelRegistry, build_default_registry
+
+from .history import BenchmarkHistory
+from .report import BenchmarkReport, BenchmarkResult
+
+_GPU_DEVICES = ("cuda", "gpu", "mps")
+
+
+def available_cpus() -> List[int]:
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _child_main(
+    conn: Any,
+    registry_factory: Callable[[], ModelRegistry],
+    model: str,
+    cpus: Sequence[int] | None,
+    runner_kwargs: Dict[str, Any],
+) -> None:
+    # Imported here so the parent never touches model or framework state.
+    from .runner import BenchmarkRunner
+
+    try:
+        if cpus and hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(0, set(cpus))
+        runner = BenchmarkRunner(registry_factory(), **runner_kwargs)
+        result = runner.run(model, save=False, raise_on_error=False)
+        # report the affinity the worker actually ran with, not the requested slot
+        conn.send({"ok": True, "result": result.to_dict(), "affinity": available_cpus()})
+    except BaseException as exc:  # report everything; the parent decides
+        conn.send({"ok": False, "error": f"{type(exc).__name__}: {exc}"})
+    finally:
+        conn.close()
+
+
+@dataclass
+class _RunningJob:
+    model: str
+    process: Any
+    conn: Any
+    cpus: List[int]
+    gpu: bool
+    started: float
+    peak_rss_mb: float = 0.0
+
+
+@dataclass
+class OrchestratorStats:
+    completed: int = 0
+    failed: int = 0
+    timed_out: int = 0
+    memory_killed: int = 0
+    wall_seconds: float = 0.0
+    per_model_seconds: Dict[str, float] = field(default_factory=dict)
+
+
+class BenchmarkOrchestrator:
+    """Runs each model's benchmark in its own spawned process.
+
+    CPUs are split into disjoint slots of ``cpus_per_job`` and every job is
+    pinned to its slot with ``os.sched_setaffinity``. CPU models run in
+    parallel up to the number of slots; models configured for a GPU device
+    are serialized among themselves. Results come back over a pipe and are
+    saved by the parent, so the report directory and history database have
+    a single writer. Jobs exceeding ``timeout`` seconds or ``memory_limit_mb``
+    resident memory are killed and reported as failed.
+    """
+
+    def __init__(
+        self,
+        registry_factory: Callable[[], ModelRegistry] = build_default_registry,
+        results_dir: str | Path | None = None,
+        *,
+        max_parallel: int | None = None,
+        cpus_per_job: int = 1,
+        timeout: float | None = 1800.0,
+        memory_limit_mb: float | None = None,
+        history: BenchmarkHistory | None = None,
+        runner_kwargs: Dict[str, Any] | None = None,
+        poll_interval: float = 0.05,
+    ) -> None:
+        self.registry_factory = registry_factory
+        self.results_dir = Path(results_dir or "benchmark_results")
+        self.reporter = BenchmarkReport(self.results_dir)
+        self.history = history
+        self.cpus_per_job = max(1, cpus_per_job)
+        cpus = available_cpus()
+        self._slots = [
+            cpus[idx : idx + self.cpus_per_job]
+            for idx in range(0, len(cpus) - self.cpus_per_job + 1, self.cpus_per_job)
+        ] or [cpus]
+        if max_parallel is not None:
+            self._slots = self._slots[: max(1, max_parallel)]
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.runner_kwargs = dict(runner_kwargs or {})
+        self.poll_interval = poll_interval
+        self.stats = OrchestratorStats()
+        self._ctx = multiprocessing.get_context("spawn")
+
+    @property
+    def max_parallel(self) -> int:
+        return len(self._slots)
+
+    def run(self, models: Sequence[str] | None = None, *, save: bool = True) -> List[BenchmarkResult]:
+        registry = self.registry_factory()
+        models = list(models) if models is not None else registry.list_models()
+        infos = {model: registry.info(model) for model in models}
+        pending = list(models)
+        free_slots = list(self._slots)
+        running: List[_RunningJob] = []
+        results: Dict[str, BenchmarkResult] = {}
+        started = time.perf_counter()
+
+        while pending or running:
+            gpu_busy = any(job.gpu for job in running)
+            for model in list(pending):
+                if not free_slots:
+                    break
+                gpu = _uses_gpu(infos[model])
+                if gpu and gpu_busy:
+                    continue
+                pending.remove(model)
+                running.append(self._spawn(model, free_slots.pop(0), gpu))
+                gpu_busy = gpu_busy or gpu
+
+            for job in list(running):
+                result = self._poll(job, infos[job.model])
+                if result is None:
+                    continue
+                running.remove(job)
+                free_slots.append(job.cpus)
+                results[job.model] = result
+                self.stats.per_model_seconds[job.model] = time.perf_counter() - job.started
+                if result.success:
+                    self.stats.completed += 1
+                else:
+                    self.stats.failed += 1
+                if save:
+                    self.reporter.save(result)
+                if self.history is not None:
+                    self.history.record(result)
+            if running:
+                time.sleep(self.poll_interval)
+
+        self.stats.wall_seconds = time.perf_counter() - started
+        return [results[model] for model in models]
+
+    def _spawn(self, model: str, cpus: List[int], gpu: bool) -> _RunningJob:
+        parent_conn, child_conn = self._ctx.Pipe(duplex=False)
+        process = self._ctx.Process(
+            target=_child_main,
+            args=(child_conn, self.registry_factory, model, cpus, self.runner_kwargs),
+            name=f"bench-{model}",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        return _RunningJob(model=model, process=process, conn=parent_conn, cpus=cpus, gpu=gpu, started=time.perf_counter())
+
+    def _poll(self, job: _RunningJob, info: Dict[str, Any]) -> BenchmarkResult | None:
+        model_type = info.get("type", "custom")
+        if job.conn.poll():
+            try:
+                message = job.conn.recv()
+            except EOFError:
+                message = {"ok": False, "error": "worker exited without a result"}
+            self._reap(job)
+            if message.get("ok"):
+                result = BenchmarkResult.from_dict(message["result"])
+                result.metadata.update(self._job_metadata(job))
+                result.metadata["affinity"] = message.get("affinity")
+                return result
+            return self._failure(job, model_type, message.get("error", "unknown error"))
+
+        if not job.process.is_alive():
+            self._reap(job)
+            return self._failure(job, model_type, f"worker exited with code {job.process.exitcode}")
+
+        if self.timeout is not None and time.perf_counter() - job.started > self.timeout:
+            self._kill(job)
+            self.stats.timed_out += 1
+            return self._failure(job, model_type, f"timeout after {self.timeout:g}s")
+
+        if self.memory_limit_mb is not None:
+            rss = _rss_mb(job.process.pid)
+            job.peak_rss_mb = max(job.peak_rss_mb, rss)
+            if rss > self.memory_limit_mb:
+                self._kill(job)
+                self.stats.memory_killed += 1
+                return self._failure(
+                    job, model_type, f"memory limit exceeded ({rss:.0f}MB > {self.memory_limit_mb:g}MB)"
+                )
+        return None
+
+    def _job_metadata(self, job: _RunningJob) -> Dict[str, Any]:
+        metadata: Dict[str, Any] = {"isolated": True, "cpus": list(job.cpus)}
+        if job.peak_rss_mb:
+            metadata["worker_peak_rss_mb"] = round(job.peak_rss_mb, 2)
+        return metadata
+
+    def _failure(self, job: _RunningJob, model_type: str, error: str) -> BenchmarkResult:
+        metadata = self._job_metadata(job)
+        metadata["error"] = error
+        return BenchmarkResult(model=job.model, model_type=model_type, metrics={}, success=False, metadata=metadata)
+
+    @staticmethod
+    def _reap(job: _RunningJob) -> None:
+        job.process.join(timeout=5)
+        if job.process.is_alive():
+            job.process.kill()
+            job.process.join()
+        job.conn.close()
+
+    @staticmethod
+    def _kill(job: _RunningJob) -> None:
+        job.process.kill()
+        job.process.join()
+        job.conn.close()
+
+
+def _uses_gpu(info: Dict[str, Any]) -> bool:
+    device = str(info.get("device") or "").lower()
+    return device.startswith(_GPU_DEVICES)
+
+
+def _rss_mb(pid: int) -> float:
+    try:
+        import psutil
+    except ImportError:
+        return 0.0
+    try:
+        process = psutil.Process(pid)
+        rss = process.memory_info().rss
+        for child in process.children(recursive=True):
+            rss += child.memory_info().rss
+    except psutil.Error:
+        return 0.0
+    return rss / (1024 * 1024)
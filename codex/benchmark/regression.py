@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import math
+import random
+from dataclasses import dataclass
+from statistics import median
+from typing import Dict, List, Sequence, Tuple
+
+
+def _ranks(values: Sequence[float]) -> Tuple[List[float], bool]:
+    order = sorted(range(len(values)), key=values.__getitem__)
+    ranks = [0.0] * len(values)
+    ties = False
+    idx = 0
+    while idx < len(order):
+        end = idx
+        while end + 1 < len(order) and values[order[end + 1]] == values[order[idx]]:
+            end += 1
+        if end > idx:
+            ties = True
+        shared = (idx + end) / 2 + 1
+        for pos in range(idx, end + 1):
+            ranks[order[pos]] = shared
+        idx = end + 1
+    return ranks, ties
+
+
+def _exact_u_distribution(n1: int, n2: int) -> List[int]:
+    """Number of orderings yielding each U under the null, for tie-free samples."""
+    # counts[m][n][u]: the largest value either comes from the first sample
+    # (beating all n others, u - n left) or from the second.
+    counts = [[[1] for _ in range(n2 + 1)] for _ in range(n1 + 1)]
+    for m in range(1, n1 + 1):
+        for n in range(1, n2 + 1):
+            row = [0] * (m * n + 1)
+            for u, ways in enumerate(counts[m - 1][n]):
+                row[u + n] += ways
+            for u, ways in enumerate(counts[m][n - 1]):
+                row[u] += ways
+            counts[m][n] = row
+    return counts[n1][n2]
+
+
+def min_p_value(n1: int, n2: int) -> float:
+    """Smallest two-sided Mann-Whitney p-value samples of these sizes can reach."""
+    if n1 == 0 or n2 == 0:
+        return 1.0
+    return min(1.0, 2 / math.comb(n1 + n2, n1))
+
+
+def mann_whitney_u(baseline: Sequence[float], candidate: Sequence[float]) -> Tuple[float, float]:
+    """Two-sided Mann-Whitney U test; returns ``(u, p_value)``.
+
+    Uses the exact null distribution for small tie-free samples and the
+    tie-corrected normal approximation otherwise.
+    """
+    n1, n2 = len(baseline), len(candidate)
+    if n1 == 0 or n2 == 0:
+        return 0.0, 1.0
+    ranks, ties = _ranks(list(baseline) + list(candidate))
+    u1 = sum(ranks[:n1]) - n1 * (n1 + 1) / 2
+    if not ties and n1 * n2 <= 400:
+        distribution = _exact_u_distribution(n1, n2)
+        total = sum(distribution)
+        u = int(round(u1))
+        lower = sum(distribution[: u + 1]) / total
+        upper = sum(distribution[u:]) / total
+        return u1, min(1.0, 2 * min(lower, upper))
+
+    n = n1 + n2
+    mean_u = n1 * n2 / 2
+    tie_term = 0.0
+    if ties:
+        groups: Dict[float, int] = {}
+        for rank in ranks:
+            groups[rank] = groups.get(rank, 0) + 1
+        tie_term = sum(t**3 - t for t in groups.values()) / (n * (n - 1))
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term)
+    if variance <= 0:
+        return u1, 1.0
+    z = (abs(u1 - mean_u) - 0.5) / math.sqrt(variance)
+    return u1, min(1.0, math.erfc(max(z, 0.0) / math.sqrt(2)))
+
+
+def bootstrap_ci(
+    baseline: Sequence[float],
+    candidate: Sequence[float],
+    *,
+    iterations: int = 2000,
+    confidence: float = 0.95,
+    seed: int = 0,
+) -> Tuple[float, float]:
+    """Percentile bootstrap CI of the relative change in medians (candidate vs baseline)."""
+    if not baseline or not candidate:
+        return -math.inf, math.inf
+    rng = random.Random(seed)
+    diffs: List[float] = []
+    for _ in range(iterations):
+        base = median(rng.choices(baseline, k=len(baseline)))
+        cand = median(rng.choices(candidate, k=len(candidate)))
+        if base:
+            diffs.append((cand - base) / abs(base))
+    if not diffs:
+        return -math.inf, math.inf
+    diffs.sort()
+    tail = (1.0 - confidence) / 2
+    low = diffs[int(tail * (len(diffs) - 1))]
+    high = diffs[int(math.ceil((1.0 - tail) * (len(diffs) - 1)))]
+    return low, high
+
+
+@dataclass(frozen=True)
+class RegressionCheck:
+    metric: str
+    baseline_median: float
+    candidate_median: float
+    change: float
+    p_value: float | None
+    ci: Tuple[float, float] | None
+    higher_is_better: bool
+    regressed: bool
+    improved: bool
+    inconclusive: bool = False
+
+    def to_dict(self) -> Dict[str, object]:
+        payload: Dict[str, object] = {
+            "metric": self.metric,
+            "baseline_median": round(self.baseline_median, 4),
+            "candidate_median": round(self.candidate_median, 4),
+            "change": round(self.change, 4),
+            "higher_is_better": self.higher_is_better,
+            "regressed": self.regressed,
+            "improved": self.improved,
+            "inconclusive": self.inconclusive,
+        }
+        if self.p_value is not None:
+            payload["p_value"] = round(self.p_value, 4)
+        if self.ci is not None:
+            payload["ci"] = [round(self.ci[0], 4), round(self.ci[1], 4)]
+        return payload
+
+
+def detect_regression(
+    metric: str,
+    baseline: Sequence[float],
+    candidate: Sequence[float],
+    *,
+    higher_is_better: bool,
+    alpha: float = 0.05,
+    min_effect: float = 0.05,
+) -> RegressionCheck:
+    """Compare two sample sets of one metric.
+
+    A change counts when the median moved by at least ``min_effect`` (as a
+    fraction of the baseline), the Mann-Whitney test rejects at ``alpha``
+    and the bootstrap CI of the change excludes zero. Requiring both keeps
+    the false-positive rate at ``alpha``; on its own the bootstrap CI of
+    tiny samples excludes zero whenever they merely do not overlap. When
+    the samples are too few for the test to ever reach ``alpha`` (three per
+    side give at best p = 0.1), the check is marked ``inconclusive`` and
+    never reports a regression or an improvement.
+    """
+    base_median = median(baseline) if baseline else 0.0
+    cand_median = median(candidate) if candidate else 0.0
+    change = (cand_median - base_median) / abs(base_median) if base_median else 0.0
+    p_value: float | None = None
+    ci: Tuple[float, float] | None = None
+    inconclusive = min_p_value(len(baseline), len(candidate)) >= alpha
+    significant = False
+    if not inconclusive:
+        _, p_value = mann_whitney_u(baseline, candidate)
+        ci = bootstrap_ci(baseline, candidate)
+        significant = p_value < alpha and (ci[0] > 0 or ci[1] < 0)
+    worse = -change if higher_is_better else change
+    return RegressionCheck(
+        metric=metric,
+        baseline_median=base_median,
+        candidate_median=cand_median,
+        change=change,
+        p_value=p_value,
+        ci=ci,
+        higher_is_better=higher_is_better,
+        regressed=significant and worse >= min_effect,
+        improved=significant and -worse >= min_effect,
+        inconclusive=inconclusive,
+    )
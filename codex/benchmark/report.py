@@ -4,7 +4,7 @@ import json
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, Iterable, List, Tuple
 
 
 LOWER_IS_BETTER = {
@@ -13,6 +13,17 @@ LOWER_IS_BETTER = {
     "transcriptionlatencyms",
     "processinglatencyms",
     "realtimefactor",
+    "realtimefactor_p90",
+    "latency_p50_ms",
+    "latency_p90_ms",
+    "latency_p99_ms",
+}
+
+HIGHER_IS_BETTER = {
+    "tokenspersecond",
+    "tokenspersecond_p10",
+    "tokenspersecond_p50",
+    "stability_score",
 }
 
 
@@ -71,6 +82,17 @@ class BenchmarkReport:
             results.append(BenchmarkResult.from_dict(payload))
         return results
 
+    def signature(self) -> Tuple[Tuple[str, int, int], ...]:
+        """Cheap change marker: name, mtime and size of every result file."""
+        entries = []
+        for path in sorted(self.results_dir.glob("*.json")):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((path.name, stat.st_mtime_ns, stat.st_size))
+        return tuple(entries)
+
     def list_models(self) -> List[str]:
         return [path.stem for path in sorted(self.results_dir.glob("*.json"))]
 
@@ -86,8 +108,8 @@ class BenchmarkReport:
         return sorted(rows, key=lambda row: row["value"], reverse=reverse)
 
     def model_report(self, model: str) -> Dict[str, Any]:
-        result = self.load(model)
         all_results = self.load_all()
+        result = next((item for item in all_results if item.model == model), None) or self.load(model)
         model_type = result.model_type
         if model_type == "llm":
             metrics = [
@@ -97,13 +119,16 @@ class BenchmarkReport:
                 "peakrammb",
                 "peakvrammb",
                 "stability_score",
+                "latency_p99_ms",
             ]
         elif model_type == "stt":
             metrics = [
                 "transcriptionlatencyms",
                 "realtimefactor",
+                "realtimefactor_p90",
                 "loadtimems",
                 "peakrammb",
+                "latency_p99_ms",
             ]
         else:
             metrics = ["processinglatencyms", "loadtimems"]
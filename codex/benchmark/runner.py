@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import importlib.util
-import math
+import os
+import sys
 import time
-import wave
 from contextlib import nullcontext
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
 
 from codex.causal_memory import CausalMemoryLayer
 from codex.capu import Tracer
@@ -15,13 +17,46 @@ from codex.lpi import PresenceMonitor
 from codex.lpi.integration import extract_capu_features
 from codex.registry import ModelRegistry
 
-from .metrics import LLMMetrics, STTMetrics, VADMetrics, stability_score
+from .fixtures import FixtureCache, read_wav_segment, synthesize, wav_duration_seconds, write_wav
+from .history import BenchmarkHistory
+from .metrics import (
+    LLMMetrics,
+    RunStats,
+    STTMetrics,
+    VADMetrics,
+    latency_percentiles,
+    percentile,
+    relative_ci,
+    stability_score,
+)
 from .report import BenchmarkReport, BenchmarkResult
 
 DEFAULT_PROMPT = "Explain what a neural network is in one paragraph."
 
 
 class BenchmarkRunner:
+    """Benchmarks registered models with warmup and adaptive run counts.
+
+    Each model gets ``warmup_runs`` unrecorded iterations, then at least
+    ``stability_runs`` measured ones. Measuring continues until the 95%
+    confidence interval of the mean is within ``target_ci`` of the mean, or
+    until ``max_runs`` is reached. With ``keep_loaded`` models stay resident
+    between runs; call ``close`` to release them. Raw samples are kept in
+    ``result.metadata["samples"]`` and, when ``history`` is given, every run
+    is appended to it for regression tracking.
+
+    STT and VAD runs use ``assets/sample_5s.wav`` unless ``clip_seconds`` is
+    set, in which case a ``clip_kind`` signal of that length is taken from
+    the fixture cache (``fixtures_dir``, by default the assets directory).
+
+    A model that was already resident is not reloaded, so its load time is
+    reported as ``loadtimems_warm`` rather than ``loadtimems``. Peak RAM
+    combines per-iteration samples with the ``VmHWM`` high-water mark when
+    the kernel lets it be reset per model (``metadata["peak_ram"] == "run"``);
+    otherwise the mark spans the process lifetime, so it is reported apart
+    as ``metadata["process_peak_ram_mb"]`` (``"process"``).
+    """
+
     def __init__(
         self,
         registry: ModelRegistry,
@@ -30,13 +65,32 @@ class BenchmarkRunner:
         memory_layer: CausalMemoryLayer | None = None,
         tracer: Tracer | None = None,
         presence_monitor: PresenceMonitor | None = None,
+        *,
+        warmup_runs: int = 1,
+        max_runs: int = 20,
+        target_ci: float = 0.05,
+        keep_loaded: bool = False,
+        history: BenchmarkHistory | None = None,
+        clip_seconds: float | None = None,
+        clip_kind: str = "speech",
+        fixtures_dir: str | Path | None = None,
     ) -> None:
         self.registry = registry
         self.results_dir = Path(results_dir or "benchmark_results")
         self.reporter = BenchmarkReport(self.results_dir)
         self.stability_runs = max(1, stability_runs)
+        self.warmup_runs = max(0, warmup_runs)
+        self.max_runs = max(self.stability_runs, max_runs)
+        self.target_ci = target_ci
+        self.keep_loaded = keep_loaded
+        self.history = history
+        self._samples: Dict[str, List[float]] = {}
+        self._peak_ram: Dict[str, Any] = {}
         self.assets_dir = Path(__file__).resolve().parent / "assets"
         self.sample_wav = self.assets_dir / "sample_5s.wav"
+        self.fixtures = FixtureCache(fixtures_dir or self.assets_dir)
+        self.clip_seconds = clip_seconds
+        self.clip_kind = clip_kind
         self.memory_layer = memory_layer
         self.tracer = tracer or Tracer()
         self.presence_monitor = presence_monitor or PresenceMonitor()
@@ -45,6 +99,9 @@ class BenchmarkRunner:
         if not self.registry.exists(model_name):
             raise KeyError(f"Model '{model_name}' is not registered.")
         model_type = self.registry.info(model_name).get("type", "custom")
+        resident = self.registry.is_loaded(model_name)
+        self._samples = {}
+        self._peak_ram = {}
         try:
             if model_type == "llm":
                 metrics = self._run_llm(model_name)
@@ -55,7 +112,20 @@ class BenchmarkRunner:
             else:
                 raise ValueError(f"Unsupported model type for benchmarking: {model_type}")
             metrics_payload = metrics.to_dict() if hasattr(metrics, "to_dict") else dict(metrics)
-            result = BenchmarkResult(model=model_name, model_type=model_type, metrics=metrics_payload)
+            metadata: Dict[str, Any] = {"samples": self._samples} if self._samples else {}
+            metadata["load"] = "warm" if resident else "cold"
+            metadata.update(self._peak_ram)
+            if resident:
+                metadata["resident"] = True
+                # nothing was loaded; keep this out of cold load-time comparisons
+                if "loadtimems" in metrics_payload:
+                    metrics_payload["loadtimems_warm"] = metrics_payload.pop("loadtimems")
+            result = BenchmarkResult(
+                model=model_name,
+                model_type=model_type,
+                metrics=metrics_payload,
+                metadata=metadata,
+            )
         except Exception as exc:
             if raise_on_error:
                 raise
@@ -67,7 +137,7 @@ class BenchmarkRunner:
                 metadata={"error": str(exc)},
             )
         finally:
-            if self.registry.is_loaded(model_name):
+            if not self.keep_loaded and self.registry.is_loaded(model_name):
                 self.registry.unload(model_name)
         snapshot = None
         if result.metrics and self.presence_monitor:
@@ -77,11 +147,16 @@ class BenchmarkRunner:
                 metrics=result.metrics,
                 hardware=hardware_profile,
             )
-            result.metadata = result.metadata or {}
+            # BenchmarkResult is frozen; its metadata dict is updated in place
             result.metadata["system_state"] = snapshot.state.value
         if self.memory_layer:
             model_info = self.registry.info(model_name)
-            metadata = {"stability_runs": self.stability_runs}
+            metadata = {
+                "stability_runs": self.stability_runs,
+                "warmup_runs": self.warmup_runs,
+                "max_runs": self.max_runs,
+                "target_ci": self.target_ci,
+            }
             if snapshot is not None:
                 metadata["system_state"] = snapshot.state.value
             self.memory_layer.record_benchmark(
@@ -95,6 +170,8 @@ class BenchmarkRunner:
             )
         if save:
             self.reporter.save(result)
+        if self.history is not None:
+            self.history.record(result)
         return result
 
     def run_all(self, save: bool = True) -> List[BenchmarkResult]:
@@ -103,8 +180,30 @@ class BenchmarkRunner:
             results.append(self.run(name, save=save, raise_on_error=False))
         return results
 
+    def close(self) -> None:
+        """Unload every model kept resident by ``keep_loaded``."""
+        for name in self.registry.list_models():
+            if self.registry.is_loaded(name):
+                self.registry.unload(name)
+
+    def _measure(self, run_once: Callable[[], float]) -> RunStats:
+        """Run warmups, then sample ``run_once`` until the CI is tight enough."""
+        for _ in range(self.warmup_runs):
+            run_once()
+        samples: List[float] = []
+        while len(samples) < self.max_runs:
+            samples.append(run_once())
+            if len(samples) >= self.stability_runs and relative_ci(samples) <= self.target_ci:
+                return RunStats(samples=samples, warmup_runs=self.warmup_runs, converged=True)
+        return RunStats(
+            samples=samples,
+            warmup_runs=self.warmup_runs,
+            converged=relative_ci(samples) <= self.target_ci,
+        )
+
     def _run_llm(self, model_name: str) -> Dict[str, Any]:
         process = _psutil().Process()
+        reset = _reset_peak_rss()
         start_ram = self._ram_mb(process)
         load_start = time.perf_counter()
         model_bundle = self.registry.load(model_name)
@@ -123,23 +222,31 @@ class BenchmarkRunner:
 
             context = torch.no_grad()
 
+        latencies_ms: List[float] = []
+
+        def generate_once() -> float:
+            nonlocal peak_ram
+            run_start = time.perf_counter()
+            output = model.generate(**inputs, max_new_tokens=32)
+            elapsed = time.perf_counter() - run_start
+            latencies_ms.append(elapsed * 1000)
+            peak_ram = max(peak_ram, self._ram_mb(process))
+            generated = self._count_generated_tokens(output, inputs)
+            return generated / elapsed if elapsed > 0 else 0.0
+
         with context:
             first_start = time.perf_counter()
             model.generate(**inputs, max_new_tokens=1)
             first_ms = (time.perf_counter() - first_start) * 1000
             peak_ram = max(peak_ram, self._ram_mb(process))
+            stats = self._measure(generate_once)
 
-            tokens_per_sec_samples: List[float] = []
-            for _ in range(self.stability_runs):
-                run_start = time.perf_counter()
-                output = model.generate(**inputs, max_new_tokens=32)
-                elapsed = time.perf_counter() - run_start
-                generated = self._count_generated_tokens(output, inputs)
-                tokens_per_sec_samples.append(generated / elapsed if elapsed > 0 else 0.0)
-                peak_ram = max(peak_ram, self._ram_mb(process))
-
+        peak_ram = self._settle_peak_ram(peak_ram, process, reset)
         peak_vram = max(peak_vram, self._get_peak_vram_mb())
+        tokens_per_sec_samples = stats.samples
         tokens_per_second = sum(tokens_per_sec_samples) / len(tokens_per_sec_samples)
+        measured_latencies = latencies_ms[stats.warmup_runs :]
+        self._samples = {"tokenspersecond": tokens_per_sec_samples, "latency_ms": measured_latencies}
 
         base_metrics = LLMMetrics(
             loadtimems=round(load_ms, 2),
@@ -148,11 +255,15 @@ class BenchmarkRunner:
             peakrammb=round(peak_ram, 2),
             peakvrammb=round(peak_vram, 2),
             stability_score=stability_score(tokens_per_sec_samples),
+            latency_ms=latency_percentiles(measured_latencies),
+            tokenspersecond_samples=tokens_per_sec_samples,
+            run_stats=stats.to_dict(),
         )
         return finalize_llm_metrics(self.tracer, model_name, base_metrics.to_dict())
 
     def _run_stt(self, model_name: str) -> Dict[str, Any]:
         process = _psutil().Process()
+        reset = _reset_peak_rss()
         start_ram = self._ram_mb(process)
         load_start = time.perf_counter()
         model = self.registry.load(model_name)
@@ -162,19 +273,31 @@ class BenchmarkRunner:
         _, model = self.tracer.start_stt_session(model_name, model)
         sample_wav = self._ensure_sample_wav()
         audio_seconds = self._wav_duration_seconds(sample_wav)
-        start = time.perf_counter()
-        segments, _info = model.transcribe(str(sample_wav), beam_size=1)
-        for _segment in segments:
-            pass
-        latency = time.perf_counter() - start
-        peak_ram = max(peak_ram, self._ram_mb(process))
 
-        rtf = latency / audio_seconds if audio_seconds else 0.0
+        def transcribe_once() -> float:
+            nonlocal peak_ram
+            start = time.perf_counter()
+            segments, _info = model.transcribe(str(sample_wav), beam_size=1)
+            for _segment in segments:
+                pass
+            latency_ms = (time.perf_counter() - start) * 1000
+            peak_ram = max(peak_ram, self._ram_mb(process))
+            return latency_ms
+
+        stats = self._measure(transcribe_once)
+        peak_ram = self._settle_peak_ram(peak_ram, process, reset)
+        self._samples = {"latency_ms": stats.samples}
+        latency_ms = sum(stats.samples) / len(stats.samples)
+        rtf = latency_ms / 1000 / audio_seconds if audio_seconds else 0.0
+        rtf_p90 = percentile(stats.samples, 90) / 1000 / audio_seconds if audio_seconds else 0.0
         base_metrics = STTMetrics(
             loadtimems=round(load_ms, 2),
-            transcriptionlatencyms=round(latency * 1000, 2),
+            transcriptionlatencyms=round(latency_ms, 2),
             realtimefactor=round(rtf, 3),
             peakrammb=round(peak_ram, 2),
+            latency_ms=latency_percentiles(stats.samples),
+            realtimefactor_p90=round(rtf_p90, 3),
+            run_stats=stats.to_dict(),
         )
         return finalize_stt_metrics(self.tracer, model_name, base_metrics.to_dict())
 
@@ -184,6 +307,7 @@ class BenchmarkRunner:
         import torch
 
         process = _psutil().Process()
+        reset = _reset_peak_rss()
         start_ram = self._ram_mb(process)
         load_start = time.perf_counter()
         model = self.registry.load(model_name)
@@ -192,15 +316,25 @@ class BenchmarkRunner:
 
         sample_wav = self._ensure_sample_wav()
         audio = self._load_wav_segment(sample_wav, seconds=1.0)
-        waveform = torch.tensor(audio).float().unsqueeze(0)
-        run_start = time.perf_counter()
-        _ = model(waveform, 16000)
-        latency_ms = (time.perf_counter() - run_start) * 1000
-        peak_ram = max(peak_ram, self._ram_mb(process))
+        waveform = torch.from_numpy(audio).float().unsqueeze(0)
+
+        def detect_once() -> float:
+            nonlocal peak_ram
+            run_start = time.perf_counter()
+            _ = model(waveform, 16000)
+            latency_ms = (time.perf_counter() - run_start) * 1000
+            peak_ram = max(peak_ram, self._ram_mb(process))
+            return latency_ms
 
+        stats = self._measure(detect_once)
+        peak_ram = self._settle_peak_ram(peak_ram, process, reset)
+        self._samples = {"latency_ms": stats.samples}
         return VADMetrics(
             loadtimems=round(load_ms, 2),
-            processinglatencyms=round(latency_ms, 2),
+            processinglatencyms=round(sum(stats.samples) / len(stats.samples), 2),
+            peakrammb=round(peak_ram, 2),
+            latency_ms=latency_percentiles(stats.samples),
+            run_stats=stats.to_dict(),
         )
 
     @staticmethod
@@ -227,48 +361,61 @@ class BenchmarkRunner:
     def _ram_mb(process: Any) -> float:
         return process.memory_info().rss / (1024 * 1024)
 
+    def _settle_peak_ram(self, peak_ram: float, process: Any, reset: bool) -> float:
+        """Fold the run's high-water RSS into ``peak_ram`` when it is scoped to this run.
+
+        A mark that could not be reset covers the whole process lifetime, so an
+        earlier, larger model would leak into this one; it is kept out of
+        ``peakrammb`` and reported as ``metadata["process_peak_ram_mb"]``.
+        """
+        high_water, scope = self._peak_ram_mb(process, reset)
+        self._peak_ram = {"peak_ram": scope}
+        if scope == "run":
+            return max(peak_ram, high_water)
+        self._peak_ram["process_peak_ram_mb"] = round(max(peak_ram, high_water), 2)
+        return peak_ram
+
     @staticmethod
-    def _wav_duration_seconds(path: Path) -> float:
-        with wave.open(str(path), "rb") as wf:
-            frames = wf.getnframes()
-            rate = wf.getframerate()
-        return frames / float(rate)
+    def _peak_ram_mb(process: Any, reset: bool = False) -> Tuple[float, str]:
+        """High-water RSS of ``process`` and whether it covers this ``"run"`` or the whole ``"process"``."""
+        try:
+            with open(f"/proc/{process.pid}/status", encoding="ascii") as handle:
+                for line in handle:
+                    if line.startswith("VmHWM:"):
+                        scope = "run" if reset and process.pid == os.getpid() else "process"
+                        return int(line.split()[1]) / 1024, scope
+        except (OSError, ValueError, IndexError):
+            pass
+        if process.pid == os.getpid():
+            try:
+                import resource
+            except ImportError:
+                pass
+            else:
+                maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+                # kilobytes on Linux, bytes on macOS; never reset, so always process-wide
+                return (maxrss / (1024 * 1024) if sys.platform == "darwin" else maxrss / 1024), "process"
+        return process.memory_info().rss / (1024 * 1024), "run"
 
+    @staticmethod
+    def _wav_duration_seconds(path: Path) -> float:
+        return wav_duration_seconds(path)
 
     def _ensure_sample_wav(self) -> Path:
+        if self.clip_seconds is not None:
+            return self.fixtures.get(self.clip_kind, self.clip_seconds)
         if self.sample_wav.exists():
             return self.sample_wav
-        self.assets_dir.mkdir(parents=True, exist_ok=True)
         self._write_sine_wave(self.sample_wav, seconds=5.0)
         return self.sample_wav
 
     @staticmethod
     def _write_sine_wave(path: Path, seconds: float, sample_rate: int = 16000) -> None:
-        frames = int(sample_rate * seconds)
-        amplitude = 0.2
-        frequency = 440.0
-        data = bytearray()
-        for i in range(frames):
-            sample = amplitude * math.sin(2 * math.pi * frequency * (i / sample_rate))
-            value = int(sample * 32767)
-            data.extend(value.to_bytes(2, "little", signed=True))
-        with wave.open(str(path), "wb") as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(2)
-            wf.setframerate(sample_rate)
-            wf.writeframes(data)
+        write_wav(path, synthesize("sine", seconds, sample_rate=sample_rate), sample_rate)
 
     @staticmethod
-    def _load_wav_segment(path: Path, seconds: float) -> List[float]:
-        with wave.open(str(path), "rb") as wf:
-            rate = wf.getframerate()
-            frames = int(rate * seconds)
-            data = wf.readframes(frames)
-            samples = []
-            for i in range(0, len(data), 2):
-                sample = int.from_bytes(data[i : i + 2], "little", signed=True)
-                samples.append(sample / 32768.0)
-        return samples
+    def _load_wav_segment(path: Path, seconds: float) -> np.ndarray:
+        return read_wav_segment(path, seconds)
 
     @staticmethod
     def _reset_vram_peak() -> float:
@@ -292,6 +439,16 @@ class BenchmarkRunner:
         return 0.0
 
 
+def _reset_peak_rss() -> bool:
+    """Restart this process's ``VmHWM`` so each model gets its own peak (Linux only)."""
+    try:
+        with open("/proc/self/clear_refs", "w", encoding="ascii") as handle:
+            handle.write("5")
+    except OSError:
+        return False
+    return True
+
+
 def _psutil():
     try:
         import psutil
@@ -3,11 +3,104 @@ from __future__ import annotations
 import argparse
 import json
 import sys
+from pathlib import Path
 from typing import Sequence
 
-from codex.benchmark import BenchmarkReport, BenchmarkRunner
+from codex.benchmark import (
+    BenchmarkHistory,
+    BenchmarkOrchestrator,
+    BenchmarkReport,
+    BenchmarkRunner,
+    HistoryEntry,
+    hardware_fingerprint,
+)
 from codex.registry import build_default_registry
 
+DEFAULT_RESULTS_DIR = "benchmark_results"
+HISTORY_FILENAME = "history.sqlite3"
+
+
+def _add_run_options(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--warmup", type=int, default=1, help="Unrecorded warmup iterations")
+    parser.add_argument("--min-runs", type=int, default=3, help="Minimum measured iterations")
+    parser.add_argument("--max-runs", type=int, default=20, help="Maximum measured iterations")
+    parser.add_argument(
+        "--target-ci",
+        type=float,
+        default=0.05,
+        help="Stop once the 95%% CI half-width is within this fraction of the mean",
+    )
+    parser.add_argument("--keep-loaded", action="store_true", help="Keep models resident across runs")
+
+
+_RUN_ID_PREFIXES = ("#", "run:")
+
+
+def _resolve_run(history: BenchmarkHistory, model: str, ref: str, hardware: str) -> HistoryEntry:
+    """Find a run by ``#<id>``/``run:<id>`` or by code revision.
+
+    A bare number is looked up as a revision first (short git hashes can be
+    all digits) and only then as a run id.
+    """
+    for prefix in _RUN_ID_PREFIXES:
+        if ref.startswith(prefix):
+            run_id = ref[len(prefix) :]
+            entry = history.get(int(run_id)) if run_id.isdigit() else None
+            if entry is None or entry.model != model:
+                raise KeyError(f"No run {run_id} for model '{model}'.")
+            return entry
+    entries = history.history(model, hardware=hardware, revision=ref, limit=1)
+    if entries:
+        return entries[0]
+    if ref.isdigit():
+        entry = history.get(int(ref))
+        if entry is not None and entry.model == model:
+            return entry
+    raise KeyError(f"No run of '{model}' at revision '{ref}' on this hardware.")
+
+
+def _run_benchmark_history(args: argparse.Namespace, history: BenchmarkHistory) -> int:
+    hardware = hardware_fingerprint()
+    if args.benchmark_command == "history":
+        entries = history.history(
+            args.name,
+            hardware=None if args.all_hardware else hardware,
+            limit=args.limit,
+        )
+        if args.metric:
+            rows = [
+                {"id": e.run_id, "revision": e.revision, "timestamp": e.timestamp, args.metric: e.metrics.get(args.metric)}
+                for e in entries
+            ]
+        else:
+            rows = [entry.to_dict() for entry in entries]
+        print(json.dumps(rows, indent=2, sort_keys=True))
+        return 0
+
+    latest = history.history(args.name, hardware=hardware, limit=2)
+    candidate = _resolve_run(history, args.name, args.candidate, hardware) if args.candidate else None
+    baseline = _resolve_run(history, args.name, args.baseline, hardware) if args.baseline else None
+    if candidate is None:
+        if not latest:
+            print(f"No recorded runs for '{args.name}' on this hardware.", file=sys.stderr)
+            return 2
+        candidate = latest[0]
+    if baseline is None:
+        previous = [entry for entry in latest if entry.run_id != candidate.run_id]
+        if not previous:
+            print(f"Need at least two runs of '{args.name}' to compare.", file=sys.stderr)
+            return 2
+        baseline = previous[0]
+    checks = history.compare(baseline, candidate, alpha=args.alpha, min_effect=args.min_effect)
+    payload = {
+        "baseline": {"id": baseline.run_id, "revision": baseline.revision},
+        "candidate": {"id": candidate.run_id, "revision": candidate.revision},
+        "checks": [check.to_dict() for check in checks],
+        "regressed": any(check.regressed for check in checks),
+    }
+    print(json.dumps(payload, indent=2, sort_keys=True))
+    return 1 if payload["regressed"] else 0
+
 
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="codex", description="Codex CLI")
@@ -32,12 +125,39 @@ def _build_parser() -> argparse.ArgumentParser:
 
     benchmark_run = benchmark_sub.add_parser("run", help="Benchmark a single model")
     benchmark_run.add_argument("name")
-
-    benchmark_sub.add_parser("all", help="Benchmark all registered models")
+    _add_run_options(benchmark_run)
+
+    benchmark_all = benchmark_sub.add_parser("all", help="Benchmark all registered models")
+    _add_run_options(benchmark_all)
+    benchmark_all.add_argument(
+        "--isolated", action="store_true", help="Run each model in its own CPU-pinned worker process"
+    )
+    benchmark_all.add_argument("--parallel", type=int, help="Maximum concurrent workers (implies --isolated)")
+    benchmark_all.add_argument("--cpus-per-job", type=int, default=1, help="CPUs pinned to each worker")
+    benchmark_all.add_argument("--timeout", type=float, default=1800.0, help="Per-model timeout in seconds")
+    benchmark_all.add_argument("--memory-limit", type=float, help="Per-worker RSS limit in MB")
 
     benchmark_report = benchmark_sub.add_parser("report", help="Show benchmark report")
     benchmark_report.add_argument("name")
 
+    benchmark_history = benchmark_sub.add_parser("history", help="Show recorded runs for a model")
+    benchmark_history.add_argument("name")
+    benchmark_history.add_argument("--metric", help="Only print this metric per run")
+    benchmark_history.add_argument("--limit", type=int, default=20)
+    benchmark_history.add_argument("--all-hardware", action="store_true", help="Include runs from other machines")
+
+    benchmark_compare = benchmark_sub.add_parser(
+        "compare",
+        help="Test two runs for statistically significant regressions (runs need 4+ samples, see --min-runs)",
+    )
+    benchmark_compare.add_argument("name")
+    benchmark_compare.add_argument("--baseline", help="Code revision or #<run id> (default: previous run)")
+    benchmark_compare.add_argument("--candidate", help="Code revision or #<run id> (default: latest run)")
+    benchmark_compare.add_argument("--alpha", type=float, default=0.05)
+    benchmark_compare.add_argument(
+        "--min-effect", type=float, default=0.05, help="Smallest relative change reported as a regression"
+    )
+
     return parser
 
 
@@ -64,13 +184,50 @@ def main(argv: Sequence[str] | None = None) -> int:
             print(f"Unloaded {args.name}")
             return 0
     if args.command == "benchmark":
-        runner = BenchmarkRunner(registry)
+        if args.benchmark_command in {"history", "compare"}:
+            history = BenchmarkHistory(Path(DEFAULT_RESULTS_DIR) / HISTORY_FILENAME)
+            try:
+                return _run_benchmark_history(args, history)
+            finally:
+                history.close()
+        if args.benchmark_command in {"run", "all"}:
+            runner = BenchmarkRunner(
+                registry,
+                stability_runs=args.min_runs,
+                warmup_runs=args.warmup,
+                max_runs=args.max_runs,
+                target_ci=args.target_ci,
+                keep_loaded=args.keep_loaded,
+                history=BenchmarkHistory(Path(DEFAULT_RESULTS_DIR) / HISTORY_FILENAME),
+            )
+        else:
+            runner = BenchmarkRunner(registry)
         if args.benchmark_command == "run":
             result = runner.run(args.name)
+            runner.close()
             print(json.dumps(result.to_dict(), indent=2, sort_keys=True))
             return 0
+        if args.benchmark_command == "all" and (args.isolated or args.parallel):
+            orchestrator = BenchmarkOrchestrator(
+                results_dir=runner.results_dir,
+                max_parallel=args.parallel,
+                cpus_per_job=args.cpus_per_job,
+                timeout=args.timeout,
+                memory_limit_mb=args.memory_limit,
+                history=runner.history,
+                runner_kwargs={
+                    "stability_runs": args.min_runs,
+                    "warmup_runs": args.warmup,
+                    "max_runs": args.max_runs,
+                    "target_ci": args.target_ci,
+                },
+            )
+            results = orchestrator.run()
+            print(json.dumps([result.to_dict() for result in results], indent=2, sort_keys=True))
+            return 0
         if args.benchmark_command == "all":
             results = runner.run_all()
+            runner.close()
             print(json.dumps([result.to_dict() for result in results], indent=2, sort_keys=True))
             return 0
         if args.benchmark_command == "report":
@@ -1,11 +1,13 @@
-from .capabilities import HardwareCapabilities, parse_memory_to_mb
-from .profiler import HardwareProfiler, HardwareProfile, GPUInfo, TorchInfo
+from .capabilities import CapabilityMatrix, HardwareCapabilities, parse_memory_to_mb
+from .profiler import HardwareProfiler, HardwareProfile, GPUInfo, TorchInfo, host_fingerprint
 
 __all__ = [
+    "CapabilityMatrix",
     "HardwareCapabilities",
     "HardwareProfiler",
     "HardwareProfile",
     "GPUInfo",
     "TorchInfo",
+    "host_fingerprint",
     "parse_memory_to_mb",
 ]
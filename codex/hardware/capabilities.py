@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, Set
+from typing import Dict, Iterable, Set
 
 from codex.registry.model_config import ModelConfig
 
@@ -79,6 +79,10 @@ class HardwareCapabilities:
         ram_required = parse_memory_to_mb(config.ram_required)
         if ram_required is not None and self.profile.ram_available_mb < ram_required:
             return False
+        return self.supports_model_statically(config)
+
+    def supports_model_statically(self, config: ModelConfig) -> bool:
+        """Device and quantization checks, which do not depend on free memory."""
         if config.device == "gpu" and not self.gpu_available:
             return False
         if config.quant in {"fp16", "float16"} and not self.fp16_available:
@@ -91,3 +95,31 @@ class HardwareCapabilities:
 
     def filter_supported(self, models: Iterable[ModelConfig]) -> list[ModelConfig]:
         return [model for model in models if self.supports_model(model)]
+
+
+class CapabilityMatrix:
+    """Precomputed model support for one host.
+
+    Device and quantization checks depend only on static hardware facts, so
+    they are evaluated once per model. Only the free-RAM comparison is left
+    for lookup time, against a parsed ``ram_required``.
+    """
+
+    def __init__(self, models: Iterable[ModelConfig], capabilities: HardwareCapabilities) -> None:
+        self._static: Dict[str, bool] = {}
+        self._ram_required: Dict[str, float | None] = {}
+        for model in models:
+            self._static[model.name] = capabilities.supports_model_statically(model)
+            self._ram_required[model.name] = parse_memory_to_mb(model.ram_required)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._static
+
+    def supports(self, name: str, ram_available_mb: float) -> bool:
+        if not self._static.get(name, False):
+            return False
+        required = self._ram_required[name]
+        return required is None or ram_available_mb >= required
+
+    def supported(self, ram_available_mb: float) -> frozenset[str]:
+        return frozenset(name for name in self._static if self.supports(name, ram_available_mb))
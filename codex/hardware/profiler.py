@@ -1,12 +1,25 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import functools
+import hashlib
 import importlib
 import importlib.util
+import json
+import os
 import platform
 import shutil
 import subprocess
-from typing import Any, Dict, Optional
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+STATIC_CACHE_VERSION = 1
+# ISA extensions that decide which kernels/quantizations are usable.
+ISA_FLAGS_OF_INTEREST = (
+    "sse4_2", "avx", "avx2", "fma", "f16c", "avx512f", "avx512bw", "avx512_vnni",
+    "avx512_bf16", "amx_tile", "amx_bf16", "amx_int8", "asimd", "sve", "neon",
+)
 
 
 @dataclass(frozen=True)
@@ -54,6 +67,9 @@ class HardwareProfile:
     gpu: GPUInfo | None
     torch: TorchInfo
     libraries: Dict[str, bool]
+    cpu_model: str | None = None
+    isa_flags: List[str] = field(default_factory=list)
+    numa_nodes: int = 1
 
     def to_dict(self) -> Dict[str, Any]:
         payload = {
@@ -68,43 +84,213 @@ class HardwareProfile:
         }
         if self.gpu is not None:
             payload["gpu"] = self.gpu.to_dict()
+        if self.cpu_model:
+            payload["cpu_model"] = self.cpu_model
+        if self.isa_flags:
+            payload["isa_flags"] = list(self.isa_flags)
+        if self.numa_nodes != 1:
+            payload["numa_nodes"] = self.numa_nodes
         return payload
 
 
+def _read_text(path: str) -> str | None:
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as handle:
+            return handle.read()
+    except OSError:
+        return None
+
+
+def _site_packages_state() -> List[str]:
+    """``path:mtime`` of each package directory on ``sys.path``; pip touches these on (un)install."""
+    state = []
+    for entry in sys.path:
+        if os.path.basename(entry) not in ("site-packages", "dist-packages"):
+            continue
+        try:
+            state.append(f"{entry}:{os.stat(entry).st_mtime_ns}")
+        except OSError:
+            continue
+    return state
+
+
+@functools.lru_cache(maxsize=1)
+def host_fingerprint() -> str:
+    """Cheap identity for the host and interpreter the static facts belong to.
+
+    Combines the boot id (a reboot may come with new hardware or drivers),
+    a hash of ``/proc/cpuinfo`` minus the ever-changing MHz lines, the
+    Python executable and the site-packages modification times, so
+    installing or removing torch or another probed library invalidates the
+    cached library/torch facts. It is computed once per process.
+    """
+    parts = [
+        _read_text("/proc/sys/kernel/random/boot_id") or platform.node(),
+        platform.machine(),
+        platform.processor(),
+        sys.executable,
+        sys.version,
+        *_site_packages_state(),
+    ]
+    cpuinfo = _read_text("/proc/cpuinfo")
+    if cpuinfo:
+        parts.append("".join(line for line in cpuinfo.splitlines(True) if not line.startswith("cpu MHz")))
+    return hashlib.sha1("\0".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
+def default_cache_path() -> Path:
+    base = os.getenv("CODEX_CACHE_DIR") or os.path.join(
+        os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "codex"
+    )
+    return Path(base) / "hardware_profile.json"
+
+
 class HardwareProfiler:
-    def __init__(self) -> None:
+    """Collects a ``HardwareProfile`` from static facts plus a cheap dynamic sample.
+
+    Static facts (CPU model, ISA flags, core count, total RAM, NUMA layout,
+    GPU identity, torch capabilities, installed libraries) are probed once,
+    memoized in-process and written to ``cache_path`` keyed by
+    ``host_fingerprint()``. Later processes on the same boot reuse them
+    without importing torch or running ``nvidia-smi``. Each ``collect``
+    samples only memory, CPU frequency and, when a GPU is present, free
+    VRAM. Pass ``cache_path=False`` to keep the cache in memory only.
+    """
+
+    def __init__(self, cache_path: str | Path | bool | None = None) -> None:
         self._library_targets = {
             "transformers": "transformers",
             "faster_whisper": "faster_whisper",
             "torch": "torch",
             "ollama": "ollama",
         }
+        if cache_path is False:
+            self.cache_path: Path | None = None
+        else:
+            self.cache_path = default_cache_path() if cache_path in (None, True) else Path(cache_path)
+        self._static: Dict[str, Any] | None = None
+        self.static_probes = 0
 
     def collect(self) -> HardwareProfile:
+        static = self.static_facts()
         psutil = _psutil()
         memory = psutil.virtual_memory()
         cpu_freq = psutil.cpu_freq()
         cpu_freq_ghz = None
         if cpu_freq and cpu_freq.current:
             cpu_freq_ghz = round(cpu_freq.current / 1000.0, 2)
-        cpu_arch = platform.machine() or platform.processor() or "unknown"
 
-        torch_info = self._collect_torch_info()
-        gpu_info = self._collect_gpu_info(torch_info.cuda)
-        libraries = self._collect_libraries()
+        gpu_info = None
+        if static["gpu"] is not None:
+            gpu = dict(static["gpu"])
+            gpu["vram_free_mb"] = self._sample_vram_free_mb(static)
+            gpu_info = GPUInfo(**gpu)
 
         return HardwareProfile(
-            cpu_cores=psutil.cpu_count(logical=True) or 0,
+            cpu_cores=static["cpu_cores"],
             cpu_freq_ghz=cpu_freq_ghz,
-            cpu_arch=cpu_arch,
-            ram_total_mb=round(memory.total / (1024 * 1024), 2),
+            cpu_arch=static["cpu_arch"],
+            ram_total_mb=static["ram_total_mb"],
             ram_available_mb=round(memory.available / (1024 * 1024), 2),
             ram_used_mb=round(memory.used / (1024 * 1024), 2),
             gpu=gpu_info,
-            torch=torch_info,
-            libraries=libraries,
+            torch=TorchInfo(**static["torch"]),
+            libraries=dict(static["libraries"]),
+            cpu_model=static.get("cpu_model"),
+            isa_flags=list(static.get("isa_flags", [])),
+            numa_nodes=static.get("numa_nodes", 1),
         )
 
+    def static_facts(self) -> Dict[str, Any]:
+        """Static host facts, from memory, the disk cache or a fresh probe."""
+        fingerprint = host_fingerprint()
+        if self._static is not None and self._static.get("fingerprint") == fingerprint:
+            return self._static
+        cached = self._load_static(fingerprint)
+        if cached is None:
+            cached = self._probe_static(fingerprint)
+            self._store_static(cached)
+        self._static = cached
+        return cached
+
+    def refresh(self) -> HardwareProfile:
+        """Discard cached static facts (e.g. after a driver install) and re-probe."""
+        self._static = None
+        if self.cache_path is not None:
+            try:
+                self.cache_path.unlink()
+            except FileNotFoundError:
+                pass
+        return self.collect()
+
+    def _probe_static(self, fingerprint: str) -> Dict[str, Any]:
+        self.static_probes += 1
+        psutil = _psutil()
+        torch_info = self._collect_torch_info()
+        gpu_info = self._collect_gpu_info(torch_info.cuda)
+        cpu_model, isa_flags = _cpu_identity()
+        return {
+            "version": STATIC_CACHE_VERSION,
+            "fingerprint": fingerprint,
+            "cpu_cores": psutil.cpu_count(logical=True) or 0,
+            "cpu_arch": platform.machine() or platform.processor() or "unknown",
+            "cpu_model": cpu_model,
+            "isa_flags": isa_flags,
+            "numa_nodes": _numa_nodes(),
+            "ram_total_mb": round(psutil.virtual_memory().total / (1024 * 1024), 2),
+            "gpu": None
+            if gpu_info is None
+            else {
+                "name": gpu_info.name,
+                "vram_total_mb": gpu_info.vram_total_mb,
+                "vram_free_mb": gpu_info.vram_free_mb,
+                "cuda": gpu_info.cuda,
+                "cuda_version": gpu_info.cuda_version,
+            },
+            "torch": {
+                "cuda": torch_info.cuda,
+                "mps": torch_info.mps,
+                "fp16": torch_info.fp16,
+                "bf16": torch_info.bf16,
+            },
+            "libraries": self._collect_libraries(),
+        }
+
+    def _load_static(self, fingerprint: str) -> Dict[str, Any] | None:
+        if self.cache_path is None or not self.cache_path.exists():
+            return None
+        try:
+            payload = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if payload.get("version") != STATIC_CACHE_VERSION or payload.get("fingerprint") != fingerprint:
+            return None
+        return payload
+
+    def _store_static(self, payload: Dict[str, Any]) -> None:
+        if self.cache_path is None:
+            return
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_name(f".{self.cache_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            # an unwritable cache only costs a re-probe next time
+            pass
+
+    def _sample_vram_free_mb(self, static: Dict[str, Any]) -> float | None:
+        # Only ask torch when it is already imported; importing it just to
+        # read free VRAM would cost more than the whole static probe saves.
+        torch = sys.modules.get("torch")
+        if static["torch"]["cuda"] and torch is not None:
+            try:
+                free_bytes, _total = torch.cuda.mem_get_info()
+                return round(free_bytes / (1024 * 1024), 2)
+            except Exception:
+                return None
+        return static["gpu"].get("vram_free_mb")
+
     def _collect_libraries(self) -> Dict[str, bool]:
         return {
             name: importlib.util.find_spec(module) is not None
@@ -172,6 +358,30 @@ class HardwareProfiler:
         )
 
 
+def _cpu_identity() -> tuple[str | None, List[str]]:
+    cpuinfo = _read_text("/proc/cpuinfo") or ""
+    model = None
+    flags: set[str] = set()
+    for line in cpuinfo.splitlines():
+        key, _, value = line.partition(":")
+        key = key.strip().lower()
+        if model is None and key in {"model name", "hardware", "cpu model"}:
+            model = value.strip() or None
+        elif key in {"flags", "features"} and not flags:
+            flags = set(value.split())
+    if model is None:
+        model = platform.processor() or None
+    return model, [flag for flag in ISA_FLAGS_OF_INTEREST if flag in flags]
+
+
+def _numa_nodes() -> int:
+    try:
+        nodes = [entry for entry in os.listdir("/sys/devices/system/node") if entry.startswith("node")]
+    except OSError:
+        return 1
+    return max(1, len([entry for entry in nodes if entry[4:].isdigit()]))
+
+
 def _psutil():
     if importlib.util.find_spec("psutil") is None:
         raise RuntimeError("psutil is required for hardware profiling.")
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Tuple
 
 from codex.benchmark.report import LOWER_IS_BETTER, BenchmarkReport, BenchmarkResult
-from codex.hardware.capabilities import HardwareCapabilities
+from codex.hardware.capabilities import CapabilityMatrix, HardwareCapabilities
 from codex.hardware.profiler import HardwareProfiler
 from codex.lpi import PresenceMonitor, SystemState
 from codex.registry.model_config import ModelConfig
@@ -62,29 +63,92 @@ class SelectionResult:
         }
 
 
+@dataclass
+class _Ranking:
+    """Precomputed pick for one (task, priority) under one table version."""
+
+    supported: List[ModelConfig]
+    scores: Dict[str, float]
+    order: List[ModelConfig]
+    candidates: List[str]
+    reasons: Dict[str, str] = field(default_factory=dict)
+
+
 class AdaptiveModelSelector:
+    """Picks a model per task from hardware support and benchmark ranks.
+
+    Rankings are computed once per ``(task, priority)`` and kept in a
+    versioned table. The hardware profile, registry contents and benchmark
+    report are re-checked at most every ``profile_ttl`` seconds. The table
+    is rebuilt only when one of them actually changed: the set of supported
+    models, the registered models, or the report files. Between checks a
+    pick is a dictionary lookup. Presence-state adjustments are applied per
+    pick because the state changes independently of the table.
+    """
+
     def __init__(
         self,
         registry: ModelRegistry,
         profiler: HardwareProfiler,
         benchmark_report: BenchmarkReport | None = None,
         presence_monitor: PresenceMonitor | None = None,
+        *,
+        profile_ttl: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
     ) -> None:
         self.registry = registry
         self.profiler = profiler
         self.benchmark_report = benchmark_report
         self.presence_monitor = presence_monitor
+        self.profile_ttl = profile_ttl
+        self._clock = clock
+        self._expires_at: float | None = None
+        self._table_key: Tuple[object, ...] | None = None
+        self._configs: List[ModelConfig] = []
+        self._matrix: CapabilityMatrix | None = None
+        self._matrix_key: Tuple[object, ...] | None = None
+        self._supported_names: frozenset[str] = frozenset()
+        self._benchmarks: Dict[str, BenchmarkResult] = {}
+        self._rankings: Dict[Tuple[str, str], _Ranking] = {}
+        self.table_version = 0
 
-    def pick(self, task: str, priority: str | None = None) -> SelectionResult:
+    def invalidate(self) -> None:
+        """Force the next pick to re-probe hardware and reload benchmarks."""
+        self._expires_at = None
+        self._table_key = None
+
+    def _refresh(self) -> None:
+        now = self._clock()
+        if self._expires_at is not None and now < self._expires_at:
+            return
         profile = self.profiler.collect()
-        capabilities = HardwareCapabilities(profile)
+        names = tuple(self.registry.list_models())
+        if self._table_key is None or names != self._table_key[0]:
+            self._configs = self._load_model_configs()
+        # The matrix holds the static half of supports_model; rebuild it only
+        # when the models or the static side of the profile change.
+        matrix_key = (names, profile.gpu is not None, profile.torch)
+        if self._matrix is None or matrix_key != self._matrix_key:
+            self._matrix = CapabilityMatrix(self._configs, HardwareCapabilities(profile))
+            self._matrix_key = matrix_key
+        supported = self._matrix.supported(profile.ram_available_mb)
+        signature = self.benchmark_report.signature() if self.benchmark_report else ()
+        key = (names, supported, signature)
+        if key != self._table_key:
+            if self._table_key is None or signature != self._table_key[2]:
+                self._benchmarks = self._load_benchmarks()
+            self._supported_names = supported
+            self._rankings.clear()
+            self._table_key = key
+            self.table_version += 1
+        self._expires_at = now + self.profile_ttl
 
+    def _build_ranking(self, task: str, priority: str) -> _Ranking:
         task_profile = TASK_PROFILES.get(task, {})
-        task_priority = priority or task_profile.get("priority", "latency")
         preferred = task_profile.get("preferred", [])
         allowed_types = task_profile.get("types")
 
-        models = self._load_model_configs()
+        models = list(self._configs)
         if allowed_types:
             models = [model for model in models if model.type in allowed_types]
 
@@ -93,20 +157,42 @@ class AdaptiveModelSelector:
             if preferred_models:
                 models = preferred_models
 
-        supported = [model for model in models if capabilities.supports_model(model)]
-        if not supported:
+        supported = [model for model in models if model.name in self._supported_names]
+        scores = self._rank_scores(supported, self._benchmarks, priority)
+        return _Ranking(
+            supported=supported,
+            scores=scores,
+            order=sorted(supported, key=lambda model: scores[model.name]),
+            candidates=[model.name for model in supported],
+        )
+
+    def pick(self, task: str, priority: str | None = None) -> SelectionResult:
+        self._refresh()
+        task_priority = priority or TASK_PROFILES.get(task, {}).get("priority", "latency")
+        ranking = self._rankings.get((task, task_priority))
+        if ranking is None:
+            ranking = self._rankings[(task, task_priority)] = self._build_ranking(task, task_priority)
+        if not ranking.supported:
             raise ValueError("No compatible models found for the current hardware.")
 
-        benchmark_results = self._load_benchmarks()
-        scored = self._score_models(supported, benchmark_results, task_priority)
-        selected = scored[0]
-        reason = self._build_reason(selected, benchmark_results, task_priority)
+        selected = ranking.order[0]
+        if self.presence_monitor and self.presence_monitor.current_state.state in (
+            SystemState.OVERLOAD,
+            SystemState.UNCERTAIN,
+        ):
+            selected = min(
+                ranking.supported,
+                key=lambda model: ranking.scores[model.name] + self._apply_state_adjustment(model, self._benchmarks),
+            )
+        reason = ranking.reasons.get(selected.name)
+        if reason is None:
+            reason = ranking.reasons[selected.name] = self._build_reason(selected, self._benchmarks, task_priority)
         return SelectionResult(
             task=task,
             priority=task_priority,
             selected_model=selected.name,
             reason=reason,
-            candidates=[model.name for model in supported],
+            candidates=list(ranking.candidates),
         )
 
     def select(
@@ -144,28 +230,36 @@ class AdaptiveModelSelector:
         benchmarks: Dict[str, BenchmarkResult],
         priority: str,
     ) -> List[ModelConfig]:
-        metrics = PRIORITY_METRICS.get(priority, PRIORITY_METRICS["latency"])
         model_list = list(models)
-        metric_values = self._metric_values(model_list, benchmarks, metrics)
+        scores = self._rank_scores(model_list, benchmarks, priority)
+        return sorted(
+            model_list,
+            key=lambda model: scores[model.name] + self._apply_state_adjustment(model, benchmarks),
+        )
 
-        def rank_score(model: ModelConfig) -> float:
-            score = 0.0
-            for metric in metrics:
-                values = metric_values.get(metric, {})
-                if not values:
-                    score += len(model_list)
-                    continue
-                ordered = sorted(
-                    values.items(),
-                    key=lambda item: item[1],
-                    reverse=metric not in LOWER_IS_BETTER,
-                )
-                rank = next((idx for idx, (name, _) in enumerate(ordered) if name == model.name), len(model_list))
-                score += rank
-            score += self._apply_state_adjustment(model, benchmarks)
-            return score
-
-        return sorted(model_list, key=rank_score)
+    def _rank_scores(
+        self,
+        model_list: List[ModelConfig],
+        benchmarks: Dict[str, BenchmarkResult],
+        priority: str,
+    ) -> Dict[str, float]:
+        """Sum of per-metric ranks; each metric is sorted once."""
+        metrics = PRIORITY_METRICS.get(priority, PRIORITY_METRICS["latency"])
+        metric_values = self._metric_values(model_list, benchmarks, metrics)
+        scores = {model.name: 0.0 for model in model_list}
+        for metric in metrics:
+            values = metric_values.get(metric, {})
+            if not values:
+                for name in scores:
+                    scores[name] += len(model_list)
+                continue
+            ordered = sorted(values.items(), key=lambda item: item[1], reverse=metric not in LOWER_IS_BETTER)
+            ranks = {}
+            for idx, (name, _) in enumerate(ordered):
+                ranks.setdefault(name, idx)
+            for name in scores:
+                scores[name] += ranks.get(name, len(model_list))
+        return scores
 
     def _metric_values(
         self,
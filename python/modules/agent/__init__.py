@@ -1,13 +1,46 @@
 from .events import AgentEvent, EventType
 from .loop import AgentLoop
-from .sinks import EventSink, NullSink, PrintSink, build_event_sink
+from .metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    HistogramSnapshot,
+    MetricsRegistry,
+    MetricsServer,
+    RegistrySnapshot,
+)
+from .sinks import (
+    BatchingSink,
+    EventSink,
+    JsonlFileSink,
+    NullSink,
+    PrintSink,
+    RingBufferSink,
+    UnixSocketSink,
+    build_event_sink,
+)
+from .workers import CancellationToken, WorkerPool, WorkerPoolFull
 
 __all__ = [
     "AgentEvent",
     "EventType",
     "AgentLoop",
+    "BatchingSink",
+    "CancellationToken",
+    "Counter",
     "EventSink",
+    "Gauge",
+    "Histogram",
+    "HistogramSnapshot",
+    "JsonlFileSink",
+    "MetricsRegistry",
+    "MetricsServer",
     "NullSink",
     "PrintSink",
+    "RegistrySnapshot",
+    "RingBufferSink",
+    "UnixSocketSink",
+    "WorkerPool",
+    "WorkerPoolFull",
     "build_event_sink",
 ]
@@ -48,6 +48,11 @@ def _map_event_type(event_type: str) -> Optional[ObservabilityEventType]:
     return mapping.get(event_type)
 
 
+def is_observable(event_type: str) -> bool:
+    """Whether ``event_type`` maps to an observability event at all."""
+    return _map_event_type(event_type) is not None
+
+
 def build_observability_event(
     event_type: str,
     payload: Dict[str, Any] | None,
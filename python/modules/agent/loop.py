@@ -1,17 +1,24 @@
 from __future__ import annotations
 
+import asyncio
 import queue
 import threading
 import time
+from concurrent.futures import Future
 from typing import Any, Callable, Optional
 
 from ..llm.temporal import TemporalContext
 from ..cognitive_flow import CognitiveFlow, PresenceState, TransitionEngine
 from ..cognitive_flow.liminal import is_liminal_phase
 
-from .event_schema import build_observability_event
+from .event_schema import build_observability_event, is_observable
 from .events import AgentEvent, EventType
+from .metrics import Counter, MetricsRegistry
 from .sinks import EventSink, NullSink
+from .workers import CancellationToken, WorkerPool
+
+class _Stop:
+    """Wakes a blocked ``run()``; only the token of the current run stops it."""
 
 
 class AgentLoop:
@@ -31,6 +38,8 @@ class AgentLoop:
         metrics_enabled: bool = True,
         event_sink: EventSink | None = None,
         observability_enabled: bool = True,
+        worker_pool: WorkerPool | None = None,
+        metrics_registry: MetricsRegistry | None = None,
     ) -> None:
         if (llm is None) == (handler is None):
             raise ValueError("Provide exactly one of llm or handler")
@@ -52,8 +61,11 @@ class AgentLoop:
         self._task_lock = threading.Lock()
         self._task_counter = 0
         self._active_task_id = 0
-        self._active_thread: threading.Thread | None = None
-        self._active_cancel: threading.Event | None = None
+        self._active_future: Future | None = None
+        self._active_cancel: CancellationToken | None = None
+        self._worker_pool = worker_pool
+        self._owns_pool = worker_pool is None
+        self._stop_token: _Stop | None = None
         self._pending_item: dict | None = None
         self._cancel_grace_until = 0.0
 
@@ -81,17 +93,47 @@ class AgentLoop:
         self._phase_transitions = 0
         self._liminal_transitions = 0
 
+        # Latency histograms live in a registry that can be shared across
+        # loops and exported with MetricsServer; metric objects are resolved
+        # once here so observations skip the registry lookup.
+        self.metrics_registry = metrics_registry or MetricsRegistry()
+        registry = self.metrics_registry
+        self._event_counters: dict[str, Counter] = {}
+        self._llm_latency = registry.histogram(
+            "agent_llm_latency_seconds", help="LLM generation time per task"
+        )
+        self._task_latency = registry.histogram(
+            "agent_task_latency_seconds", help="Time from input_received to output_ready"
+        )
+        self._queue_delay = registry.histogram(
+            "agent_input_queue_delay_seconds", help="Age of an input item when a worker picks it up"
+        )
+        self._stt_latency = registry.histogram(
+            "agent_stt_latency_seconds", help="Transcription time reported by the STT stage"
+        )
+        self._cancel_counter = registry.counter("agent_cancellations_total", help="Cancelled tasks")
+
     def _next_task_id(self) -> int:
         with self._task_lock:
             self._task_counter += 1
             return self._task_counter
 
-    def _set_active(self, task_id: int, cancel_event: threading.Event, thread: threading.Thread | None) -> None:
+    def _set_active(self, task_id: int, cancel_event: CancellationToken, future: Future | None) -> None:
         self._active_task_id = task_id
         self._active_cancel = cancel_event
-        self._active_thread = thread
+        self._active_future = future
         self._touch_presence(task_id=task_id)
 
+    def _task_running(self) -> bool:
+        return self._active_future is not None and not self._active_future.done()
+
+    def _pool(self) -> WorkerPool:
+        # A private pool needs two workers so ask() can start a superseding
+        # task while the cancelled one unwinds; run() waits for it instead.
+        if self._worker_pool is None:
+            self._worker_pool = WorkerPool(workers=2, name="agent-loop")
+        return self._worker_pool
+
     def _is_active(self, task_id: int, cancel_event: threading.Event) -> bool:
         if cancel_event.is_set():
             return False
@@ -136,27 +178,50 @@ class AgentLoop:
                 )
 
     def _emit_observability(self, event_type: EventType, payload: dict, *, task_id: int | None = None) -> None:
-        if not self.observability_enabled:
+        if not self.observability_enabled or isinstance(self.event_sink, NullSink) or not is_observable(event_type):
+            # skip building the event and presence snapshot nobody will read
             return
-        state = self.temporal.state if self.temporal else None
-        event = build_observability_event(
+        # Capture what changes under us, presence included, on this thread;
+        # batching sinks build the rest of the event on their writer thread.
+        raw = (
             event_type,
             payload,
-            state,
+            time.time(),
+            self.temporal.state if self.temporal else None,
             str(task_id or self._active_task_id),
+            self.presence.snapshot() if self.presence is not None else None,
         )
-        if event is None:
-            return
-        if self.presence is not None:
-            event["presence"] = self.presence.snapshot()
         try:
-            self.event_sink.emit(event)
+            emit_raw = getattr(self.event_sink, "emit_raw", None)
+            if emit_raw is not None:
+                emit_raw(raw, self._build_event)
+                return
+            event = self._build_event(raw)
+            if event is not None:
+                self.event_sink.emit(event)
         except Exception:
             # observability must never break the agent loop
             pass
 
+    def _build_event(self, raw: tuple) -> dict | None:
+        event_type, payload, timestamp, state, task_id, presence = raw
+        event = build_observability_event(event_type, payload, state, task_id, timestamp=timestamp)
+        if event is not None and presence is not None:
+            event["presence"] = presence
+        return event
+
+    def _count_event(self, event_type: EventType) -> None:
+        counter = self._event_counters.get(event_type)
+        if counter is None:
+            counter = self._event_counters[event_type] = self.metrics_registry.counter(
+                "agent_events_total", {"type": event_type}, help="Events emitted by the agent loop"
+            )
+        counter.inc()
+
     def _emit(self, event_type: EventType, payload: dict | None = None, *, task_id: int | None = None) -> None:
         payload = payload or {}
+        if self.metrics_enabled:
+            self._count_event(event_type)
         self._touch_presence(task_id=task_id)
         self._step_flow(event_type, payload, task_id=task_id)
         if self.on_event:
@@ -184,6 +249,8 @@ class AgentLoop:
             return
         setattr(cancel_event, "_counted", True)
         self._increment_metric("cancellations", 1)
+        if self.metrics_enabled:
+            self._cancel_counter.inc()
 
     def _increment_metric(self, key: str, delta: int = 1) -> None:
         with self._task_lock:
@@ -195,6 +262,10 @@ class AgentLoop:
             if self._phase_last is not None and self._phase_last_ts is not None:
                 elapsed = max(0.0, now - self._phase_last_ts)
                 self._phase_durations[self._phase_last] = self._phase_durations.get(self._phase_last, 0.0) + elapsed
+                if self.metrics_enabled:
+                    self.metrics_registry.histogram(
+                        "agent_phase_duration_seconds", {"phase": self._phase_last}, help="Time spent per cognitive phase"
+                    ).observe(elapsed)
             self._phase_last = after
             self._phase_last_ts = now
             self._phase_counts[after] = self._phase_counts.get(after, 0) + 1
@@ -214,6 +285,12 @@ class AgentLoop:
             snapshot["last_phase"] = self._phase_last
             if self._phase_last_ts is not None:
                 snapshot["last_phase_age"] = max(0.0, time.time() - self._phase_last_ts)
+        snapshot["latency"] = {
+            "llm": self._llm_latency.snapshot().summary(),
+            "task": self._task_latency.snapshot().summary(),
+            "input_queue_delay": self._queue_delay.snapshot().summary(),
+            "stt": self._stt_latency.snapshot().summary(),
+        }
         self._emit("metrics", snapshot)
 
     def _remember_question(self, question: str) -> None:
@@ -248,32 +325,48 @@ class AgentLoop:
         return self.handler(question)
 
     def _cancel_active(self, reason: str) -> None:
-        if self._active_thread and self._active_thread.is_alive() and self._active_cancel:
-            self._active_cancel.set()
+        if self._task_running() and self._active_cancel:
+            self._active_cancel.cancel(reason)
             self._emit("cancelled", {"reason": reason}, task_id=self._active_task_id)
             self._track_cancellation(self._active_cancel)
             if self.cancel_grace_ms:
                 self._cancel_grace_until = time.time() + (self.cancel_grace_ms / 1000.0)
 
-    def _start_task(self, item: dict) -> None:
+    def _consume_grace(self) -> float:
+        wait = 0.0
+        if self._cancel_grace_until:
+            wait = max(0.0, self._cancel_grace_until - time.time())
+            self._cancel_grace_until = 0.0
+        return wait
+
+    def _observe_input(self, item: dict) -> None:
+        timestamp = item.get("timestamp")
+        if isinstance(timestamp, (int, float)):
+            self._queue_delay.observe(max(0.0, time.time() - timestamp))
+        stt_duration = item.get("stt_duration")
+        if isinstance(stt_duration, (int, float)):
+            self._stt_latency.observe(stt_duration)
+
+    def _start_task(self, item: dict, *, block: bool = True) -> Future:
         task_id = self._next_task_id()
-        cancel_event = threading.Event()
-        thread = threading.Thread(
-            target=self._process_item,
-            args=(item, task_id, cancel_event),
-            daemon=True,
-        )
-        self._set_active(task_id, cancel_event, thread)
-        thread.start()
+        cancel_event = CancellationToken()
+        self._set_active(task_id, cancel_event, None)
+        future = self._pool().submit(self._process_item, item, task_id, cancel_event, block=block)
+        self._active_future = future
+        return future
 
-    def _process_item(self, item: dict, task_id: int, cancel_event: threading.Event) -> None:
+    def _process_item(self, item: dict, task_id: int, cancel_event: threading.Event) -> dict | None:
+        payload = None
+        received = time.perf_counter()
         try:
             self._increment_metric("inputs", 1)
+            if self.metrics_enabled:
+                self._observe_input(item)
             self._emit("input_received", {"item": item}, task_id=task_id)
             self._transition("listening", task_id=task_id)
 
             if item.get("type") != "question":
-                return
+                return None
 
             question = item.get("text", "")
             self._remember_question(question)
@@ -281,7 +374,7 @@ class AgentLoop:
             if cancel_event.is_set():
                 self._emit("cancelled", {"question": question}, task_id=task_id)
                 self._track_cancellation(cancel_event)
-                return
+                return None
 
             self._emit("llm_started", {"question": question}, task_id=task_id)
             self._transition("thinking", task_id=task_id)
@@ -289,11 +382,13 @@ class AgentLoop:
             start = time.time()
             result = self._process(question, cancel_event)
             duration = time.time() - start
+            if self.metrics_enabled:
+                self._llm_latency.observe(duration)
 
             if not self._is_active(task_id, cancel_event):
                 self._emit("cancelled", {"question": question}, task_id=task_id)
                 self._track_cancellation(cancel_event)
-                return
+                return None
 
             self._emit("llm_finished", {
                 "question": question,
@@ -319,6 +414,8 @@ class AgentLoop:
 
             if payload is not None:
                 self._increment_metric("outputs", 1)
+                if self.metrics_enabled:
+                    self._task_latency.observe(time.perf_counter() - received)
                 with self._task_lock:
                     self.metrics["last_latency"] = duration
                     outputs = max(int(self.metrics.get("outputs", 0)), 1)
@@ -337,13 +434,15 @@ class AgentLoop:
 
         except Exception as exc:
             self._emit("error", {"message": str(exc)}, task_id=task_id)
+            payload = None
         finally:
             if self._is_active(task_id, cancel_event):
                 self._transition("idle", task_id=task_id)
+        return payload
 
     def handle_item(self, item: dict) -> None:
         task_id = self._next_task_id()
-        cancel_event = threading.Event()
+        cancel_event = CancellationToken()
         self._set_active(task_id, cancel_event, None)
         self._process_item(item, task_id, cancel_event)
 
@@ -364,55 +463,129 @@ class AgentLoop:
             "timestamp": time.time(),
         })
 
+    async def ask(self, text: str) -> dict | None:
+        """Answer ``text`` on the worker pool without blocking the event loop.
+
+        Follows the same latest-wins policy as ``run()``: with
+        ``cancel_on_new_input`` a newer question cancels the one in flight,
+        otherwise it waits for it. Returns the output payload, or None when
+        the task was cancelled or produced no answer. Many loops sharing one
+        ``WorkerPool`` can serve concurrent conversations from one process.
+        Raises ``WorkerPoolFull`` rather than blocking the event loop when
+        the pool's queue is full.
+        """
+        while self._task_running():
+            active = self._active_future
+            if self.cancel_on_new_input:
+                self._cancel_active("superseded")
+                break
+            if active is not None:
+                await asyncio.wait([asyncio.wrap_future(active)])
+        wait = self._consume_grace()
+        if wait:
+            await asyncio.sleep(wait)
+        future = self._start_task(
+            {
+                "type": "question",
+                "text": text,
+                "timestamp": time.time(),
+            },
+            block=False,
+        )
+        return await asyncio.wrap_future(future)
+
+    def _take_latest(self, item: Any) -> Any:
+        """Drain queued inputs so only the newest one survives (latest-wins)."""
+        while True:
+            try:
+                newer = self.input_queue.get_nowait()
+            except queue.Empty:
+                return item
+            self._ack_input()
+            if isinstance(newer, _Stop):
+                if newer is self._stop_token:
+                    return newer
+                continue
+            item = newer
+
+    def _next_input(self) -> Any:
+        """Block for the next input, skipping stop tokens left by earlier runs."""
+        while True:
+            item = self.input_queue.get()
+            self._ack_input()
+            if not isinstance(item, _Stop) or item is self._stop_token:
+                return item
+
+    def _ack_input(self) -> None:
+        try:
+            # We do not rely on queue.join(); task_done is called immediately.
+            self.input_queue.task_done()
+        except Exception:
+            pass
+
     def run(self) -> None:
         if self.input_queue is None:
             raise RuntimeError("input_queue is required for run()")
 
+        self._stop_token = _Stop()
         self.running = True
         while self.running:
-            if self._active_thread and self._active_thread.is_alive():
+            if self._task_running():
+                active = self._active_future
                 if not self.cancel_on_new_input:
-                    time.sleep(0.05)
+                    if active is not None:
+                        active.exception()
                     continue
-                try:
-                    item = self.input_queue.get(timeout=0.2)
-                except queue.Empty:
+                if self._pending_item is not None:
+                    # a superseded task is unwinding; start the newest input once it has
+                    if active is not None:
+                        active.exception()
+                    self._pending_item = self._take_latest(self._pending_item)
+                    if self._pending_item is self._stop_token:
+                        self._pending_item = None
+                        break
                     continue
+                item = self._next_input()
+                if item is self._stop_token:
+                    break
 
                 self._cancel_active("superseded")
                 # latest-wins semantics: keep only the most recent pending item
                 self._pending_item = item
                 self._transition("listening")
-                try:
-                    # We do not rely on queue.join(); task_done is called immediately.
-                    self.input_queue.task_done()
-                except Exception:
-                    pass
                 continue
 
             if self._pending_item is not None:
                 item = self._pending_item
                 self._pending_item = None
             else:
-                try:
-                    item = self.input_queue.get(timeout=0.2)
-                except queue.Empty:
-                    continue
-                try:
-                    # We do not rely on queue.join(); task_done is called immediately.
-                    self.input_queue.task_done()
-                except Exception:
-                    pass
-
-            if self._cancel_grace_until:
-                wait = self._cancel_grace_until - time.time()
-                if wait > 0:
-                    time.sleep(wait)
-                self._cancel_grace_until = 0.0
+                item = self._next_input()
+                if item is self._stop_token:
+                    break
+
+            wait = self._consume_grace()
+            if wait:
+                time.sleep(wait)
 
             self._start_task(item)
+        self.running = False
 
     def stop(self) -> None:
+        was_running = self.running
         self.running = False
         if self._active_cancel:
-            self._active_cancel.set()
+            self._active_cancel.cancel("stopped")
+        if was_running and self.input_queue is not None and self._stop_token is not None:
+            try:
+                # wake run() if it is blocked waiting for input; a token run()
+                # exits without reading is skipped by the next run()
+                self.input_queue.put_nowait(self._stop_token)
+            except queue.Full:
+                pass
+
+    def close(self) -> None:
+        """Stop, and shut down the worker pool unless it was passed in."""
+        self.stop()
+        if self._owns_pool and self._worker_pool is not None:
+            pool, self._worker_pool = self._worker_pool, None
+            pool.shutdown(wait=True)
@@ -0,0 +1,409 @@
+from __future__ import annotations
+
+import http.server
+import math
+import os
+import socketserver
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Iterable
+
+_get_ident = threading.get_ident
+
+
+def _label_key(labels: dict[str, str] | None) -> tuple[tuple[str, str], ...]:
+    if not labels:
+        return ()
+    return tuple(sorted((str(k), str(v)) for k, v in labels.items()))
+
+
+def _render_labels(labels: Iterable[tuple[str, str]], extra: tuple[str, str] | None = None) -> str:
+    items = list(labels)
+    if extra is not None:
+        items.append(extra)
+    if not items:
+        return ""
+    body = ",".join(f'{key}="{value}"' for key, value in items)
+    return "{" + body + "}"
+
+
+class _CounterShard:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+
+class Counter:
+    """Monotonic counter sharded per writing thread.
+
+    Each thread only ever mutates its own shard, so increments need no lock;
+    readers sum the shards.
+    """
+
+    def __init__(self) -> None:
+        self._shards: dict[int, _CounterShard] = {}
+        self._lock = threading.Lock()
+
+    def _new_shard(self) -> _CounterShard:
+        with self._lock:
+            shard = self._shards[_get_ident()] = _CounterShard()
+        return shard
+
+    def inc(self, amount: float = 1.0) -> None:
+        try:
+            shard = self._shards[_get_ident()]
+        except KeyError:
+            shard = self._new_shard()
+        shard.value += amount
+
+    def value(self) -> float:
+        with self._lock:
+            shards = list(self._shards.values())
+        return sum(shard.value for shard in shards)
+
+
+class Gauge:
+    """Last-value gauge; ``set`` is a single attribute store."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._value = 0.0
+
+    def set(self, value: float) -> None:
+        self._value = float(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.inc(-amount)
+
+    def value(self) -> float:
+        return self._value
+
+
+# Log-bucketed layout: each power of two from 2**MIN_EXP up to 2**MAX_EXP is
+# split into SUB_BUCKETS linear slices, bounding relative error to ~6%.
+SUB_BUCKETS = 16
+MIN_EXP = -20  # ~1 microsecond when observing seconds
+MAX_EXP = 12  # ~68 minutes
+_BUCKETS = (MAX_EXP - MIN_EXP) * SUB_BUCKETS + 2
+_EXP_OFFSET = MIN_EXP + 1
+_MANTISSA_SCALE = 2 * SUB_BUCKETS
+_MANTISSA_BIAS = SUB_BUCKETS - 1
+_frexp = math.frexp
+
+
+def _bucket_index(value: float) -> int:
+    if value <= 0.0:
+        return 0
+    mantissa, exponent = math.frexp(value)
+    if exponent <= MIN_EXP:
+        return 0
+    if exponent > MAX_EXP:
+        return _BUCKETS - 1
+    return (exponent - MIN_EXP - 1) * SUB_BUCKETS + int((mantissa - 0.5) * 2 * SUB_BUCKETS) + 1
+
+
+def bucket_upper_bound(index: int) -> float:
+    if index <= 0:
+        return math.ldexp(1.0, MIN_EXP)
+    if index >= _BUCKETS - 1:
+        return math.inf
+    exponent, sub = divmod(index - 1, SUB_BUCKETS)
+    return math.ldexp(0.5 + (sub + 1) / (2 * SUB_BUCKETS), exponent + MIN_EXP + 1)
+
+
+class _HistogramShard:
+    __slots__ = ("counts", "total")
+
+    def __init__(self) -> None:
+        self.counts = [0] * _BUCKETS
+        self.total = 0.0
+
+
+@dataclass
+class HistogramSnapshot:
+    """Point-in-time, mergeable copy of a histogram.
+
+    Quantiles and ``max`` report the upper bound of the matching bucket, so
+    they overestimate by at most one sub-bucket (~6%).
+    """
+
+    counts: list[int] = field(default_factory=lambda: [0] * _BUCKETS)
+    total: float = 0.0
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    @property
+    def max(self) -> float:
+        for index in range(len(self.counts) - 1, -1, -1):
+            if self.counts[index]:
+                return bucket_upper_bound(index)
+        return 0.0
+
+    def merge(self, other: "HistogramSnapshot") -> "HistogramSnapshot":
+        return HistogramSnapshot(
+            counts=[a + b for a, b in zip(self.counts, other.counts)],
+            total=self.total + other.total,
+        )
+
+    def quantile(self, q: float) -> float:
+        count = self.count
+        if count == 0:
+            return 0.0
+        rank = max(1, math.ceil(q * count))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return bucket_upper_bound(index)
+        return self.max
+
+    def mean(self) -> float:
+        count = self.count
+        return self.total / count if count else 0.0
+
+    def summary(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "mean": self.mean(),
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "max": self.max,
+        }
+
+
+class Histogram:
+    """HDR-style log-bucketed histogram sharded per writing thread."""
+
+    def __init__(self) -> None:
+        self._shards: dict[int, _HistogramShard] = {}
+        self._lock = threading.Lock()
+
+    def _new_shard(self) -> _HistogramShard:
+        with self._lock:
+            shard = self._shards[_get_ident()] = _HistogramShard()
+        return shard
+
+    def observe(self, value: float) -> None:
+        # _bucket_index inlined: this is the per-observation hot path
+        if value > 0.0:
+            mantissa, exponent = _frexp(value)
+            if exponent <= MIN_EXP:
+                index = 0
+            elif exponent > MAX_EXP:
+                index = _BUCKETS - 1
+            else:
+                index = (exponent - _EXP_OFFSET) * SUB_BUCKETS + int(mantissa * _MANTISSA_SCALE) - _MANTISSA_BIAS
+        else:
+            index = 0
+        try:
+            shard = self._shards[_get_ident()]
+        except KeyError:
+            shard = self._new_shard()
+        shard.counts[index] += 1
+        shard.total += value
+
+    def snapshot(self) -> HistogramSnapshot:
+        with self._lock:
+            shards = list(self._shards.values())
+        merged = HistogramSnapshot()
+        for shard in shards:
+            merged = merged.merge(HistogramSnapshot(list(shard.counts), shard.total))
+        return merged
+
+
+@dataclass
+class RegistrySnapshot:
+    """Plain-data copy of a registry; snapshots from several registries merge."""
+
+    counters: dict[tuple[str, tuple[tuple[str, str], ...]], float] = field(default_factory=dict)
+    gauges: dict[tuple[str, tuple[tuple[str, str], ...]], float] = field(default_factory=dict)
+    histograms: dict[tuple[str, tuple[tuple[str, str], ...]], HistogramSnapshot] = field(default_factory=dict)
+    help: dict[str, str] = field(default_factory=dict)
+
+    def merge(self, other: "RegistrySnapshot") -> "RegistrySnapshot":
+        merged = RegistrySnapshot(dict(self.counters), dict(self.gauges), dict(self.histograms), {**self.help, **other.help})
+        for key, value in other.counters.items():
+            merged.counters[key] = merged.counters.get(key, 0.0) + value
+        merged.gauges.update(other.gauges)
+        for key, hist in other.histograms.items():
+            merged.histograms[key] = merged.histograms[key].merge(hist) if key in merged.histograms else hist
+        return merged
+
+    def to_text(self) -> str:
+        """Render in the Prometheus text exposition format."""
+        lines: list[str] = []
+
+        def header(name: str, kind: str) -> None:
+            if name in self.help:
+                lines.append(f"# HELP {name} {self.help[name]}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        for kind, family in (("counter", self.counters), ("gauge", self.gauges)):
+            for name in sorted({key[0] for key in family}):
+                header(name, kind)
+                for (metric, labels), value in sorted(family.items()):
+                    if metric == name:
+                        lines.append(f"{name}{_render_labels(labels)} {value:g}")
+
+        for name in sorted({key[0] for key in self.histograms}):
+            header(name, "histogram")
+            for (metric, labels), hist in sorted(self.histograms.items(), key=lambda item: item[0]):
+                if metric != name:
+                    continue
+                cumulative = 0
+                for index, bucket_count in enumerate(hist.counts):
+                    if not bucket_count:
+                        continue
+                    cumulative += bucket_count
+                    bound = bucket_upper_bound(index)
+                    if math.isinf(bound):
+                        continue
+                    lines.append(f"{name}_bucket{_render_labels(labels, ('le', f'{bound:.6g}'))} {cumulative}")
+                lines.append(f"{name}_bucket{_render_labels(labels, ('le', '+Inf'))} {hist.count}")
+                lines.append(f"{name}_sum{_render_labels(labels)} {hist.total:g}")
+                lines.append(f"{name}_count{_render_labels(labels)} {hist.count}")
+
+        for name in sorted({key[0] for key in self.histograms}):
+            if name in self.help:
+                lines.append(f"# HELP {name}_quantile {self.help[name]} (estimated quantiles)")
+            lines.append(f"# TYPE {name}_quantile gauge")
+            for (metric, labels), hist in sorted(self.histograms.items(), key=lambda item: item[0]):
+                if metric != name:
+                    continue
+                for q in (0.5, 0.95, 0.99):
+                    lines.append(f"{name}_quantile{_render_labels(labels, ('quantile', str(q)))} {hist.quantile(q):g}")
+        return "\n".join(lines) + "\n"
+
+
+class MetricsRegistry:
+    """Named counters, gauges and histograms with optional labels.
+
+    Lookups create metrics on first use; hold on to the returned object on
+    hot paths so each observation skips the registry lock.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: dict[tuple[str, tuple[tuple[str, str], ...]], Counter] = {}
+        self._gauges: dict[tuple[str, tuple[tuple[str, str], ...]], Gauge] = {}
+        self._histograms: dict[tuple[str, tuple[tuple[str, str], ...]], Histogram] = {}
+        self._help: dict[str, str] = {}
+
+    def _get(self, family: dict, factory: type, name: str, labels: dict[str, str] | None, help: str) -> Any:
+        key = (name, _label_key(labels))
+        metric = family.get(key)
+        if metric is None:
+            with self._lock:
+                metric = family.get(key)
+                if metric is None:
+                    metric = factory()
+                    family[key] = metric
+                    if help:
+                        self._help.setdefault(name, help)
+        return metric
+
+    def counter(self, name: str, labels: dict[str, str] | None = None, *, help: str = "") -> Counter:
+        return self._get(self._counters, Counter, name, labels, help)
+
+    def gauge(self, name: str, labels: dict[str, str] | None = None, *, help: str = "") -> Gauge:
+        return self._get(self._gauges, Gauge, name, labels, help)
+
+    def histogram(self, name: str, labels: dict[str, str] | None = None, *, help: str = "") -> Histogram:
+        return self._get(self._histograms, Histogram, name, labels, help)
+
+    def snapshot(self) -> RegistrySnapshot:
+        with self._lock:
+            counters = dict(self._counters)
+            gauges = dict(self._gauges)
+            histograms = dict(self._histograms)
+            help_text = dict(self._help)
+        return RegistrySnapshot(
+            counters={key: metric.value() for key, metric in counters.items()},
+            gauges={key: metric.value() for key, metric in gauges.items()},
+            histograms={key: metric.snapshot() for key, metric in histograms.items()},
+            help=help_text,
+        )
+
+    def render_text(self) -> str:
+        return self.snapshot().to_text()
+
+
+class _HTTPHandler(http.server.BaseHTTPRequestHandler):
+    registry: MetricsRegistry
+
+    def do_GET(self) -> None:  # noqa: N802 - stdlib hook name
+        if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = self.registry.render_text().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        return
+
+
+class _UnixHandler(socketserver.StreamRequestHandler):
+    registry: MetricsRegistry
+
+    def handle(self) -> None:
+        self.wfile.write(self.registry.render_text().encode("utf-8"))
+
+
+class MetricsServer:
+    """Serves ``registry.render_text()`` over local HTTP or a UNIX socket.
+
+    Pass ``unix_path`` to listen on a UNIX socket (each connection receives
+    one exposition and is closed); otherwise an HTTP server is bound to
+    ``host:port`` and answers ``GET /metrics``. Port 0 picks a free port.
+    """
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        unix_path: str | None = None,
+    ) -> None:
+        self.registry = registry
+        self.unix_path = unix_path
+        handler: type
+        if unix_path is not None:
+            if os.path.exists(unix_path):
+                os.remove(unix_path)
+            handler = type("MetricsUnixHandler", (_UnixHandler,), {"registry": registry})
+            self._server: socketserver.BaseServer = socketserver.ThreadingUnixStreamServer(unix_path, handler)
+        else:
+            handler = type("MetricsHTTPHandler", (_HTTPHandler,), {"registry": registry})
+            self._server = http.server.ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True  # type: ignore[attr-defined]
+        self._thread: threading.Thread | None = None
+
+    @property
+    def address(self) -> Any:
+        return self._server.server_address  # type: ignore[attr-defined]
+
+    def start(self) -> "MetricsServer":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, name="metrics-server", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self.unix_path is not None and os.path.exists(self.unix_path):
+            os.remove(self.unix_path)
+        self._thread = None
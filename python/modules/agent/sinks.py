@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import abc
 import json
-from typing import Any, Protocol
+import os
+import socket
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Optional, Protocol
 
 
 class EventSink(Protocol):
@@ -18,10 +24,297 @@ class PrintSink:
         print(json.dumps(event, ensure_ascii=False, default=str))
 
 
+def _serialize(event: dict[str, Any]) -> str:
+    return json.dumps(event, ensure_ascii=False, default=str)
+
+
+EventBuilder = Callable[[tuple], Optional[dict[str, Any]]]
+
+
+class BatchingSink(abc.ABC):
+    """Base for sinks that serialize and write events off the task thread.
+
+    ``emit`` only appends to a bounded deque (append/popleft are atomic, so
+    no lock is taken); a background thread drains it in batches of up to
+    ``batch_size`` every ``flush_interval`` seconds, or sooner once a full
+    batch is waiting. Events arriving while ``max_queue`` events are already
+    waiting are dropped and counted rather than blocking the agent loop.
+    ``emit_raw`` goes further and queues the caller's raw tuple, leaving
+    the event itself to be built on the writer thread.
+    """
+
+    def __init__(self, *, max_queue: int = 10_000, batch_size: int = 256, flush_interval: float = 0.5) -> None:
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: deque[tuple[EventBuilder | None, Any]] = deque()
+        self._wakeup = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._closed = False
+        self.emitted = 0
+        self.dropped = 0
+        self.written = 0
+        self.batches = 0
+        self.errors = 0
+        self._thread = threading.Thread(target=self._drain_forever, name=type(self).__name__, daemon=True)
+        self._thread.start()
+
+    def emit(self, event: dict[str, Any]) -> None:
+        self._enqueue(None, event)
+
+    def emit_raw(self, raw: tuple, build: EventBuilder) -> None:
+        """Queue ``raw`` for ``build(raw)`` to turn into an event on the writer thread.
+
+        ``build`` may return None to skip the event.
+        """
+        self._enqueue(build, raw)
+
+    def _enqueue(self, build: EventBuilder | None, item: Any) -> None:
+        if len(self._queue) >= self.max_queue or self._closed:
+            self.dropped += 1
+            return
+        self._queue.append((build, item))
+        self.emitted += 1
+        if len(self._queue) == self.batch_size:
+            # wake the writer once per full batch; the timer covers the rest
+            self._wakeup.set()
+
+    def _take_batch(self) -> list[dict[str, Any]]:
+        batch: list[dict[str, Any]] = []
+        taken = 0
+        while taken < self.batch_size:
+            try:
+                build, item = self._queue.popleft()
+            except IndexError:
+                break
+            taken += 1
+            if build is None:
+                batch.append(item)
+                continue
+            try:
+                event = build(item)
+            except Exception:
+                self.errors += 1
+                self.dropped += 1
+                continue
+            if event is not None:
+                batch.append(event)
+        return batch
+
+    def _drain_once(self) -> None:
+        while self._queue:
+            batch = self._take_batch()
+            if not batch:
+                continue
+            try:
+                self._write_batch(batch)
+                self.written += len(batch)
+            except Exception:
+                # observability must never break the agent loop
+                self.errors += 1
+                self.dropped += len(batch)
+            self.batches += 1
+
+    def _drain_forever(self) -> None:
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self._idle.clear()
+            self._drain_once()
+            self._on_tick()
+            self._idle.set()
+            if self._closed and not self._queue:
+                return
+
+    @abc.abstractmethod
+    def _write_batch(self, batch: list[dict[str, Any]]) -> None:
+        """Write ``batch`` to the destination; raising drops and counts it."""
+
+    def _on_tick(self) -> None:
+        return
+
+    def _on_close(self) -> None:
+        return
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Block until everything emitted so far has been written."""
+        deadline = time.monotonic() + timeout
+        while self._queue or not self._idle.is_set():
+            if time.monotonic() >= deadline:
+                return False
+            self._wakeup.set()
+            time.sleep(0.001)
+        return True
+
+    def close(self, timeout: float = 5.0) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._wakeup.set()
+        self._thread.join(timeout)
+        self._on_close()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "emitted": self.emitted,
+            "dropped": self.dropped,
+            "written": self.written,
+            "batches": self.batches,
+            "errors": self.errors,
+            "queue_depth": len(self._queue),
+        }
+
+
+class RingBufferSink(BatchingSink):
+    """Keeps the most recent ``capacity`` events in memory for inspection."""
+
+    def __init__(self, capacity: int = 1_000, **kwargs: Any) -> None:
+        self._ring: deque[dict[str, Any]] = deque(maxlen=capacity)
+        super().__init__(**kwargs)
+
+    def _write_batch(self, batch: list[dict[str, Any]]) -> None:
+        self._ring.extend(batch)
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        return list(self._ring)
+
+
+class JsonlFileSink(BatchingSink):
+    """Appends JSON lines to ``path``, rotating to ``path.1``..``path.N``.
+
+    Lines are flushed to disk after each batch once ``flush_bytes`` have been
+    buffered, and at least every ``fsync_interval`` seconds otherwise.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        max_bytes: int = 10 * 1024 * 1024,
+        backup_count: int = 3,
+        flush_bytes: int = 64 * 1024,
+        fsync_interval: float = 1.0,
+        **kwargs: Any,
+    ) -> None:
+        self.path = os.fspath(path)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.flush_bytes = flush_bytes
+        self.fsync_interval = fsync_interval
+        self.rotations = 0
+        self._handle = open(self.path, "a", encoding="utf-8")
+        self._size = self._handle.tell()
+        self._unflushed = 0
+        self._last_flush = time.monotonic()
+        super().__init__(**kwargs)
+
+    def _rotate(self) -> None:
+        self._handle.close()
+        for idx in range(self.backup_count - 1, 0, -1):
+            source = f"{self.path}.{idx}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{idx + 1}")
+        if self.backup_count > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._handle = open(self.path, "a", encoding="utf-8")
+        self._size = 0
+        self.rotations += 1
+
+    def _write_batch(self, batch: list[dict[str, Any]]) -> None:
+        chunk = "".join(_serialize(event) + "\n" for event in batch)
+        encoded = len(chunk.encode("utf-8"))
+        if self._size and self._size + encoded > self.max_bytes:
+            self._handle.flush()
+            self._rotate()
+        self._handle.write(chunk)
+        self._size += encoded
+        self._unflushed += encoded
+        if self._unflushed >= self.flush_bytes:
+            self._flush_file()
+
+    def _flush_file(self) -> None:
+        self._handle.flush()
+        self._unflushed = 0
+        self._last_flush = time.monotonic()
+
+    def _on_tick(self) -> None:
+        if self._unflushed and time.monotonic() - self._last_flush >= self.fsync_interval:
+            self._flush_file()
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        done = super().flush(timeout)
+        self._flush_file()
+        return done
+
+    def _on_close(self) -> None:
+        self._flush_file()
+        self._handle.close()
+
+
+class UnixSocketSink(BatchingSink):
+    """Streams newline-delimited JSON batches to a local UNIX socket.
+
+    The connection is (re)opened lazily; while the collector is unreachable
+    each batch is dropped and counted, so a missing collector costs nothing
+    on the task thread.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], *, connect_timeout: float = 1.0, **kwargs: Any) -> None:
+        self.path = os.fspath(path)
+        self.connect_timeout = connect_timeout
+        self._sock: socket.socket | None = None
+        super().__init__(**kwargs)
+
+    def _connect(self) -> socket.socket:
+        if self._sock is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.connect_timeout)
+            try:
+                sock.connect(self.path)
+            except OSError:
+                sock.close()
+                raise
+            self._sock = sock
+        return self._sock
+
+    def _write_batch(self, batch: list[dict[str, Any]]) -> None:
+        data = "".join(_serialize(event) + "\n" for event in batch).encode("utf-8")
+        try:
+            self._connect().sendall(data)
+        except OSError:
+            self._disconnect()
+            raise
+
+    def _disconnect(self) -> None:
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            finally:
+                self._sock = None
+
+    def _on_close(self) -> None:
+        self._disconnect()
+
+
 def build_event_sink(name: str | None) -> EventSink:
+    """Build a sink from a config string.
+
+    Accepts ``print``, ``ring``, ``jsonl:<path>`` and ``unix:<socket path>``;
+    anything else yields a ``NullSink``.
+    """
     if not name:
         return NullSink()
-    name = name.lower()
-    if name == "print":
+    kind, _, target = name.partition(":")
+    kind = kind.lower()
+    if kind == "print":
         return PrintSink()
+    if kind == "ring":
+        return RingBufferSink()
+    if kind == "jsonl" and target:
+        return JsonlFileSink(target)
+    if kind == "unix" and target:
+        return UnixSocketSink(target)
     return NullSink()
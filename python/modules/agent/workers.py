@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable
+
+
+class CancellationToken(threading.Event):
+    """Cancellation flag that also notifies registered callbacks.
+
+    It is a drop-in replacement for the ``threading.Event`` passed as
+    ``cancel_event`` to LLM backends. Backends that hold a cancellable
+    resource (an HTTP response, a subprocess) register a callback with
+    ``add_callback`` so cancellation interrupts them instead of waiting for
+    the next cooperative ``is_set()`` check.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._callbacks: list[Callable[[], None]] = []
+        self._callback_lock = threading.Lock()
+        self.reason: str | None = None
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        if self.reason is None:
+            self.reason = reason
+        self.set()
+
+    def set(self) -> None:
+        with self._callback_lock:
+            if self.is_set():
+                return
+            super().set()
+            callbacks = list(self._callbacks)
+            self._callbacks.clear()
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                # a failing cleanup hook must not mask the cancellation
+                pass
+
+    def add_callback(self, callback: Callable[[], None]) -> None:
+        with self._callback_lock:
+            if not self.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def remove_callback(self, callback: Callable[[], None]) -> None:
+        with self._callback_lock:
+            try:
+                self._callbacks.remove(callback)
+            except ValueError:
+                pass
+
+
+class WorkerPoolFull(RuntimeError):
+    """Raised when a non-blocking submission hits the bounded queue limit."""
+
+
+_SHUTDOWN = object()
+
+
+class WorkerPool:
+    """Persistent worker threads fed by a bounded submission queue.
+
+    Workers block on the queue rather than polling, so an idle pool costs
+    nothing and a submission is picked up as soon as a worker is free.
+    Several ``AgentLoop`` instances can share one pool to host many
+    conversations in a single process.
+    """
+
+    def __init__(self, workers: int = 2, *, max_pending: int = 64, name: str = "agent-worker") -> None:
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        self.workers = workers
+        self.max_pending = max_pending
+        self.name = name
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._threads: list[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self.stats = {
+            "submitted": 0,
+            "dispatched": 0,
+            "completed": 0,
+            "rejected": 0,
+            "last_dispatch_latency": 0.0,
+            "avg_dispatch_latency": 0.0,
+        }
+
+    def _ensure_started(self) -> None:
+        if self._threads:
+            return
+        for idx in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"{self.name}-{idx}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _worker(self) -> None:
+        while True:
+            entry = self._queue.get()
+            if entry is _SHUTDOWN:
+                return
+            future, fn, args, kwargs, enqueued_at = entry
+            latency = time.perf_counter() - enqueued_at
+            with self._lock:
+                self.stats["dispatched"] += 1
+                self.stats["last_dispatch_latency"] = latency
+                prev_avg = float(self.stats["avg_dispatch_latency"])
+                self.stats["avg_dispatch_latency"] = prev_avg + ((latency - prev_avg) / self.stats["dispatched"])
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(fn(*args, **kwargs))
+                except BaseException as exc:
+                    future.set_exception(exc)
+            with self._lock:
+                self.stats["completed"] += 1
+
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        block: bool = True,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> Future:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("WorkerPool is shut down")
+            self._ensure_started()
+        future: Future = Future()
+        try:
+            self._queue.put((future, fn, args, kwargs, time.perf_counter()), block=block, timeout=timeout)
+        except queue.Full:
+            with self._lock:
+                self.stats["rejected"] += 1
+            raise WorkerPoolFull(f"{self.name} queue is full ({self.max_pending} pending)") from None
+        with self._lock:
+            self.stats["submitted"] += 1
+        return future
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            threads = list(self._threads)
+        for _ in threads:
+            self._queue.put(_SHUTDOWN)
+        if wait:
+            for thread in threads:
+                thread.join()
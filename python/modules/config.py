@@ -29,6 +29,18 @@ USE_BREAKER = _get(["llm", "use_breaker"], False)
 BREAKER_THRESHOLD = _get(["llm", "breaker", "failure_threshold"], 3)
 BREAKER_COOLDOWN = _get(["llm", "breaker", "cooldown_seconds"], 10)
 TEMPORAL_ENABLED = _get(["llm", "temporal_enabled"], True)
+LLM_CACHE_ENABLED = _get(["llm", "cache", "enabled"], True)
+LLM_CACHE_MAX_ENTRIES = _get(["llm", "cache", "max_entries"], 512)
+LLM_CACHE_TTL_SECONDS = _get(["llm", "cache", "ttl_seconds"], 86400)
+LLM_CACHE_NEAR_DUPLICATES = _get(["llm", "cache", "near_duplicates"], False)
+LLM_CACHE_SIMILARITY = _get(["llm", "cache", "similarity_threshold"], 0.8)
+LLM_CACHE_PATH = _get(["llm", "cache", "path"], "")
+LLM_CACHE_SCOPE = _get(["llm", "cache", "scope"], "question")
+LLM_SCHEDULER_ENABLED = _get(["llm", "scheduler", "enabled"], True)
+LLM_SCHEDULER_MAX_CONCURRENCY = _get(["llm", "scheduler", "max_concurrency"], 4)
+LLM_SCHEDULER_BACKGROUND_SHARE = _get(["llm", "scheduler", "background_share"], 0.5)
+LLM_CONTEXT_WINDOW = _get(["llm", "context_window"], 4096)
+LLM_REUSE_CONTEXT = _get(["llm", "reuse_context"], True)
 AGENT_ENABLED = _get(["agent", "enabled"], False)
 AGENT_CANCEL_ON_NEW_INPUT = _get(["agent", "cancel_on_new_input"], True)
 AGENT_CANCEL_GRACE_MS = _get(["agent", "cancel_grace_ms"], 0)
@@ -14,7 +14,8 @@ Rule: C never modifies A/B results, only selects and syncs.
 Rule: C always passes data to D (observability).
 """
 
-from typing import Literal, Optional, Dict, Any
+from collections import deque
+from typing import Deque, Literal, Optional, Dict, Any
 from dataclasses import dataclass
 import time
 
@@ -45,8 +46,8 @@ class Coordinator:
     v0.3: Will add adaptive heuristics.
     """
 
-    def __init__(self):
-        """Initialize coordinator with sub-modules."""
+    def __init__(self, max_history: int = 1000):
+        """Initialize coordinator with sub-modules; keeps the last ``max_history`` decisions."""
         from .mode_detector import ModeDetector
         from .context_sync import ContextSync
         from .cognitive_hygiene import CognitiveHygiene
@@ -76,7 +77,7 @@ class Coordinator:
 
         # Metadata
         self.last_decision: Optional[CoordinationDecision] = None
-        self.decision_history: list[CoordinationDecision] = []
+        self.decision_history: Deque[CoordinationDecision] = deque(maxlen=max_history)
         self.last_orientation: Optional[Dict[str, Any]] = None
         self.last_trajectory_error: Optional[float] = None
 
@@ -85,34 +86,36 @@ class Coordinator:
         telemetry: Optional[Dict[str, Any]],
         retrospective: Optional[Dict[str, Any]],
     ):
+        # the caller's dicts are passed through as-is and copied only when an alias is added
         telemetry = telemetry or {}
         retrospective = retrospective or {}
 
-        history_stats = dict(telemetry)
+        history_stats = telemetry
         if "diversity" in history_stats and "diversity_score" not in history_stats:
-            history_stats["diversity_score"] = history_stats["diversity"]
+            history_stats = {**history_stats, "diversity_score": history_stats["diversity"]}
 
         beliefs = retrospective.get("beliefs")
         if beliefs is None and "stability_score" in retrospective:
             beliefs = [{"stability_score": retrospective.get("stability_score")}]
 
-        temporal_metrics = dict(retrospective.get("temporal_metrics") or {})
-        if "contradiction_rate" in retrospective and "contradiction_rate" not in temporal_metrics:
-            temporal_metrics["contradiction_rate"] = retrospective.get("contradiction_rate")
-        if "contradictions" in retrospective and "contradiction_rate" not in temporal_metrics:
-            temporal_metrics["contradiction_rate"] = retrospective.get("contradictions")
-
-        immunity_signals = dict(retrospective.get("immunity_signals") or {})
-        if "drift_pressure" in retrospective and "drift_pressure" not in immunity_signals:
-            immunity_signals["drift_pressure"] = retrospective.get("drift_pressure")
-        if "drift" in retrospective and "drift_pressure" not in immunity_signals:
-            immunity_signals["drift_pressure"] = retrospective.get("drift")
-
-        conviction_inputs = dict(retrospective.get("conviction_inputs") or {})
-        if "confidence_budget" in retrospective and "confidence_budget" not in conviction_inputs:
-            conviction_inputs["confidence_budget"] = retrospective.get("confidence_budget")
-        if "confidence" in retrospective and "confidence_budget" not in conviction_inputs:
-            conviction_inputs["confidence_budget"] = retrospective.get("confidence")
+        temporal_metrics = self._with_alias(
+            retrospective.get("temporal_metrics") or {},
+            retrospective,
+            "contradiction_rate",
+            ("contradiction_rate", "contradictions"),
+        )
+        immunity_signals = self._with_alias(
+            retrospective.get("immunity_signals") or {},
+            retrospective,
+            "drift_pressure",
+            ("drift_pressure", "drift"),
+        )
+        conviction_inputs = self._with_alias(
+            retrospective.get("conviction_inputs") or {},
+            retrospective,
+            "confidence_budget",
+            ("confidence_budget", "confidence"),
+        )
 
         return {
             "history_stats": history_stats,
@@ -122,6 +125,21 @@ class Coordinator:
             "conviction_inputs": conviction_inputs,
         }
 
+    @staticmethod
+    def _with_alias(
+        signals: Dict[str, Any],
+        retrospective: Dict[str, Any],
+        key: str,
+        aliases: tuple[str, ...],
+    ) -> Dict[str, Any]:
+        """``signals`` with ``key`` filled from the first of ``aliases`` found in ``retrospective``."""
+        if key in signals:
+            return signals
+        for alias in aliases:
+            if alias in retrospective:
+                return {**signals, key: retrospective.get(alias)}
+        return signals
+
     def choose_mode(
         self,
         input_data: str,
@@ -203,18 +221,21 @@ class Coordinator:
         self.last_orientation["trajectory_bias"] = trajectory_bias
         self.last_orientation["adaptive_bias"] = adaptive_bias
 
-        coordination_bias = 0.0
+        # one field read per decision: every pull runs the registry's stateful stages
+        field_metrics: Optional[Dict[str, float]] = None
         if self.field_adapter is not None:
-            metrics = self.field_adapter.pull_field_metrics()
-            coordination_bias = self.field_coordination.compute(metrics)
+            field_metrics = self.field_adapter.pull_field_metrics()
+
+        coordination_bias = 0.0
+        if field_metrics is not None:
+            coordination_bias = self.field_coordination.compute(field_metrics)
         context["coordination_bias"] = coordination_bias
 
         decision = self.choose_mode(input_data, context, system_load=system_load)
         consensus_adjustment = 0.0
-        if self.field_adapter is not None:
-            metrics = self.field_adapter.pull_field_metrics()
+        if field_metrics is not None:
             consensus_adjustment = self.consensus.compute(
-                metrics,
+                field_metrics,
                 decision.mode,
                 decision.confidence,
             )
@@ -234,8 +255,8 @@ class Coordinator:
         self.meta.adapt_adaptive_bias(self.adaptive)
 
         field_bias = {}
-        if self.field_adapter is not None and self.field_bias is not None:
-            field_bias = self.field_adapter.compute_field_bias(self.field_bias)
+        if field_metrics is not None and self.field_bias is not None:
+            field_bias = self.field_bias.compute_bias(field_metrics)
             self.confidence_dynamics.alpha += field_bias.get("confidence_bias", 0.0)
             self.confidence_dynamics.max_delta += field_bias.get("trajectory_bias", 0.0)
             self.adaptive.apply_external_bias(field_bias.get("orientation_bias", 0.0))
@@ -6,6 +6,8 @@ from .evolution import FieldEvolution
 from .mesh import CognitiveMesh
 from .morphogenesis import FieldMorphogenesis
 from .resonance import FieldResonance
+from .metrics_engine import FieldMetricsEngine
+from .pipeline import FieldPipeline
 from .reflexivity import FieldReflexivity
 from .bias import FieldBias
 from .consensus import ConsensusEngine
@@ -17,6 +19,8 @@ __all__ = [
     "FieldRegistry",
     "FieldAdapter",
     "FieldResonance",
+    "FieldMetricsEngine",
+    "FieldPipeline",
     "FieldBias",
     "FieldDampening",
     "FieldEvolution",
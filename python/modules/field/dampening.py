@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict
+from typing import Callable, Dict, Sequence
 
 
 def _clamp(value: float, low: float = 0.0, high: float = 1.0) -> float:
@@ -34,3 +34,17 @@ class FieldDampening:
             smoothed[key] = updated
             self._state[key] = updated
         return smoothed
+
+    def compile(self, keys: Sequence[str]) -> Callable[[list[float]], None]:
+        """In-place ``apply`` over metric values laid out in ``keys`` order."""
+        keys = tuple(keys)
+
+        def step(values: list[float]) -> None:
+            alpha = self.alpha
+            state = self._state
+            for index, key in enumerate(keys):
+                current = _clamp(values[index])
+                updated = _clamp(alpha * current + (1.0 - alpha) * state.get(key, current))
+                values[index] = state[key] = updated
+
+        return step
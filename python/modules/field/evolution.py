@@ -1,6 +1,12 @@
 from __future__ import annotations
 
-from typing import Dict
+from typing import Callable, Dict, Sequence
+
+WEIGHT_KEYS = {
+    "orientation_coherence": "coherence_weight",
+    "confidence_alignment": "alignment_weight",
+    "trajectory_tension": "tension_weight",
+}
 
 
 def _clamp(value: float, low: float = 0.5, high: float = 2.0) -> float:
@@ -44,3 +50,23 @@ class FieldEvolution:
         )
 
         return dict(self.state)
+
+    def compile(self, keys: Sequence[str]) -> Callable[[list[float]], None]:
+        """``update`` followed by the registry's weighting, in place over values in ``keys`` order."""
+        slots = {key: index for index, key in enumerate(keys)}
+        inputs = [(weight, slots.get(metric)) for metric, weight in WEIGHT_KEYS.items()]
+        weights = [WEIGHT_KEYS.get(key) for key in keys]
+
+        def step(values: list[float]) -> None:
+            if not values:
+                return
+            state = self.state
+            lr = self.lr
+            for weight, slot in inputs:
+                metric = values[slot] if slot is not None else 0.0
+                state[weight] = _clamp(state[weight] + lr * (metric - 0.5))
+            for index, weight in enumerate(weights):
+                scaled = values[index] * state[weight] if weight is not None else values[index]
+                values[index] = 0.0 if scaled < 0.0 else 1.0 if scaled > 1.0 else scaled
+
+        return step
@@ -1,6 +1,17 @@
 from __future__ import annotations
 
-from typing import Dict
+from typing import Callable, Dict, Sequence
+
+PATTERN_KEYS = {
+    "orientation_coherence": "coherence_pattern",
+    "confidence_alignment": "alignment_pattern",
+    "trajectory_tension": "tension_pattern",
+}
+
+
+def pattern_key(metric: str) -> str:
+    base = metric.replace("orientation_", "").replace("confidence_", "").replace("trajectory_", "")
+    return f"{base}_pattern"
 
 
 def _clamp(value: float, low: float = 0.0, high: float = 1.0) -> float:
@@ -50,3 +61,22 @@ class CognitiveMesh:
         )
 
         return dict(self.mesh_state)
+
+    def compile(self, keys: Sequence[str]) -> Callable[[list[float]], None]:
+        """``update`` followed by the registry's pattern blend, in place over values in ``keys`` order."""
+        slots = {key: index for index, key in enumerate(keys)}
+        inputs = [(pattern, slots.get(metric)) for metric, pattern in PATTERN_KEYS.items()]
+        patterns = [pattern_key(key) for key in keys]
+
+        def step(values: list[float]) -> None:
+            if not values:
+                return
+            state = self.mesh_state
+            lr = self.lr
+            for pattern, slot in inputs:
+                metric = values[slot] if slot is not None else 0.0
+                state[pattern] = _clamp(state[pattern] + lr * (metric - state[pattern]))
+            for index, pattern in enumerate(patterns):
+                values[index] = _clamp((values[index] + state.get(pattern, 0.0)) / 2.0)
+
+        return step
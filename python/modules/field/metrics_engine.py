@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import math
+from bisect import bisect_left, insort
+from typing import Iterable
+
+from .state import FieldNodeState
+
+# incremental pair sums drift in floating point; rebuild after this many changes
+_RESYNC_EVERY = 4096
+
+
+def _clamp(value: float, low: float = 0.0, high: float = 1.0) -> float:
+    if value < low:
+        return low
+    if value > high:
+        return high
+    return value
+
+
+class _KeySpread:
+    """Sorted values of one orientation key with their sum of pairwise distances."""
+
+    __slots__ = ("values", "total", "abs_total", "pair_sum", "changes")
+
+    def __init__(self) -> None:
+        self.values: list[float] = []
+        self.total = 0.0
+        self.abs_total = 0.0
+        self.pair_sum = 0.0
+        self.changes = 0
+
+    def _distance_to_all(self, value: float, index: int) -> float:
+        """Sum of |value - v| over the stored values, ``index`` being value's sorted position."""
+        values = self.values
+        count = len(values)
+        if index <= count // 2:
+            below = sum(values[:index])
+        else:
+            below = self.total - sum(values[index:])
+        above = self.total - below
+        return value * index - below + above - value * (count - index)
+
+    def add(self, value: float) -> None:
+        index = bisect_left(self.values, value)
+        self.pair_sum += self._distance_to_all(value, index)
+        self.values.insert(index, value)
+        self.total += value
+        self.abs_total += abs(value)
+        self._changed()
+
+    def remove(self, value: float) -> None:
+        index = bisect_left(self.values, value)
+        del self.values[index]
+        self.total -= value
+        self.abs_total -= abs(value)
+        self.pair_sum -= self._distance_to_all(value, index)
+        self._changed()
+
+    def _changed(self) -> None:
+        self.changes += 1
+        if self.changes >= _RESYNC_EVERY:
+            self.resync()
+
+    def resync(self) -> None:
+        values = self.values
+        count = len(values)
+        self.total = math.fsum(values)
+        self.abs_total = math.fsum(abs(value) for value in values)
+        self.pair_sum = math.fsum(value * (2 * index - count + 1) for index, value in enumerate(values))
+        self.changes = 0
+
+
+def _cross_distance(left: _KeySpread, right: _KeySpread) -> float:
+    """Sum of |a - b| over every a in ``left`` and b in ``right``, by merging the sorted values."""
+    values = left.values
+    count = len(values)
+    index = 0
+    below = 0.0
+    result = 0.0
+    for value in right.values:
+        while index < count and values[index] < value:
+            below += values[index]
+            index += 1
+        result += value * index - below + (left.total - below) - value * (count - index)
+    return result
+
+
+class _KeyGroup:
+    """Nodes reporting the same set of orientation keys, with a spread per key."""
+
+    __slots__ = ("count", "spreads")
+
+    def __init__(self, keys: frozenset[str]) -> None:
+        self.count = 0
+        self.spreads = {key: _KeySpread() for key in keys}
+
+
+class FieldMetricsEngine:
+    """Resonance metrics maintained as nodes join, change and leave the field.
+
+    ``orientation_coherence`` is one minus the mean pairwise orientation
+    distance, where a pair's distance is the mean absolute difference over
+    the keys either node reports (a missing key counts as 0, and a pair
+    with no keys has distance 0). Nodes are grouped by the set of keys they
+    report, since every pair between two groups shares one key union. Each
+    key of a group keeps its values sorted with the sum of their pairwise
+    differences, so an update costs a bisect and a partial sum per key
+    instead of a pass over every pair. When all nodes report the same keys
+    ``metrics`` costs O(K); pairs across G key sets add a merge of their
+    sorted values per shared key, O(G^2 * N) at worst. Confidence alignment
+    and trajectory tension come from sorted value lists.
+
+    ``metrics`` is cached until the next change.
+    """
+
+    def __init__(self, nodes: Iterable[FieldNodeState] = ()) -> None:
+        self._groups: dict[frozenset[str], _KeyGroup] = {}
+        self._confidence: list[float] = []
+        self._errors: list[float] = []
+        self._count = 0
+        self._cached: dict[str, float] | None = None
+        for node in nodes:
+            self.add(node)
+
+    def __len__(self) -> int:
+        return self._count
+
+    @staticmethod
+    def _confidence_of(node: FieldNodeState) -> float | None:
+        conf = node.confidence.get("smoothed")
+        if conf is None:
+            conf = node.confidence.get("raw")
+        return float(conf) if conf is not None else None
+
+    def add(self, node: FieldNodeState) -> None:
+        self._count += 1
+        keys = frozenset(node.orientation)
+        group = self._groups.get(keys)
+        if group is None:
+            group = self._groups[keys] = _KeyGroup(keys)
+        group.count += 1
+        for key, value in node.orientation.items():
+            group.spreads[key].add(float(value))
+        conf = self._confidence_of(node)
+        if conf is not None:
+            insort(self._confidence, conf)
+        err = node.trajectory.get("error")
+        if err is not None:
+            insort(self._errors, float(err))
+        self._cached = None
+
+    def remove(self, node: FieldNodeState) -> None:
+        self._count -= 1
+        keys = frozenset(node.orientation)
+        group = self._groups[keys]
+        group.count -= 1
+        if not group.count:
+            del self._groups[keys]
+        else:
+            for key, value in node.orientation.items():
+                group.spreads[key].remove(float(value))
+        conf = self._confidence_of(node)
+        if conf is not None:
+            del self._confidence[bisect_left(self._confidence, conf)]
+        err = node.trajectory.get("error")
+        if err is not None:
+            del self._errors[bisect_left(self._errors, float(err))]
+        self._cached = None
+
+    def replace(self, old: FieldNodeState | None, new: FieldNodeState) -> None:
+        if old is not None:
+            self.remove(old)
+        self.add(new)
+
+    def metrics(self) -> dict[str, float]:
+        if self._cached is None:
+            if not self._count:
+                self._cached = {
+                    "orientation_coherence": 0.0,
+                    "confidence_alignment": 0.0,
+                    "trajectory_tension": 0.0,
+                }
+            else:
+                self._cached = {
+                    "orientation_coherence": self._orientation_coherence(),
+                    "confidence_alignment": self._confidence_alignment(),
+                    "trajectory_tension": self._trajectory_tension(),
+                }
+        return dict(self._cached)
+
+    def _orientation_coherence(self) -> float:
+        count = self._count
+        if count < 2:
+            return 1.0
+        groups = list(self._groups.items())
+        distance = 0.0
+        for index, (keys, group) in enumerate(groups):
+            if keys:
+                distance += sum(spread.pair_sum for spread in group.spreads.values()) / len(keys)
+            for other_keys, other in groups[index + 1 :]:
+                union = keys | other_keys
+                cross = 0.0
+                for key in union:
+                    mine = group.spreads.get(key)
+                    theirs = other.spreads.get(key)
+                    if mine is not None and theirs is not None:
+                        cross += _cross_distance(mine, theirs)
+                    elif mine is not None:
+                        cross += mine.abs_total * other.count
+                    else:
+                        cross += theirs.abs_total * group.count
+                distance += cross / len(union)
+        avg_distance = distance / (count * (count - 1) / 2)
+        return _clamp(1.0 - _clamp(avg_distance))
+
+    def _confidence_alignment(self) -> float:
+        values = self._confidence
+        if len(values) < 2:
+            return 1.0 if values else 0.0
+        return _clamp(1.0 - _clamp(values[-1] - values[0]))
+
+    def _trajectory_tension(self) -> float:
+        values = self._errors
+        if len(values) < 2:
+            return 0.0 if not values else _clamp(values[0])
+        return _clamp(values[-1] - values[0])
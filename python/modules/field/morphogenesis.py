@@ -1,6 +1,14 @@
 from __future__ import annotations
 
-from typing import Dict
+from typing import Callable, Dict, Sequence
+
+from .mesh import PATTERN_KEYS, CognitiveMesh
+
+SCALE_KEYS = {
+    "orientation_coherence": "coherence_scale",
+    "confidence_alignment": "alignment_scale",
+    "trajectory_tension": "tension_scale",
+}
 
 
 def _clamp(value: float, low: float = 0.5, high: float = 1.5) -> float:
@@ -58,3 +66,25 @@ class FieldMorphogenesis:
         )
 
         return dict(self.morphology)
+
+    def compile(self, keys: Sequence[str], mesh: CognitiveMesh) -> Callable[[list[float]], None]:
+        """``update`` against ``mesh`` followed by the registry's scaling, in place over values in ``keys`` order."""
+        slots = {key: index for index, key in enumerate(keys)}
+        inputs = [(SCALE_KEYS[metric], PATTERN_KEYS[metric], slots.get(metric)) for metric in SCALE_KEYS]
+        scales = [SCALE_KEYS.get(key) for key in keys]
+
+        def step(values: list[float]) -> None:
+            if not values:
+                return
+            morphology = self.morphology
+            patterns = mesh.mesh_state
+            lr = self.lr
+            for scale, pattern, slot in inputs:
+                metric = values[slot] if slot is not None else 0.0
+                target = 0.5 * patterns.get(pattern, 0.0) + 0.5 * metric
+                morphology[scale] = _clamp(morphology[scale] + lr * (target - morphology[scale]))
+            for index, scale in enumerate(scales):
+                scaled = values[index] * morphology[scale] if scale is not None else values[index]
+                values[index] = 0.0 if scaled < 0.0 else 1.0 if scaled > 1.0 else scaled
+
+        return step
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import time
+from typing import Callable, Sequence
+
+from .dampening import FieldDampening
+from .evolution import FieldEvolution
+from .mesh import CognitiveMesh
+from .morphogenesis import FieldMorphogenesis
+from .reflexivity import FieldReflexivity
+from .topology import CognitiveTopology
+
+Step = Callable[[list[float]], None]
+
+
+def _overrides(stage: object, base: type, *names: str) -> bool:
+    return any(getattr(type(stage), name) is not getattr(base, name) for name in names)
+
+
+class FieldPipeline:
+    """The registry's post-resonance stages compiled for one set of metric keys.
+
+    Values live in a list of floats indexed by ``slots``; each stage is a
+    closure built by the stage object's ``compile`` with its key lookups
+    resolved up front, and updates that list in place. Stage state
+    (dampening EMA, weights, mesh patterns, morphology, edges, trends) is
+    kept on the stage objects exactly as the dict-based methods keep it.
+    A stage whose class overrides its dict method runs through that method
+    instead. With ``profile`` set, per-stage time is accumulated for
+    ``timings``.
+    """
+
+    def __init__(
+        self,
+        keys: Sequence[str],
+        *,
+        dampening: FieldDampening | None = None,
+        evolution: FieldEvolution | None = None,
+        mesh: CognitiveMesh | None = None,
+        morphogenesis: FieldMorphogenesis | None = None,
+        topology: CognitiveTopology | None = None,
+        reflexivity: FieldReflexivity | None = None,
+        profile: bool = False,
+    ) -> None:
+        self.keys = tuple(keys)
+        self.slots = {key: index for index, key in enumerate(self.keys)}
+        self.profile = profile
+        self._stages: list[tuple[str, Step]] = []
+        if dampening is not None:
+            self._add(
+                "dampening",
+                dampening,
+                FieldDampening,
+                ("apply",),
+                lambda: dampening.compile(self.keys),
+                lambda: self._dampening_step(dampening),
+            )
+        if evolution is not None:
+            self._add(
+                "evolution",
+                evolution,
+                FieldEvolution,
+                ("update",),
+                lambda: evolution.compile(self.keys),
+                lambda: self._evolution_step(evolution),
+            )
+        if mesh is not None:
+            self._add(
+                "mesh",
+                mesh,
+                CognitiveMesh,
+                ("update",),
+                lambda: mesh.compile(self.keys),
+                lambda: self._mesh_step(mesh),
+            )
+            if morphogenesis is not None:
+                self._add(
+                    "morphogenesis",
+                    morphogenesis,
+                    FieldMorphogenesis,
+                    ("update",),
+                    lambda: morphogenesis.compile(self.keys, mesh),
+                    lambda: self._morphogenesis_step(morphogenesis, mesh),
+                )
+            if topology is not None:
+                self._add(
+                    "topology",
+                    topology,
+                    CognitiveTopology,
+                    ("update", "apply"),
+                    lambda: topology.compile(self.keys, mesh),
+                    lambda: self._topology_step(topology, mesh),
+                )
+        if reflexivity is not None:
+            self._add(
+                "reflexivity",
+                reflexivity,
+                FieldReflexivity,
+                ("update",),
+                lambda: reflexivity.compile(self.keys),
+                lambda: self._reflexivity_step(reflexivity),
+            )
+        self._seconds = {name: 0.0 for name, _ in self._stages}
+        self._runs = 0
+
+    @property
+    def stages(self) -> tuple[str, ...]:
+        return tuple(name for name, _ in self._stages)
+
+    def _add(
+        self,
+        name: str,
+        stage: object,
+        base: type,
+        methods: tuple[str, ...],
+        compiled: Callable[[], Step],
+        fallback: Callable[[], Step],
+    ) -> None:
+        step = fallback() if _overrides(stage, base, *methods) else compiled()
+        self._stages.append((name, step))
+
+    def run(self, metrics: dict[str, float]) -> dict[str, float]:
+        """Run every stage over ``metrics`` (which must carry exactly ``keys``)."""
+        values = [float(metrics[key]) for key in self.keys]
+        if self.profile:
+            clock = time.perf_counter
+            seconds = self._seconds
+            for name, step in self._stages:
+                started = clock()
+                step(values)
+                seconds[name] += clock() - started
+            self._runs += 1
+        else:
+            for _, step in self._stages:
+                step(values)
+        return dict(zip(self.keys, values))
+
+    def timings(self) -> dict[str, dict[str, float]]:
+        """Per-stage totals and means in microseconds over the profiled runs."""
+        runs = self._runs
+        return {
+            name: {
+                "runs": runs,
+                "total_us": seconds * 1e6,
+                "mean_us": seconds * 1e6 / runs if runs else 0.0,
+            }
+            for name, seconds in self._seconds.items()
+        }
+
+    def reset_timings(self) -> None:
+        self._seconds = dict.fromkeys(self._seconds, 0.0)
+        self._runs = 0
+
+    # Dict-based fallbacks for stage subclasses that override the public methods.
+
+    def _wrap(self, transform: Callable[[dict[str, float]], dict[str, float]]) -> Step:
+        keys = self.keys
+
+        def step(values: list[float]) -> None:
+            out = transform(dict(zip(keys, values)))
+            values[:] = [float(out.get(key, 0.0)) for key in keys]
+
+        return step
+
+    def _dampening_step(self, stage: FieldDampening) -> Step:
+        return self._wrap(stage.apply)
+
+    def _evolution_step(self, stage: FieldEvolution) -> Step:
+        from .registry import FieldRegistry
+
+        return self._wrap(lambda metrics: FieldRegistry._apply_weights(metrics, stage.update(metrics)))
+
+    def _mesh_step(self, stage: CognitiveMesh) -> Step:
+        from .registry import FieldRegistry
+
+        return self._wrap(lambda metrics: FieldRegistry.applymesh(metrics, stage.update(metrics)))
+
+    def _morphogenesis_step(self, stage: FieldMorphogenesis, mesh: CognitiveMesh) -> Step:
+        from .registry import FieldRegistry
+
+        return self._wrap(
+            lambda metrics: FieldRegistry.applymorphology(metrics, stage.update(dict(mesh.mesh_state), metrics))
+        )
+
+    def _topology_step(self, stage: CognitiveTopology, mesh: CognitiveMesh) -> Step:
+        def transform(metrics: dict[str, float]) -> dict[str, float]:
+            stage.update(metrics, dict(mesh.mesh_state))
+            return stage.apply(metrics)
+
+        return self._wrap(transform)
+
+    def _reflexivity_step(self, stage: FieldReflexivity) -> Step:
+        from .registry import FieldRegistry
+
+        return self._wrap(lambda metrics: FieldRegistry.applyreflexivity(metrics, stage.update(metrics)))
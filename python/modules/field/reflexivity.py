@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict
+from typing import Callable, Dict, Sequence
 
 
 def _clamp(value: float, low: float = -0.1, high: float = 0.1) -> float:
@@ -44,3 +44,22 @@ class FieldReflexivity:
             adjustments[key] = adjustment
             self.prev[key] = current
         return adjustments
+
+    def compile(self, keys: Sequence[str]) -> Callable[[list[float]], None]:
+        """``update`` with the adjustments applied in place over values in ``keys`` order."""
+        keys = tuple(keys)
+
+        def step(values: list[float]) -> None:
+            prev = self.prev
+            trend = self.trend
+            lr = self.lr
+            for index, key in enumerate(keys):
+                current = values[index]
+                previous = prev.get(key)
+                change = 0.0 if previous is None else current - previous
+                trend[key] = change
+                prev[key] = current
+                adjusted = current + _clamp(-lr * change)
+                values[index] = 0.0 if adjusted < 0.0 else 1.0 if adjusted > 1.0 else adjusted
+
+        return step
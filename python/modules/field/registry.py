@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import heapq
+import itertools
 import time
 from typing import Callable
 
 from .dampening import FieldDampening
 from .evolution import FieldEvolution
+from .metrics_engine import FieldMetricsEngine
 from .mesh import CognitiveMesh
 from .morphogenesis import FieldMorphogenesis
+from .pipeline import FieldPipeline
 from .reflexivity import FieldReflexivity
 from .resonance import FieldResonance
 from .state import FieldNodeState, FieldState
@@ -37,35 +41,69 @@ class FieldRegistry:
         self._topology = topology
         self._reflexivity = reflexivity
         self._nodes: dict[str, FieldNodeState] = {}
+        # resonance inputs kept current on every change instead of recomputed per read
+        self._engine = FieldMetricsEngine()
+        self._expiry: list[tuple[float, int, str]] = []
+        self._expiry_seq: dict[str, int] = {}
+        self._sequence = itertools.count()
+        self._version = 0
+        self._snapshot: tuple[int, dict[str, FieldNodeState]] | None = None
+        self._base_metrics: tuple[int, dict[str, float]] | None = None
+        self._pipeline: FieldPipeline | None = None
+        self._profile = False
+
+    @property
+    def version(self) -> int:
+        """Bumped whenever a node is added, replaced or expires."""
+        return self._version
 
     def update_node(self, node_state: FieldNodeState) -> None:
-        self._nodes[node_state.node_id] = node_state
+        node_id = node_state.node_id
+        self._engine.replace(self._nodes.get(node_id), node_state)
+        self._nodes[node_id] = node_state
+        sequence = next(self._sequence)
+        self._expiry_seq[node_id] = sequence
+        heapq.heappush(self._expiry, (node_state.timestamp, sequence, node_id))
+        self._version += 1
         self._prune()
 
     def get_state(self) -> FieldState:
         self._prune()
-        base_state = FieldState(nodes=dict(self._nodes))
+        if self._snapshot is None or self._snapshot[0] != self._version:
+            self._snapshot = (self._version, dict(self._nodes))
+        base_state = FieldState(nodes=self._snapshot[1])
         if self._resonance is None:
             return base_state
-        metrics = self._resonance.compute(base_state)
-        if self._dampening is not None:
-            metrics = self._dampening.apply(metrics)
-        if self._evolution is not None:
-            weights = self._evolution.update(metrics)
-            metrics = self._apply_weights(metrics, weights)
-        if self._mesh is not None:
-            mesh_state = self._mesh.update(metrics)
-            metrics = self.applymesh(metrics, mesh_state)
-            if self._morphogenesis is not None:
-                morphology = self._morphogenesis.update(mesh_state, metrics)
-                metrics = self.applymorphology(metrics, morphology)
-            if self._topology is not None:
-                self._topology.update(metrics, mesh_state)
-                metrics = self.applytopology(metrics, self._topology)
-        if self._reflexivity is not None:
-            adjustments = self._reflexivity.update(metrics)
-            metrics = self.applyreflexivity(metrics, adjustments)
-        return FieldState(nodes=base_state.nodes, metrics=metrics)
+        metrics = self._resonance_metrics(base_state)
+        return FieldState(nodes=base_state.nodes, metrics=self._pipeline_for(metrics).run(metrics))
+
+    def profile_stages(self, enabled: bool = True) -> None:
+        """Start (or stop) timing each post-resonance stage of ``get_state``."""
+        self._profile = enabled
+        if self._pipeline is not None:
+            self._pipeline.profile = enabled
+
+    def stage_timings(self) -> dict[str, dict[str, float]]:
+        """Per-stage timings gathered since ``profile_stages`` was enabled (empty before)."""
+        return self._pipeline.timings() if self._pipeline is not None else {}
+
+    def _pipeline_for(self, metrics: dict[str, float]) -> FieldPipeline:
+        # compiled once per key layout; resonance keeps the same keys from call to call
+        pipeline = self._pipeline
+        if pipeline is None or len(pipeline.keys) != len(metrics) or any(
+            key not in pipeline.slots for key in metrics
+        ):
+            pipeline = self._pipeline = FieldPipeline(
+                tuple(metrics),
+                dampening=self._dampening,
+                evolution=self._evolution,
+                mesh=self._mesh,
+                morphogenesis=self._morphogenesis,
+                topology=self._topology,
+                reflexivity=self._reflexivity,
+                profile=self._profile,
+            )
+        return pipeline
 
     @staticmethod
     def _apply_weights(metrics: dict[str, float], weights: dict[str, float]) -> dict[str, float]:
@@ -146,8 +184,23 @@ class FieldRegistry:
             out[key] = new
         return out
 
+    def _resonance_metrics(self, base_state: FieldState) -> dict[str, float]:
+        if type(self._resonance).compute is not FieldResonance.compute:
+            return self._resonance.compute(base_state)
+        if self._base_metrics is None or self._base_metrics[0] != self._version:
+            self._base_metrics = (self._version, self._resonance.compute_incremental(self._engine))
+        return dict(self._base_metrics[1])
+
     def _prune(self) -> None:
         now = self._clock()
-        expired = [node_id for node_id, state in self._nodes.items() if now - state.timestamp > self.ttl]
-        for node_id in expired:
-            self._nodes.pop(node_id, None)
+        expiry = self._expiry
+        while expiry and now - expiry[0][0] > self.ttl:
+            _, sequence, node_id = heapq.heappop(expiry)
+            if self._expiry_seq.get(node_id) != sequence:
+                continue  # superseded by a later update
+            del self._expiry_seq[node_id]
+            self._engine.remove(self._nodes.pop(node_id))
+            self._version += 1
+        if len(expiry) > 2 * len(self._nodes) + 64:
+            self._expiry = [entry for entry in expiry if self._expiry_seq.get(entry[2]) == entry[1]]
+            heapq.heapify(self._expiry)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Dict, Tuple
+from typing import Callable, Dict, Sequence, Tuple
+
+from .mesh import CognitiveMesh
 
 PAIRS = [
     ("orientation_coherence", "confidence_alignment"),
@@ -84,3 +86,45 @@ class CognitiveTopology:
             out[key] = adjusted
 
         return out
+
+    def compile(self, keys: Sequence[str], mesh: CognitiveMesh) -> Callable[[list[float]], None]:
+        """``update`` against ``mesh`` followed by ``apply``, in place over values in ``keys`` order."""
+        slots = {key: index for index, key in enumerate(keys)}
+        pairs = [
+            (
+                slots.get(a),
+                slots.get(b),
+                f"{_metric_base(a)}_pattern",
+                f"{_metric_base(b)}_pattern",
+                tuple(sorted((a, b))),
+            )
+            for a, b in PAIRS
+        ]
+        count = len(slots)
+
+        def step(values: list[float]) -> None:
+            edges = self.edges
+            patterns = mesh.mesh_state
+            lr = self.lr
+            for slot_a, slot_b, pattern_a, pattern_b, edge in pairs:
+                va = values[slot_a] if slot_a is not None else 0.0
+                vb = values[slot_b] if slot_b is not None else 0.0
+                modulation = 0.5 * (patterns.get(pattern_a, 0.0) + patterns.get(pattern_b, 0.0))
+                delta = lr * ((va - 0.5) * (vb - 0.5)) * (1.0 + modulation)
+                edges[edge] = _clamp(edges.get(edge, 0.0) + delta)
+
+            influence = [0.0] * count
+            for (a, b), weight in edges.items():
+                slot_a = slots.get(a)
+                slot_b = slots.get(b)
+                va = values[slot_a] if slot_a is not None else 0.0
+                vb = values[slot_b] if slot_b is not None else 0.0
+                if slot_a is not None:
+                    influence[slot_a] += weight * (vb - 0.5)
+                if slot_b is not None:
+                    influence[slot_b] += weight * (va - 0.5)
+            for index in range(count):
+                adjusted = values[index] + influence[index]
+                values[index] = 0.0 if adjusted < 0.0 else 1.0 if adjusted > 1.0 else adjusted
+
+        return step
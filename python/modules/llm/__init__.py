@@ -9,6 +9,8 @@ from .errors import (
     LLMProviderError,
     LLMTimeoutError,
 )
+from .response_cache import CacheStats, MinHasher, ResponseCache, normalize_prompt
+from .scheduler import AdaptiveLimit, RequestScheduler, SchedulerStats
 from .temporal import TemporalContext
 
 if TYPE_CHECKING:
@@ -28,6 +30,8 @@ def __getattr__(name: str):
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
+    "AdaptiveLimit",
+    "CacheStats",
     "CircuitBreaker",
     "CircuitOpenError",
     "COTAdapter",
@@ -37,6 +41,11 @@ __all__ = [
     "LLMInvalidFormatError",
     "LLMProviderError",
     "LanguageModel",
+    "MinHasher",
     "QwenHandler",
+    "RequestScheduler",
+    "ResponseCache",
+    "SchedulerStats",
     "TemporalContext",
+    "normalize_prompt",
 ]
@@ -5,16 +5,34 @@ Connects to Ollama phi3 API and generates responses to questions
 """
 
 import requests
+import inspect
 import time
 import logging
 import queue
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from .breaker import CircuitBreaker, CircuitOpenError
 from .cot_adapter import COTAdapter
 from .errors import LLMEmptyResponseError, LLMInvalidFormatError, as_llm_error
-from .qwen_handler import QwenHandler
+from .prompt import PromptAssembler, PromptSession, PromptTurn
+from .qwen_handler import NUM_PREDICT, QwenHandler
+from .response_cache import ResponseCache
+from .scheduler import INTERACTIVE, RequestScheduler, shared_scheduler
 from ..config import (
+    LLM_CACHE_ENABLED,
+    LLM_CACHE_MAX_ENTRIES,
+    LLM_CACHE_NEAR_DUPLICATES,
+    LLM_CACHE_PATH,
+    LLM_CACHE_SCOPE,
+    LLM_CACHE_SIMILARITY,
+    LLM_CACHE_TTL_SECONDS,
+    LLM_CONTEXT_WINDOW,
+    LLM_MODEL_NAME,
+    LLM_REUSE_CONTEXT,
+    LLM_SCHEDULER_BACKGROUND_SHARE,
+    LLM_SCHEDULER_ENABLED,
+    LLM_SCHEDULER_MAX_CONCURRENCY,
     OLLAMA_HOST,
     SYSTEM_PROMPT,
     USE_CLOUD_LLM,
@@ -27,8 +45,90 @@ from ..config import (
 
 logger = logging.getLogger(__name__)
 
+_NO_CACHE = object()
+_UNAVAILABLE = "LLM temporarily unavailable. Please try again later."
+_BACKEND_KWARGS = ("cancel_event", "context")
+
+
+def _accepted_kwargs(fn) -> frozenset:
+    """Which of ``_BACKEND_KWARGS`` ``fn`` takes; none when its signature cannot be read."""
+    try:
+        parameters = inspect.signature(fn).parameters
+    except (TypeError, ValueError):
+        return frozenset()
+    if any(param.kind is inspect.Parameter.VAR_KEYWORD for param in parameters.values()):
+        return frozenset(_BACKEND_KWARGS)
+    return frozenset(name for name in _BACKEND_KWARGS if name in parameters)
+
+
+def build_response_cache() -> Optional[ResponseCache]:
+    """Response cache configured from ``llm.cache``; None when disabled."""
+    if not LLM_CACHE_ENABLED:
+        return None
+    return ResponseCache(
+        max_entries=LLM_CACHE_MAX_ENTRIES,
+        ttl_seconds=LLM_CACHE_TTL_SECONDS,
+        near_duplicates=LLM_CACHE_NEAR_DUPLICATES,
+        similarity_threshold=LLM_CACHE_SIMILARITY,
+        path=LLM_CACHE_PATH or None,
+    )
+
+
+def build_scheduler() -> Optional[RequestScheduler]:
+    """Process-wide scheduler for the configured backend; None when disabled."""
+    if not LLM_SCHEDULER_ENABLED:
+        return None
+    backend = "cloud" if USE_CLOUD_LLM else OLLAMA_HOST
+    return shared_scheduler(
+        backend,
+        lambda: RequestScheduler(
+            max_concurrency=LLM_SCHEDULER_MAX_CONCURRENCY,
+            background_share=LLM_SCHEDULER_BACKGROUND_SHARE,
+        ),
+    )
+
+
+class _OrderedOutput:
+    """Hands results to ``publish`` in the order their slots were reserved.
+
+    Answers are produced concurrently; whichever worker completes the
+    oldest outstanding slot publishes it and everything ready behind it.
+    A slot delivered as None is skipped.
+    """
+
+    def __init__(self, publish) -> None:
+        self._publish = publish
+        self._lock = threading.Lock()
+        self._next_slot = 0
+        self._next_publish = 0
+        self._ready = {}
+
+    def reserve(self) -> int:
+        with self._lock:
+            slot = self._next_slot
+            self._next_slot += 1
+            return slot
+
+    def deliver(self, slot: int, item) -> None:
+        with self._lock:
+            self._ready[slot] = item
+            while self._next_publish in self._ready:
+                item = self._ready.pop(self._next_publish)
+                self._next_publish += 1
+                if item is not None:
+                    self._publish(item)
+
+
 class LanguageModel:
-    def __init__(self, input_queue: queue.Queue, output_queue: queue.Queue, use_cotcore: Optional[bool] = None, use_breaker: Optional[bool] = None):
+    def __init__(
+        self,
+        input_queue: queue.Queue,
+        output_queue: queue.Queue,
+        use_cotcore: Optional[bool] = None,
+        use_breaker: Optional[bool] = None,
+        response_cache=_NO_CACHE,
+        scheduler=_NO_CACHE,
+    ):
         self.input_queue = input_queue
         self.output_queue = output_queue
         self.running = False
@@ -45,12 +145,54 @@ class LanguageModel:
             api_key=qwen_api_key,
             raise_on_error=True,
         )
+        # Pass ``response_cache=None`` to disable caching regardless of config.
+        self.response_cache: Optional[ResponseCache] = (
+            build_response_cache() if response_cache is _NO_CACHE else response_cache
+        )
+        # Everything besides the question that shapes the answer: sampling
+        # settings, context size and whether COT rewrites the prompt.
+        self._cache_namespace = ResponseCache.namespace(
+            LLM_MODEL_NAME,
+            self.qwen_handler.generation_params(),
+            backend="cloud" if USE_CLOUD_LLM else "ollama",
+            system_prompt=SYSTEM_PROMPT,
+            cotcore=self.use_cotcore,
+        )
+        self.cache_scope = LLM_CACHE_SCOPE
+        # Pass ``scheduler=None`` to call the backend directly on the caller's thread.
+        self.scheduler: Optional[RequestScheduler] = build_scheduler() if scheduler is _NO_CACHE else scheduler
+        self.prompts = PromptAssembler(SYSTEM_PROMPT, context_window=LLM_CONTEXT_WINDOW, reserve_tokens=NUM_PREDICT)
+        # Only Ollama returns a token context to continue from.
+        self.session = PromptSession(self.prompts, reuse_context=LLM_REUSE_CONTEXT and not USE_CLOUD_LLM)
+        self._backend_signature = None
 
-    def _compose_prompt(self, question: str) -> str:
-        prompt = f"{SYSTEM_PROMPT}\n\n\u0412\u043e\u043f\u0440\u043e\u0441: {question}\n\u041e\u0442\u0432\u0435\u0442:"
+    def _begin_turn(self, question: str) -> PromptTurn:
+        turn = self.session.begin(question)
+        if turn.truncated:
+            logger.warning(f"Question trimmed to fit the {self.prompts.context_window}-token context window")
         if self.cot_adapter:
-            return self.cot_adapter.process(question, prompt)
-        return prompt
+            turn.prompt = self.cot_adapter.process(question, turn.prompt)
+        return turn
+
+    def _turn_namespace(self, turn: PromptTurn) -> str:
+        # With the default "question" scope every question is looked up as if
+        # it stood alone, so reuse_context does not switch the cache off after
+        # the first turn; "conversation" also keys continued turns on the context.
+        if turn.continued and self.cache_scope == "conversation":
+            return ResponseCache.namespace(self._cache_namespace, context=turn.context)
+        return self._cache_namespace
+
+    def _cached_response(self, turn: PromptTurn) -> Optional[str]:
+        if self.response_cache is None:
+            return None
+        response = self.response_cache.get(turn.question, self._turn_namespace(turn))
+        if response is not None:
+            logger.debug(f"Response cache hit: {turn.question[:50]}...")
+        return response
+
+    def _store_response(self, turn: PromptTurn, response: str) -> None:
+        if self.response_cache is not None:
+            self.response_cache.put(turn.question, response, self._turn_namespace(turn))
 
     def test_ollama_connection(self) -> bool:
         """Test connection to Ollama server"""
@@ -70,54 +212,102 @@ class LanguageModel:
     def _is_cancelled(self, cancel_event) -> bool:
         return cancel_event is not None and getattr(cancel_event, "is_set", lambda: False)()
 
-    def generate_response_local(self, question: str, cancel_event=None) -> Optional[str]:
-        """Generate response using local Ollama Qwen"""
+    def _call_backend(self, prompt: str, cancel_event=None, lane: str = INTERACTIVE, turn: Optional[PromptTurn] = None):
+        if self.scheduler is None:
+            return self._checked_backend_call(prompt, cancel_event, turn)
+        future = self.scheduler.submit(
+            lambda shared_cancel: self._checked_backend_call(prompt, shared_cancel, turn),
+            key=(self._cache_namespace, *(turn.cache_key() if turn is not None else (prompt,))),
+            lane=lane,
+            cancel_event=cancel_event,
+            breaker=self.breaker,
+        )
+        # Identical prompts share one backend call, which only stops once every
+        # waiter cancelled; this caller returns as soon as its own token is set.
+        woken = threading.Event()
+        future.add_done_callback(lambda _: woken.set())
+        register = getattr(cancel_event, "add_callback", None)
+        if register is not None:
+            register(woken.set)
         try:
-            if self._is_cancelled(cancel_event):
-                return None
-            prompt = self._compose_prompt(question)
+            if cancel_event is None or register is not None:
+                woken.wait()
+            else:
+                # a plain Event cannot notify us, so look at it between waits
+                while not woken.wait(0.05) and not self._is_cancelled(cancel_event):
+                    pass
+        finally:
+            unregister = getattr(cancel_event, "remove_callback", None)
+            if unregister is not None:
+                unregister(woken.set)
+        if not future.done():
+            return None
+        return future.result()
 
-            if self._is_cancelled(cancel_event):
-                return None
+    def _checked_backend_call(self, prompt: str, cancel_event=None, turn: Optional[PromptTurn] = None):
+        """One backend call plus its validation and breaker bookkeeping.
 
-            if self.breaker:
-                try:
-                    self.breaker.before_call()
-                except CircuitOpenError:
-                    return "LLM temporarily unavailable. Please try again later."
-            
-            logger.debug(f"Sending to Qwen: {question[:50]}...")
-            
-            response = self.qwen_handler.generate_response(prompt)
+        Runs once per coalesced request, so the breaker sees one outcome per
+        backend call however many callers share it. A cancelled call records
+        nothing and returns None.
+        """
+        try:
+            response = self._invoke_backend(prompt, cancel_event, turn)
+            if response is None and self._is_cancelled(cancel_event):
+                return None
             if response is None or (isinstance(response, str) and not response.strip()):
                 raise LLMEmptyResponseError()
             if not isinstance(response, str):
                 raise LLMInvalidFormatError("Expected string response")
-
-            if self.breaker:
-                self.breaker.after_success()
-            if self._is_cancelled(cancel_event):
-                return None
-             
-            logger.info(f"Generated response: {response[:100]}...")
-            return response
-                 
         except Exception as exc:
             err = as_llm_error(exc)
             if self.breaker and err.trip_breaker:
                 self.breaker.after_failure(err)
-            if isinstance(err, LLMEmptyResponseError):
-                logger.warning(str(err))
-            else:
-                logger.error(f"Error generating local response ({err.kind}): {err}")
-            return None
-    
-    def generate_response_cloud(self, question: str, cancel_event=None) -> Optional[str]:
+            if err is exc:
+                raise
+            raise err from exc
+        if self.breaker:
+            self.breaker.after_success()
+        return response
+
+    def _backend_accepts(self, generate) -> frozenset:
+        # inspected once per handler; a replaced handler is inspected again
+        target = getattr(generate, "__func__", generate)
+        if self._backend_signature is None or self._backend_signature[0] is not target:
+            self._backend_signature = (target, _accepted_kwargs(generate))
+        return self._backend_signature[1]
+
+    def _invoke_backend(self, prompt: str, cancel_event=None, turn: Optional[PromptTurn] = None):
+        # Pass the token through so the backend can abort an in-flight request,
+        # and the turn so it can continue from the previous context.
+        generate = self.qwen_handler.generate_response
+        accepted = self._backend_accepts(generate)
+        kwargs = {}
+        if cancel_event is not None and "cancel_event" in accepted:
+            kwargs["cancel_event"] = cancel_event
+        if turn is not None and "context" in accepted:
+            kwargs["context"] = turn
+        return generate(prompt, **kwargs)
+
+    def generate_response_local(self, question: str, cancel_event=None, lane: str = INTERACTIVE) -> Optional[str]:
+        """Generate response using local Ollama Qwen"""
+        return self._generate(question, cancel_event, lane, backend="Qwen", kind="local")
+
+    def generate_response_cloud(self, question: str, cancel_event=None, lane: str = INTERACTIVE) -> Optional[str]:
         """Generate response using cloud Qwen API"""
+        return self._generate(question, cancel_event, lane, backend="Qwen Cloud", kind="cloud")
+
+    def _generate(self, question: str, cancel_event, lane: str, *, backend: str, kind: str) -> Optional[str]:
+        if self._is_cancelled(cancel_event):
+            return None
+        turn: Optional[PromptTurn] = None
         try:
-            if self._is_cancelled(cancel_event):
-                return None
-            prompt = self._compose_prompt(question)
+            # Only one turn at a time continues the session context; turns that
+            # overlap it go out stand-alone, so the backend calls run in parallel.
+            turn = self._begin_turn(question)
+            cached = self._cached_response(turn)
+            if cached is not None:
+                return cached
 
             if self._is_cancelled(cancel_event):
                 return None
@@ -126,42 +316,52 @@ class LanguageModel:
                 try:
                     self.breaker.before_call()
                 except CircuitOpenError:
-                    return "LLM temporarily unavailable. Please try again later."
-            
-            logger.debug(f"Sending to Qwen Cloud: {question[:50]}...")
-            
-            response = self.qwen_handler.generate_response(prompt)
-            if response is None or (isinstance(response, str) and not response.strip()):
-                raise LLMEmptyResponseError()
-            if not isinstance(response, str):
-                raise LLMInvalidFormatError("Expected string response")
+                    return _UNAVAILABLE
 
-            if self.breaker:
-                self.breaker.after_success()
+            logger.debug(f"Sending to {backend}: {question[:50]}...")
+
+            response = self._call_backend(turn.prompt, cancel_event, lane, turn)
+            if response is None:
+                # only a cancelled call comes back empty-handed
+                return None
+            self.session.complete(turn)
+            self._store_response(turn, response)
             if self._is_cancelled(cancel_event):
                 return None
-             
-            logger.info(f"Generated cloud response: {response[:100]}...")
+
+            logger.info(f"Generated {kind} response: {response[:100]}...")
             return response
-                 
+
+        except CircuitOpenError:
+            return _UNAVAILABLE
         except Exception as exc:
+            if turn is not None and turn.continued:
+                # a failed continuation may have left Ollama's state unusable
+                self.session.reset()
+            # the breaker already saw this failure in _checked_backend_call
             err = as_llm_error(exc)
-            if self.breaker and err.trip_breaker:
-                self.breaker.after_failure(err)
             if isinstance(err, LLMEmptyResponseError):
                 logger.warning(str(err))
             else:
-                logger.error(f"Error generating cloud response ({err.kind}): {err}")
+                logger.error(f"Error generating {kind} response ({err.kind}): {err}")
             return None
-    
-    def generate_response(self, question: str, cancel_event=None) -> Optional[str]:
-        """Generate response using either local or cloud LLM"""
+        finally:
+            if turn is not None:
+                self.session.release(turn)
+
+    def generate_response(self, question: str, cancel_event=None, lane: str = INTERACTIVE) -> Optional[str]:
+        """Generate response using either local or cloud LLM.
+
+        ``lane`` picks the scheduler priority: ``"interactive"`` for user
+        questions, ``"background"`` for COT, summaries and other work that
+        may wait.
+        """
         if USE_CLOUD_LLM:
             logger.info("Using cloud LLM (Groq)")
-            return self.generate_response_cloud(question, cancel_event=cancel_event)
+            return self.generate_response_cloud(question, cancel_event=cancel_event, lane=lane)
         else:
             logger.info("Using local LLM (Ollama phi3)")
-            return self.generate_response_local(question, cancel_event=cancel_event)
+            return self.generate_response_local(question, cancel_event=cancel_event, lane=lane)
     
     def format_response(self, response: str) -> str:
         """Format response for display"""
@@ -203,6 +403,14 @@ class LanguageModel:
                     return
         
         self.running = True
+        executor = None
+        ordered = None
+        if self.scheduler is not None:
+            executor = ThreadPoolExecutor(
+                max_workers=self.scheduler.limiter.max_limit,
+                thread_name_prefix="llm-question",
+            )
+            ordered = _OrderedOutput(self._publish)
         
         try:
             while self.running:
@@ -214,31 +422,13 @@ class LanguageModel:
                         question = item['text']
                         item['timestamp']
                         
-                        logger.info(f"Processing question: {question}")
-                        
-                        # Generate response
-                        start_time = time.time()
-                        raw_response = self.generate_response(question)
-                        generation_time = time.time() - start_time
-                        
-                        if raw_response:
-                            formatted_response = self.format_response(raw_response)
-                            
-                            logger.info(f"Response generated in {generation_time:.2f}s")
-                            
-                            # Send to UI queue
-                            try:
-                                self.output_queue.put_nowait({
-                                    'question': question,
-                                    'response': formatted_response,
-                                    'generation_time': generation_time,
-                                    'timestamp': time.time()
-                                })
-                                logger.debug("Response sent to UI queue")
-                            except queue.Full:
-                                logger.warning("UI queue full, dropping response")
+                        if executor is not None:
+                            # The scheduler bounds backend concurrency; the
+                            # executor only keeps the queue draining meanwhile.
+                            # Answers still reach the UI in question order.
+                            executor.submit(self._answer_in_order, ordered, ordered.reserve(), question)
                         else:
-                            logger.warning("Failed to generate response")
+                            self._answer_question(question)
                     
                     self.input_queue.task_done()
                     
@@ -252,7 +442,53 @@ class LanguageModel:
         except Exception as e:
             logger.error(f"LLM module error: {e}")
         finally:
+            if executor is not None:
+                # let questions already accepted finish before reporting stopped
+                executor.shutdown(wait=True)
             self.stop()
+
+    def _answer_in_order(self, ordered: _OrderedOutput, slot: int, question: str) -> None:
+        answer = None
+        try:
+            answer = self._build_answer(question)
+        except Exception as e:
+            logger.error(f"LLM processing error: {e}")
+        finally:
+            ordered.deliver(slot, answer)
+
+    def _answer_question(self, question: str) -> None:
+        answer = self._build_answer(question)
+        if answer is not None:
+            self._publish(answer)
+
+    def _build_answer(self, question: str) -> Optional[dict]:
+        logger.info(f"Processing question: {question}")
+        
+        # Generate response
+        start_time = time.time()
+        raw_response = self.generate_response(question)
+        generation_time = time.time() - start_time
+        
+        if not raw_response:
+            logger.warning("Failed to generate response")
+            return None
+        formatted_response = self.format_response(raw_response)
+        
+        logger.info(f"Response generated in {generation_time:.2f}s")
+        return {
+            'question': question,
+            'response': formatted_response,
+            'generation_time': generation_time,
+            'timestamp': time.time()
+        }
+
+    def _publish(self, answer: dict) -> None:
+        # Send to UI queue
+        try:
+            self.output_queue.put_nowait(answer)
+            logger.debug("Response sent to UI queue")
+        except queue.Full:
+            logger.warning("UI queue full, dropping response")
     
     def stop(self):
         """Stop LLM module"""
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import math
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+QUESTION_LABEL = "Вопрос"
+ANSWER_LABEL = "Ответ"
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough BPE token count without a tokenizer.
+
+    English and code average about four characters per token; Cyrillic and
+    other non-ASCII scripts split much finer, about 2.5 characters per
+    token for Qwen/Llama vocabularies. The estimate errs high on purpose.
+    """
+    if not text:
+        return 0
+    non_ascii = sum(1 for char in text if ord(char) > 127)
+    return math.ceil((len(text) - non_ascii) / 4 + non_ascii / 2.5)
+
+
+def trim_to_tokens(text: str, max_tokens: int) -> str:
+    """Keep the tail of ``text`` that fits ``max_tokens``; transcripts end with the question."""
+    if max_tokens <= 0:
+        return ""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    low, high = 0, len(text)
+    while low < high:
+        mid = (low + high) // 2
+        if estimate_tokens(text[mid:]) <= max_tokens:
+            high = mid
+        else:
+            low = mid + 1
+    return text[low:]
+
+
+@dataclass
+class PromptTurn:
+    """One request to the backend.
+
+    ``context`` holds the Ollama token state to continue from, or None when
+    the prompt carries the full prefix. Backends that support continuation
+    store the state returned with the answer in ``returned_context``.
+    """
+
+    question: str
+    prompt: str
+    context: Optional[List[int]] = None
+    prefix_version: int = 0
+    estimated_tokens: int = 0
+    truncated: bool = False
+    returned_context: Optional[List[int]] = None
+
+    @property
+    def continued(self) -> bool:
+        return self.context is not None
+
+    def cache_key(self) -> Tuple[str, int, int]:
+        """Identity for coalescing; two turns match only on the same prompt and state."""
+        context = self.context or ()
+        return self.prompt, len(context), hash(tuple(context))
+
+
+class PromptAssembler:
+    """Builds prompts from a stable prefix plus the per-turn question.
+
+    The prefix is a list of named sections (system prompt first) rendered
+    once and cached until a section changes, so every turn starts with
+    byte-identical text and the backend's prompt cache can skip it. Turns
+    are budgeted against ``context_window`` minus ``reserve_tokens`` for
+    the answer; an over-long question is trimmed from the front.
+    """
+
+    def __init__(
+        self,
+        system_prompt: str = "",
+        *,
+        context_window: int = 4096,
+        reserve_tokens: int = 256,
+    ) -> None:
+        self.context_window = context_window
+        self.reserve_tokens = reserve_tokens
+        self._sections: Dict[str, str] = {}
+        self.version = 0
+        self._rendered: Optional[Tuple[str, int]] = None
+        if system_prompt:
+            self.set_section("system", system_prompt)
+
+    def set_section(self, name: str, text: str) -> None:
+        if self._sections.get(name) == text:
+            return
+        self._sections[name] = text
+        self.version += 1
+        self._rendered = None
+
+    def remove_section(self, name: str) -> None:
+        if self._sections.pop(name, None) is not None:
+            self.version += 1
+            self._rendered = None
+
+    def _render_prefix(self) -> Tuple[str, int]:
+        if self._rendered is None:
+            text = "".join(f"{section}\n\n" for section in self._sections.values() if section)
+            self._rendered = (text, estimate_tokens(text))
+        return self._rendered
+
+    @property
+    def prefix(self) -> str:
+        return self._render_prefix()[0]
+
+    @property
+    def prefix_tokens(self) -> int:
+        return self._render_prefix()[1]
+
+    @property
+    def budget(self) -> int:
+        """Tokens available to prompt text once the answer is reserved."""
+        return max(0, self.context_window - self.reserve_tokens)
+
+    @staticmethod
+    def render_turn(question: str) -> str:
+        return f"{QUESTION_LABEL}: {question}\n{ANSWER_LABEL}:"
+
+    def build(self, question: str, context: Optional[List[int]] = None) -> PromptTurn:
+        """Continue from ``context`` when the turn still fits, else send the full prefix."""
+        overhead = estimate_tokens(self.render_turn(""))
+        if context is not None:
+            room = self.budget - len(context) - overhead
+            if estimate_tokens(question) <= room:
+                turn = self.render_turn(question)
+                return PromptTurn(
+                    question=question,
+                    prompt=f"\n\n{turn}",
+                    context=list(context),
+                    prefix_version=self.version,
+                    estimated_tokens=len(context) + estimate_tokens(turn) + 2,
+                )
+        prefix, prefix_tokens = self._render_prefix()
+        fitted = trim_to_tokens(question, self.budget - prefix_tokens - overhead)
+        turn = self.render_turn(fitted)
+        return PromptTurn(
+            question=question,
+            prompt=prefix + turn,
+            prefix_version=self.version,
+            estimated_tokens=prefix_tokens + estimate_tokens(turn),
+            truncated=fitted != question,
+        )
+
+
+@dataclass
+class PromptSession:
+    """Ollama ``context`` carried between turns of one conversation.
+
+    A returned context is adopted only if the prefix has not changed since
+    the turn was built; ``reset`` drops it so the next turn resends the
+    prefix. The context is handed from turn to turn: the turn that ``begin``
+    gives it to holds it until ``complete`` or ``release``, and turns begun
+    meanwhile carry the full prefix instead of waiting for it.
+    """
+
+    assembler: PromptAssembler
+    reuse_context: bool = True
+    context: Optional[List[int]] = None
+    _context_version: int = 0
+    _holder: Optional[PromptTurn] = field(default=None, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def begin(self, question: str) -> PromptTurn:
+        with self._lock:
+            context = self.context
+            if context is not None and self._context_version != self.assembler.version:
+                context = self.context = None
+            claim = self.reuse_context and self._holder is None
+            turn = self.assembler.build(question, context if claim else None)
+            if claim:
+                self._holder = turn
+        return turn
+
+    def complete(self, turn: PromptTurn) -> None:
+        """Adopt the context ``turn`` returned, if it held the session's context."""
+        with self._lock:
+            if self._holder is not turn:
+                return
+            self._holder = None
+            if turn.returned_context is not None and turn.prefix_version == self.assembler.version:
+                self.context = list(turn.returned_context)
+                self._context_version = turn.prefix_version
+
+    def release(self, turn: PromptTurn) -> None:
+        """Give up the context without adopting anything; a no-op after ``complete``."""
+        with self._lock:
+            if self._holder is turn:
+                self._holder = None
+
+    def reset(self) -> None:
+        with self._lock:
+            self.context = None
+            self._holder = None
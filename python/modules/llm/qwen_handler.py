@@ -8,7 +8,7 @@ import requests
 import json
 import logging
 from typing import Optional
-from ..config import OLLAMA_HOST, LLM_MODEL_NAME
+from ..config import OLLAMA_HOST, LLM_MODEL_NAME, LLM_CONTEXT_WINDOW
 from .errors import (
     LLMEmptyResponseError,
     LLMInvalidFormatError,
@@ -20,6 +20,23 @@ from .errors import (
 logger = logging.getLogger(__name__)
 
 DEFAULT_TIMEOUT = 30
+NUM_PREDICT = 150
+CLOUD_MODEL = "qwen-max"  # or qwen-plus for faster response
+
+# Sampling settings sent with every request; they also key the response cache.
+OLLAMA_OPTIONS = {
+    "temperature": 0.2,
+    "top_k": 40,
+    "top_p": 0.9,
+    "num_predict": NUM_PREDICT,
+    "num_ctx": LLM_CONTEXT_WINDOW,
+    "repeat_penalty": 1.1,
+}
+CLOUD_PARAMETERS = {
+    "temperature": 0.2,
+    "max_tokens": NUM_PREDICT,
+    "top_p": 0.9,
+}
 
 class QwenHandler:
     def __init__(self, use_cloud_api: bool = False, api_key: str = "", *, raise_on_error: bool = False):
@@ -28,37 +45,97 @@ class QwenHandler:
         self.raise_on_error = raise_on_error
         self.session = requests.Session()
         self.session.timeout = 30
+
+    def generation_params(self) -> dict:
+        """Model and sampling settings of the active backend."""
+        if self.use_cloud_api:
+            return {"model": CLOUD_MODEL, **CLOUD_PARAMETERS}
+        return {"model": LLM_MODEL_NAME, **OLLAMA_OPTIONS}
         
-    def generate_with_ollama(self, prompt: str) -> Optional[str]:
-        """Generate response using Ollama Qwen model"""
+    def _stream_ollama(self, url: str, payload: dict, cancel_event, turn=None) -> Optional[str]:
+        """Stream an Ollama generation so cancellation can abort it mid-flight.
+
+        Closing the response from the cancel callback drops the connection,
+        which also stops generation on the Ollama side. Returns None when
+        cancelled.
+        """
+        response = self.session.post(url, json=payload, timeout=DEFAULT_TIMEOUT, stream=True)
+        register = getattr(cancel_event, "add_callback", None)
+        if register is not None:
+            register(response.close)
+        parts = []
+        try:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if cancel_event.is_set():
+                    return None
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                if not isinstance(chunk, dict):
+                    raise LLMInvalidFormatError("Invalid JSON chunk from Ollama")
+                piece = chunk.get("response", "")
+                if piece is None:
+                    piece = ""
+                if not isinstance(piece, str):
+                    raise LLMInvalidFormatError("Expected 'response' to be a string")
+                parts.append(piece)
+                if chunk.get("done"):
+                    if turn is not None:
+                        turn.returned_context = chunk.get("context")
+                    break
+        except Exception:
+            if cancel_event.is_set():
+                return None
+            raise
+        finally:
+            unregister = getattr(cancel_event, "remove_callback", None)
+            if unregister is not None:
+                unregister(response.close)
+            response.close()
+        if cancel_event.is_set():
+            return None
+        return "".join(parts)
+
+    def generate_with_ollama(self, prompt: str, cancel_event=None, context=None) -> Optional[str]:
+        """Generate response using Ollama Qwen model.
+
+        ``context`` is an optional ``PromptTurn``: its token state is sent so
+        Ollama continues from the previous turn instead of re-reading the
+        prefix, and the state returned with the answer is stored back on it.
+        """
         try:
             url = f"{OLLAMA_HOST}/api/generate"
             
             payload = {
                 "model": LLM_MODEL_NAME,
                 "prompt": prompt,
-                "stream": False,
-                "options": {
-                    "temperature": 0.2,
-                    "top_k": 40,
-                    "top_p": 0.9,
-                    "num_predict": 150,
-                    "repeat_penalty": 1.1
-                }
+                "stream": cancel_event is not None,
+                "options": dict(OLLAMA_OPTIONS),
             }
+            if context is not None and context.context:
+                payload["context"] = context.context
             
             logger.debug(f"Sending to Ollama Qwen: {prompt[:50]}...")
-            response = self.session.post(url, json=payload, timeout=DEFAULT_TIMEOUT)
-            response.raise_for_status()
-            
-            result = response.json()
-            if not isinstance(result, dict):
-                raise LLMInvalidFormatError("Invalid JSON payload from Ollama")
-            raw_answer = result.get("response", "")
-            if raw_answer is None:
-                raw_answer = ""
-            if not isinstance(raw_answer, str):
-                raise LLMInvalidFormatError("Expected 'response' to be a string")
+            if cancel_event is not None:
+                raw_answer = self._stream_ollama(url, payload, cancel_event, context)
+                if raw_answer is None:
+                    logger.info("Ollama Qwen generation cancelled")
+                    return None
+            else:
+                response = self.session.post(url, json=payload, timeout=DEFAULT_TIMEOUT)
+                response.raise_for_status()
+
+                result = response.json()
+                if not isinstance(result, dict):
+                    raise LLMInvalidFormatError("Invalid JSON payload from Ollama")
+                raw_answer = result.get("response", "")
+                if raw_answer is None:
+                    raw_answer = ""
+                if not isinstance(raw_answer, str):
+                    raise LLMInvalidFormatError("Expected 'response' to be a string")
+                if context is not None:
+                    context.returned_context = result.get("context")
             answer = raw_answer.strip()
              
             if answer:
@@ -100,17 +177,13 @@ class QwenHandler:
             }
             
             payload = {
-                "model": "qwen-max",  # or qwen-plus for faster response
+                "model": CLOUD_MODEL,
                 "input": {
                     "messages": [
                         {"role": "user", "content": prompt}
                     ]
                 },
-                "parameters": {
-                    "temperature": 0.2,
-                    "max_tokens": 150,
-                    "top_p": 0.9
-                }
+                "parameters": dict(CLOUD_PARAMETERS),
             }
             
             logger.debug(f"Sending to Qwen Cloud API: {prompt[:50]}...")
@@ -151,12 +224,12 @@ class QwenHandler:
             logger.error(f"Qwen Cloud API error: {e}")
             return None
     
-    def generate_response(self, prompt: str) -> Optional[str]:
+    def generate_response(self, prompt: str, cancel_event=None, context=None) -> Optional[str]:
         """Generate response using appropriate Qwen variant"""
         if self.use_cloud_api:
             return self.generate_with_cloud_api(prompt)
         else:
-            return self.generate_with_ollama(prompt)
+            return self.generate_with_ollama(prompt, cancel_event=cancel_event, context=context)
 
 # Test function
 def test_qwen_integration():
@@ -0,0 +1,341 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+_TRAILING_PUNCT = " \t\n?!.;,:…"
+
+# MinHash uses universal hashing modulo a Mersenne prime; keeping the
+# coefficients below 2**31 and shingle hashes below 2**32 keeps a * x + b
+# inside uint64 without overflow.
+_MERSENNE_31 = (1 << 31) - 1
+
+
+def normalize_prompt(text: str) -> str:
+    """Canonical form used for exact matching: NFKC, casefolded, single-spaced."""
+    text = unicodedata.normalize("NFKC", text).casefold()
+    return " ".join(text.split()).strip(_TRAILING_PUNCT)
+
+
+def _stable_hash32(token: str) -> int:
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=4).digest(), "little")
+
+
+class MinHasher:
+    """MinHash signatures over word shingles, banded for LSH lookup.
+
+    Short prompts are shingled by single words as well as ``shingle_size``
+    word n-grams so that one changed word in a five word question still
+    leaves most of the set intact.
+    """
+
+    def __init__(self, num_perm: int = 64, bands: int = 16, shingle_size: int = 2, seed: int = 1) -> None:
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, _MERSENNE_31, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, _MERSENNE_31, size=num_perm, dtype=np.uint64)
+
+    def shingles(self, text: str) -> List[str]:
+        words = _WORD_RE.findall(text)
+        grams = list(words)
+        for size in range(2, self.shingle_size + 1):
+            grams.extend(" ".join(words[idx : idx + size]) for idx in range(len(words) - size + 1))
+        return grams
+
+    def signature(self, text: str) -> np.ndarray:
+        shingles = self.shingles(text)
+        if not shingles:
+            return np.full(self.num_perm, _MERSENNE_31, dtype=np.uint64)
+        hashes = np.fromiter((_stable_hash32(token) for token in set(shingles)), dtype=np.uint64)
+        permuted = (np.outer(hashes, self._a) + self._b) % _MERSENNE_31
+        return permuted.min(axis=0)
+
+    def band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [
+            band.to_bytes(2, "little") + signature[band * self.rows : (band + 1) * self.rows].tobytes()
+            for band in range(self.bands)
+        ]
+
+    @staticmethod
+    def similarity(left: np.ndarray, right: np.ndarray) -> float:
+        return float(np.count_nonzero(left == right)) / len(left)
+
+
+@dataclass
+class CacheStats:
+    exact_hits: int = 0
+    near_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.exact_hits + self.near_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "exact_hits": self.exact_hits,
+            "near_hits": self.near_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+@dataclass
+class _Entry:
+    key: str
+    namespace: str
+    prompt: str
+    response: str
+    created: float
+    signature: Optional[np.ndarray] = None
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    namespace TEXT NOT NULL,
+    prompt TEXT NOT NULL,
+    response TEXT NOT NULL,
+    created REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_created ON responses (created);
+"""
+
+
+class ResponseCache:
+    """Two-level cache of LLM answers keyed by normalized prompt.
+
+    The first level is an exact-match LRU over ``(namespace, normalized
+    prompt)``, where the namespace carries the model name, sampling
+    parameters and system prompt so a change to any of them never serves a
+    stale answer. The optional second level matches near-duplicate prompts
+    within the same namespace by MinHash/LSH and accepts a candidate when
+    the estimated Jaccard similarity reaches ``similarity_threshold``.
+
+    Entries expire after ``ttl_seconds``. With ``path`` set, entries are also
+    written to an SQLite file; in-memory misses fall through to it and the
+    most recent entries are loaded back on start so answers survive
+    restarts.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 512,
+        ttl_seconds: float | None = 24 * 3600.0,
+        near_duplicates: bool = False,
+        similarity_threshold: float = 0.8,
+        path: str | Path | None = None,
+        max_disk_entries: int = 10000,
+        minhasher: MinHasher | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self.similarity_threshold = similarity_threshold
+        self.max_disk_entries = max_disk_entries
+        self.stats = CacheStats()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._minhasher = (minhasher or MinHasher()) if near_duplicates else None
+        self._bands: Dict[bytes, set[str]] = {}
+        self._conn: sqlite3.Connection | None = None
+        if path is not None:
+            path = Path(path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(path), check_same_thread=False)
+            self._conn.executescript(_SCHEMA)
+            self._load_recent()
+
+    @staticmethod
+    def namespace(model: str, params: Mapping[str, Any] | None = None, **extra: Any) -> str:
+        """Stable identifier for everything besides the prompt that shapes an answer."""
+        payload = json.dumps({"model": model, "params": dict(params or {}), **extra}, sort_keys=True, default=str)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+    @staticmethod
+    def _key(namespace: str, normalized: str) -> str:
+        return hashlib.sha256(f"{namespace}\x00{normalized}".encode("utf-8")).hexdigest()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, prompt: str, namespace: str = "") -> Optional[str]:
+        normalized = normalize_prompt(prompt)
+        key = self._key(namespace, normalized)
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if self._expired(entry, now):
+                    self._drop(entry)
+                    self.stats.expirations += 1
+                else:
+                    self._entries.move_to_end(key)
+                    self.stats.exact_hits += 1
+                    return entry.response
+            if self._conn is not None:
+                entry = self._disk_get(key, now)
+                if entry is not None:
+                    self._insert(entry)
+                    self.stats.disk_hits += 1
+                    return entry.response
+            if self._minhasher is not None:
+                entry = self._near_match(namespace, normalized, now)
+                if entry is not None:
+                    self._entries.move_to_end(entry.key)
+                    self.stats.near_hits += 1
+                    return entry.response
+            self.stats.misses += 1
+            return None
+
+    def put(self, prompt: str, response: str, namespace: str = "") -> None:
+        normalized = normalize_prompt(prompt)
+        entry = _Entry(
+            key=self._key(namespace, normalized),
+            namespace=namespace,
+            prompt=normalized,
+            response=response,
+            created=self._clock(),
+        )
+        with self._lock:
+            old = self._entries.get(entry.key)
+            if old is not None:
+                self._drop(old)
+            self._insert(entry)
+            self.stats.stores += 1
+            if self._conn is not None:
+                self._disk_put(entry)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bands.clear()
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _expired(self, entry: _Entry, now: float) -> bool:
+        return self.ttl_seconds is not None and now - entry.created > self.ttl_seconds
+
+    def _insert(self, entry: _Entry) -> None:
+        if self._minhasher is not None:
+            if entry.signature is None:
+                entry.signature = self._minhasher.signature(entry.prompt)
+            for band in self._band_keys(entry.namespace, entry.signature):
+                self._bands.setdefault(band, set()).add(entry.key)
+        self._entries[entry.key] = entry
+        while len(self._entries) > self.max_entries:
+            _, oldest = self._entries.popitem(last=False)
+            self._unindex(oldest)
+            self.stats.evictions += 1
+
+    def _drop(self, entry: _Entry) -> None:
+        self._entries.pop(entry.key, None)
+        self._unindex(entry)
+
+    def _unindex(self, entry: _Entry) -> None:
+        if self._minhasher is None or entry.signature is None:
+            return
+        for band in self._band_keys(entry.namespace, entry.signature):
+            keys = self._bands.get(band)
+            if keys is not None:
+                keys.discard(entry.key)
+                if not keys:
+                    del self._bands[band]
+
+    def _band_keys(self, namespace: str, signature: np.ndarray) -> List[bytes]:
+        prefix = namespace.encode("utf-8") + b"\x00"
+        return [prefix + band for band in self._minhasher.band_keys(signature)]
+
+    def _near_match(self, namespace: str, normalized: str, now: float) -> Optional[_Entry]:
+        signature = self._minhasher.signature(normalized)
+        candidates: set[str] = set()
+        for band in self._band_keys(namespace, signature):
+            candidates.update(self._bands.get(band, ()))
+        best: Tuple[float, Optional[_Entry]] = (0.0, None)
+        for key in candidates:
+            entry = self._entries.get(key)
+            if entry is None:
+                continue
+            if self._expired(entry, now):
+                self._drop(entry)
+                self.stats.expirations += 1
+                continue
+            score = MinHasher.similarity(signature, entry.signature)
+            if score >= self.similarity_threshold and score > best[0]:
+                best = (score, entry)
+        return best[1]
+
+    def _load_recent(self) -> None:
+        cutoff = -1.0 if self.ttl_seconds is None else self._clock() - self.ttl_seconds
+        rows = self._conn.execute(
+            "SELECT key, namespace, prompt, response, created FROM responses"
+            " WHERE created >= ? ORDER BY created DESC LIMIT ?",
+            (cutoff, self.max_entries),
+        ).fetchall()
+        for row in reversed(rows):
+            self._insert(_Entry(*row))
+
+    def _disk_get(self, key: str, now: float) -> Optional[_Entry]:
+        row = self._conn.execute(
+            "SELECT key, namespace, prompt, response, created FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        entry = _Entry(*row)
+        if self._expired(entry, now):
+            with self._conn:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self.stats.expirations += 1
+            return None
+        return entry
+
+    def _disk_put(self, entry: _Entry) -> None:
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, namespace, prompt, response, created) VALUES (?, ?, ?, ?, ?)",
+                (entry.key, entry.namespace, entry.prompt, entry.response, entry.created),
+            )
+            if self.stats.stores % 64 == 0:
+                self._conn.execute(
+                    "DELETE FROM responses WHERE key IN ("
+                    " SELECT key FROM responses ORDER BY created DESC LIMIT -1 OFFSET ?)",
+                    (self.max_disk_entries,),
+                )
@@ -0,0 +1,366 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional
+
+from .breaker import CircuitBreaker, CircuitOpenError
+
+INTERACTIVE = "interactive"
+BACKGROUND = "background"
+LANES = (INTERACTIVE, BACKGROUND)
+
+
+class AdaptiveLimit:
+    """AIMD concurrency limit driven by backend latency.
+
+    The smoothed latency is compared with the lowest latency seen recently.
+    While it stays within ``tolerance`` times that floor the backend is not
+    queueing and the limit grows by roughly one per round trip; once it
+    drifts above, requests are queueing inside the backend and the limit
+    shrinks. Failures halve it. The floor decays slowly so a permanently
+    slower backend (a bigger model) resets the baseline instead of pinning
+    the limit at the minimum.
+    """
+
+    def __init__(
+        self,
+        initial: int = 2,
+        *,
+        min_limit: int = 1,
+        max_limit: int = 8,
+        tolerance: float = 2.0,
+        smoothing: float = 0.2,
+        floor_decay: float = 1.01,
+    ) -> None:
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self.floor_decay = floor_decay
+        self._limit = float(min(max(initial, self.min_limit), self.max_limit))
+        self.smoothed_latency: float | None = None
+        self.min_latency: float | None = None
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def reset(self) -> None:
+        self._limit = float(self.min_limit)
+
+    def on_sample(self, latency: float, ok: bool = True) -> None:
+        if not ok:
+            self._limit = max(self.min_limit, self._limit * 0.5)
+            return
+        self.min_latency = latency if self.min_latency is None else min(latency, self.min_latency * self.floor_decay)
+        if self.smoothed_latency is None:
+            self.smoothed_latency = latency
+        else:
+            self.smoothed_latency += self.smoothing * (latency - self.smoothed_latency)
+        if self.smoothed_latency <= self.min_latency * self.tolerance:
+            self._limit = min(self.max_limit, self._limit + 1.0 / self._limit)
+        else:
+            self._limit = max(self.min_limit, self._limit * 0.9)
+
+
+class _CoalescedCancel:
+    """Cancel flag shared by every caller waiting on one coalesced request.
+
+    It reads as set only once every subscriber has cancelled; a subscriber
+    without a cancel event keeps the request alive.
+    """
+
+    def __init__(self) -> None:
+        self._events: List[Any] = []
+        self._pinned = False
+        self._callbacks: List[Callable[[], None]] = []
+        self._fired = False
+        self._lock = threading.Lock()
+
+    @property
+    def cancellable(self) -> bool:
+        return not self._pinned and bool(self._events)
+
+    def attach(self, event: Any) -> None:
+        if event is None:
+            self._pinned = True
+            return
+        self._events.append(event)
+        register = getattr(event, "add_callback", None)
+        if register is not None:
+            register(self._check)
+
+    def is_set(self) -> bool:
+        return self.cancellable and all(event.is_set() for event in self._events)
+
+    def add_callback(self, callback: Callable[[], None]) -> None:
+        with self._lock:
+            if not self._fired:
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def remove_callback(self, callback: Callable[[], None]) -> None:
+        with self._lock:
+            try:
+                self._callbacks.remove(callback)
+            except ValueError:
+                pass
+
+    def _check(self) -> None:
+        if not self.is_set():
+            return
+        with self._lock:
+            if self._fired:
+                return
+            self._fired = True
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                pass
+
+
+@dataclass
+class _Request:
+    key: Hashable
+    fn: Callable[[Any], Any]
+    lane: str
+    future: Future
+    cancel: _CoalescedCancel
+    submitted: float
+    breaker: CircuitBreaker | None = None
+    subscribers: int = 1
+
+
+@dataclass
+class SchedulerStats:
+    submitted: int = 0
+    coalesced: int = 0
+    completed: int = 0
+    failed: int = 0
+    cancelled: int = 0
+    rejected: int = 0
+    promoted: int = 0
+    peak_inflight: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return dict(self.__dict__)
+
+
+class RequestScheduler:
+    """Dispatches LLM backend calls with bounded, adaptive concurrency.
+
+    ``submit`` queues ``fn(cancel_event)`` in a priority lane and returns a
+    future. The interactive lane is always served first; the background
+    lane (COT, summaries) may only fill ``background_share`` of the current
+    limit so a burst of background work cannot block a user's question.
+    Submissions with the same ``key`` while a request is queued or in
+    flight share its future, and an interactive duplicate promotes a queued
+    background request.
+
+    The concurrency limit adapts to observed latency (see
+    ``AdaptiveLimit``). When a ``CircuitBreaker`` is attached, to the
+    scheduler or to a single submission, requests are rejected with
+    ``CircuitOpenError`` while it is open and the limit restarts from the
+    minimum after it closes.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = 4,
+        min_concurrency: int = 1,
+        initial_concurrency: int | None = None,
+        background_share: float = 0.5,
+        breaker: CircuitBreaker | None = None,
+        limiter: AdaptiveLimit | None = None,
+        name: str = "llm-scheduler",
+    ) -> None:
+        self.limiter = limiter or AdaptiveLimit(
+            initial_concurrency or min_concurrency,
+            min_limit=min_concurrency,
+            max_limit=max_concurrency,
+        )
+        self.background_share = background_share
+        self.breaker = breaker
+        self.stats = SchedulerStats()
+        self._lanes: Dict[str, Deque[_Request]] = {lane: deque() for lane in LANES}
+        self._pending: Dict[Hashable, _Request] = {}
+        self._inflight = {lane: 0 for lane in LANES}
+        self._cond = threading.Condition()
+        self._closed = False
+        self._open_breakers: set[int] = set()
+        self._threads = [
+            threading.Thread(target=self._worker, name=f"{name}-{idx}", daemon=True)
+            for idx in range(self.limiter.max_limit)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    @property
+    def limit(self) -> int:
+        return self.limiter.limit
+
+    @property
+    def inflight(self) -> int:
+        return sum(self._inflight.values())
+
+    def queued(self, lane: str | None = None) -> int:
+        with self._cond:
+            if lane is not None:
+                return len(self._lanes[lane])
+            return sum(len(requests) for requests in self._lanes.values())
+
+    def submit(
+        self,
+        fn: Callable[[Any], Any],
+        *,
+        key: Hashable | None = None,
+        lane: str = INTERACTIVE,
+        cancel_event: Any = None,
+        breaker: CircuitBreaker | None = None,
+    ) -> Future:
+        """Queue ``fn``; ``breaker`` overrides the scheduler-wide one for this request."""
+        if lane not in self._lanes:
+            raise ValueError(f"Unknown lane '{lane}'; expected one of {LANES}")
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("scheduler is shut down")
+            self.stats.submitted += 1
+            existing = self._pending.get(key) if key is not None else None
+            if existing is not None:
+                existing.cancel.attach(cancel_event)
+                existing.subscribers += 1
+                self.stats.coalesced += 1
+                if lane == INTERACTIVE and existing.lane == BACKGROUND and existing in self._lanes[BACKGROUND]:
+                    self._lanes[BACKGROUND].remove(existing)
+                    existing.lane = INTERACTIVE
+                    self._lanes[INTERACTIVE].append(existing)
+                    self.stats.promoted += 1
+                    self._cond.notify()
+                return existing.future
+            cancel = _CoalescedCancel()
+            cancel.attach(cancel_event)
+            request = _Request(
+                key=key,
+                fn=fn,
+                lane=lane,
+                future=Future(),
+                cancel=cancel,
+                submitted=time.perf_counter(),
+                breaker=breaker or self.breaker,
+            )
+            if key is not None:
+                self._pending[key] = request
+            self._lanes[lane].append(request)
+            self._cond.notify()
+            return request.future
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def _background_slots(self, limit: int) -> int:
+        return max(1, int(limit * self.background_share))
+
+    def _next_request(self) -> Optional[_Request]:
+        limit = self.limiter.limit
+        if self.inflight >= limit:
+            return None
+        if self._lanes[INTERACTIVE]:
+            return self._lanes[INTERACTIVE].popleft()
+        if self._lanes[BACKGROUND] and self._inflight[BACKGROUND] < self._background_slots(limit):
+            return self._lanes[BACKGROUND].popleft()
+        return None
+
+    def _breaker_open(self, breaker: CircuitBreaker | None) -> bool:
+        if breaker is None:
+            return False
+        is_open = breaker.is_open()
+        if is_open:
+            self._open_breakers.add(id(breaker))
+        elif id(breaker) in self._open_breakers:
+            # probe the recovered backend gently before ramping up again
+            self._open_breakers.discard(id(breaker))
+            self.limiter.reset()
+        return is_open
+
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed and not any(self._lanes.values()):
+                        return
+                    request = self._next_request()
+                    if request is not None:
+                        break
+                    self._cond.wait()
+                if request.cancel.is_set():
+                    self._finish(request)
+                    self.stats.cancelled += 1
+                    request.future.set_result(None)
+                    continue
+                if self._breaker_open(request.breaker):
+                    self._finish(request)
+                    self.stats.rejected += 1
+                    request.future.set_exception(CircuitOpenError("Circuit breaker is open"))
+                    continue
+                if not request.future.set_running_or_notify_cancel():
+                    self._finish(request)
+                    continue
+                lane = request.lane
+                self._inflight[lane] += 1
+                self.stats.peak_inflight = max(self.stats.peak_inflight, self.inflight)
+
+            started = time.perf_counter()
+            ok = True
+            try:
+                result = request.fn(request.cancel if request.cancel.cancellable else None)
+            except BaseException as exc:
+                ok = False
+                result = exc
+            latency = time.perf_counter() - started
+
+            with self._cond:
+                self._inflight[lane] -= 1
+                self._finish(request)
+                if request.cancel.is_set():
+                    self.stats.cancelled += 1
+                else:
+                    self.limiter.on_sample(latency, ok)
+                    if ok:
+                        self.stats.completed += 1
+                    else:
+                        self.stats.failed += 1
+                self._cond.notify_all()
+            if ok:
+                request.future.set_result(result)
+            else:
+                request.future.set_exception(result)
+
+    def _finish(self, request: _Request) -> None:
+        if request.key is not None and self._pending.get(request.key) is request:
+            del self._pending[request.key]
+
+
+_shared: Dict[str, RequestScheduler] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_scheduler(name: str, factory: Callable[[], RequestScheduler]) -> RequestScheduler:
+    """Process-wide scheduler per backend, so sessions sharing a host share its limit."""
+    with _shared_lock:
+        scheduler = _shared.get(name)
+        if scheduler is None:
+            scheduler = _shared[name] = factory()
+        return scheduler
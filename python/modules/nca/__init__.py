@@ -14,8 +14,9 @@ from .multiagent import MultiAgentSystem
 from .orientation import OrientationCenter
 from .self_model import SelfModel
 from .shared_causal import SharedCausalGraph
-from .signals import CollectiveSignalBus, InternalSignal, SignalBus
+from .signals import CollectiveSignalBus, InternalSignal, SignalBus, TopicMetrics
 from .social_cognition import SocialCognitionEngine
+from .spatial import SpatialHash
 from .synergy_engine import SynergyEngine
 from .trajectories import TrajectoryOption, TrajectoryPlanner
 from .value_system import ValueSystem
@@ -43,7 +44,9 @@ __all__ = [
     "SharedCausalGraph",
     "SignalBus",
     "SocialCognitionEngine",
+    "SpatialHash",
     "SynergyEngine",
+    "TopicMetrics",
     "TrajectoryOption",
     "TrajectoryPlanner",
     "ValueSystem",
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+from .orientation import OrientationCenter
+from .world import GridWorld
+
+ACTIONS: tuple[str, ...] = ("left", "right", "idle")
+_LEFT, _RIGHT, _IDLE = 0, 1, 2
+# Snapshot features tracked by SelfModel: progress pref, stability pref,
+# impulsiveness, stability preference (personality) and risk tolerance.
+_SNAPSHOT_WIDTH = 5
+
+
+class BatchedNCAPopulation:
+    """Array-of-agents NCA backend advancing every agent in one vectorized step.
+
+    Mirrors the core of ``NCAAgent.step`` for a population sharing one
+    ``GridWorld`` layout: observation noise, ``SelfModel`` windows (identity
+    drift and predicted self-consistency), ``OrientationCenter.update_from_self_model``
+    feedback, the planner's progress/stability/exploration/uncertainty scoring
+    with world causal features, and the world's blocked/slippery transitions.
+    Higher cognitive engines (intent, values, social, culture, learned causal
+    graph) are not modelled, so outputs are comparable to the object backend
+    in aggregate rather than step for step.
+    """
+
+    def __init__(
+        self,
+        world: GridWorld,
+        orientation: OrientationCenter,
+        *,
+        population: int,
+        seed: int = 42,
+        max_history: int = 100,
+    ) -> None:
+        if population < 1:
+            raise ValueError("population must be >= 1")
+        self.population = population
+        self.size = world.size
+        self.noise_level = float(world.noise_level)
+        self.max_history = max_history
+        self.t = 0
+        self._rng = np.random.default_rng(seed)
+
+        cells = np.arange(self.size)
+        self._slippery = np.isin(cells, world.slippery_zone)
+        self._blocked = np.isin(cells, world.blocked_zone)
+        self._reward = np.isin(cells, world.reward_zone)
+
+        self.position = np.full(population, world.agent_position, dtype=np.int64)
+        self.previous_position = self.position.copy()
+        self.goal = np.full(population, world.goal_position, dtype=np.int64)
+
+        prefs = orientation.preferences
+        self.pref_progress = np.full(population, float(prefs.get("progress", np.nan)))
+        self.pref_stability = np.full(population, float(prefs.get("stability", np.nan)))
+        self.risk_tolerance = np.full(population, float(orientation.risk_tolerance))
+        self.exploration_ratio = np.full(population, float(orientation.exploration_ratio))
+        self.impulsiveness = np.full(population, float(orientation.impulsiveness))
+        self.stability_preference = np.full(population, float(orientation.stability_preference))
+
+        self._snapshots = np.zeros((population, max_history, _SNAPSHOT_WIDTH))
+        self._edge_weights = np.zeros((population, max_history))
+        self._snapshot_count = 0
+        self._edge_count = 0
+        self.identity_drift = np.zeros(population)
+        self.predicted_consistency = np.ones(population)
+
+    def _record_self_model(self) -> None:
+        snapshot = np.stack(
+            (
+                np.nan_to_num(self.pref_progress, nan=0.0),
+                np.nan_to_num(self.pref_stability, nan=0.0),
+                self.impulsiveness,
+                self.stability_preference,
+                self.risk_tolerance,
+            ),
+            axis=1,
+        )
+        slot = self._snapshot_count % self.max_history
+        if self._snapshot_count:
+            previous = self._snapshots[:, (self._snapshot_count - 1) % self.max_history]
+            weight = np.abs(snapshot - previous).sum(axis=1)
+            self._edge_weights[:, self._edge_count % self.max_history] = weight
+            self._edge_count += 1
+        else:
+            weight = np.zeros(self.population)
+        self._snapshots[:, slot] = snapshot
+        self._snapshot_count += 1
+
+        # predict_future_state: the summed one-step trend equals the newest edge weight.
+        self.predicted_consistency = np.clip(1.0 - np.minimum(1.0, weight), 0.0, 1.0)
+        if self._snapshot_count < 2:
+            self.identity_drift = np.zeros(self.population)
+            return
+        window = min(10, self._edge_count)
+        slots = (self._edge_count - 1 - np.arange(window)) % self.max_history
+        self.identity_drift = np.maximum(0.0, self._edge_weights[:, slots].mean(axis=1))
+
+    def _apply_orientation_feedback(self) -> None:
+        self.stability_preference = np.where(
+            self.identity_drift >= 0.35,
+            np.minimum(1.0, self.stability_preference + 0.08),
+            self.stability_preference,
+        )
+        self.impulsiveness = np.where(
+            self.predicted_consistency < 0.45,
+            np.maximum(0.0, self.impulsiveness - 0.07),
+            self.impulsiveness,
+        )
+
+    def _score_actions(self, goal_hidden: np.ndarray, observation_uncertainty: np.ndarray) -> np.ndarray:
+        last = self.size - 1
+        projected = np.stack(
+            (np.maximum(0, self.position - 1), np.minimum(last, self.position + 1), self.position),
+            axis=1,
+        )
+        is_idle = np.zeros((1, 3), dtype=bool)
+        is_idle[0, _IDLE] = True
+
+        success = np.where(is_idle, 0.15, 0.75) + np.zeros_like(projected, dtype=float)
+        error = np.full(projected.shape, 0.05)
+        deviation = np.where(is_idle, 0.2, 0.05) + np.zeros_like(projected, dtype=float)
+        slippery = self._slippery[projected]
+        success = success - 0.2 * slippery
+        deviation = deviation + 0.35 * slippery
+        blocked = self._blocked[projected] & ~is_idle
+        success = success - 0.45 * blocked
+        error = error + 0.35 * blocked
+        success = success + 0.2 * self._reward[projected]
+        causal = 0.25 * (np.clip(success, 0.0, 1.0) - np.clip(error, 0.0, 1.0) - np.clip(deviation, 0.0, 1.0))
+
+        action_risk = np.where(is_idle, 0.15, 0.08)
+        uncertainty = np.clip(
+            0.45 * self.noise_level + 0.35 * observation_uncertainty[:, None] + 0.2 * action_risk,
+            0.0,
+            1.0,
+        )
+
+        progress_weight = np.nan_to_num(self.pref_progress, nan=1.0)[:, None]
+        stability_weight = np.nan_to_num(self.pref_stability, nan=0.2)[:, None]
+        distance = np.abs(self.goal[:, None] - projected)
+        progress = np.where(goal_hidden[:, None], 0.0, -distance)
+        base = (
+            progress_weight * progress
+            + stability_weight * np.where(is_idle, -1.0, 0.0)
+            + self.exploration_ratio[:, None] * np.where(is_idle, -0.1, 0.2)
+        )
+        return base + 0.25 * causal - uncertainty * (1.0 - self.risk_tolerance[:, None])
+
+    def _move(self, actions: np.ndarray) -> None:
+        before = self.position
+        delta = np.where(actions == _LEFT, -1, np.where(actions == _RIGHT, 1, 0))
+        projected = np.clip(before + delta, 0, self.size - 1)
+        moving = actions != _IDLE
+        projected = np.where(moving & self._blocked[projected], before, projected)
+        slips = moving & self._slippery[projected] & (self._rng.random(self.population) < 0.35)
+        jitter = self._rng.choice(np.array([-1, 1]), size=self.population)
+        projected = np.where(slips, np.clip(projected + jitter, 0, self.size - 1), projected)
+        self.previous_position = before
+        self.position = projected
+
+    def step(self) -> dict[str, Any]:
+        if self.noise_level > 0:
+            goal_hidden = self._rng.random(self.population) < self.noise_level * 0.4
+            observation_uncertainty = np.minimum(1.0, self.noise_level + self._rng.random(self.population) * 0.2)
+        else:
+            goal_hidden = np.zeros(self.population, dtype=bool)
+            observation_uncertainty = np.zeros(self.population)
+
+        self._record_self_model()
+        self._apply_orientation_feedback()
+        scores = self._score_actions(goal_hidden, observation_uncertainty)
+        actions = scores.argmax(axis=1)
+        self._move(actions)
+        self.t += 1
+
+        counts = np.bincount(actions, minlength=len(ACTIONS))
+        reached = self.position == self.goal
+        return {
+            "t": self.t,
+            "population": self.population,
+            "action_counts": {name: int(counts[idx]) for idx, name in enumerate(ACTIONS)},
+            "mean_position": float(self.position.mean()),
+            "goal_reached_rate": float(reached.mean()),
+            "mean_score": float(scores.max(axis=1).mean()),
+            "identity_drift": float(self.identity_drift.mean()),
+            "predicted_self_consistency": float(self.predicted_consistency.mean()),
+            "mean_impulsiveness": float(self.impulsiveness.mean()),
+            "mean_stability_preference": float(self.stability_preference.mean()),
+        }
+
+    def run(self, steps: int) -> list[dict[str, Any]]:
+        return [self.step() for _ in range(steps)]
+
+    def positions(self) -> list[int]:
+        return self.position.tolist()
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import random
+import time
+
+from modules.nca.spatial import SpatialHash
+from modules.nca.world import GridWorld
+
+
+def _pairwise_collisions(positions: dict[str, int]) -> list[tuple[str, str, int]]:
+    values = list(positions.items())
+    found: list[tuple[str, str, int]] = []
+    for idx, (agent_a, pos_a) in enumerate(values):
+        for agent_b, pos_b in values[idx + 1 :]:
+            if pos_a == pos_b:
+                found.append((agent_a, agent_b, pos_a))
+    return found
+
+
+def run_spatial_benchmark(
+    agent_counts: tuple[int, ...] = (10, 100, 1_000, 10_000),
+    steps: int = 5,
+    seed: int = 11,
+    pairwise_limit: int = 2_000,
+) -> list[dict[str, float]]:
+    """Compare pairwise and hashed collision detection as the population grows.
+
+    The world grows with the population (10 cells per agent) so collisions stay
+    sparse, which is the regime the spatial hash targets. The pairwise scan is
+    skipped above ``pairwise_limit`` agents because it becomes quadratic.
+    """
+    results: list[dict[str, float]] = []
+    for count in agent_counts:
+        rng = random.Random(seed)
+        world = GridWorld(size=count * 10, start_position=0, goal_position=count * 10 - 1)
+        positions = {f"agent-{idx}": rng.randrange(world.size) for idx in range(count)}
+
+        index = SpatialHash()
+        started = time.perf_counter()
+        for _ in range(steps):
+            for agent_id in positions:
+                positions[agent_id] = max(0, min(world.size - 1, positions[agent_id] + rng.choice((-1, 0, 1))))
+            index.sync(positions)
+            hashed = list(index.collisions())
+        hashed_ms = (time.perf_counter() - started) * 1000.0 / steps
+
+        started = time.perf_counter()
+        world.multiagent_features(positions)
+        features_ms = (time.perf_counter() - started) * 1000.0
+
+        pairwise_ms = float("nan")
+        if count <= pairwise_limit:
+            started = time.perf_counter()
+            pairwise = _pairwise_collisions(positions)
+            pairwise_ms = (time.perf_counter() - started) * 1000.0
+            assert pairwise == hashed
+
+        row = {
+            "agents": float(count),
+            "collisions": float(len(hashed)),
+            "hashed_step_ms": hashed_ms,
+            "pairwise_step_ms": pairwise_ms,
+            "multiagent_features_ms": features_ms,
+        }
+        results.append(row)
+        print(
+            f"agents={count:>6} collisions={len(hashed):>5} "
+            f"hashed={hashed_ms:8.3f}ms pairwise={pairwise_ms:10.3f}ms "
+            f"features={features_ms:8.3f}ms"
+        )
+    return results
+
+
+if __name__ == "__main__":
+    run_spatial_benchmark()
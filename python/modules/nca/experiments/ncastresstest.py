@@ -3,11 +3,26 @@ from __future__ import annotations
 import random
 
 from modules.nca.agent import NCAAgent
+from modules.nca.batched import BatchedNCAPopulation
 from modules.nca.orientation import OrientationCenter
 from modules.nca.world import GridWorld
 
 
-def run_stress_test(steps: int = 30, seed: int = 7) -> list[dict[str, object]]:
+def run_stress_test(
+    steps: int = 30,
+    seed: int = 7,
+    *,
+    backend: str = "object",
+    population: int = 1,
+) -> list[dict[str, object]]:
+    """Run the noisy-world stress scenario.
+
+    ``backend="object"`` steps a single ``NCAAgent`` and logs its full events;
+    ``backend="batched"`` advances ``population`` agents through
+    ``BatchedNCAPopulation`` and logs one aggregate event per step.
+    """
+    if backend not in ("object", "batched"):
+        raise ValueError(f"Unknown backend: {backend}")
     rng = random.Random(seed)
     world = GridWorld(size=14, start_position=0, goal_position=12, noise_level=0.55)
     orientation = OrientationCenter(
@@ -19,9 +34,27 @@ def run_stress_test(steps: int = 30, seed: int = 7) -> list[dict[str, object]]:
         impulsiveness=0.25,
         stability_preference=0.75,
     )
-    agent = NCAAgent(world=world, orientation=orientation)
-
     log: list[dict[str, object]] = []
+    if backend == "batched":
+        batch = BatchedNCAPopulation(world, orientation, population=population, seed=seed)
+        for _ in range(steps):
+            if rng.random() < 0.2:
+                batch.noise_level = min(0.9, batch.noise_level + 0.1)
+            elif rng.random() < 0.2:
+                batch.noise_level = max(0.1, batch.noise_level - 0.1)
+
+            summary = batch.step()
+            log.append(summary)
+            print(
+                f"t={summary['t']:02d} population={summary['population']} "
+                f"actions={summary['action_counts']} "
+                f"mean_position={summary['mean_position']:.2f} "
+                f"goal_reached={summary['goal_reached_rate']:.2f} "
+                f"predicted_self_consistency={summary['predicted_self_consistency']:.2f}"
+            )
+        return log
+
+    agent = NCAAgent(world=world, orientation=orientation)
     for _ in range(steps):
         if rng.random() < 0.2:
             world.noise_level = min(0.9, world.noise_level + 0.1)
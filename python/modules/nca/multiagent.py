@@ -5,7 +5,7 @@ from typing import Any
 
 from .agent import NCAAgent
 from .shared_causal import SharedCausalGraph
-from .signals import CollectiveSignalBus, InternalSignal
+from .signals import ORIENTATION_FEEDBACK_TOPICS, CollectiveSignalBus, InternalSignal
 from .utils import normalize_traditions, get_norm_conflicts, MAX_NORM_CONFLICTS
 
 
@@ -47,7 +47,11 @@ class MultiAgentSystem:
         resolved_id = agent_id or getattr(agent.orientation, "identity", None) or f"agent-{len(self.agents)}"
         setattr(agent, "agent_id", resolved_id)
         self.agents.append(agent)
-        self.collective_signal_bus.subscribe_agent(resolved_id, agent._orientation_signal_handler)
+        self.collective_signal_bus.subscribe_agent(
+            resolved_id,
+            agent._orientation_signal_handler,
+            topics=ORIENTATION_FEEDBACK_TOPICS,
+        )
 
     def broadcast_signals(self) -> list[dict[str, Any]]:
         distributed: list[dict[str, Any]] = []
@@ -58,8 +62,11 @@ class MultiAgentSystem:
                 payload = dict(signal.payload)
                 payload["sourceagentid"] = agent_id
                 collective_signal = InternalSignal(signal_type=signal.signal_type, payload=payload, t=signal.t)
-                self.collective_signal_bus.emit_broadcast(collective_signal)
+                self.collective_signal_bus.queue_broadcast(collective_signal)
                 distributed.append({"sourceagentid": agent_id, "type": signal.signal_type, "payload": payload})
+            # deliver before draining the next agent's bus, so feedback its
+            # handlers emit in response is still distributed this step
+            self.collective_signal_bus.flush()
         return distributed
 
     def step_all(self) -> list[dict[str, Any]]:
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
-from time import time
-from typing import Any, Callable
+from time import monotonic, time
+from typing import Any, Callable, Iterable
 
 SignalHandler = Callable[["InternalSignal"], None]
 
@@ -13,6 +14,15 @@ COLLECTIVE_RISK_DETECTED = "collective_risk_detected"
 COORDINATION_REQUIRED = "coordination_required"
 MULTIAGENT_DRIFT = "multiagent_drift"
 COLLECTIVE_GOAL_CONFLICT = "collectivegoalconflict"
+ORIENTATION_FEEDBACK_REQUIRED = "orientationfeedbackrequired"
+
+# Signal types consumed by NCAAgent._orientation_signal_handler.
+ORIENTATION_FEEDBACK_TOPICS: tuple[str, ...] = (
+    ORIENTATION_FEEDBACK_REQUIRED,
+    CAUSAL_DRIFT,
+    MULTIAGENT_DRIFT,
+    COORDINATION_REQUIRED,
+)
 
 
 @dataclass
@@ -25,76 +35,216 @@ class InternalSignal:
     timestamp: float = field(default_factory=time)
 
 
+@dataclass
+class TopicMetrics:
+    """Per-topic delivery counters reported by ``SignalBus.metrics``."""
+
+    emitted: int = 0
+    delivered: int = 0
+    dropped: int = 0
+    first_seen: float = 0.0
+    last_seen: float = 0.0
+
+    def rate(self) -> float:
+        span = self.last_seen - self.first_seen
+        if span <= 0.0:
+            return float(self.emitted)
+        return self.emitted / span
+
+    def to_dict(self) -> dict[str, float]:
+        return {
+            "emitted": self.emitted,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "rate_per_s": self.rate(),
+        }
+
+
 class SignalBus:
-    """Centralized in-process registry and dispatcher for internal signals."""
+    """Centralized in-process registry and dispatcher for internal signals.
+
+    Recent signals live in a ring buffer of ``max_recent`` entries; signals
+    evicted before anyone read them are counted as drops for their topic.
+    Handlers may subscribe to specific topics (signal types) so dispatch only
+    touches interested subscribers.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, *, max_recent: int = 256) -> None:
         self._handlers: list[SignalHandler] = []
-        self._recent: list[InternalSignal] = []
+        self._topic_handlers: dict[str, list[SignalHandler]] = {}
+        self._recent: deque[InternalSignal] = deque(maxlen=max_recent)
+        self._unread: set[int] = set()
+        self._metrics: dict[str, TopicMetrics] = {}
+
+    def _topic(self, signal_type: str) -> TopicMetrics:
+        metrics = self._metrics.get(signal_type)
+        if metrics is None:
+            now = monotonic()
+            metrics = TopicMetrics(first_seen=now, last_seen=now)
+            self._metrics[signal_type] = metrics
+        return metrics
+
+    def _track(self, signal: InternalSignal) -> TopicMetrics:
+        metrics = self._topic(signal.signal_type)
+        metrics.emitted += 1
+        metrics.last_seen = monotonic()
+        return metrics
+
+    def _remember(self, signal: InternalSignal) -> None:
+        if self._recent.maxlen is not None and len(self._recent) == self._recent.maxlen:
+            evicted = self._recent[0]
+            if id(evicted) in self._unread:
+                self._unread.discard(id(evicted))
+                self._metrics[evicted.signal_type].dropped += 1
+        self._recent.append(signal)
+        self._unread.add(id(signal))
+
+    def _handlers_for(self, signal_type: str) -> list[SignalHandler]:
+        topical = self._topic_handlers.get(signal_type)
+        if not topical:
+            return self._handlers
+        return self._handlers + topical
 
     def emit(self, signal: InternalSignal) -> None:
-        self._recent.append(signal)
-        for handler in self._handlers:
+        metrics = self._track(signal)
+        self._remember(signal)
+        for handler in self._handlers_for(signal.signal_type):
+            self._unread.discard(id(signal))
             handler(signal)
+            metrics.delivered += 1
 
-    def subscribe(self, handler: SignalHandler) -> None:
-        self._handlers.append(handler)
+    def subscribe(self, handler: SignalHandler, *, topics: Iterable[str] | None = None) -> None:
+        if topics is None:
+            self._handlers.append(handler)
+            return
+        for topic in topics:
+            self._topic_handlers.setdefault(topic, []).append(handler)
 
     def get_recent(self, *, clear: bool = False) -> list[InternalSignal]:
         snapshot = list(self._recent)
+        self._unread.clear()
         if clear:
             self._recent.clear()
         return snapshot
 
+    def metrics(self) -> dict[str, dict[str, float]]:
+        return {topic: item.to_dict() for topic, item in self._metrics.items()}
+
 
 class CollectiveSignalBus(SignalBus):
-    """Signal bus with scoped routing for multi-agent communication."""
+    """Signal bus with scoped routing for multi-agent communication.
 
-    def __init__(self) -> None:
-        super().__init__()
+    Agent and group subscriptions are indexed by topic, so a broadcast only
+    reaches handlers registered for its signal type (or for every type).
+    ``queue_*`` methods stage signals for batched delivery by ``flush``; at
+    most ``max_pending`` signals are staged and the oldest are dropped first.
+    """
+
+    def __init__(self, *, max_recent: int = 256, max_pending: int = 1024) -> None:
+        super().__init__(max_recent=max_recent)
         self._agent_handlers: dict[str, list[SignalHandler]] = {}
         self._group_handlers: dict[str, list[SignalHandler]] = {}
-
-    def subscribe_agent(self, agent_id: str, handler: SignalHandler) -> None:
+        self._agent_topics: dict[str, dict[str | None, list[SignalHandler]]] = {}
+        self._group_topics: dict[str, dict[str | None, list[SignalHandler]]] = {}
+        self._broadcast_topics: dict[str | None, dict[int, SignalHandler]] = {}
+        self._pending: deque[tuple[str, str | None, InternalSignal]] = deque()
+        self._max_pending = max_pending
+
+    @staticmethod
+    def _index(
+        index: dict[str | None, list[SignalHandler]],
+        handler: SignalHandler,
+        topics: Iterable[str] | None,
+    ) -> list[str | None]:
+        keys: list[str | None] = [None] if topics is None else list(topics)
+        for key in keys:
+            index.setdefault(key, []).append(handler)
+        return keys
+
+    @staticmethod
+    def _scoped(index: dict[str | None, list[SignalHandler]] | None, signal_type: str) -> list[SignalHandler]:
+        if not index:
+            return []
+        return index.get(None, []) + index.get(signal_type, [])
+
+    def subscribe_agent(self, agent_id: str, handler: SignalHandler, *, topics: Iterable[str] | None = None) -> None:
         self._agent_handlers.setdefault(agent_id, []).append(handler)
+        keys = self._index(self._agent_topics.setdefault(agent_id, {}), handler, topics)
+        for key in keys:
+            self._broadcast_topics.setdefault(key, {}).setdefault(id(handler), handler)
 
-    def subscribe_group(self, group_id: str, handler: SignalHandler) -> None:
+    def subscribe_group(self, group_id: str, handler: SignalHandler, *, topics: Iterable[str] | None = None) -> None:
         self._group_handlers.setdefault(group_id, []).append(handler)
+        self._index(self._group_topics.setdefault(group_id, {}), handler, topics)
+
+    def _deliver(self, signal: InternalSignal, handlers: list[SignalHandler]) -> None:
+        metrics = self._metrics[signal.signal_type]
+        for handler in handlers + self._handlers_for(signal.signal_type):
+            self._unread.discard(id(signal))
+            handler(signal)
+            metrics.delivered += 1
 
     def emit_local(self, signal: InternalSignal, *, target_agent_id: str) -> None:
         signal.payload.setdefault("scope", "local")
         signal.payload.setdefault("targetagentid", target_agent_id)
-        self._recent.append(signal)
-        for handler in self._agent_handlers.get(target_agent_id, []):
-            handler(signal)
-        for handler in self._handlers:
-            handler(signal)
+        self._track(signal)
+        self._remember(signal)
+        self._deliver(signal, self._scoped(self._agent_topics.get(target_agent_id), signal.signal_type))
 
     def emit_group(self, signal: InternalSignal, *, group_id: str) -> None:
         signal.payload.setdefault("scope", "group")
         signal.payload.setdefault("groupid", group_id)
-        self._recent.append(signal)
-        for handler in self._group_handlers.get(group_id, []):
-            handler(signal)
-        for handler in self._handlers:
-            handler(signal)
+        self._track(signal)
+        self._remember(signal)
+        self._deliver(signal, self._scoped(self._group_topics.get(group_id), signal.signal_type))
 
     def emit_broadcast(self, signal: InternalSignal) -> None:
         signal.payload.setdefault("scope", "broadcast")
-        self._recent.append(signal)
-        delivered: set[int] = set()
-        for handlers in self._agent_handlers.values():
-            for handler in handlers:
-                handler_id = id(handler)
-                if handler_id in delivered:
-                    continue
-                delivered.add(handler_id)
-                handler(signal)
-        for handler in self._handlers:
-            handler(signal)
+        self._track(signal)
+        self._remember(signal)
+        wildcard = self._broadcast_topics.get(None, {})
+        topical = self._broadcast_topics.get(signal.signal_type, {})
+        if topical:
+            handlers = dict(wildcard)
+            handlers.update(topical)
+            self._deliver(signal, list(handlers.values()))
+        else:
+            self._deliver(signal, list(wildcard.values()))
 
     def emit(self, signal: InternalSignal) -> None:
         source = signal.payload.get("sourceagentid")
         if source is None:
             signal.payload["sourceagentid"] = "system"
         self.emit_broadcast(signal)
+
+    def _stage(self, scope: str, target: str | None, signal: InternalSignal) -> None:
+        if len(self._pending) >= self._max_pending:
+            _, _, dropped = self._pending.popleft()
+            self._topic(dropped.signal_type).dropped += 1
+        self._pending.append((scope, target, signal))
+
+    def queue_local(self, signal: InternalSignal, *, target_agent_id: str) -> None:
+        self._stage("local", target_agent_id, signal)
+
+    def queue_group(self, signal: InternalSignal, *, group_id: str) -> None:
+        self._stage("group", group_id, signal)
+
+    def queue_broadcast(self, signal: InternalSignal) -> None:
+        self._stage("broadcast", None, signal)
+
+    def flush(self) -> int:
+        """Deliver every staged signal in submission order; returns the count."""
+        delivered = 0
+        while self._pending:
+            scope, target, signal = self._pending.popleft()
+            if scope == "local":
+                self.emit_local(signal, target_agent_id=str(target))
+            elif scope == "group":
+                self.emit_group(signal, group_id=str(target))
+            else:
+                self.emit_broadcast(signal)
+            delivered += 1
+        return delivered
+
+    def pending(self) -> int:
+        return len(self._pending)
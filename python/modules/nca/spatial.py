@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from itertools import product
+from typing import Any, Iterable, Iterator
+
+Position = int | tuple[int, ...]
+
+
+class SpatialHash:
+    """Incremental bucket index over agent positions on 1D or 2D grids.
+
+    Agents are bucketed by cell (``position // cell_size`` per axis). Every
+    agent keeps the rank it was first registered with, and all queries yield
+    agents in rank order so seeded runs stay reproducible regardless of the
+    order in which agents moved.
+    """
+
+    def __init__(self, *, cell_size: int = 1) -> None:
+        if cell_size < 1:
+            raise ValueError("cell_size must be >= 1")
+        self.cell_size = cell_size
+        self._positions: dict[str, Position] = {}
+        self._cells: dict[Position, Position] = {}
+        self._buckets: dict[Position, dict[str, None]] = {}
+        self._ranks: dict[str, int] = {}
+        self._next_rank = 0
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, agent_id: object) -> bool:
+        return agent_id in self._positions
+
+    def _cell_of(self, position: Position) -> Position:
+        if isinstance(position, tuple):
+            return tuple(int(axis) // self.cell_size for axis in position)
+        return int(position) // self.cell_size
+
+    def _ordered(self, agent_ids: Iterable[str]) -> list[str]:
+        return sorted(agent_ids, key=self._ranks.__getitem__)
+
+    def position_of(self, agent_id: str) -> Position | None:
+        return self._positions.get(agent_id)
+
+    def update(self, agent_id: str, position: Position) -> bool:
+        """Insert or move an agent; returns True when its position changed."""
+        previous = self._positions.get(agent_id)
+        if previous == position and agent_id in self._ranks:
+            return False
+        if agent_id not in self._ranks:
+            self._ranks[agent_id] = self._next_rank
+            self._next_rank += 1
+        cell = self._cell_of(position)
+        old_cell = self._cells.get(agent_id)
+        if old_cell is not None and old_cell != cell:
+            bucket = self._buckets[old_cell]
+            del bucket[agent_id]
+            if not bucket:
+                del self._buckets[old_cell]
+        if old_cell != cell:
+            self._buckets.setdefault(cell, {})[agent_id] = None
+            self._cells[agent_id] = cell
+        self._positions[agent_id] = position
+        return True
+
+    def remove(self, agent_id: str) -> None:
+        cell = self._cells.pop(agent_id, None)
+        if cell is None:
+            return
+        del self._positions[agent_id]
+        del self._ranks[agent_id]
+        bucket = self._buckets[cell]
+        del bucket[agent_id]
+        if not bucket:
+            del self._buckets[cell]
+
+    def sync(self, positions: dict[str, Position]) -> int:
+        """Bring the index in line with ``positions``; returns the number of moves.
+
+        Agents missing from ``positions`` are dropped, new agents are ranked
+        in the mapping's iteration order.
+        """
+        stale = [agent_id for agent_id in self._positions if agent_id not in positions]
+        for agent_id in stale:
+            self.remove(agent_id)
+        moved = 0
+        for agent_id, position in positions.items():
+            if self.update(agent_id, position):
+                moved += 1
+        return moved
+
+    def occupants(self, position: Position) -> list[str]:
+        """Agents standing exactly on ``position``, in rank order."""
+        bucket = self._buckets.get(self._cell_of(position))
+        if not bucket:
+            return []
+        return self._ordered(agent_id for agent_id in bucket if self._positions[agent_id] == position)
+
+    def collisions(self) -> Iterator[tuple[str, str, Position]]:
+        """Yield ``(agent_a, agent_b, position)`` for every co-located pair.
+
+        Pairs are ordered by the rank of ``agent_a`` then ``agent_b``, matching
+        a naive pairwise scan over agents in registration order. Only buckets
+        holding two or more agents are inspected.
+        """
+        by_position: dict[Position, list[str]] = {}
+        for bucket in self._buckets.values():
+            if len(bucket) < 2:
+                continue
+            for agent_id in bucket:
+                by_position.setdefault(self._positions[agent_id], []).append(agent_id)
+
+        followers: dict[str, list[str]] = {}
+        for members in by_position.values():
+            if len(members) < 2:
+                continue
+            ordered = self._ordered(members)
+            for idx, agent_id in enumerate(ordered[:-1]):
+                followers[agent_id] = ordered[idx + 1 :]
+
+        for agent_a in self._ordered(followers):
+            position = self._positions[agent_a]
+            for agent_b in followers[agent_a]:
+                yield agent_a, agent_b, position
+
+    def neighbors(self, agent_id: str, radius: int = 1) -> list[str]:
+        """Agents within Chebyshev distance ``radius`` of ``agent_id`` (excluding itself)."""
+        origin = self._positions.get(agent_id)
+        if origin is None:
+            return []
+        return [other for other in self.within(origin, radius) if other != agent_id]
+
+    def within(self, position: Position, radius: int) -> list[str]:
+        """Agents within Chebyshev distance ``radius`` of ``position``, in rank order."""
+        origin = position if isinstance(position, tuple) else (int(position),)
+        cell_span = radius // self.cell_size + 1
+        center = self._cell_of(position)
+        center_axes = center if isinstance(center, tuple) else (center,)
+        found: list[str] = []
+        for offset in product(range(-cell_span, cell_span + 1), repeat=len(center_axes)):
+            axes = tuple(c + o for c, o in zip(center_axes, offset))
+            cell: Position = axes if isinstance(position, tuple) else axes[0]
+            bucket = self._buckets.get(cell)
+            if not bucket:
+                continue
+            for other in bucket:
+                other_position = self._positions[other]
+                other_axes = other_position if isinstance(other_position, tuple) else (int(other_position),)
+                if max(abs(a - b) for a, b in zip(origin, other_axes)) <= radius:
+                    found.append(other)
+        return self._ordered(found)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "agents": len(self._positions),
+            "occupied_cells": len(self._buckets),
+            "cell_size": self.cell_size,
+        }
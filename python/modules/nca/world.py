@@ -4,6 +4,8 @@ import random
 from dataclasses import dataclass
 from typing import Any
 
+from .spatial import SpatialHash
+
 
 @dataclass
 class GridWorld:
@@ -26,6 +28,7 @@ class GridWorld:
         self.t = 0
         self._rng = random.Random(42)
         self._last_position = self.agent_position
+        self._spatial = SpatialHash()
         if not self.slippery_zone:
             self.slippery_zone = (max(1, self.size // 3),)
         if not self.blocked_zone:
@@ -114,19 +117,15 @@ class GridWorld:
 
     def multiagent_features(self, agent_positions: dict[str, int]) -> dict[str, Any]:
         positions = {agent_id: max(0, min(self.size - 1, int(pos))) for agent_id, pos in agent_positions.items()}
-        collisions: list[dict[str, Any]] = []
-        values = list(positions.items())
-        for idx, (agent_a, pos_a) in enumerate(values):
-            for agent_b, pos_b in values[idx + 1 :]:
-                if pos_a == pos_b:
-                    collisions.append({"agents": (agent_a, agent_b), "position": pos_a})
-
-        shared_presence = {
-            zone: [agent_id for agent_id, pos in positions.items() if pos == zone]
-            for zone in self.shared_zones
-        }
+        self._spatial.sync(positions)
+        collisions: list[dict[str, Any]] = [
+            {"agents": (agent_a, agent_b), "position": pos}
+            for agent_a, agent_b, pos in self._spatial.collisions()
+        ]
+
+        shared_presence = {zone: self._spatial.occupants(zone) for zone in self.shared_zones}
         group_reward = sum(1.0 for zone, members in shared_presence.items() if members and zone in self.reward_zone)
-        cooperative_progress = sum(1.0 for pos in positions.values() if pos in self.cooperative_tasks)
+        cooperative_progress = float(sum(len(self._spatial.occupants(task)) for task in set(self.cooperative_tasks)))
 
         return {
             "shared_zones": list(self.shared_zones),
@@ -138,6 +137,10 @@ class GridWorld:
             "shared_presence": shared_presence,
         }
 
+    def nearby_agents(self, agent_id: str, radius: int = 1) -> list[str]:
+        """Agents within ``radius`` cells of ``agent_id`` as of the last ``multiagent_features`` call."""
+        return self._spatial.neighbors(agent_id, radius)
+
     def state(self) -> dict[str, Any]:
         base = {
             "t": self.t,
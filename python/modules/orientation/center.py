@@ -14,6 +14,22 @@ from .conviction_regulator import ConvictionRegulator
 from .trajectory_adapter import TrajectoryAdapter
 
 
+_NESTED = (dict, list, tuple)
+
+
+def _freeze(value: Any) -> Any:
+    """Immutable copy of nested dicts/lists, compared with ``==`` to detect unchanged inputs."""
+    if isinstance(value, dict):
+        items = tuple(value.items())
+        for _, item in items:
+            if isinstance(item, _NESTED):
+                return tuple((key, _freeze(item)) for key, item in items)
+        return items
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(item) for item in value))
+    return value
+
+
 @dataclass(frozen=True)
 class OrientationOutput:
     rhythm_phase: RhythmPhase
@@ -47,6 +63,11 @@ class OrientationCenter:
     Phase 13 - Orientation Center
 
     Skeleton: computes orientation signals only (no side effects).
+
+    The organ scores are memoized on the last inputs, and the output on the
+    last fused signals and trajectory signal, so repeated evaluations with
+    unchanged inputs skip the organs and the rhythm engine once fusion has
+    settled. Call ``clear_cache`` after reconfiguring an organ in place.
     """
 
     def __init__(
@@ -70,6 +91,14 @@ class OrientationCenter:
         self.cognitive_immunity = cognitive_immunity or CognitiveImmunity()
         self.conviction_regulator = conviction_regulator or ConvictionRegulator()
         self.trajectory_adapter = trajectory_adapter or TrajectoryAdapter()
+        self._inputs: tuple[Any, ...] | None = None
+        self._raw_signals: OrientationSignals | None = None
+        self._output: tuple[OrientationSignals, float, OrientationOutput] | None = None
+
+    def clear_cache(self) -> None:
+        self._inputs = None
+        self._raw_signals = None
+        self._output = None
 
     def evaluate(
         self,
@@ -81,21 +110,31 @@ class OrientationCenter:
         conviction_inputs: dict[str, Any] | None = None,
         trajectory_error: float | None = None,
     ) -> OrientationOutput:
-        diversity_score = self.metabolic_diversity.evaluate(history_stats)
-        stability_score = self.belief_aging.evaluate(beliefs)
-        contradiction_rate = self.temporal_causality.evaluate(temporal_metrics)
-        drift_pressure = self.cognitive_immunity.evaluate(immunity_signals)
-        confidence_budget = self.conviction_regulator.evaluate(conviction_inputs)
+        inputs = (
+            _freeze(history_stats),
+            _freeze(beliefs),
+            _freeze(temporal_metrics),
+            _freeze(immunity_signals),
+            _freeze(conviction_inputs),
+        )
+        raw_signals = self._raw_signals
+        if raw_signals is None or inputs != self._inputs:
+            raw_signals = OrientationSignals(
+                diversity_score=self.metabolic_diversity.evaluate(history_stats),
+                stability_score=self.belief_aging.evaluate(beliefs),
+                contradiction_rate=self.temporal_causality.evaluate(temporal_metrics),
+                drift_pressure=self.cognitive_immunity.evaluate(immunity_signals),
+                confidence_budget=self.conviction_regulator.evaluate(conviction_inputs),
+            )
+            self._inputs = inputs
+            self._raw_signals = raw_signals
         trajectory_signal = self.trajectory_adapter.evaluate(trajectory_error)
 
-        raw_signals = OrientationSignals(
-            diversity_score=diversity_score,
-            stability_score=stability_score,
-            contradiction_rate=contradiction_rate,
-            drift_pressure=drift_pressure,
-            confidence_budget=confidence_budget,
-        )
+        # fusion is stateful, so it runs every time; only what follows it is reused
         fused = self.fusion_layer.fuse(raw_signals)
+        cached = self._output
+        if cached is not None and cached[0] == fused and cached[1] == trajectory_signal:
+            return cached[2]
 
         rhythm_inputs = RhythmInputs(
             diversity_score=fused.diversity_score,
@@ -106,7 +145,7 @@ class OrientationCenter:
         )
         rhythm_result = self.rhythm_engine.evaluate(rhythm_inputs)
 
-        return OrientationOutput(
+        output = OrientationOutput(
             rhythm_phase=rhythm_result["rhythm_phase"],
             chaos_score=rhythm_result["chaos_score"],
             harmony_score=rhythm_result["harmony_score"],
@@ -118,3 +157,5 @@ class OrientationCenter:
             confidence_budget=fused.confidence_budget,
             trajectory_signal=trajectory_signal,
         )
+        self._output = (fused, trajectory_signal, output)
+        return output
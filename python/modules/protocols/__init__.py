@@ -1,9 +1,10 @@
 """Protocol utilities for CIP/HCP/LIP."""
 
 from .cip import CIP_VERSION, CipIdentity, CipState, build_envelope as build_cip_envelope
+from .codec import BinaryEnvelope, CodecError, decode_envelope, encode_envelope
 from .hcp import HCP_VERSION, HcpHumanState, HcpIdentity, build_envelope as build_hcp_envelope
 from .lip import LIP_VERSION, LipIdentity, LipSource, build_envelope as build_lip_envelope
-from .router import ProtocolRouter, RouterResult
+from .router import ProtocolRouter, RouterResult, TypeStats
 from .trust import TrustFSM, TrustState, TrustTransition
 
 __all__ = [
@@ -11,6 +12,10 @@ __all__ = [
     "CipIdentity",
     "CipState",
     "build_cip_envelope",
+    "BinaryEnvelope",
+    "CodecError",
+    "decode_envelope",
+    "encode_envelope",
     "HCP_VERSION",
     "HcpHumanState",
     "HcpIdentity",
@@ -21,6 +26,7 @@ __all__ = [
     "build_lip_envelope",
     "ProtocolRouter",
     "RouterResult",
+    "TypeStats",
     "TrustFSM",
     "TrustState",
     "TrustTransition",
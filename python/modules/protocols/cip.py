@@ -3,9 +3,10 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Dict, Iterable
-import json
 import uuid
 
+from .codec import _canonical_encoder
+
 
 CIP_VERSION = "1.0"
 
@@ -49,7 +50,7 @@ class CipState:
 
 
 def canonical_json(data: Dict[str, Any]) -> str:
-    return json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return _canonical_encoder.encode(data)
 
 
 def build_envelope(
@@ -0,0 +1,378 @@
+"""Binary wire format for CIP/HCP/LIP envelopes.
+
+Layout (big-endian)::
+
+    header   magic "W4" | codec version u8 | protocol u8 | flags u8 | type u8
+             | msg_id 16 bytes | timestamp int64 (µs since epoch, UTC)
+    sections (tag u8 | length u32 | bytes)*, in ascending tag order
+
+Message types from ``MESSAGE_TYPES`` are sent as their index; anything else
+goes inline in a section, as do msg ids that are not UUIDs and timestamps
+that would not render back identically. Sections hold compact JSON with
+sorted keys, the canonical form used for signing, so encoding is
+deterministic and the signable bytes are assembled from the sections
+without parsing them. Identity sections start with a marker byte saying
+whether ``agent_id`` and ``fingerprint`` are present. ``decode_envelope``
+only indexes the sections of the buffer; nothing is parsed until a field
+is read.
+
+``MESSAGE_TYPES`` is part of the codec version: append to it only together
+with a new ``CODEC_VERSION``.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Dict, Tuple, Union
+
+MAGIC = b"W4"
+CODEC_VERSION = 1
+
+PROTOCOLS: Tuple[str, ...] = ("cip", "hcp", "lip")
+MESSAGE_TYPES: Tuple[str, ...] = (
+    "HELLO",
+    "HELLO_ACK",
+    "HUMAN_STATE",
+    "SOURCE_UPDATE",
+    "FACT_CONFIRM",
+    "FACT_CHALLENGE",
+)
+_TYPE_IDS = {name: index + 1 for index, name in enumerate(MESSAGE_TYPES)}
+
+_HEADER = struct.Struct(">2sBBBB16sq")
+_SECTION = struct.Struct(">BI")
+_IDENTITY_OK = b"\x00"
+_IDENTITY_INCOMPLETE = b"\x01"
+
+_FLAG_INLINE_ID = 0x01
+_FLAG_INLINE_TIMESTAMP = 0x02
+_FLAG_PACKED_ID = 0x04
+_FLAG_PACKED_TIMESTAMP = 0x08
+
+_VERSION, _TYPE, _MSG_ID, _TIMESTAMP = 1, 2, 3, 4
+_SENDER, _RECEIVER = 10, 11
+_STATE, _TRUST, _SOURCE, _PAYLOAD, _SIGN, _EXTRA = 12, 13, 14, 15, 16, 17
+
+_JSON_FIELDS = {"state": _STATE, "trust": _TRUST, "source": _SOURCE, "payload": _PAYLOAD, "sign": _SIGN}
+_IDENTITY_FIELDS = {"sender": _SENDER, "receiver": _RECEIVER}
+_HEADER_FIELDS = ("msg_id", "type", "timestamp")
+_SECTION_NAMES = {_VERSION: "version", _TYPE: "type", **{tag: key for key, tag in {**_JSON_FIELDS, **_IDENTITY_FIELDS}.items()}}
+_REQUIRED = {
+    "cip": ("version", "msg_id", "type", "timestamp", "sender", "receiver", "payload"),
+    "hcp": ("version", "msg_id", "type", "timestamp", "sender", "receiver", "state", "payload"),
+    "lip": ("version", "msg_id", "type", "timestamp", "sender", "receiver", "source", "payload"),
+}
+_SIGNED_SECTIONS = tuple((key, tag) for key, tag in {**_IDENTITY_FIELDS, **_JSON_FIELDS}.items() if key != "sign")
+_IDENTITY_TAGS = frozenset(_IDENTITY_FIELDS.values())
+_TYPE_BYTES = {type_id: json.dumps(name).encode("utf-8") for name, type_id in _TYPE_IDS.items()}
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+class CodecError(ValueError):
+    """Raised for buffers that are not a well-formed binary envelope."""
+
+
+# json.dumps builds a new encoder per call when given options; reuse one.
+# cip/hcp/lip import it for canonical_json, so this module must not import them at load time.
+_canonical_encoder = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def _dumps(value: Any) -> bytes:
+    return _canonical_encoder.encode(value).encode("utf-8")
+
+
+@lru_cache(maxsize=1)
+def _protocol_versions() -> Dict[str, Tuple[str, bytes]]:
+    """Current version of each protocol and its encoded section."""
+    from .cip import CIP_VERSION
+    from .hcp import HCP_VERSION
+    from .lip import LIP_VERSION
+
+    versions = {"cip": CIP_VERSION, "hcp": HCP_VERSION, "lip": LIP_VERSION}
+    return {name: (version, _dumps(version)) for name, version in versions.items()}
+
+
+@lru_cache(maxsize=256)
+def _key_bytes(key: str) -> bytes:
+    return _dumps(key) + b":"
+
+
+def _section(parts: list, tag: int, data: bytes) -> None:
+    parts.append(_SECTION.pack(tag, len(data)))
+    parts.append(data)
+
+
+def _encode_identity(identity: Any) -> bytes:
+    """JSON behind a marker byte that records whether the identity fields are present."""
+    valid = isinstance(identity, dict) and "agent_id" in identity and "fingerprint" in identity
+    return (_IDENTITY_OK if valid else _IDENTITY_INCOMPLETE) + _dumps(identity)
+
+
+def _timestamp_us(timestamp: Any) -> int | None:
+    """Microseconds for UTC ISO timestamps that render back byte-identical, else None."""
+    if not isinstance(timestamp, str) or not timestamp.endswith("+00:00"):
+        return None
+    try:
+        parsed = datetime.fromisoformat(timestamp)
+    except ValueError:
+        return None
+    if parsed.isoformat() != timestamp:
+        return None
+    return (parsed - _EPOCH) // _MICROSECOND
+
+
+def _render_timestamp(micros: int) -> str:
+    return (_EPOCH + timedelta(microseconds=micros)).isoformat()
+
+
+_UUID_DASHES = (8, 13, 18, 23)
+
+
+def _uuid_bytes(msg_id: Any) -> bytes | None:
+    """The 16 bytes of a canonical (lower-case, dashed) UUID string, else None."""
+    if not isinstance(msg_id, str) or len(msg_id) != 36 or msg_id != msg_id.lower():
+        return None
+    if any(msg_id[index] != "-" for index in _UUID_DASHES):
+        return None
+    try:
+        return bytes.fromhex(msg_id.replace("-", ""))
+    except ValueError:
+        return None
+
+
+def encode_envelope(envelope: Dict[str, Any]) -> bytes:
+    """Encode a dict envelope as built by ``build_cip_envelope`` and friends."""
+    protocol = next((name for name in PROTOCOLS if name in envelope), None)
+    if protocol is None:
+        raise CodecError("Envelope has no cip/hcp/lip version field")
+    parts: list = []
+    sections: list = []
+    flags = 0
+
+    message_type = envelope.get("type")
+    type_id = _TYPE_IDS.get(message_type, 0) if isinstance(message_type, str) else 0
+    if type_id == 0 and "type" in envelope:
+        sections.append((_TYPE, _dumps(message_type)))
+
+    id_bytes = _uuid_bytes(envelope.get("msg_id"))
+    if id_bytes is not None:
+        flags |= _FLAG_PACKED_ID
+    else:
+        id_bytes = bytes(16)
+        if "msg_id" in envelope:
+            flags |= _FLAG_INLINE_ID
+            sections.append((_MSG_ID, _dumps(envelope["msg_id"])))
+
+    micros = _timestamp_us(envelope.get("timestamp"))
+    if micros is not None:
+        flags |= _FLAG_PACKED_TIMESTAMP
+    else:
+        micros = 0
+        if "timestamp" in envelope:
+            flags |= _FLAG_INLINE_TIMESTAMP
+            sections.append((_TIMESTAMP, _dumps(envelope["timestamp"])))
+
+    version = envelope[protocol]
+    current, current_bytes = _protocol_versions()[protocol]
+    sections.append((_VERSION, current_bytes if version == current else _dumps(version)))
+    extra: Dict[str, Any] = {}
+    for key, value in envelope.items():
+        if key == protocol or key in _HEADER_FIELDS:
+            continue
+        tag = _JSON_FIELDS.get(key)
+        if tag is not None:
+            sections.append((tag, _dumps(value)))
+            continue
+        tag = _IDENTITY_FIELDS.get(key)
+        if tag is not None:
+            sections.append((tag, _encode_identity(value)))
+            continue
+        extra[key] = value
+    if extra:
+        sections.append((_EXTRA, _dumps(extra)))
+
+    parts.append(
+        _HEADER.pack(MAGIC, CODEC_VERSION, PROTOCOLS.index(protocol) + 1, flags, type_id, id_bytes, micros)
+    )
+    for tag, data in sorted(sections, key=lambda item: item[0]):
+        _section(parts, tag, data)
+    return b"".join(parts)
+
+
+class BinaryEnvelope:
+    """Decoded view over an encoded envelope buffer.
+
+    Sections are located on construction and parsed on first access; the
+    buffer itself is never copied, so keep it alive and unmodified while
+    the envelope is in use. ``signable_bytes`` is the same canonical JSON
+    that ``signable_payload`` produces for the dict form, computed once.
+    """
+
+    __slots__ = ("_view", "protocol", "flags", "type_id", "_header", "_sections", "_cache", "_signable")
+
+    def __init__(self, data: Buffer) -> None:
+        view = memoryview(data).cast("B") if not isinstance(data, memoryview) or data.format != "B" else data
+        if len(view) < _HEADER.size:
+            raise CodecError("Buffer too short for an envelope header")
+        magic, version, protocol, flags, type_id, id_bytes, micros = _HEADER.unpack_from(view, 0)
+        if magic != MAGIC:
+            raise CodecError("Not a binary envelope")
+        if version != CODEC_VERSION:
+            raise CodecError(f"Unsupported codec version {version}")
+        if not 1 <= protocol <= len(PROTOCOLS):
+            raise CodecError(f"Unknown protocol id {protocol}")
+        if type_id > len(MESSAGE_TYPES):
+            raise CodecError(f"Unknown message type id {type_id}")
+        self._view = view
+        self.protocol = PROTOCOLS[protocol - 1]
+        self.flags = flags
+        self.type_id = type_id
+        self._header = (id_bytes, micros)
+        self._sections: Dict[int, Tuple[int, int]] = {}
+        self._cache: Dict[int, Any] = {}
+        self._signable: bytes | None = None
+        offset, end = _HEADER.size, len(view)
+        while offset < end:
+            if offset + _SECTION.size > end:
+                raise CodecError("Truncated section header")
+            tag, length = _SECTION.unpack_from(view, offset)
+            offset += _SECTION.size
+            if offset + length > end:
+                raise CodecError("Truncated section")
+            self._sections[tag] = (offset, offset + length)
+            offset += length
+
+    def raw(self, tag: int) -> memoryview | None:
+        """Undecoded bytes of one section, without copying."""
+        bounds = self._sections.get(tag)
+        return self._view[bounds[0] : bounds[1]] if bounds is not None else None
+
+    def _field(self, tag: int) -> Any:
+        if tag in self._cache:
+            return self._cache[tag]
+        data = self.raw(tag)
+        if data is None:
+            value = None
+        elif tag in (_SENDER, _RECEIVER):
+            value = json.loads(bytes(data[1:]))
+        else:
+            value = json.loads(bytes(data))
+        self._cache[tag] = value
+        return value
+
+    @property
+    def version(self) -> Any:
+        return self._field(_VERSION)
+
+    @property
+    def message_type(self) -> Any:
+        return MESSAGE_TYPES[self.type_id - 1] if self.type_id else self._field(_TYPE)
+
+    @property
+    def msg_id(self) -> Any:
+        if self.flags & _FLAG_INLINE_ID:
+            return self._field(_MSG_ID)
+        hex_id = self._header[0].hex()
+        return f"{hex_id[:8]}-{hex_id[8:12]}-{hex_id[12:16]}-{hex_id[16:20]}-{hex_id[20:]}"
+
+    @property
+    def timestamp(self) -> Any:
+        if self.flags & _FLAG_INLINE_TIMESTAMP:
+            return self._field(_TIMESTAMP)
+        return _render_timestamp(self._header[1])
+
+    @property
+    def sender(self) -> Any:
+        return self._field(_SENDER)
+
+    @property
+    def receiver(self) -> Any:
+        return self._field(_RECEIVER)
+
+    @property
+    def payload(self) -> Any:
+        return self._field(_PAYLOAD)
+
+    def validate(self) -> None:
+        """The checks of the protocol's ``validate_envelope``, mostly without parsing JSON."""
+        present = {_SECTION_NAMES[tag] for tag in self._sections if tag in _SECTION_NAMES}
+        if self.type_id:
+            present.add("type")
+        if self.flags & (_FLAG_INLINE_ID | _FLAG_PACKED_ID):
+            present.add("msg_id")
+        if self.flags & (_FLAG_INLINE_TIMESTAMP | _FLAG_PACKED_TIMESTAMP):
+            present.add("timestamp")
+        missing = [name for name in _REQUIRED[self.protocol] if name not in present]
+        if missing:
+            raise ValueError(f"Missing envelope fields: {', '.join(missing)}")
+        if bytes(self.raw(_VERSION)) != _protocol_versions()[self.protocol][1]:
+            raise ValueError(f"Unsupported {self.protocol.upper()} version")
+        if bytes(self.raw(_PAYLOAD)[:1]) != b"{":
+            raise ValueError("Payload must be an object")
+        for tag in (_SENDER, _RECEIVER):
+            if bytes(self.raw(tag)[:1]) != _IDENTITY_OK:
+                raise ValueError("Sender/receiver missing identity fields")
+        if self.protocol == "hcp":
+            state = self._field(_STATE)
+            if not isinstance(state, dict) or "human" not in state:
+                raise ValueError("Missing human state")
+        elif self.protocol == "lip" and bytes(self.raw(_SOURCE)[:1]) != b"{":
+            raise ValueError("Missing source block")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The dict form this buffer was encoded from."""
+        envelope: Dict[str, Any] = {self.protocol: self.version}
+        if self.flags & (_FLAG_INLINE_ID | _FLAG_PACKED_ID):
+            envelope["msg_id"] = self.msg_id
+        if self.type_id or _TYPE in self._sections:
+            envelope["type"] = self.message_type
+        if self.flags & (_FLAG_INLINE_TIMESTAMP | _FLAG_PACKED_TIMESTAMP):
+            envelope["timestamp"] = self.timestamp
+        for key, tag in _IDENTITY_FIELDS.items():
+            if tag in self._sections:
+                envelope[key] = self._field(tag)
+        for key, tag in _JSON_FIELDS.items():
+            if tag in self._sections:
+                envelope[key] = self._field(tag)
+        if _EXTRA in self._sections:
+            envelope.update(self._field(_EXTRA))
+        return envelope
+
+    def signable_bytes(self) -> bytes:
+        """Assembled from the already-canonical sections, so the payload is never parsed."""
+        if self._signable is None:
+            sections = self._sections
+            items: Dict[str, bytes] = {self.protocol: bytes(self.raw(_VERSION))}
+            # packed ids, timestamps and interned types never need JSON escaping
+            if self.flags & _FLAG_PACKED_ID:
+                items["msg_id"] = b'"' + self.msg_id.encode("ascii") + b'"'
+            elif self.flags & _FLAG_INLINE_ID:
+                items["msg_id"] = bytes(self.raw(_MSG_ID))
+            if self.type_id:
+                items["type"] = _TYPE_BYTES[self.type_id]
+            elif _TYPE in sections:
+                items["type"] = bytes(self.raw(_TYPE))
+            if self.flags & _FLAG_PACKED_TIMESTAMP:
+                items["timestamp"] = b'"' + self.timestamp.encode("ascii") + b'"'
+            elif self.flags & _FLAG_INLINE_TIMESTAMP:
+                items["timestamp"] = bytes(self.raw(_TIMESTAMP))
+            for key, tag in _SIGNED_SECTIONS:
+                if tag in sections:
+                    start, end = sections[tag]
+                    items[key] = bytes(self._view[start + 1 if tag in _IDENTITY_TAGS else start : end])
+            if _EXTRA in sections:
+                for key, value in self._field(_EXTRA).items():
+                    items[key] = _dumps(value)
+            items.pop("sign", None)
+            self._signable = b"{" + b",".join(_key_bytes(key) + items[key] for key in sorted(items)) + b"}"
+        return self._signable
+
+
+def decode_envelope(data: Buffer) -> BinaryEnvelope:
+    return BinaryEnvelope(data)
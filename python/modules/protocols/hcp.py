@@ -3,9 +3,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Dict
-import json
 import uuid
 
+from .codec import _canonical_encoder
+
 
 HCP_VERSION = "1.0"
 
@@ -40,7 +41,7 @@ class HcpHumanState:
 
 
 def canonical_json(data: Dict[str, Any]) -> str:
-    return json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return _canonical_encoder.encode(data)
 
 
 def build_envelope(
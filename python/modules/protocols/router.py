@@ -1,41 +1,157 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Callable, Dict
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
-from .cip import validate_envelope
+from . import cip, hcp, lip
 from .trust import TrustFSM, TrustTransition
 
 
-Handler = Callable[[Dict[str, Any]], None]
+Handler = Callable[[Dict[str, Any]], Any]
+
+ANY_TYPE = "*"
+VALIDATORS: Dict[str, Callable[[Dict[str, Any]], None]] = {
+    "cip": cip.validate_envelope,
+    "hcp": hcp.validate_envelope,
+    "lip": lip.validate_envelope,
+}
+
+
+def validate_any(envelope: Dict[str, Any]) -> str:
+    """Validate with the envelope's own protocol (CIP when none is named); returns the protocol."""
+    protocol = next((name for name in VALIDATORS if name in envelope), "cip")
+    VALIDATORS[protocol](envelope)
+    return protocol
 
 
 @dataclass
 class RouterResult:
     transition: TrustTransition | None
     handled: bool
+    results: List[Any] = field(default_factory=list)
+    error: Exception | None = None
+
+
+@dataclass
+class TypeStats:
+    """Dispatch counters for one message type; ``seconds`` covers validation and handlers."""
+
+    count: int = 0
+    errors: int = 0
+    seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    @property
+    def mean_ms(self) -> float:
+        return self.seconds / self.count * 1000 if self.count else 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "mean_ms": self.mean_ms,
+            "max_ms": self.max_seconds * 1000,
+        }
 
 
 class ProtocolRouter:
+    """Validates envelopes once and fans them out to the handlers for their type.
+
+    Several handlers may be registered per type, plus ``ANY_TYPE`` handlers
+    that see every envelope; they run in registration order from a table
+    rebuilt only when registrations change. The first ``TrustTransition``
+    a handler returns becomes the result's ``transition``. Handlers receive
+    an envelope that has already been validated, so runtimes called from
+    them can skip their own check. ``stats`` are kept per routed type; types
+    without handlers of their own, whatever a peer sent, share the
+    ``ANY_TYPE`` entry so the table stays bounded.
+    """
+
     def __init__(self, trust: TrustFSM | None = None) -> None:
         self._trust = trust or TrustFSM()
-        self._handlers: Dict[str, Handler] = {}
+        self._handlers: Dict[str, List[Handler]] = {}
+        self._table: Dict[str, Tuple[Handler, ...]] = {}
+        self._fallback: Tuple[Handler, ...] = ()
+        self.stats: Dict[str, TypeStats] = {}
 
     @property
     def trust(self) -> TrustFSM:
         return self._trust
 
     def on(self, message_type: str, handler: Handler) -> None:
-        self._handlers[message_type] = handler
+        self._handlers.setdefault(message_type, []).append(handler)
+        self._compile()
+
+    def off(self, message_type: str, handler: Handler | None = None) -> None:
+        """Remove one handler, or every handler for ``message_type`` when None."""
+        handlers = self._handlers.get(message_type, [])
+        if handler is None:
+            handlers.clear()
+        elif handler in handlers:
+            handlers.remove(handler)
+        if not handlers:
+            self._handlers.pop(message_type, None)
+        self._compile()
 
-    def dispatch(self, envelope: Dict[str, Any]) -> RouterResult:
-        validate_envelope(envelope)
+    def _compile(self) -> None:
+        wildcard = tuple(self._handlers.get(ANY_TYPE, ()))
+        self._table = {
+            message_type: tuple(handlers) + wildcard
+            for message_type, handlers in self._handlers.items()
+            if message_type != ANY_TYPE
+        }
+        self._fallback = wildcard
+
+    def dispatch(self, envelope: Dict[str, Any], *, validated: bool = False) -> RouterResult:
+        """Raises ``ValueError`` for an invalid envelope unless ``validated`` is set by the caller."""
+        started = time.perf_counter()
         message_type = envelope.get("type")
-        handler = self._handlers.get(message_type)
-        if handler:
-            handler(envelope)
-            return RouterResult(None, True)
-        return RouterResult(None, False)
+        handlers = self._table.get(message_type) if isinstance(message_type, str) else None
+        stats_key = message_type if handlers is not None else ANY_TYPE
+        if handlers is None:
+            handlers = self._fallback
+        stats = self.stats.get(stats_key)
+        if stats is None:
+            stats = self.stats[stats_key] = TypeStats()
+        stats.count += 1
+        try:
+            if not validated:
+                validate_any(envelope)
+            transition = None
+            results = []
+            for handler in handlers:
+                outcome = handler(envelope)
+                results.append(outcome)
+                if transition is None and isinstance(outcome, TrustTransition):
+                    transition = outcome
+            return RouterResult(transition, bool(handlers), results)
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            stats.seconds += elapsed
+            if elapsed > stats.max_seconds:
+                stats.max_seconds = elapsed
+
+    def dispatch_batch(self, envelopes: Iterable[Dict[str, Any]], *, validated: bool = False) -> List[RouterResult]:
+        """Dispatch in order; a failing envelope gets a result with ``error`` set instead of stopping the batch."""
+        results: List[RouterResult] = []
+        dispatch = self.dispatch
+        for envelope in envelopes:
+            try:
+                results.append(dispatch(envelope, validated=validated))
+            except Exception as exc:
+                results.append(RouterResult(None, False, error=exc))
+        return results
+
+    def drain(self, session: Any, max_items: Optional[int] = None, timeout: Optional[float] = 0.0) -> List[RouterResult]:
+        """Dispatch whatever is queued on an ``RttSession``, taken with one ``receive_batch`` call."""
+        return self.dispatch_batch(session.receive_batch(max_items, timeout))
+
+    def stats_snapshot(self) -> Dict[str, Dict[str, float]]:
+        return {str(message_type): stats.to_dict() for message_type, stats in self.stats.items()}
 
     def register_trust_signals(self) -> None:
         self.on("HELLO", lambda _env: self._trust.on_valid_handshake())
@@ -1,9 +1,120 @@
 from __future__ import annotations
 
-from typing import Any
+from collections import OrderedDict, deque
+from typing import Any, Callable
 import copy
 import time
 
+INPUT_BUCKETS = ("0-4", "5-10", "11-50", "51-100", "101+")
+
+
+def _copy_stats(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _copy_stats(item) for key, item in value.items()}
+    if isinstance(value, (int, float, str, bool)) or value is None:
+        return value
+    return copy.deepcopy(value)
+
+
+class _Aggregate:
+    """Running totals over a set of Mode A snapshots; mergeable for rollups."""
+
+    __slots__ = (
+        "snapshots",
+        "heuristics",
+        "hits",
+        "misses",
+        "load_shed",
+        "by_source",
+        "input_count",
+        "input_total",
+        "input_min",
+        "input_max",
+        "buckets",
+    )
+
+    def __init__(self) -> None:
+        self.snapshots = 0
+        self.heuristics: dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.load_shed = 0
+        self.by_source: dict[str, int] = {}
+        self.input_count = 0
+        self.input_total = 0
+        self.input_min: int | None = None
+        self.input_max: int | None = None
+        self.buckets = dict.fromkeys(INPUT_BUCKETS, 0)
+
+    def add(self, stats: dict[str, Any]) -> None:
+        self.snapshots += 1
+        heuristics = self.heuristics
+        for key, value in stats.get("heuristics", {}).items():
+            heuristics[key] = heuristics.get(key, 0) + int(value)
+        self.hits += int(stats.get("cache_hits", 0))
+        self.misses += int(stats.get("cache_misses", 0))
+        self.load_shed += int(stats.get("load_shed", 0))
+        by_source = self.by_source
+        for key, value in stats.get("load_shed_by_source", {}).items():
+            by_source[key] = by_source.get(key, 0) + int(value)
+
+        input_stats = stats.get("input_length", {})
+        self.input_count += int(input_stats.get("count", 0))
+        self.input_total += int(input_stats.get("total", 0))
+        if input_stats.get("min") is not None:
+            self._extend(int(input_stats["min"]), None)
+        if input_stats.get("max") is not None:
+            self._extend(None, int(input_stats["max"]))
+        input_buckets = input_stats.get("buckets", {})
+        for key in self.buckets:
+            self.buckets[key] += int(input_buckets.get(key, 0))
+
+    def _extend(self, low: int | None, high: int | None) -> None:
+        if low is not None and (self.input_min is None or low < self.input_min):
+            self.input_min = low
+        if high is not None and (self.input_max is None or high > self.input_max):
+            self.input_max = high
+
+    def merge(self, other: "_Aggregate") -> None:
+        self.snapshots += other.snapshots
+        for key, value in other.heuristics.items():
+            self.heuristics[key] = self.heuristics.get(key, 0) + value
+        self.hits += other.hits
+        self.misses += other.misses
+        self.load_shed += other.load_shed
+        for key, value in other.by_source.items():
+            self.by_source[key] = self.by_source.get(key, 0) + value
+        self.input_count += other.input_count
+        self.input_total += other.input_total
+        self._extend(other.input_min, other.input_max)
+        for key, value in other.buckets.items():
+            self.buckets[key] += value
+
+    def summary(self) -> dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "total_snapshots": self.snapshots,
+            "heuristics_usage": dict(self.heuristics),
+            "cache": {
+                "hits": self.hits,
+                "misses": self.misses,
+                "total": total,
+                "hit_rate": (self.hits / total) if total else 0.0,
+            },
+            "load": {
+                "load_shed": self.load_shed,
+                "load_shed_by_source": dict(self.by_source),
+            },
+            "input": {
+                "count": self.input_count,
+                "total": self.input_total,
+                "min": self.input_min,
+                "max": self.input_max,
+                "avg": (self.input_total / self.input_count) if self.input_count else 0.0,
+                "buckets": dict(self.buckets),
+            },
+        }
+
 
 class Retrospective:
     """
@@ -11,107 +122,82 @@ class Retrospective:
 
     Collects and summarizes telemetry from Mode A.
     Does not modify behavior.
+
+    Totals are updated as snapshots arrive, so ``summarize`` does not walk
+    the history. Only the last ``max_history`` raw snapshots are kept;
+    per-minute and per-hour rollups (``minute_retention`` and
+    ``hour_retention`` buckets) serve windowed summaries, which are rounded
+    out to whole buckets.
     """
 
-    def __init__(self) -> None:
-        self.history: list[dict[str, Any]] = []
+    def __init__(
+        self,
+        *,
+        max_history: int = 1000,
+        minute_retention: int = 120,
+        hour_retention: int = 48,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.history: deque[dict[str, Any]] = deque(maxlen=max_history)
+        self.minute_retention = minute_retention
+        self.hour_retention = hour_retention
+        self._clock = clock
+        self._totals = _Aggregate()
+        self._minutes: OrderedDict[int, _Aggregate] = OrderedDict()
+        self._hours: OrderedDict[int, _Aggregate] = OrderedDict()
 
     def snapshot(self, stats: dict[str, Any]) -> None:
+        timestamp = self._clock()
         self.history.append({
-            "timestamp": time.time(),
-            "stats": copy.deepcopy(stats),
+            "timestamp": timestamp,
+            "stats": _copy_stats(stats),
         })
-
-    def summarize(self) -> dict[str, Any]:
-        summary = {
-            "total_snapshots": len(self.history),
-            "heuristics_usage": self._aggregate_heuristics(),
-            "cache": self._aggregate_cache(),
-            "load": self._aggregate_load(),
-            "input": self._aggregate_input(),
-        }
+        self._totals.add(stats)
+        self._rollup(self._minutes, int(timestamp // 60), self.minute_retention).add(stats)
+        self._rollup(self._hours, int(timestamp // 3600), self.hour_retention).add(stats)
+
+    @staticmethod
+    def _rollup(buckets: OrderedDict[int, _Aggregate], index: int, retention: int) -> _Aggregate:
+        bucket = buckets.get(index)
+        if bucket is None:
+            bucket = buckets[index] = _Aggregate()
+            while buckets and next(iter(buckets)) <= index - retention:
+                buckets.popitem(last=False)
+        return bucket
+
+    def summarize(self, window: float | None = None) -> dict[str, Any]:
+        """Summary of every snapshot so far, or of the last ``window`` seconds from the rollups.
+
+        Windows up to ``minute_retention`` minutes use minute buckets, longer
+        ones hour buckets; a window longer than the hour retention covers
+        what is retained.
+        """
+        if window is None:
+            summary = self._totals.summary()
+        else:
+            summary = self._windowed(window).summary()
         summary["cache_insights"] = self._cache_insights(summary)
         return summary
 
+    def _windowed(self, window: float) -> _Aggregate:
+        now = self._clock()
+        if window <= self.minute_retention * 60:
+            buckets, width = self._minutes, 60
+        else:
+            buckets, width = self._hours, 3600
+        first = int((now - window) // width)
+        aggregate = _Aggregate()
+        for index in reversed(buckets):
+            if index < first:
+                break
+            aggregate.merge(buckets[index])
+        return aggregate
+
     def reset(self) -> None:
         self.history.clear()
-
-    def _aggregate_heuristics(self) -> dict[str, int]:
-        totals: dict[str, int] = {}
-        for entry in self.history:
-            stats = entry.get("stats", {})
-            heuristics = stats.get("heuristics", {})
-            for key, value in heuristics.items():
-                totals[key] = totals.get(key, 0) + int(value)
-        return totals
-
-    def _aggregate_cache(self) -> dict[str, float | int]:
-        hits = 0
-        misses = 0
-        for entry in self.history:
-            stats = entry.get("stats", {})
-            hits += int(stats.get("cache_hits", 0))
-            misses += int(stats.get("cache_misses", 0))
-        total = hits + misses
-        hit_rate = (hits / total) if total else 0.0
-        return {
-            "hits": hits,
-            "misses": misses,
-            "total": total,
-            "hit_rate": hit_rate,
-        }
-
-    def _aggregate_load(self) -> dict[str, int]:
-        load_shed = 0
-        by_source: dict[str, int] = {}
-        for entry in self.history:
-            stats = entry.get("stats", {})
-            load_shed += int(stats.get("load_shed", 0))
-            sources = stats.get("load_shed_by_source", {})
-            for key, value in sources.items():
-                by_source[key] = by_source.get(key, 0) + int(value)
-        return {
-            "load_shed": load_shed,
-            "load_shed_by_source": by_source,
-        }
-
-    def _aggregate_input(self) -> dict[str, Any]:
-        count = 0
-        total = 0
-        min_len: int | None = None
-        max_len: int | None = None
-        buckets = {
-            "0-4": 0,
-            "5-10": 0,
-            "11-50": 0,
-            "51-100": 0,
-            "101+": 0,
-        }
-
-        for entry in self.history:
-            stats = entry.get("stats", {})
-            input_stats = stats.get("input_length", {})
-            count += int(input_stats.get("count", 0))
-            total += int(input_stats.get("total", 0))
-            if input_stats.get("min") is not None:
-                value = int(input_stats["min"])
-                min_len = value if min_len is None else min(min_len, value)
-            if input_stats.get("max") is not None:
-                value = int(input_stats["max"])
-                max_len = value if max_len is None else max(max_len, value)
-            input_buckets = input_stats.get("buckets", {})
-            for key in buckets:
-                buckets[key] += int(input_buckets.get(key, 0))
-
-        avg = (total / count) if count else 0.0
-        return {
-            "count": count,
-            "total": total,
-            "min": min_len,
-            "max": max_len,
-            "avg": avg,
-            "buckets": buckets,
-        }
+        self._totals = _Aggregate()
+        self._minutes.clear()
+        self._hours.clear()
 
     def _cache_insights(self, summary: dict[str, Any]) -> dict[str, Any]:
         cache = summary.get("cache", {})
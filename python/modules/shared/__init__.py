@@ -3,8 +3,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from .config_loader import load_config, get_config
+from .event_store import EventHub, EventStore
 
 __all__ = [
+    "EventHub",
+    "EventStore",
     "load_config",
     "get_config",
     "check_system_resources",
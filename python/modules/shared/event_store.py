@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, is_dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Generic, List, Optional, Tuple, TypeVar
+
+EventT = TypeVar("EventT")
+
+# Anchor pairing the monotonic clock with wall time, taken once at import so
+# events can carry a cheap monotonic stamp and still render a UTC time.
+_ANCHOR_MONOTONIC_NS = time.monotonic_ns()
+_ANCHOR_WALL_NS = time.time_ns()
+
+
+def monotonic_ns() -> int:
+    return time.monotonic_ns()
+
+
+def wall_time_iso(timestamp_ns: int) -> str:
+    """UTC ISO-8601 time of a ``monotonic_ns`` stamp taken in this process."""
+    wall_ns = _ANCHOR_WALL_NS + (timestamp_ns - _ANCHOR_MONOTONIC_NS)
+    return datetime.fromtimestamp(wall_ns / 1e9, tz=timezone.utc).isoformat()
+
+
+def _default_serialize(event: Any) -> Dict[str, Any]:
+    if not is_dataclass(event):
+        return {"event": repr(event)}
+    payload = asdict(event)
+    timestamp_ns = payload.get("timestamp_ns")
+    if isinstance(timestamp_ns, int):
+        payload["occurred_at"] = wall_time_iso(timestamp_ns)
+    return payload
+
+
+class EventStore(Generic[EventT]):
+    """Bounded, thread-safe event log with sequence-number cursors.
+
+    Events live in a ring buffer of ``capacity`` entries; each gets the next
+    sequence number, which doubles as a cursor for ``since``. A poller that
+    keeps its cursor only pays for events appended since its last read.
+    Per-type totals are kept for the lifetime of the store, so they stay
+    correct after old events are evicted.
+
+    With ``spill_path`` set, evicted events are appended to that file as
+    JSON lines; it rotates at ``spill_max_bytes`` keeping ``spill_backups``
+    older files (``path.1`` is the most recent).
+    """
+
+    def __init__(
+        self,
+        capacity: int = 10000,
+        *,
+        spill_path: str | Path | None = None,
+        spill_max_bytes: int = 10 * 1024 * 1024,
+        spill_backups: int = 3,
+        serialize: Callable[[EventT], Dict[str, Any]] = _default_serialize,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._events: Deque[Tuple[int, EventT]] = deque()
+        self._counts: Dict[str, int] = {}
+        self._sequence = 0
+        self._lock = threading.Lock()
+        self._serialize = serialize
+        self.spill_path = Path(spill_path) if spill_path is not None else None
+        self.spill_max_bytes = spill_max_bytes
+        self.spill_backups = spill_backups
+        self._spill_file: Any = None
+        self.evicted = 0
+
+    @property
+    def cursor(self) -> int:
+        """Sequence number of the newest event; pass it to ``since`` to read only later ones."""
+        return self._sequence
+
+    @property
+    def first_sequence(self) -> int:
+        """Sequence number of the oldest retained event (``cursor + 1`` when empty)."""
+        with self._lock:
+            return self._events[0][0] if self._events else self._sequence + 1
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def append(self, event: EventT, event_type: str) -> int:
+        with self._lock:
+            self._sequence += 1
+            sequence = self._sequence
+            self._counts[event_type] = self._counts.get(event_type, 0) + 1
+            events = self._events
+            events.append((sequence, event))
+            if len(events) > self.capacity:
+                _, evicted = events.popleft()
+                self.evicted += 1
+                if self.spill_path is not None:
+                    self._spill(evicted)
+            return sequence
+
+    def since(self, cursor: int = 0, limit: Optional[int] = None) -> Tuple[List[EventT], int]:
+        """Events with a sequence number above ``cursor``, oldest first, and the cursor to resume from.
+
+        Events evicted before the read are skipped; compare the first
+        returned sequence via ``first_sequence`` to detect the gap.
+        """
+        with self._lock:
+            newest = self._sequence
+            available = min(newest - cursor, len(self._events))
+            if available <= 0:
+                return [], newest
+            # walk from the right so the cost is proportional to new events
+            tail: List[EventT] = []
+            iterator = reversed(self._events)
+            for _ in range(available):
+                tail.append(next(iterator)[1])
+            tail.reverse()
+            if limit is not None and len(tail) > limit:
+                tail = tail[:limit]
+                return tail, newest - available + limit
+            return tail, newest
+
+    def snapshot(self) -> List[EventT]:
+        with self._lock:
+            return [event for _, event in self._events]
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._spill_file is not None:
+                self._spill_file.close()
+                self._spill_file = None
+
+    def _spill(self, event: EventT) -> None:
+        if self._spill_file is None:
+            self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+            self._spill_file = self.spill_path.open("a", encoding="utf-8")
+        self._spill_file.write(json.dumps(self._serialize(event), default=str) + "\n")
+        if self._spill_file.tell() >= self.spill_max_bytes:
+            self._rotate()
+
+    def _rotate(self) -> None:
+        self._spill_file.close()
+        self._spill_file = None
+        path = str(self.spill_path)
+        if self.spill_backups <= 0:
+            os.remove(path)
+            return
+        for index in range(self.spill_backups - 1, 0, -1):
+            older = f"{path}.{index}"
+            if os.path.exists(older):
+                os.replace(older, f"{path}.{index + 1}")
+        os.replace(path, f"{path}.1")
+
+
+class EventHub(Generic[EventT]):
+    """Read side shared by the Web4 observability hubs; subclasses add ``record``."""
+
+    def __init__(
+        self,
+        capacity: int = 10000,
+        *,
+        spill_path: str | Path | None = None,
+        spill_max_bytes: int = 10 * 1024 * 1024,
+        spill_backups: int = 3,
+    ) -> None:
+        self._store: EventStore[EventT] = EventStore(
+            capacity,
+            spill_path=spill_path,
+            spill_max_bytes=spill_max_bytes,
+            spill_backups=spill_backups,
+        )
+
+    @property
+    def cursor(self) -> int:
+        return self._store.cursor
+
+    def snapshot(self) -> List[EventT]:
+        """Retained events, oldest first; at most ``capacity`` of them."""
+        return self._store.snapshot()
+
+    def since(self, cursor: int = 0, limit: Optional[int] = None) -> Tuple[List[EventT], int]:
+        return self._store.since(cursor, limit)
+
+    def counts(self) -> Dict[str, int]:
+        """Events recorded per type since the hub was created, including evicted ones."""
+        return self._store.counts()
+
+    def close(self) -> None:
+        self._store.close()
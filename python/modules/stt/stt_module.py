@@ -167,7 +167,8 @@ class SpeechToText:
                             self.output_queue.put_nowait({
                                 'type': 'question',
                                 'text': question,
-                                'timestamp': time.time()
+                                'timestamp': time.time(),
+                                'stt_duration': transcription_time
                             })
                             logger.info(f"Sent question to LLM queue: {question}")
                         except queue.Full:
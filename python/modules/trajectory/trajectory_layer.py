@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
 from typing import Any, Optional
 
@@ -21,29 +22,36 @@ class TrajectoryLayer:
 
     def __init__(self, max_history: int = 100) -> None:
         self.max_history = max_history
-        self.history: list[TrajectoryPoint] = []
+        self.history: deque[TrajectoryPoint] = deque(maxlen=max_history)
+        # running counts over history so the error rate needs no rescan
+        self._outcomes = 0
+        self._errors = 0
 
     def record_decision(self, decision: str, context: dict[str, Any]) -> None:
+        if self.history and len(self.history) == self.history.maxlen:
+            self._count(self.history[0].outcome, -1)
         self.history.append(TrajectoryPoint(decision=decision, context=context))
-        if len(self.history) > self.max_history:
-            self.history.pop(0)
 
     def record_outcome(self, outcome: dict[str, Any]) -> None:
         if not self.history:
             return
-        self.history[-1].outcome = outcome
+        point = self.history[-1]
+        self._count(point.outcome, -1)
+        point.outcome = outcome
+        self._count(outcome, 1)
+
+    def _count(self, outcome: Optional[dict[str, Any]], sign: int) -> None:
+        if outcome is None:
+            return
+        self._outcomes += sign
+        if outcome.get("success") is False:
+            self._errors += sign
 
     def compute_trajectory_error(self) -> float:
         """
         Skeleton: mismatch rate between expected and actual outcomes.
         Uses outcome['success'] == False as an error signal.
+        Counts are kept as outcomes are recorded, so this is O(1); outcomes
+        must be set through ``record_outcome``.
         """
-        errors = 0
-        total = 0
-        for point in self.history:
-            if point.outcome is None:
-                continue
-            total += 1
-            if point.outcome.get("success") is False:
-                errors += 1
-        return errors / total if total else 0.0
+        return self._errors / self._outcomes if self._outcomes else 0.0
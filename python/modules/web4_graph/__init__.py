@@ -3,6 +3,7 @@ from .graph_observability import GraphObservabilityEvent, GraphObservabilityHub
 from .graph_validator import Graph
 from .node import GraphNode
 from .routing_rules import RoutingPolicy, should_route, next_hop
+from .routing_table import RoutingTable
 from .trust_graph import GraphTrustFSM, GraphTrustLink, GraphTrustLevel
 
 __all__ = [
@@ -14,6 +15,7 @@ __all__ = [
     "RoutingPolicy",
     "should_route",
     "next_hop",
+    "RoutingTable",
     "GraphTrustFSM",
     "GraphTrustLink",
     "GraphTrustLevel",
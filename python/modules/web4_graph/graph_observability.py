@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime, timezone
-from typing import Any, Dict, List
+from typing import Any, Dict
+
+from ..shared.event_store import EventHub, monotonic_ns, wall_time_iso
 
 
 @dataclass(frozen=True)
@@ -11,12 +12,15 @@ class GraphObservabilityEvent:
     node: str
     peer: str
     payload: Dict[str, Any]
-    occurred_at: str
+    timestamp_ns: int
+
+    @property
+    def occurred_at(self) -> str:
+        return wall_time_iso(self.timestamp_ns)
 
 
-class GraphObservabilityHub:
-    def __init__(self) -> None:
-        self._events: List[GraphObservabilityEvent] = []
+class GraphObservabilityHub(EventHub[GraphObservabilityEvent]):
+    """Bounded event log; see ``EventHub`` for capacity, cursors and spilling."""
 
     def record(self, event_type: str, node: str, peer: str, payload: Dict[str, Any]) -> GraphObservabilityEvent:
         event = GraphObservabilityEvent(
@@ -24,10 +28,7 @@ class GraphObservabilityHub:
             node=node,
             peer=peer,
             payload=payload,
-            occurred_at=datetime.now(timezone.utc).isoformat(),
+            timestamp_ns=monotonic_ns(),
         )
-        self._events.append(event)
+        self._store.append(event, event_type)
         return event
-
-    def snapshot(self) -> List[GraphObservabilityEvent]:
-        return list(self._events)
@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Optional
 
+from .routing_table import RoutingTable
 from .trust_graph import GraphTrustFSM, GraphTrustLevel
 
 
@@ -23,7 +24,20 @@ def should_route(destination: str, origin: str, hops: list[str], trust: GraphTru
     return True
 
 
-def next_hop(destination: str, origin: str, hops: list[str], trust: GraphTrustFSM, policy: RoutingPolicy) -> Optional[str]:
+def next_hop(
+    destination: str,
+    origin: str,
+    hops: list[str],
+    trust: GraphTrustFSM,
+    policy: RoutingPolicy,
+    table: RoutingTable | None = None,
+) -> Optional[str]:
+    """Without a table the destination is assumed adjacent; with one, the next node on the cheapest path."""
     if not should_route(destination, origin, hops, trust, policy):
         return None
-    return destination
+    if table is None:
+        return destination
+    hop = table.next_hop(hops[-1] if hops else origin, destination)
+    if hop is None or hop == origin or hop in hops:
+        return None
+    return hop
@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Protocol
+
+from .graph_validator import Graph
+
+# Extra cost for forwarding *through* a node, by trust level. Destinations
+# are never penalised; blocked nodes are neither destinations nor transit.
+DEFAULT_TRANSIT_PENALTY: Dict[str, float] = {
+    "trusted": 0.0,
+    "probing": 1.0,
+    "unknown": 3.0,
+}
+BLOCKED = "blocked"
+_EPSILON = 1e-12
+
+
+class TrustSource(Protocol):
+    def get(self, node_id: str) -> Any: ...
+
+
+@dataclass
+class _Tree:
+    """Shortest-path tree from one source."""
+
+    dist: Dict[str, float]
+    parent: Dict[str, str]
+    first_hop: Dict[str, str]
+    children: Dict[str, List[str]] = field(default_factory=dict)
+
+
+class RoutingTable:
+    """Next-hop tables over a weighted link graph, kept current incrementally.
+
+    Link cost is the edge weight; forwarding through a node adds the transit
+    penalty of its trust level, so routes prefer trusted relays and avoid
+    blocked nodes entirely. Each source's shortest-path tree (Dijkstra) is
+    computed on first use and cached. Topology and trust changes only drop
+    the cached trees they can actually affect: a cost increase matters only
+    to trees that use the link or relay, a decrease only to trees it would
+    shorten, and blocking a leaf just prunes it. A trust source with a
+    ``subscribe(listener)`` method (the trust FSMs) reports level changes
+    itself; for any other source call ``refresh_trust`` after changing it.
+
+    The same trees serve broadcast: ``children(root, node)`` is the fan-out
+    of ``node`` in the tree rooted at the broadcast origin, so every node
+    receives one copy.
+    """
+
+    def __init__(
+        self,
+        trust: TrustSource | None = None,
+        *,
+        transit_penalty: Mapping[str, float] | None = None,
+    ) -> None:
+        self.trust = trust
+        self.transit_penalty = dict(DEFAULT_TRANSIT_PENALTY if transit_penalty is None else transit_penalty)
+        self._adj: Dict[str, Dict[str, float]] = {}
+        self._levels: Dict[str, str] = {}
+        self._trees: Dict[str, _Tree] = {}
+        self.computations = 0
+        self.invalidations = 0
+        subscribe = getattr(trust, "subscribe", None)
+        if callable(subscribe):
+            subscribe(self._on_trust_changed)
+
+    @classmethod
+    def from_graph(
+        cls,
+        graph: Graph,
+        trust: TrustSource | None = None,
+        *,
+        bidirectional: bool = True,
+        **kwargs: Any,
+    ) -> "RoutingTable":
+        """Links from the graph's active edges; parallel edges keep the lowest weight."""
+        table = cls(trust, **kwargs)
+        for node_id in graph.nodes:
+            table.add_node(node_id)
+        for edge in graph.edges:
+            if edge.state != "active":
+                continue
+            table.set_link(edge.source, edge.target, edge.weight, bidirectional=bidirectional, keep_lower=True)
+        return table
+
+    # -- topology -----------------------------------------------------------
+
+    @property
+    def nodes(self) -> List[str]:
+        return list(self._adj)
+
+    def neighbors(self, node_id: str) -> Dict[str, float]:
+        return dict(self._adj.get(node_id, {}))
+
+    def add_node(self, node_id: str) -> None:
+        if node_id in self._adj:
+            return
+        self._adj[node_id] = {}
+        self._levels[node_id] = self._read_level(node_id)
+
+    def remove_node(self, node_id: str) -> None:
+        if node_id not in self._adj:
+            return
+        self._detach(node_id)
+        for neighbor in list(self._adj[node_id]):
+            self._adj[neighbor].pop(node_id, None)
+        del self._adj[node_id]
+        self._levels.pop(node_id, None)
+
+    def set_link(
+        self,
+        source: str,
+        target: str,
+        weight: float = 1.0,
+        *,
+        bidirectional: bool = True,
+        keep_lower: bool = False,
+    ) -> None:
+        if weight < 0:
+            raise ValueError("link weight must be non-negative")
+        self.add_node(source)
+        self.add_node(target)
+        pairs = [(source, target), (target, source)] if bidirectional else [(source, target)]
+        for a, b in pairs:
+            old = self._adj[a].get(b)
+            if old is not None and keep_lower and old <= weight:
+                continue
+            self._adj[a][b] = weight
+            if old is None or weight < old:
+                self._on_link_improved(a, b, weight)
+            elif weight > old:
+                self._on_link_worsened(a, b)
+
+    def remove_link(self, source: str, target: str, *, bidirectional: bool = True) -> None:
+        pairs = [(source, target), (target, source)] if bidirectional else [(source, target)]
+        for a, b in pairs:
+            if self._adj.get(a, {}).pop(b, None) is not None:
+                self._on_link_worsened(a, b)
+
+    # -- trust --------------------------------------------------------------
+
+    def _read_level(self, node_id: str) -> str:
+        if self.trust is None:
+            return "trusted"
+        level = self.trust.get(node_id)
+        return str(getattr(level, "value", level))
+
+    def _penalty(self, level: str) -> float:
+        return self.transit_penalty.get(level, self.transit_penalty.get("unknown", 0.0))
+
+    def refresh_trust(self, node_ids: Iterable[str] | None = None) -> int:
+        """Re-read trust for ``node_ids`` (all nodes when None); returns how many changed."""
+        changed = 0
+        for node_id in list(self._adj) if node_ids is None else node_ids:
+            if node_id not in self._adj:
+                continue
+            old, new = self._levels[node_id], self._read_level(node_id)
+            if old == new:
+                continue
+            changed += 1
+            self._levels[node_id] = new
+            if new == BLOCKED:
+                self._detach(node_id)
+            elif old == BLOCKED:
+                self._on_node_opened(node_id)
+            elif self._penalty(new) > self._penalty(old):
+                self._invalidate(lambda source, tree: bool(tree.children.get(node_id)) and source != node_id)
+            elif self._penalty(new) < self._penalty(old):
+                self._on_node_opened(node_id)
+        return changed
+
+    def _on_trust_changed(self, node_id: str) -> None:
+        self.refresh_trust([node_id])
+
+    def level(self, node_id: str) -> str:
+        return self._levels.get(node_id, "unknown")
+
+    # -- queries ------------------------------------------------------------
+
+    def next_hop(self, source: str, destination: str) -> Optional[str]:
+        if source == destination:
+            return destination
+        tree = self._tree(source)
+        return tree.first_hop.get(destination) if tree is not None else None
+
+    def distance(self, source: str, destination: str) -> Optional[float]:
+        tree = self._tree(source)
+        return tree.dist.get(destination) if tree is not None else None
+
+    def path(self, source: str, destination: str) -> List[str]:
+        """Nodes after ``source`` up to and including ``destination``; empty when unreachable."""
+        tree = self._tree(source)
+        if tree is None or destination not in tree.dist or destination == source:
+            return []
+        path = [destination]
+        while tree.parent[path[-1]] != source:
+            path.append(tree.parent[path[-1]])
+        path.reverse()
+        return path
+
+    def children(self, root: str, node_id: str) -> List[str]:
+        """Fan-out of ``node_id`` in the broadcast tree rooted at ``root``."""
+        tree = self._tree(root)
+        if tree is None:
+            return []
+        return list(tree.children.get(node_id, ()))
+
+    def reachable(self, source: str) -> List[str]:
+        tree = self._tree(source)
+        return [node for node in tree.dist if node != source] if tree is not None else []
+
+    # -- internals ----------------------------------------------------------
+
+    def _tree(self, source: str) -> Optional[_Tree]:
+        tree = self._trees.get(source)
+        if tree is None:
+            if source not in self._adj or self._levels.get(source) == BLOCKED:
+                return None
+            tree = self._trees[source] = self._compute(source)
+        return tree
+
+    def _compute(self, source: str) -> _Tree:
+        self.computations += 1
+        adj, levels = self._adj, self._levels
+        penalties = {level: self._penalty(level) for level in set(levels.values())}
+        dist: Dict[str, float] = {source: 0.0}
+        parent: Dict[str, str] = {}
+        first_hop: Dict[str, str] = {}
+        children: Dict[str, List[str]] = {}
+        done = set()
+        heap = [(0.0, source)]
+        while heap:
+            cost, node = heapq.heappop(heap)
+            if node in done:
+                continue
+            done.add(node)
+            if node != source:
+                via = parent[node]
+                first_hop[node] = node if via == source else first_hop[via]
+                children.setdefault(via, []).append(node)
+                cost += penalties[levels[node]]
+            for neighbor, weight in adj[node].items():
+                if neighbor in done or levels[neighbor] == BLOCKED:
+                    continue
+                candidate = cost + weight
+                if candidate < dist.get(neighbor, float("inf")) - _EPSILON:
+                    dist[neighbor] = candidate
+                    parent[neighbor] = node
+                    heapq.heappush(heap, (candidate, neighbor))
+        return _Tree(dist=dist, parent=parent, first_hop=first_hop, children=children)
+
+    def _invalidate(self, affected) -> None:
+        for source in [source for source, tree in self._trees.items() if affected(source, tree)]:
+            del self._trees[source]
+            self.invalidations += 1
+
+    def _relay_cost(self, source: str, node: str) -> float:
+        return 0.0 if node == source else self._penalty(self._levels[node])
+
+    def _on_link_improved(self, a: str, b: str, weight: float) -> None:
+        if self._levels.get(a) == BLOCKED or self._levels.get(b) == BLOCKED:
+            return
+
+        def shortens(source: str, tree: _Tree) -> bool:
+            if a not in tree.dist:
+                return False
+            via = tree.dist[a] + self._relay_cost(source, a) + weight
+            return via < tree.dist.get(b, float("inf")) - _EPSILON or tree.parent.get(b) == a
+
+        self._invalidate(shortens)
+
+    def _on_link_worsened(self, a: str, b: str) -> None:
+        self._invalidate(lambda source, tree: tree.parent.get(b) == a)
+
+    def _on_node_opened(self, node_id: str) -> None:
+        """``node_id`` became cheaper to use (unblocked or more trusted)."""
+        links = self._adj.get(node_id, {})
+
+        def improves(source: str, tree: _Tree) -> bool:
+            if source == node_id:
+                return False
+            if node_id in tree.dist:
+                via = tree.dist[node_id] + self._relay_cost(source, node_id)
+                return any(via + weight < tree.dist.get(neighbor, float("inf")) - _EPSILON for neighbor, weight in links.items())
+            # previously unreachable: any reachable neighbor now reaches it
+            return any(neighbor in tree.dist for neighbor in links)
+
+        self._invalidate(improves)
+
+    def _detach(self, node_id: str) -> None:
+        """Drop ``node_id`` from every cached tree; pruning leaves in place."""
+        self._trees.pop(node_id, None)
+        for source in list(self._trees):
+            tree = self._trees[source]
+            if node_id not in tree.dist:
+                continue
+            if tree.children.get(node_id):
+                del self._trees[source]
+                self.invalidations += 1
+                continue
+            via = tree.parent.pop(node_id)
+            del tree.dist[node_id]
+            tree.first_hop.pop(node_id, None)
+            tree.children[via].remove(node_id)
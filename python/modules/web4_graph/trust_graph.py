@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict
+from typing import Callable, Dict, List
 
 
 class GraphTrustLevel(str, Enum):
@@ -19,28 +19,44 @@ class GraphTrustLink:
     reason: str
 
 
+TrustListener = Callable[[str], None]
+
+
 class GraphTrustFSM:
+    """Trust level per node. Listeners added with ``subscribe`` get the id of every node whose level changes."""
+
     def __init__(self) -> None:
         self._levels: Dict[str, GraphTrustLevel] = {}
+        self._listeners: List[TrustListener] = []
+
+    def subscribe(self, listener: TrustListener) -> None:
+        self._listeners.append(listener)
+
+    def _set(self, node_id: str, level: GraphTrustLevel) -> None:
+        changed = self.get(node_id) != level
+        self._levels[node_id] = level
+        if changed:
+            for listener in list(self._listeners):
+                listener(node_id)
 
     def get(self, node_id: str) -> GraphTrustLevel:
         return self._levels.get(node_id, GraphTrustLevel.UNKNOWN)
 
     def on_handshake(self, node_id: str) -> GraphTrustLink:
         level = GraphTrustLevel.PROBING if self.get(node_id) == GraphTrustLevel.UNKNOWN else self.get(node_id)
-        self._levels[node_id] = level
+        self._set(node_id, level)
         return GraphTrustLink(node_id, level, "handshake")
 
     def on_verified(self, node_id: str) -> GraphTrustLink:
-        self._levels[node_id] = GraphTrustLevel.TRUSTED
+        self._set(node_id, GraphTrustLevel.TRUSTED)
         return GraphTrustLink(node_id, GraphTrustLevel.TRUSTED, "verified")
 
     def on_conflict(self, node_id: str) -> GraphTrustLink:
         current = self.get(node_id)
         if current == GraphTrustLevel.TRUSTED:
-            self._levels[node_id] = GraphTrustLevel.PROBING
+            self._set(node_id, GraphTrustLevel.PROBING)
             return GraphTrustLink(node_id, GraphTrustLevel.PROBING, "conflict")
-        self._levels[node_id] = GraphTrustLevel.BLOCKED
+        self._set(node_id, GraphTrustLevel.BLOCKED)
         return GraphTrustLink(node_id, GraphTrustLevel.BLOCKED, "conflict")
 
     def propagate(self, source: str, target: str) -> GraphTrustLink:
@@ -2,7 +2,7 @@ from .mesh_envelope import MeshEnvelope
 from .mesh_rtt import MeshRttConfig, MeshRttSession, MeshBackpressureError, MeshDisconnectedError
 from .observability_mesh import MeshObservabilityEvent, MeshObservabilityHub
 from .peers import Peer, PeerRegistry
-from .router import MeshRouter, MeshForwardingPolicy
+from .router import MeshRouter, MeshForwardingPolicy, SeenEnvelopes
 from .trust_mesh import DistributedTrustFSM, TrustLink, TrustLevel
 
 __all__ = [
@@ -17,6 +17,7 @@ __all__ = [
     "PeerRegistry",
     "MeshRouter",
     "MeshForwardingPolicy",
+    "SeenEnvelopes",
     "DistributedTrustFSM",
     "TrustLink",
     "TrustLevel",
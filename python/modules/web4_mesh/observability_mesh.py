@@ -1,29 +1,30 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime, timezone
-from typing import Any, Dict, List
+from typing import Any, Dict
+
+from ..shared.event_store import EventHub, monotonic_ns, wall_time_iso
 
 
 @dataclass(frozen=True)
 class MeshObservabilityEvent:
     event_type: str
     payload: Dict[str, Any]
-    occurred_at: str
+    timestamp_ns: int
+
+    @property
+    def occurred_at(self) -> str:
+        return wall_time_iso(self.timestamp_ns)
 
 
-class MeshObservabilityHub:
-    def __init__(self) -> None:
-        self._events: List[MeshObservabilityEvent] = []
+class MeshObservabilityHub(EventHub[MeshObservabilityEvent]):
+    """Bounded event log; see ``EventHub`` for capacity, cursors and spilling."""
 
     def record(self, event_type: str, payload: Dict[str, Any]) -> MeshObservabilityEvent:
         event = MeshObservabilityEvent(
             event_type=event_type,
             payload=payload,
-            occurred_at=datetime.now(timezone.utc).isoformat(),
+            timestamp_ns=monotonic_ns(),
         )
-        self._events.append(event)
+        self._store.append(event, event_type)
         return event
-
-    def snapshot(self) -> List[MeshObservabilityEvent]:
-        return list(self._events)
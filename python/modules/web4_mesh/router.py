@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from typing import List, Optional
 
+from ..web4_graph.routing_table import RoutingTable
 from .mesh_envelope import MeshEnvelope
-from .peers import PeerRegistry
+from .peers import Peer, PeerRegistry
 from .trust_mesh import DistributedTrustFSM, TrustLevel
 
 
@@ -13,11 +15,63 @@ class MeshForwardingPolicy:
     max_hops: int = 3
 
 
+class SeenEnvelopes:
+    """Bounded LRU set of envelope ids, used to drop repeated floods."""
+
+    def __init__(self, capacity: int = 4096) -> None:
+        self.capacity = capacity
+        self._ids: OrderedDict[str, None] = OrderedDict()
+
+    def __contains__(self, envelope_id: str) -> bool:
+        return envelope_id in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, envelope_id: str) -> bool:
+        """Record ``envelope_id``; False if it was already seen."""
+        if envelope_id in self._ids:
+            self._ids.move_to_end(envelope_id)
+            return False
+        self._ids[envelope_id] = None
+        if len(self._ids) > self.capacity:
+            self._ids.popitem(last=False)
+        return True
+
+
 @dataclass
 class MeshRouter:
+    """Forwards envelopes for one mesh node.
+
+    Registered peers are direct neighbours. With a ``table`` (a
+    ``RoutingTable`` over the mesh links) envelopes for other nodes go to
+    the next hop on the cheapest trusted path, and broadcasts follow the
+    origin's shortest-path tree so each node receives one copy. The node
+    forwarding is the last hop of the envelope, or its origin.
+    """
+
     registry: PeerRegistry
     trust: DistributedTrustFSM
     policy: MeshForwardingPolicy = MeshForwardingPolicy()
+    table: Optional[RoutingTable] = None
+    node_id: Optional[str] = None
+    seen: SeenEnvelopes = field(default_factory=SeenEnvelopes)
+
+    def connect(self, peer: Peer, weight: float = 1.0) -> None:
+        """Register a direct peer and, when routing by table, its link from ``node_id``."""
+        self.registry.add(peer)
+        if self.table is not None and self.node_id is not None:
+            self.table.set_link(self.node_id, peer.peer_id, weight)
+
+    def disconnect(self, peer_id: str) -> None:
+        self.registry.remove(peer_id)
+        if self.table is not None and self.node_id is not None:
+            self.table.remove_link(self.node_id, peer_id)
+
+    def trust_changed(self, peer_id: str) -> None:
+        """Re-read ``peer_id``'s trust; only needed when the table's trust source does not notify it."""
+        if self.table is not None:
+            self.table.refresh_trust([peer_id])
 
     def route(self, envelope: MeshEnvelope) -> Optional[MeshEnvelope]:
         if envelope.destination == envelope.origin:
@@ -28,16 +82,31 @@ class MeshRouter:
             return None
         if self.trust.get(envelope.destination) == TrustLevel.BLOCKED:
             return None
-        if not self.registry.has(envelope.destination):
+        if self.registry.has(envelope.destination):
+            return envelope.with_hop(envelope.destination)
+        if self.table is None:
+            return None
+        current = envelope.hops[-1] if envelope.hops else envelope.origin
+        hop = self.table.next_hop(current, envelope.destination)
+        if hop is None or hop == envelope.origin or hop in envelope.hops:
+            return None
+        if self.trust.get(hop) == TrustLevel.BLOCKED:
             return None
-        return envelope.with_hop(envelope.destination)
+        return envelope.with_hop(hop)
 
     def broadcast(self, envelope: MeshEnvelope) -> List[MeshEnvelope]:
+        if not self.seen.add(envelope.envelope_id):
+            return []
+        if self.table is not None:
+            current = envelope.hops[-1] if envelope.hops else envelope.origin
+            targets = self.table.children(envelope.origin, current)
+        else:
+            targets = [peer.peer_id for peer in self.registry.all_peers()]
         routed: List[MeshEnvelope] = []
-        for peer in self.registry.all_peers():
-            if peer.peer_id == envelope.origin:
+        for peer_id in targets:
+            if peer_id == envelope.origin or peer_id in envelope.hops:
                 continue
-            if self.trust.get(peer.peer_id) == TrustLevel.BLOCKED:
+            if self.trust.get(peer_id) == TrustLevel.BLOCKED:
                 continue
-            routed.append(envelope.with_hop(peer.peer_id))
+            routed.append(envelope.with_hop(peer_id))
         return routed
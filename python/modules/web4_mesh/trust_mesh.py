@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict
+from typing import Callable, Dict, List
 
 
 class TrustLevel(str, Enum):
@@ -19,28 +19,44 @@ class TrustLink:
     reason: str
 
 
+TrustListener = Callable[[str], None]
+
+
 class DistributedTrustFSM:
+    """Trust level per peer. Listeners added with ``subscribe`` get the id of every peer whose level changes."""
+
     def __init__(self) -> None:
         self._levels: Dict[str, TrustLevel] = {}
+        self._listeners: List[TrustListener] = []
+
+    def subscribe(self, listener: TrustListener) -> None:
+        self._listeners.append(listener)
+
+    def _set(self, peer_id: str, level: TrustLevel) -> None:
+        changed = self.get(peer_id) != level
+        self._levels[peer_id] = level
+        if changed:
+            for listener in list(self._listeners):
+                listener(peer_id)
 
     def get(self, peer_id: str) -> TrustLevel:
         return self._levels.get(peer_id, TrustLevel.UNKNOWN)
 
     def on_handshake(self, peer_id: str) -> TrustLink:
         level = TrustLevel.PROBING if self.get(peer_id) == TrustLevel.UNKNOWN else self.get(peer_id)
-        self._levels[peer_id] = level
+        self._set(peer_id, level)
         return TrustLink(peer_id, level, "handshake")
 
     def on_verified(self, peer_id: str) -> TrustLink:
-        self._levels[peer_id] = TrustLevel.TRUSTED
+        self._set(peer_id, TrustLevel.TRUSTED)
         return TrustLink(peer_id, TrustLevel.TRUSTED, "verified")
 
     def on_conflict(self, peer_id: str) -> TrustLink:
         current = self.get(peer_id)
         if current == TrustLevel.TRUSTED:
-            self._levels[peer_id] = TrustLevel.PROBING
+            self._set(peer_id, TrustLevel.PROBING)
             return TrustLink(peer_id, TrustLevel.PROBING, "conflict")
-        self._levels[peer_id] = TrustLevel.BLOCKED
+        self._set(peer_id, TrustLevel.BLOCKED)
         return TrustLink(peer_id, TrustLevel.BLOCKED, "conflict")
 
     def propagate(self, source_peer: str, target_peer: str) -> TrustLink:
@@ -1,5 +1,6 @@
 from .agent_integration import AgentLoopAdapter
 from .cip_runtime import CipRuntime
+from .deferred_store import DeferredStats, DeferredStore
 from .hcp_runtime import HcpRuntime, HcpPolicy
 from .lip_runtime import LipRuntime
 from .observability import ObservabilityHub, ObservabilityEvent
@@ -12,6 +13,8 @@ from .web4_session import Web4Session
 __all__ = [
     "AgentLoopAdapter",
     "CipRuntime",
+    "DeferredStats",
+    "DeferredStore",
     "HcpRuntime",
     "HcpPolicy",
     "LipRuntime",
@@ -20,8 +20,9 @@ class CipRuntime:
         payload = {"handshake": "ack"}
         return build_envelope("HELLO_ACK", self.identity, receiver, payload, state=state)
 
-    def handle_envelope(self, envelope: Dict[str, Any]) -> TrustTransition | None:
-        validate_envelope(envelope)
+    def handle_envelope(self, envelope: Dict[str, Any], *, validated: bool = False) -> TrustTransition | None:
+        if not validated:
+            validate_envelope(envelope)
         message_type = envelope.get("type")
         if message_type == "HELLO":
             return self.trust_fsm.on_valid_handshake()
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from ..protocols.lip import canonical_json
+
+Envelope = Dict[str, Any]
+
+_TIER_DIGITS = re.compile(r"(\d+)")
+UNRANKED_PRIORITY = 100
+
+
+def envelope_size(envelope: Envelope) -> int:
+    return len(canonical_json(envelope).encode("utf-8"))
+
+
+def tier_priority(envelope: Envelope) -> int:
+    """Rank by the source's trust tier number ("tier1" first); unranked sources go last."""
+    tier = str((envelope.get("source") or {}).get("trust_tier", ""))
+    match = _TIER_DIGITS.search(tier)
+    return int(match.group(1)) if match else UNRANKED_PRIORITY
+
+
+@dataclass
+class _Entry:
+    envelope: Envelope
+    size: int
+    priority: int
+    enqueued_at: float
+    sequence: int
+
+
+@dataclass
+class DeferredStats:
+    entries: int = 0
+    bytes: int = 0
+    peers: int = 0
+    deferred: int = 0
+    released: int = 0
+    coalesced: int = 0
+    dropped: Dict[str, int] = field(default_factory=dict)
+    oldest_age_s: float = 0.0
+    max_release_age_s: float = 0.0
+    total_release_age_s: float = 0.0
+
+    @property
+    def mean_release_age_s(self) -> float:
+        return self.total_release_age_s / self.released if self.released else 0.0
+
+
+class DeferredStore:
+    """Bounded holding area for envelopes from peers that are not trusted yet.
+
+    Envelopes are partitioned by sender. A newer update for the same source
+    URI from the same sender replaces the queued one. Each sender may hold
+    ``max_peer_bytes`` and the store ``max_bytes``; when a sender exceeds
+    its share its own lowest-priority, oldest entries are dropped, and when
+    the store is full the sender holding the most bytes gives way, so one
+    chatty peer cannot crowd out the rest. Entries older than
+    ``ttl_seconds`` expire. ``release`` yields entries highest priority
+    first (lowest number), oldest first within a priority, removing each as
+    it is consumed.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int = 4 * 1024 * 1024,
+        max_peer_bytes: int = 256 * 1024,
+        ttl_seconds: float | None = 600.0,
+        size_of: Callable[[Envelope], int] = envelope_size,
+        priority_of: Callable[[Envelope], int] = tier_priority,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.max_peer_bytes = min(max_peer_bytes, max_bytes)
+        self.ttl_seconds = ttl_seconds
+        self._size_of = size_of
+        self._priority_of = priority_of
+        self._clock = clock
+        self._peers: Dict[str, "OrderedDict[str, _Entry]"] = {}
+        self._peer_bytes: Dict[str, int] = {}
+        self._bytes = 0
+        self._entries = 0
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self._stats = DeferredStats()
+
+    def __len__(self) -> int:
+        return self._entries
+
+    @property
+    def bytes(self) -> int:
+        return self._bytes
+
+    @staticmethod
+    def _keys(envelope: Envelope) -> Tuple[str, str]:
+        sender = str((envelope.get("sender") or {}).get("agent_id", ""))
+        source = envelope.get("source") or {}
+        key = source.get("uri") or envelope.get("msg_id") or ""
+        return sender, str(key)
+
+    def add(self, envelope: Envelope) -> bool:
+        """Hold ``envelope``; False if it was dropped at once (too large, or first in line for eviction)."""
+        sender, key = self._keys(envelope)
+        size = self._size_of(envelope)
+        now = self._clock()
+        with self._lock:
+            self._stats.deferred += 1
+            self._expire(now)
+            if size > self.max_peer_bytes:
+                self._drop("oversize")
+                return False
+            partition = self._peers.get(sender)
+            if partition is not None and key in partition:
+                self._forget(sender, partition.pop(key))
+                self._stats.coalesced += 1
+            partition = self._peers.get(sender)
+            if partition is None:
+                partition = self._peers[sender] = OrderedDict()
+                self._peer_bytes[sender] = 0
+            sequence = next(self._sequence)
+            partition[key] = _Entry(envelope, size, self._priority_of(envelope), now, sequence)
+            self._peer_bytes[sender] += size
+            self._bytes += size
+            self._entries += 1
+            while self._peer_bytes.get(sender, 0) > self.max_peer_bytes:
+                self._evict(sender, "peer_budget")
+            while self._bytes > self.max_bytes:
+                heaviest = max(self._peer_bytes, key=self._peer_bytes.__getitem__)
+                self._evict(heaviest, "global_budget")
+            held = self._peers.get(sender, {}).get(key)
+            return held is not None and held.sequence == sequence
+
+    def expire(self) -> int:
+        """Drop entries past their TTL; returns how many."""
+        with self._lock:
+            return self._expire(self._clock())
+
+    def release(self, sender: Optional[str] = None) -> Iterator[Envelope]:
+        """Yield held envelopes (optionally from one sender) in priority order, removing each as yielded."""
+        with self._lock:
+            self._expire(self._clock())
+            senders = [sender] if sender is not None else list(self._peers)
+            order = [
+                (entry.priority, entry.enqueued_at, entry.sequence, peer, key)
+                for peer in senders
+                for key, entry in self._peers.get(peer, {}).items()
+            ]
+        heapq.heapify(order)
+        while order:
+            _, _, sequence, peer, key = heapq.heappop(order)
+            with self._lock:
+                partition = self._peers.get(peer)
+                entry = partition.get(key) if partition is not None else None
+                if entry is None or entry.sequence != sequence:
+                    continue  # superseded or dropped since the release started
+                del partition[key]
+                self._forget(peer, entry)
+                age = self._clock() - entry.enqueued_at
+                stats = self._stats
+                stats.released += 1
+                stats.total_release_age_s += age
+                stats.max_release_age_s = max(stats.max_release_age_s, age)
+            yield entry.envelope
+
+    def clear(self) -> None:
+        with self._lock:
+            self._peers.clear()
+            self._peer_bytes.clear()
+            self._bytes = self._entries = 0
+
+    def stats(self) -> DeferredStats:
+        with self._lock:
+            now = self._clock()
+            oldest = min(
+                (next(iter(partition.values())).enqueued_at for partition in self._peers.values() if partition),
+                default=now,
+            )
+            snapshot = DeferredStats(**{**self._stats.__dict__, "dropped": dict(self._stats.dropped)})
+            snapshot.entries = self._entries
+            snapshot.bytes = self._bytes
+            snapshot.peers = len(self._peers)
+            snapshot.oldest_age_s = now - oldest
+            return snapshot
+
+    def _drop(self, reason: str, count: int = 1) -> None:
+        self._stats.dropped[reason] = self._stats.dropped.get(reason, 0) + count
+
+    def _forget(self, sender: str, entry: _Entry) -> None:
+        self._peer_bytes[sender] -= entry.size
+        self._bytes -= entry.size
+        self._entries -= 1
+        if not self._peers[sender]:
+            del self._peers[sender]
+            del self._peer_bytes[sender]
+
+    def _evict(self, sender: str, reason: str) -> None:
+        partition = self._peers[sender]
+        # lowest priority first (largest number), oldest within it
+        key, entry = max(partition.items(), key=lambda item: (item[1].priority, -item[1].sequence))
+        del partition[key]
+        self._forget(sender, entry)
+        self._drop(reason)
+
+    def _expire(self, now: float) -> int:
+        if self.ttl_seconds is None:
+            return 0
+        deadline = now - self.ttl_seconds
+        expired = 0
+        for sender in list(self._peers):
+            partition = self._peers[sender]
+            # partitions are in arrival order, so expired entries are at the front
+            while partition:
+                key, entry = next(iter(partition.items()))
+                if entry.enqueued_at > deadline:
+                    break
+                del partition[key]
+                self._forget(sender, entry)
+                expired += 1
+                if sender not in self._peers:
+                    break
+        if expired:
+            self._drop("ttl", expired)
+        return expired
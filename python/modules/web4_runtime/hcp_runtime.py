@@ -30,8 +30,9 @@ class HcpRuntime:
         pressure_ok = human_state.pressure <= self.policy.max_pressure
         return consent_ok and pressure_ok
 
-    def handle_envelope(self, envelope: Dict[str, Any]) -> bool:
-        validate_envelope(envelope)
+    def handle_envelope(self, envelope: Dict[str, Any], *, validated: bool = False) -> bool:
+        if not validated:
+            validate_envelope(envelope)
         state = envelope["state"]["human"]
         human_state = HcpHumanState(**state)
         return self.allow_interaction(human_state)
@@ -1,17 +1,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Deque, Dict, List
-from collections import deque
+from typing import Any, Dict, Iterator, List
 
 from ..protocols.lip import LipIdentity, LipSource, build_envelope, validate_envelope
 from ..protocols.trust import TrustState
+from .deferred_store import DeferredStore
 
 
 @dataclass
 class LipRuntime:
     identity: LipIdentity
-    _deferred: Deque[Dict[str, Any]] = field(default_factory=deque, init=False)
+    deferred: DeferredStore = field(default_factory=DeferredStore)
 
     def build_source_update(
         self,
@@ -21,16 +21,19 @@ class LipRuntime:
     ) -> Dict[str, Any]:
         return build_envelope("SOURCE_UPDATE", self.identity, receiver, payload, source)
 
-    def defer_if_untrusted(self, envelope: Dict[str, Any], trust_state: TrustState) -> bool:
-        validate_envelope(envelope)
+    def defer_if_untrusted(self, envelope: Dict[str, Any], trust_state: TrustState, *, validated: bool = False) -> bool:
+        if not validated:
+            validate_envelope(envelope)
         if trust_state != TrustState.TRUSTED:
-            self._deferred.append(envelope)
+            self.deferred.add(envelope)
             return True
         return False
 
-    def release_deferred(self, trust_state: TrustState) -> List[Dict[str, Any]]:
+    def iter_deferred(self, trust_state: TrustState, sender: str | None = None) -> Iterator[Dict[str, Any]]:
+        """Stream held updates in priority order; stopping early leaves the rest held."""
         if trust_state != TrustState.TRUSTED:
-            return []
-        released: List[Dict[str, Any]] = list(self._deferred)
-        self._deferred.clear()
-        return released
+            return iter(())
+        return self.deferred.release(sender)
+
+    def release_deferred(self, trust_state: TrustState) -> List[Dict[str, Any]]:
+        return list(self.iter_deferred(trust_state))
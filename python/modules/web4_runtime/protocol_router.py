@@ -1,14 +1,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
-from ..protocols.router import ProtocolRouter, RouterResult
+from ..protocols.router import ProtocolRouter, RouterResult, TypeStats
 from ..protocols.trust import TrustTransition
 from .cip_runtime import CipRuntime
 from .hcp_runtime import HcpRuntime
 from .lip_runtime import LipRuntime
 
+CIP_TRUST_TYPES = ("HELLO", "FACT_CONFIRM", "FACT_CHALLENGE")
+
 
 @dataclass
 class Web4DispatchResult:
@@ -17,6 +19,13 @@ class Web4DispatchResult:
 
 
 class Web4ProtocolRouter:
+    """Routes CIP/HCP/LIP envelopes to their runtimes.
+
+    The inner ``ProtocolRouter`` validates each envelope once; the runtimes
+    are called with ``validated=True``. CIP trust signals are applied by
+    ``CipRuntime`` alone, once per envelope.
+    """
+
     def __init__(
         self,
         *,
@@ -28,15 +37,35 @@ class Web4ProtocolRouter:
         self._hcp = hcp
         self._lip = lip
         self._router = ProtocolRouter(trust=self._cip.trust_fsm)
-        self._router.register_trust_signals()
         self._register_runtime_handlers()
 
+    @property
+    def router(self) -> ProtocolRouter:
+        return self._router
+
+    @property
+    def stats(self) -> Dict[str, TypeStats]:
+        return self._router.stats
+
     def _register_runtime_handlers(self) -> None:
-        self._router.on("HELLO", lambda env: self._cip.handle_envelope(env))
-        self._router.on("HUMAN_STATE", lambda env: self._hcp.handle_envelope(env))
-        self._router.on("SOURCE_UPDATE", lambda env: self._lip.defer_if_untrusted(env, self._cip.trust_fsm.state))
+        def handle_cip(env: Dict[str, Any]) -> Optional[TrustTransition]:
+            return self._cip.handle_envelope(env, validated=True)
+
+        for message_type in CIP_TRUST_TYPES:
+            self._router.on(message_type, handle_cip)
+        self._router.on("HUMAN_STATE", lambda env: self._hcp.handle_envelope(env, validated=True))
+        self._router.on(
+            "SOURCE_UPDATE",
+            lambda env: self._lip.defer_if_untrusted(env, self._cip.trust_fsm.state, validated=True),
+        )
 
     def dispatch(self, envelope: Dict[str, Any]) -> Web4DispatchResult:
         result = self._router.dispatch(envelope)
-        transition = self._cip.handle_envelope(envelope)
-        return Web4DispatchResult(result, transition)
+        return Web4DispatchResult(result, result.transition)
+
+    def dispatch_batch(self, envelopes: Iterable[Dict[str, Any]]) -> List[Web4DispatchResult]:
+        return [Web4DispatchResult(result, result.transition) for result in self._router.dispatch_batch(envelopes)]
+
+    def drain(self, session: Any, max_items: Optional[int] = None, timeout: Optional[float] = 0.0) -> List[Web4DispatchResult]:
+        """Dispatch the envelopes queued on an ``RttSession`` in one batch."""
+        return self.dispatch_batch(session.receive_batch(max_items, timeout))
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from collections import deque
 from dataclasses import dataclass, field
-from threading import Condition
+from threading import Condition, Lock
 from time import monotonic
 from typing import TYPE_CHECKING, Any, Callable, Deque, Generic, Iterable, Literal, Optional, TypeVar
 
@@ -53,14 +53,65 @@ class RttStats:
         return self.dropped_oldest + self.dropped_newest
 
 
+class _RttCounters:
+    """Mutable counters behind ``RttStats``; updated in place under the session lock."""
+
+    __slots__ = (
+        "attempted",
+        "enqueued",
+        "dropped_oldest",
+        "dropped_newest",
+        "blocked",
+        "errors",
+        "overflow_events",
+        "max_queue_len",
+    )
+
+    def __init__(self) -> None:
+        self.attempted = 0
+        self.enqueued = 0
+        self.dropped_oldest = 0
+        self.dropped_newest = 0
+        self.blocked = 0
+        self.errors = 0
+        self.overflow_events = 0
+        self.max_queue_len = 0
+
+    def snapshot(self) -> RttStats:
+        return RttStats(
+            attempted=self.attempted,
+            enqueued=self.enqueued,
+            dropped_oldest=self.dropped_oldest,
+            dropped_newest=self.dropped_newest,
+            blocked=self.blocked,
+            errors=self.errors,
+            overflow_events=self.overflow_events,
+            max_queue_len=self.max_queue_len,
+        )
+
+
 @dataclass
 class RttSession(Generic[MessageT]):
+    """Bounded in-process message queue with a backpressure policy.
+
+    Counters are plain slotted integers updated under the session lock;
+    ``stats`` publishes an immutable ``RttStats`` snapshot on read.
+    Receivers and blocked senders wait on separate conditions over the same
+    lock and are only notified when someone is actually waiting, so the
+    uncontended path is an append and a few integer increments.
+    ``send_batch`` and ``receive_batch`` take the lock once per batch.
+    """
+
     config: RttConfig = field(default_factory=RttConfig)
     observability: Optional["ObservabilityHub"] = None
     _queue: Deque[MessageT] = field(default_factory=deque, init=False)
     _connected: bool = field(default=True, init=False)
-    _stats: RttStats = field(default_factory=RttStats, init=False)
-    _condition: Condition = field(default_factory=Condition, init=False)
+    _counters: _RttCounters = field(default_factory=_RttCounters, init=False)
+    _lock: Lock = field(default_factory=Lock, init=False)
+    _condition: Condition = field(init=False)
+    _not_empty: Condition = field(init=False)
+    _receivers_waiting: int = field(default=0, init=False)
+    _senders_waiting: int = field(default=0, init=False)
     _heartbeat_at: float = field(default_factory=monotonic, init=False)
     _on_session_open: list[LifecycleHook] = field(default_factory=list, init=False)
     _on_session_close: list[LifecycleHook] = field(default_factory=list, init=False)
@@ -68,6 +119,11 @@ class RttSession(Generic[MessageT]):
     reconnects: int = field(default=0, init=False)
     _emitting: bool = field(default=False, init=False)
 
+    def __post_init__(self) -> None:
+        # Blocked senders wait on ``_condition``; receivers on ``_not_empty``.
+        self._condition = Condition(self._lock)
+        self._not_empty = Condition(self._lock)
+
     @property
     def connected(self) -> bool:
         return self._connected
@@ -78,7 +134,8 @@ class RttSession(Generic[MessageT]):
 
     @property
     def stats(self) -> RttStats:
-        return self._stats
+        with self._lock:
+            return self._counters.snapshot()
 
     def register_on_session_open(self, hook: LifecycleHook) -> None:
         with self._condition:
@@ -118,63 +175,149 @@ class RttSession(Generic[MessageT]):
             self._on_heartbeat_timeout.clear()
 
     def send(self, message: MessageT) -> None:
-        with self._condition:
+        with self._lock:
+            counters = self._counters
             if not self._connected:
-                self._bump(errors=1)
+                counters.errors += 1
                 raise DisconnectedError("RTT session is disconnected")
-            self._bump(attempted=1)
-            if len(self._queue) >= self.config.max_queue:
+            counters.attempted += 1
+            queue = self._queue
+            if len(queue) >= self.config.max_queue:
                 self._on_overflow(message)
                 return
-            self._queue.append(message)
-            self._bump(enqueued=1)
-            self._condition.notify_all()
+            queue.append(message)
+            counters.enqueued += 1
+            if len(queue) > counters.max_queue_len:
+                counters.max_queue_len = len(queue)
+            if self._receivers_waiting:
+                self._not_empty.notify()
 
     def _on_overflow(self, message: MessageT) -> None:
-        self._bump(overflow_events=1)
-        if self.config.backpressure_policy == "dropoldest":
+        counters = self._counters
+        counters.overflow_events += 1
+        policy = self.config.backpressure_policy
+        if policy == "dropoldest":
             self._queue.popleft()
             self._queue.append(message)
-            self._bump(enqueued=1, dropped_oldest=1)
+            counters.enqueued += 1
+            counters.dropped_oldest += 1
             return
-        if self.config.backpressure_policy == "dropnewest":
-            self._bump(dropped_newest=1)
+        if policy == "dropnewest":
+            counters.dropped_newest += 1
             return
-        if self.config.backpressure_policy == "block":
-            self._bump(blocked=1)
+        if policy == "block":
+            counters.blocked += 1
+            if self._receivers_waiting:
+                # a batch may still hold undelivered wakeups; flush before sleeping
+                self._not_empty.notify_all()
             deadline = monotonic() + max(0.0, self.config.block_timeout_s)
 
             def can_enqueue() -> bool:
                 return (not self._connected) or (len(self._queue) < self.config.max_queue)
 
             remaining = max(0.0, deadline - monotonic())
-            ok = self._condition.wait_for(can_enqueue, timeout=remaining)
+            self._senders_waiting += 1
+            try:
+                ok = self._condition.wait_for(can_enqueue, timeout=remaining)
+            finally:
+                self._senders_waiting -= 1
             if not ok or not self._connected:
-                self._bump(errors=1)
+                counters.errors += 1
                 if not self._connected:
                     raise DisconnectedError("RTT session is disconnected")
                 raise BackpressureError("RTT backpressure: block timeout")
 
             self._queue.append(message)
-            self._bump(enqueued=1)
+            counters.enqueued += 1
+            if len(self._queue) > counters.max_queue_len:
+                counters.max_queue_len = len(self._queue)
             return
-        self._bump(errors=1)
+        counters.errors += 1
         raise BackpressureError("RTT backpressure: queue is full")
 
     def send_batch(self, messages: Iterable[MessageT]) -> None:
-        for message in messages:
-            self.send(message)
-
-    def receive(self) -> Optional[MessageT]:
-        with self._condition:
+        """Send ``messages`` in order under one lock acquisition.
+
+        Policies apply per message exactly as with ``send``; the first
+        error stops the batch with the earlier messages already queued.
+        Waiting receivers are woken once, when the batch ends or before a
+        blocking sender sleeps.
+        """
+        with self._lock:
+            counters = self._counters
+            queue = self._queue
+            max_queue = self.config.max_queue
+            try:
+                for message in messages:
+                    if not self._connected:
+                        counters.errors += 1
+                        raise DisconnectedError("RTT session is disconnected")
+                    counters.attempted += 1
+                    if len(queue) >= max_queue:
+                        self._on_overflow(message)
+                        continue
+                    queue.append(message)
+                    counters.enqueued += 1
+                    if len(queue) > counters.max_queue_len:
+                        counters.max_queue_len = len(queue)
+            finally:
+                if self._receivers_waiting and queue:
+                    self._not_empty.notify_all()
+
+    def _wait_for_messages(self, timeout: Optional[float]) -> bool:
+        """Wait until the queue is non-empty; caller holds the lock."""
+        if self._queue:
+            return True
+        if timeout is not None and timeout <= 0:
+            return False
+        self._receivers_waiting += 1
+        try:
+            self._not_empty.wait_for(lambda: self._queue or not self._connected, timeout)
+        finally:
+            self._receivers_waiting -= 1
+        if not self._connected:
+            raise DisconnectedError("RTT session is disconnected")
+        return bool(self._queue)
+
+    def receive(self, timeout: Optional[float] = 0.0) -> Optional[MessageT]:
+        """Pop the next message.
+
+        ``timeout=0`` (the default) returns None immediately when the queue
+        is empty; a positive value waits up to that many seconds and
+        ``None`` waits until a message arrives or the session disconnects.
+        """
+        with self._lock:
             if not self._connected:
                 raise DisconnectedError("RTT session is disconnected")
-            if not self._queue:
+            if not self._wait_for_messages(timeout):
                 return None
             item = self._queue.popleft()
-            self._condition.notify_all()
+            if self._senders_waiting:
+                self._condition.notify()
             return item
 
+    def receive_batch(self, max_items: Optional[int] = None, timeout: Optional[float] = 0.0) -> list[MessageT]:
+        """Pop up to ``max_items`` queued messages (all when None) under one lock acquisition.
+
+        Waits like ``receive`` for the first message only.
+        """
+        with self._lock:
+            if not self._connected:
+                raise DisconnectedError("RTT session is disconnected")
+            if not self._wait_for_messages(timeout):
+                return []
+            queue = self._queue
+            count = len(queue) if max_items is None else min(max_items, len(queue))
+            if count == len(queue):
+                items = list(queue)
+                queue.clear()
+            else:
+                popleft = queue.popleft
+                items = [popleft() for _ in range(count)]
+            if self._senders_waiting:
+                self._condition.notify(min(count, self._senders_waiting))
+            return items
+
     def heartbeat(self) -> None:
         with self._condition:
             self._heartbeat_at = monotonic()
@@ -188,6 +331,7 @@ class RttSession(Generic[MessageT]):
                 return False
             self._connected = False
             self._condition.notify_all()
+            self._not_empty.notify_all()
             timeout_hooks = list(self._on_heartbeat_timeout)
             close_hooks = list(self._on_session_close)
         self._emit("heartbeat_timeout", timeout_hooks)
@@ -200,6 +344,7 @@ class RttSession(Generic[MessageT]):
                 return
             self._connected = False
             self._condition.notify_all()
+            self._not_empty.notify_all()
             close_hooks = list(self._on_session_close)
         self._emit("session_close", close_hooks, reason=reason)
 
@@ -233,27 +378,3 @@ class RttSession(Generic[MessageT]):
         finally:
             with self._condition:
                 self._emitting = False
-
-    def _bump(
-        self,
-        *,
-        attempted: int = 0,
-        enqueued: int = 0,
-        dropped_oldest: int = 0,
-        dropped_newest: int = 0,
-        blocked: int = 0,
-        errors: int = 0,
-        overflow_events: int = 0,
-    ) -> None:
-        current = self._stats
-        max_queue_len = max(current.max_queue_len, len(self._queue))
-        self._stats = RttStats(
-            attempted=current.attempted + attempted,
-            enqueued=current.enqueued + enqueued,
-            dropped_oldest=current.dropped_oldest + dropped_oldest,
-            dropped_newest=current.dropped_newest + dropped_newest,
-            blocked=current.blocked + blocked,
-            errors=current.errors + errors,
-            overflow_events=current.overflow_events + overflow_events,
-            max_queue_len=max_queue_len,
-        )
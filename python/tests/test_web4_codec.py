@@ -0,0 +1,73 @@
+import pytest
+
+from modules.protocols.cip import CipIdentity, CipState, build_envelope as build_cip_envelope
+from modules.protocols.cip import signable_payload
+from modules.protocols.codec import CodecError, decode_envelope, encode_envelope
+from modules.protocols.hcp import HcpHumanState, HcpIdentity, build_envelope as build_hcp_envelope
+from modules.protocols.lip import LipIdentity, LipSource, build_envelope as build_lip_envelope
+
+
+def _envelopes():
+    cip = build_cip_envelope(
+        "HELLO",
+        CipIdentity("agent-a", "fp-a", capabilities=("chat",), pubkey="pk"),
+        CipIdentity("agent-b", "fp-b"),
+        {"text": "привет", "n": [1, 2.5, None]},
+        state=CipState("online", 3, kernel_signals=("calm",)),
+        trust={"level": "probing"},
+    )
+    hcp = build_hcp_envelope(
+        "HUMAN_STATE",
+        HcpIdentity("human-a", "fp-h"),
+        HcpIdentity("agent-b", "fp-b"),
+        {},
+        HcpHumanState("present", "calm", 3, 1, "ask", "granted"),
+    )
+    lip = build_lip_envelope(
+        "CUSTOM_TYPE",
+        LipIdentity("agent-a", "fp-a"),
+        LipIdentity("agent-b", "fp-b"),
+        {"fact": "x"},
+        LipSource("https://example.org", "tier-1", "2024-01-01T00:00:00Z"),
+    )
+    return [cip, hcp, lip]
+
+
+@pytest.mark.parametrize("envelope", _envelopes())
+def test_codec_round_trip(envelope) -> None:
+    data = encode_envelope(envelope)
+    decoded = decode_envelope(memoryview(data))
+    decoded.validate()
+    assert decoded.to_dict() == envelope
+    assert decoded.signable_bytes() == signable_payload(envelope).encode("utf-8")
+    assert encode_envelope(decoded.to_dict()) == data
+
+
+def test_codec_keeps_irregular_fields() -> None:
+    envelope = dict(_envelopes()[0], msg_id="not-a-uuid", timestamp="yesterday", sign="SIGNATURE-XYZ", route=["x"])
+    decoded = decode_envelope(encode_envelope(envelope))
+    assert decoded.to_dict() == envelope
+    assert b"SIGNATURE-XYZ" not in decoded.signable_bytes()
+
+
+def test_codec_packs_ids_and_known_types() -> None:
+    envelope = _envelopes()[1]
+    data = encode_envelope(envelope)
+    assert envelope["msg_id"].encode() not in data
+    assert b"HUMAN_STATE" not in data
+    assert decode_envelope(data).message_type == "HUMAN_STATE"
+
+
+def test_codec_rejects_bad_buffers() -> None:
+    data = encode_envelope(_envelopes()[0])
+    with pytest.raises(CodecError):
+        decode_envelope(b"XX" + data[2:])
+    with pytest.raises(CodecError):
+        decode_envelope(data[:-3])
+    envelope = dict(_envelopes()[0], payload=["not", "an", "object"])
+    with pytest.raises(ValueError, match="Payload"):
+        decode_envelope(encode_envelope(envelope)).validate()
+    envelope = _envelopes()[2]
+    del envelope["source"]
+    with pytest.raises(ValueError, match="source"):
+        decode_envelope(encode_envelope(envelope)).validate()
@@ -1,8 +1,11 @@
+import random
+
 from modules.web4_graph.edge import GraphEdge
 from modules.web4_graph.graph_observability import GraphObservabilityHub
 from modules.web4_graph.graph_validator import Graph
 from modules.web4_graph.node import GraphNode
 from modules.web4_graph.routing_rules import RoutingPolicy, next_hop
+from modules.web4_graph.routing_table import RoutingTable
 from modules.web4_graph.trust_graph import GraphTrustFSM, GraphTrustLevel
 
 
@@ -46,3 +49,66 @@ def test_end_to_end_service_path() -> None:
     trust.propagate("node-c", "service-b")
     hop = next_hop("service-b", "agent-a", ["node-c"], trust, RoutingPolicy(max_hops=3))
     assert hop == "service-b"
+
+
+def _line_graph() -> Graph:
+    nodes = {name: GraphNode(name, "node", f"local://{name}") for name in "abcd"}
+    edges = [
+        GraphEdge("a-b", "a", "b", "link", weight=1.0),
+        GraphEdge("b-c", "b", "c", "link", weight=1.0),
+        GraphEdge("c-d", "c", "d", "link", weight=1.0),
+        GraphEdge("a-d", "a", "d", "link", weight=5.0),
+    ]
+    return Graph(nodes=nodes, edges=edges)
+
+
+def test_routing_table_multi_hop_and_trust() -> None:
+    trust = GraphTrustFSM()
+    for name in "abcd":
+        trust.on_verified(name)
+    table = RoutingTable.from_graph(_line_graph(), trust)
+    assert table.path("a", "d") == ["b", "c", "d"]
+    assert next_hop("d", "a", [], trust, RoutingPolicy(max_hops=3), table) == "b"
+    assert next_hop("d", "a", ["b"], trust, RoutingPolicy(max_hops=3), table) == "c"
+
+    trust.on_conflict("b")
+    trust.on_conflict("b")
+    assert trust.get("b") == GraphTrustLevel.BLOCKED
+    assert table.next_hop("a", "d") == "d"
+    assert table.next_hop("a", "b") is None
+    assert table.children("a", "a") == ["d"]
+
+
+def test_routing_table_incremental_matches_rebuild() -> None:
+    rng = random.Random(7)
+    trust = GraphTrustFSM()
+    names = [f"n{idx}" for idx in range(30)]
+    table = RoutingTable(trust)
+    for idx, name in enumerate(names[1:], start=1):
+        table.set_link(name, names[rng.randrange(idx)], rng.uniform(1, 5))
+    for source in names:
+        table.reachable(source)
+    for _ in range(200):
+        a, b = rng.sample(names, 2)
+        action = rng.random()
+        if action < 0.4:
+            table.set_link(a, b, rng.uniform(0.5, 5))
+        elif action < 0.6:
+            table.remove_link(a, b)
+        elif action < 0.8:
+            trust.on_verified(a)
+        else:
+            trust.on_conflict(a)
+        fresh = RoutingTable(trust)
+        for node in names:
+            fresh.add_node(node)
+            for neighbor, weight in table.neighbors(node).items():
+                fresh.set_link(node, neighbor, weight, bidirectional=False)
+        for source in rng.sample(names, 5):
+            for destination in names:
+                expected = fresh.distance(source, destination)
+                actual = table.distance(source, destination)
+                assert (expected is None) == (actual is None)
+                if expected is not None:
+                    assert abs(expected - actual) < 1e-9
+    assert table.computations < 200 * 5
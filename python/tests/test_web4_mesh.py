@@ -4,6 +4,7 @@ from modules.web4_mesh.mesh_envelope import MeshEnvelope
 from modules.web4_mesh.mesh_rtt import MeshRttConfig, MeshRttSession, MeshBackpressureError, MeshDisconnectedError
 from modules.web4_mesh.observability_mesh import MeshObservabilityHub
 from modules.web4_mesh.peers import Peer, PeerRegistry
+from modules.web4_graph.routing_table import RoutingTable
 from modules.web4_mesh.router import MeshForwardingPolicy, MeshRouter
 from modules.web4_mesh.trust_mesh import DistributedTrustFSM, TrustLevel
 
@@ -21,6 +22,57 @@ def test_mesh_router_routing() -> None:
     assert routed.hops == ["peer-b"]
 
 
+def _ring_routers(size: int):
+    names = [f"peer-{idx}" for idx in range(size)]
+    trust = DistributedTrustFSM()
+    for name in names:
+        trust.on_verified(name)
+    table = RoutingTable(trust)
+    routers = {
+        name: MeshRouter(PeerRegistry(), trust, MeshForwardingPolicy(max_hops=size), table=table, node_id=name)
+        for name in names
+    }
+    for idx, name in enumerate(names):
+        neighbor = names[(idx + 1) % size]
+        routers[name].connect(Peer(neighbor, f"local://{neighbor}"))
+        routers[neighbor].registry.add(Peer(name, f"local://{name}"))
+    return names, trust, routers
+
+
+def test_mesh_router_multi_hop() -> None:
+    names, trust, routers = _ring_routers(6)
+    envelope = MeshEnvelope("HELLO", origin="peer-0", destination="peer-3", payload={})
+    while not envelope.hops or envelope.hops[-1] != envelope.destination:
+        current = envelope.hops[-1] if envelope.hops else envelope.origin
+        envelope = routers[current].route(envelope)
+        assert envelope is not None
+    assert envelope.hops in (["peer-1", "peer-2", "peer-3"], ["peer-5", "peer-4", "peer-3"])
+
+    trust.on_conflict("peer-1")
+    trust.on_conflict("peer-1")
+    routed = routers["peer-0"].route(MeshEnvelope("HELLO", origin="peer-0", destination="peer-2", payload={}))
+    assert routed is not None and routed.hops == ["peer-5"]
+
+
+def test_mesh_broadcast_spanning_tree_and_dedup() -> None:
+    names, _, routers = _ring_routers(8)
+    pending = [MeshEnvelope("PING", origin="peer-0", destination="*", payload={})]
+    delivered = {"peer-0"}
+    sent = 0
+    while pending:
+        envelope = pending.pop()
+        current = envelope.hops[-1] if envelope.hops else envelope.origin
+        for copy in routers[current].broadcast(envelope):
+            sent += 1
+            delivered.add(copy.hops[-1])
+            pending.append(copy)
+    assert delivered == set(names)
+    assert sent == len(names) - 1
+    seed = MeshEnvelope("PING", origin="peer-0", destination="*", payload={})
+    assert routers["peer-0"].broadcast(seed)
+    assert routers["peer-0"].broadcast(seed) == []
+
+
 def test_mesh_trust_propagation() -> None:
     trust = DistributedTrustFSM()
     trust.on_verified("peer-a")
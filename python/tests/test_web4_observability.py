@@ -0,0 +1,70 @@
+import json
+from datetime import datetime
+
+from modules.shared.event_store import EventStore
+from modules.web4_graph.graph_observability import GraphObservabilityHub
+from modules.web4_mesh.observability_mesh import MeshObservabilityHub
+from modules.web4_runtime.observability import ObservabilityHub
+
+
+def test_hub_is_bounded_and_counts_survive_eviction() -> None:
+    hub = ObservabilityHub(capacity=3)
+    for idx in range(5):
+        hub.record("send" if idx % 2 == 0 else "receive", {"n": idx})
+    assert [event.payload["n"] for event in hub.snapshot()] == [2, 3, 4]
+    assert hub.counts() == {"send": 3, "receive": 2}
+    assert hub.cursor == 5
+
+
+def test_since_returns_only_new_events() -> None:
+    hub = MeshObservabilityHub(capacity=100)
+    hub.record("boot", {})
+    events, cursor = hub.since(0)
+    assert [event.event_type for event in events] == ["boot"]
+
+    assert hub.since(cursor) == ([], cursor)
+    hub.record("peer_added", {"peer": "a"})
+    hub.record("peer_added", {"peer": "b"})
+    events, next_cursor = hub.since(cursor, limit=1)
+    assert [event.payload["peer"] for event in events] == ["a"]
+    events, next_cursor = hub.since(next_cursor)
+    assert [event.payload["peer"] for event in events] == ["b"]
+    assert next_cursor == hub.cursor
+
+
+def test_since_skips_evicted_events() -> None:
+    store: EventStore[int] = EventStore(capacity=2)
+    for value in range(5):
+        store.append(value, "n")
+    events, cursor = store.since(1)
+    assert events == [3, 4]
+    assert cursor == 5
+    assert store.first_sequence == 4
+
+
+def test_events_keep_monotonic_stamp_and_render_wall_time() -> None:
+    hub = GraphObservabilityHub()
+    first = hub.record("edge", "node-a", "node-b", {})
+    second = hub.record("edge", "node-b", "node-c", {})
+    assert second.timestamp_ns >= first.timestamp_ns
+    assert datetime.fromisoformat(first.occurred_at).tzinfo is not None
+
+
+def test_evicted_events_spill_to_rotating_file(tmp_path) -> None:
+    path = tmp_path / "events.jsonl"
+    hub = ObservabilityHub(capacity=2, spill_path=path, spill_max_bytes=400, spill_backups=2)
+    for idx in range(30):
+        hub.record("send", {"n": idx})
+    hub.close()
+
+    spilled = []
+    for name in ("events.jsonl.2", "events.jsonl.1", "events.jsonl"):
+        file = tmp_path / name
+        if file.exists():
+            spilled.extend(json.loads(line) for line in file.read_text().splitlines())
+    assert (tmp_path / "events.jsonl.1").exists()
+    assert not (tmp_path / "events.jsonl.3").exists()
+    numbers = [record["payload"]["n"] for record in spilled]
+    assert numbers == sorted(numbers)
+    assert numbers[-1] == 27
+    assert "occurred_at" in spilled[-1]
@@ -11,6 +11,7 @@ from modules.protocols.lip import LipIdentity, LipSource
 from modules.protocols.trust import TrustFSM, TrustState
 from modules.web4_runtime.agent_integration import AgentLoopAdapter
 from modules.web4_runtime.cip_runtime import CipRuntime
+from modules.web4_runtime.deferred_store import DeferredStore
 from modules.web4_runtime.hcp_runtime import HcpRuntime, HcpPolicy
 from modules.web4_runtime.lip_runtime import LipRuntime
 from modules.web4_runtime.observability import ObservabilityHub
@@ -219,6 +220,55 @@ def test_lip_deferred_acceptance() -> None:
     assert released == [envelope]
 
 
+def _source_update(sender: str, uri: str, tier: str = "tier2", data: int = 0) -> dict:
+    runtime = LipRuntime(LipIdentity(sender, f"fp-{sender}"))
+    return runtime.build_source_update(LipIdentity("me", "fp-me"), {"data": data}, LipSource(uri, tier, "now"))
+
+
+def test_deferred_store_coalesces_and_releases_by_priority() -> None:
+    clock = [0.0]
+    store = DeferredStore(ttl_seconds=10.0, clock=lambda: clock[0])
+    store.add(_source_update("peer-a", "https://x", data=1))
+    clock[0] = 1.0
+    store.add(_source_update("peer-a", "https://y", tier="tier3"))
+    store.add(_source_update("peer-b", "https://z", tier="tier1"))
+    clock[0] = 2.0
+    store.add(_source_update("peer-a", "https://x", data=2))
+    assert len(store) == 3
+    stats = store.stats()
+    assert stats.coalesced == 1 and stats.peers == 2
+    assert stats.oldest_age_s == 1.0
+
+    released = store.release()
+    first = next(released)
+    assert first["source"]["uri"] == "https://z"
+    assert len(store) == 2
+    rest = list(released)
+    assert [env["source"]["uri"] for env in rest] == ["https://x", "https://y"]
+    assert rest[0]["payload"] == {"data": 2}
+    assert store.stats().released == 3 and store.bytes == 0
+
+
+def test_deferred_store_budgets_and_ttl() -> None:
+    clock = [0.0]
+    store = DeferredStore(max_bytes=50, max_peer_bytes=30, ttl_seconds=5.0, size_of=lambda env: 10, clock=lambda: clock[0])
+    for idx in range(4):
+        store.add(_source_update("chatty", f"https://c/{idx}"))
+    assert len(store) == 3
+    store.add(_source_update("quiet", "https://q/0"))
+    store.add(_source_update("quiet", "https://q/1"))
+    store.add(_source_update("other", "https://o/0"))
+    assert store.bytes <= 50
+    stats = store.stats()
+    assert stats.dropped == {"peer_budget": 1, "global_budget": 1}
+    assert [env["sender"]["agent_id"] for env in store.release(sender="quiet")] == ["quiet", "quiet"]
+    clock[0] = 6.0
+    assert store.expire() == 3
+    assert len(store) == 0 and store.stats().dropped["ttl"] == 3
+    big = DeferredStore(max_peer_bytes=10, size_of=lambda env: 11)
+    assert big.add(_source_update("peer", "https://b")) is False
+
+
 def test_protocol_router_routing() -> None:
     trust = TrustFSM()
     cip = CipRuntime(CipIdentity("a", "fp-a"), trust)
@@ -231,6 +281,68 @@ def test_protocol_router_routing() -> None:
     assert result.router_result.handled is True
 
 
+def test_protocol_router_validates_once_per_envelope(monkeypatch) -> None:
+    from modules.protocols import router as protocol_router
+    from modules.web4_runtime import cip_runtime
+
+    calls = []
+    original = protocol_router.VALIDATORS["cip"]
+    monkeypatch.setitem(protocol_router.VALIDATORS, "cip", lambda env: calls.append(env) or original(env))
+    monkeypatch.setattr(cip_runtime, "validate_envelope", lambda env: calls.append(env) or original(env))
+    trust = TrustFSM()
+    cip = CipRuntime(CipIdentity("a", "fp-a"), trust)
+    router = Web4ProtocolRouter(cip=cip, hcp=HcpRuntime(HcpIdentity("a", "fp-a")), lip=LipRuntime(LipIdentity("a", "fp-a")))
+    result = router.dispatch(cip.build_hello(CipIdentity("b", "fp-b")))
+    assert len(calls) == 1
+    assert result.trust_transition is not None and result.trust_transition.reason == "valid_handshake"
+    assert trust.state == TrustState.PROBING
+
+
+def test_protocol_router_batch_from_rtt_session() -> None:
+    trust = TrustFSM(TrustState.PROBING)
+    cip = CipRuntime(CipIdentity("a", "fp-a"), trust)
+    hcp = HcpRuntime(HcpIdentity("a", "fp-a"))
+    lip = LipRuntime(LipIdentity("a", "fp-a"))
+    router = Web4ProtocolRouter(cip=cip, hcp=hcp, lip=lip)
+    seen = []
+    router.router.on("*", lambda env: seen.append(env["type"]))
+    receiver = CipIdentity("b", "fp-b")
+    session = RttSession[dict](config=RttConfig(max_queue=8))
+    session.send_batch(
+        [
+            build_envelope("FACT_CHALLENGE", cip.identity, receiver, {}),
+            hcp.build_state_update(HcpIdentity("b", "fp-b"), {}, HcpHumanState("present", "calm", 5, 3, "ask", "granted")),
+            {"cip": "1.0", "type": "HELLO"},
+            lip.build_source_update(LipIdentity("b", "fp-b"), {"data": 1}, LipSource("https://example.com", "tier1", "now")),
+        ]
+    )
+    results = router.drain(session)
+    assert [result.router_result.handled for result in results] == [True, True, False, True]
+    assert isinstance(results[2].router_result.error, ValueError)
+    assert trust.state == TrustState.UNTRUSTED
+    assert results[1].router_result.results[0] is True
+    assert results[3].router_result.results[0] is True
+    assert seen == ["FACT_CHALLENGE", "HUMAN_STATE", "SOURCE_UPDATE"]
+    assert router.stats["HELLO"].errors == 1
+    assert router.stats["HUMAN_STATE"].count == 1
+
+
+def test_protocol_router_stats_stay_bounded_for_untrusted_types() -> None:
+    from modules.protocols.router import ANY_TYPE, ProtocolRouter
+
+    router = ProtocolRouter()
+    router.on("HELLO", lambda env: None)
+    envelopes = [{"cip": "1.0", "type": f"JUNK_{idx}"} for idx in range(100)]
+    envelopes.append({"cip": "1.0", "type": ["unhashable"]})
+    envelopes.append({"cip": "1.0", "type": "HELLO"})
+    results = router.dispatch_batch(envelopes)
+
+    assert all(isinstance(result.error, ValueError) for result in results)
+    assert set(router.stats) == {ANY_TYPE, "HELLO"}
+    assert router.stats[ANY_TYPE].count == router.stats[ANY_TYPE].errors == 101
+    assert router.stats["HELLO"].errors == 1
+
+
 def test_agent_loop_integration() -> None:
     trust = TrustFSM()
     cip = CipRuntime(CipIdentity("a", "fp-a"), trust)
@@ -245,3 +357,71 @@ def test_agent_loop_integration() -> None:
     result = adapter.handle_envelope(envelope)
     assert result["handled"] is True
     assert output.get(timeout=1) == "echo:{'handshake': 'hello'}"
+
+
+def test_rtt_stats_are_immutable_snapshots() -> None:
+    session = RttSession[str](config=RttConfig(max_queue=4))
+    session.send("a")
+    before = session.stats
+    session.send_batch(["b", "c"])
+    assert before.enqueued == 1
+    assert session.stats.enqueued == 3
+    assert session.stats.max_queue_len == 3
+
+
+def test_rtt_receive_blocks_until_message() -> None:
+    session = RttSession[str](config=RttConfig(max_queue=4))
+    assert session.receive() is None
+    assert session.receive(timeout=0.01) is None
+
+    timer = threading.Timer(0.05, session.send, args=("late",))
+    timer.start()
+    started = monotonic()
+    assert session.receive(timeout=1.0) == "late"
+    assert monotonic() - started < 0.5
+    timer.join()
+
+
+def test_rtt_receive_wakes_on_disconnect() -> None:
+    session = RttSession[str](config=RttConfig(max_queue=4))
+    timer = threading.Timer(0.05, session.disconnect)
+    timer.start()
+    with pytest.raises(DisconnectedError):
+        session.receive(timeout=None)
+    timer.join()
+
+
+def test_rtt_batch_send_and_receive() -> None:
+    session = RttSession[int](config=RttConfig(max_queue=8, backpressure_policy="dropnewest"))
+    session.send_batch(range(10))
+    assert session.stats.attempted == 10
+    assert session.stats.dropped_newest == 2
+    assert session.receive_batch(max_items=3) == [0, 1, 2]
+    assert session.receive_batch() == [3, 4, 5, 6, 7]
+    assert session.receive_batch(timeout=0.01) == []
+
+
+def test_rtt_batch_error_policy_keeps_earlier_messages() -> None:
+    session = RttSession[int](config=RttConfig(max_queue=2, backpressure_policy="error"))
+    with pytest.raises(BackpressureError):
+        session.send_batch([1, 2, 3, 4])
+    assert session.receive_batch() == [1, 2]
+    assert session.stats.errors == 1
+    assert session.stats.attempted == 3
+
+
+def test_rtt_blocking_batch_drains_through_consumer() -> None:
+    session = RttSession[int](config=RttConfig(max_queue=4, backpressure_policy="block", block_timeout_s=1.0))
+    received: list[int] = []
+
+    def consumer() -> None:
+        while len(received) < 100:
+            received.extend(session.receive_batch(timeout=1.0))
+
+    worker = threading.Thread(target=consumer)
+    worker.start()
+    session.send_batch(range(100))
+    worker.join(timeout=2)
+    assert received == list(range(100))
+    assert session.stats.enqueued == 100
+    assert session.stats.max_queue_len <= 4
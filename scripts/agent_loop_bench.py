@@ -0,0 +1,87 @@
+"""Benchmark AgentLoop dispatch latency and throughput across concurrent sessions."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT / "python") not in sys.path:
+    sys.path.insert(0, str(ROOT / "python"))
+
+from modules.agent.loop import AgentLoop  # noqa: E402
+from modules.agent.workers import WorkerPool  # noqa: E402
+
+
+class SimulatedLLM:
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+
+    def generate_response(self, question: str, cancel_event=None):
+        if self.delay:
+            time.sleep(self.delay)
+        return f"ok:{question}"
+
+    def format_response(self, response: str) -> str:
+        return response
+
+
+async def _session(loop: AgentLoop, turns: int, latencies: list[float]) -> None:
+    for turn in range(turns):
+        started = time.perf_counter()
+        await loop.ask(f"turn-{turn}")
+        latencies.append(time.perf_counter() - started)
+
+
+def run_benchmark(sessions: int, turns: int, workers: int, delay: float) -> dict[str, float]:
+    pool = WorkerPool(workers=workers, max_pending=max(64, sessions * 2))
+    loops = [
+        AgentLoop(llm=SimulatedLLM(delay), worker_pool=pool, temporal_enabled=False, metrics_enabled=False)
+        for _ in range(sessions)
+    ]
+    latencies: list[float] = []
+
+    async def main() -> None:
+        await asyncio.gather(*(_session(loop, turns, latencies) for loop in loops))
+
+    started = time.perf_counter()
+    asyncio.run(main())
+    elapsed = time.perf_counter() - started
+    stats = dict(pool.stats)
+    pool.shutdown()
+
+    ordered = sorted(latencies)
+    return {
+        "sessions": sessions,
+        "tasks": len(latencies),
+        "throughput_per_s": len(latencies) / elapsed if elapsed else 0.0,
+        "task_p50_ms": statistics.median(ordered) * 1000.0,
+        "task_p99_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000.0,
+        "dispatch_avg_us": float(stats["avg_dispatch_latency"]) * 1e6,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--turns", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--delay-ms", type=float, default=2.0, help="simulated LLM latency per task")
+    args = parser.parse_args()
+
+    for sessions in args.sessions:
+        row = run_benchmark(sessions, args.turns, args.workers, args.delay_ms / 1000.0)
+        print(
+            f"sessions={row['sessions']:>4} tasks={row['tasks']:>5} "
+            f"throughput={row['throughput_per_s']:9.1f}/s "
+            f"task_p50={row['task_p50_ms']:7.2f}ms task_p99={row['task_p99_ms']:7.2f}ms "
+            f"dispatch_avg={row['dispatch_avg_us']:8.1f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
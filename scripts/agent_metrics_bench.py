@@ -0,0 +1,66 @@
+"""Measure per-observation overhead of the agent metrics registry."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import threading
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT / "python") not in sys.path:
+    sys.path.insert(0, str(ROOT / "python"))
+
+from modules.agent.metrics import MetricsRegistry  # noqa: E402
+
+
+def _per_call_ns(stmt: str, namespace: dict, number: int, repeat: int) -> float:
+    return min(timeit.repeat(stmt, globals=namespace, number=number, repeat=repeat)) / number * 1e9
+
+
+def run_benchmark(number: int = 200_000, repeat: int = 5, threads: int = 4) -> dict[str, float]:
+    registry = MetricsRegistry()
+    histogram = registry.histogram("bench_latency_seconds")
+    counter = registry.counter("bench_events_total")
+    gauge = registry.gauge("bench_depth")
+
+    namespace = {"histogram": histogram, "counter": counter, "gauge": gauge}
+    results = {
+        "histogram_observe_ns": _per_call_ns("histogram.observe(0.0123)", namespace, number, repeat),
+        "counter_inc_ns": _per_call_ns("counter.inc()", namespace, number, repeat),
+        "gauge_set_ns": _per_call_ns("gauge.set(3.0)", namespace, number, repeat),
+    }
+
+    contended = registry.histogram("bench_contended_seconds")
+    per_thread = number // threads
+
+    def worker() -> None:
+        for idx in range(per_thread):
+            contended.observe((idx % 1000 + 1) * 1e-4)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    elapsed = timeit.default_timer()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = timeit.default_timer() - elapsed
+    results["contended_observe_ns"] = elapsed / (per_thread * threads) * 1e9
+    results["snapshot_us"] = _per_call_ns("contended.snapshot()", {"contended": contended}, 200, repeat) / 1000.0
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--threads", type=int, default=4)
+    args = parser.parse_args()
+
+    for name, value in run_benchmark(args.number, args.repeat, args.threads).items():
+        print(f"{name:>24} {value:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Measure Coordinator.decide latency end to end, optionally with a shared field of peers."""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+MODULES = ROOT / "python" / "modules"
+if str(MODULES) not in sys.path:
+    sys.path.insert(0, str(MODULES))
+
+from coordinator import Coordinator  # noqa: E402
+from field import (  # noqa: E402
+    CognitiveMesh,
+    CognitiveTopology,
+    FieldAdapter,
+    FieldBias,
+    FieldDampening,
+    FieldEvolution,
+    FieldMorphogenesis,
+    FieldNodeState,
+    FieldReflexivity,
+    FieldRegistry,
+    FieldResonance,
+)
+
+QUERIES = ("hi", "what is the capital of France?", "explain why the build failed and how to fix it step by step")
+
+
+def build_coordinator(peers: int, seed: int) -> Coordinator:
+    coord = Coordinator()
+    if peers < 0:
+        return coord
+    registry = FieldRegistry(
+        ttl=3600.0,
+        resonance=FieldResonance(),
+        dampening=FieldDampening(),
+        evolution=FieldEvolution(),
+        mesh=CognitiveMesh(),
+        morphogenesis=FieldMorphogenesis(),
+        topology=CognitiveTopology(),
+        reflexivity=FieldReflexivity(),
+    )
+    rng = random.Random(seed)
+    now = time.time()
+    for index in range(peers):
+        registry.update_node(
+            FieldNodeState(
+                node_id=f"peer-{index}",
+                timestamp=now,
+                orientation={"diversity_score": rng.random(), "stability_score": rng.random()},
+                confidence={"smoothed": rng.random()},
+                trajectory={"error": rng.random() * 0.3},
+            )
+        )
+    coord.field_adapter = FieldAdapter(node_id="self", registry=registry)
+    coord.field_bias = FieldBias()
+    return coord
+
+
+def run(decisions: int, peers: int, outcome_every: int, seed: int) -> dict[str, float]:
+    coord = build_coordinator(peers, seed)
+    telemetry = {"diversity": 0.4, "unique_paths": 3, "total_paths": 8}
+    retrospective = {"stability_score": 0.7, "contradictions": 0.1, "drift": 0.2, "confidence": 0.6}
+    latencies = []
+    for turn in range(decisions):
+        started = time.perf_counter()
+        coord.decide(
+            QUERIES[turn % len(QUERIES)],
+            context={},
+            telemetry=telemetry,
+            retrospective=retrospective,
+        )
+        latencies.append(time.perf_counter() - started)
+        if outcome_every and turn % outcome_every == 0:
+            coord.record_outcome({"success": turn % (2 * outcome_every) != 0})
+    latencies.sort()
+    return {
+        "mean_us": statistics.fmean(latencies) * 1e6,
+        "p50_us": latencies[len(latencies) // 2] * 1e6,
+        "p99_us": latencies[int(len(latencies) * 0.99)] * 1e6,
+        "history": len(coord.decision_history),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--decisions", type=int, default=5_000)
+    parser.add_argument("--peers", type=int, nargs="+", default=[-1, 0, 10, 100], help="-1 runs without a field")
+    parser.add_argument("--outcome-every", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    for peers in args.peers:
+        result = run(args.decisions, peers, args.outcome_every, args.seed)
+        label = "no field" if peers < 0 else f"peers={peers}"
+        print(
+            f"{label:>10} mean={result['mean_us']:8.1f}us p50={result['p50_us']:8.1f}us "
+            f"p99={result['p99_us']:8.1f}us history={result['history']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Compare encode/decode/validate/sign throughput of the binary envelope codec with JSON."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT / "python") not in sys.path:
+    sys.path.insert(0, str(ROOT / "python"))
+
+from modules.protocols.cip import (  # noqa: E402
+    CipIdentity,
+    CipState,
+    build_envelope,
+    signable_payload,
+    validate_envelope,
+)
+from modules.protocols.codec import decode_envelope, encode_envelope  # noqa: E402
+
+
+def _rate(fn: Callable[[], None], iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return iterations / (time.perf_counter() - started)
+
+
+def sample_envelope(payload_items: int) -> Dict:
+    return build_envelope(
+        "HELLO",
+        CipIdentity("agent-a", "fp-a", capabilities=("chat", "memory"), pubkey="pk-a"),
+        CipIdentity("agent-b", "fp-b"),
+        {f"key-{idx}": {"value": idx, "text": "payload " * 4} for idx in range(payload_items)},
+        state=CipState("online", 3, kernel_signals=("calm",)),
+        trust={"level": "probing"},
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20_000)
+    parser.add_argument("--payload-items", type=int, nargs="+", default=[1, 10, 100])
+    args = parser.parse_args()
+
+    for items in args.payload_items:
+        envelope = sample_envelope(items)
+        text = json.dumps(envelope).encode("utf-8")
+        data = encode_envelope(envelope)
+        iterations = max(100, args.iterations // max(1, items // 10))
+
+        def json_receive() -> None:
+            received = json.loads(text)
+            validate_envelope(received)
+            signable_payload(received).encode("utf-8")
+
+        def binary_receive() -> None:
+            received = decode_envelope(data)
+            received.validate()
+            received.signable_bytes()
+
+        def binary_route() -> None:
+            received = decode_envelope(data)
+            received.validate()
+            received.message_type
+
+        def json_send() -> None:
+            signable_payload(envelope).encode("utf-8")
+            json.dumps(envelope).encode("utf-8")
+
+        def binary_send() -> None:
+            decode_envelope(encode_envelope(envelope)).signable_bytes()
+
+        rates = {
+            "json_encode": _rate(lambda: json.dumps(envelope).encode("utf-8"), iterations),
+            "bin_encode": _rate(lambda: encode_envelope(envelope), iterations),
+            "json_send": _rate(json_send, iterations),
+            "bin_send": _rate(binary_send, iterations),
+            "json_recv": _rate(json_receive, iterations),
+            "bin_recv": _rate(binary_receive, iterations),
+            "bin_route": _rate(binary_route, iterations),
+        }
+        print(
+            f"items={items:4d} json={len(text):6d}B bin={len(data):6d}B "
+            + " ".join(f"{name}={rate / 1000:7.1f}k/s" for name, rate in rates.items())
+        )
+
+
+if __name__ == "__main__":
+    main()
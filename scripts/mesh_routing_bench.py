@@ -0,0 +1,123 @@
+"""Simulate a Web4 mesh and compare table routing and tree broadcast with flooding."""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import itertools
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT / "python") not in sys.path:
+    sys.path.insert(0, str(ROOT / "python"))
+
+from modules.web4_graph.routing_table import RoutingTable  # noqa: E402
+from modules.web4_mesh.mesh_envelope import MeshEnvelope  # noqa: E402
+from modules.web4_mesh.peers import Peer, PeerRegistry  # noqa: E402
+from modules.web4_mesh.router import MeshForwardingPolicy, MeshRouter  # noqa: E402
+from modules.web4_mesh.trust_mesh import DistributedTrustFSM  # noqa: E402
+
+
+def build_mesh(size: int, degree: int, seed: int, use_table: bool) -> Tuple[Dict[str, MeshRouter], Dict[Tuple[str, str], float]]:
+    """A connected random mesh: a random spanning tree plus extra links up to ``degree``; weights are link latency in ms."""
+    rng = random.Random(seed)
+    names = [f"node-{idx}" for idx in range(size)]
+    trust = DistributedTrustFSM()
+    for name in names:
+        trust.on_verified(name)
+    table = RoutingTable(trust) if use_table else None
+    policy = MeshForwardingPolicy(max_hops=size)
+    routers = {name: MeshRouter(PeerRegistry(), trust, policy, table=table, node_id=name) for name in names}
+    latency: Dict[Tuple[str, str], float] = {}
+
+    def link(a: str, b: str) -> None:
+        if a == b or (a, b) in latency:
+            return
+        weight = round(rng.uniform(1.0, 20.0), 1)
+        latency[(a, b)] = latency[(b, a)] = weight
+        routers[a].connect(Peer(b, f"sim://{b}"), weight)
+        routers[b].connect(Peer(a, f"sim://{a}"), weight)
+
+    for idx in range(1, size):
+        link(names[idx], names[rng.randrange(idx)])
+    for _ in range(size * max(0, degree - 2) // 2):
+        link(rng.choice(names), rng.choice(names))
+    return routers, latency
+
+
+def unicast(routers: Dict[str, MeshRouter], latency: Dict[Tuple[str, str], float], pairs: List[Tuple[str, str]]) -> Tuple[float, float, int]:
+    """Mean delivery latency (ms), mean hops and undeliverable count for hop-by-hop forwarding."""
+    total_ms = total_hops = 0.0
+    failed = 0
+    for origin, destination in pairs:
+        envelope = MeshEnvelope("SIM", origin=origin, destination=destination, payload={})
+        current, elapsed = origin, 0.0
+        while current != destination:
+            envelope = routers[current].route(envelope)
+            if envelope is None:
+                failed += 1
+                break
+            elapsed += latency[(current, envelope.hops[-1])]
+            current = envelope.hops[-1]
+        else:
+            total_ms += elapsed
+            total_hops += len(envelope.hops)
+    delivered = max(1, len(pairs) - failed)
+    return total_ms / delivered, total_hops / delivered, failed
+
+
+def broadcast(routers: Dict[str, MeshRouter], latency: Dict[Tuple[str, str], float], origin: str) -> Tuple[int, float, int]:
+    """Messages sent, time until the last node has a copy (ms) and nodes reached.
+
+    Copies are delivered in arrival order, so a node relays the first copy it gets.
+    """
+    order = itertools.count()
+    queue = [(0.0, next(order), MeshEnvelope("SIM", origin=origin, destination="*", payload={}))]
+    first_seen = {origin: 0.0}
+    sent = 0
+    while queue:
+        at, _, envelope = heapq.heappop(queue)
+        current = envelope.hops[-1] if envelope.hops else envelope.origin
+        for copy in routers[current].broadcast(envelope):
+            sent += 1
+            peer = copy.hops[-1]
+            arrival = at + latency[(current, peer)]
+            first_seen[peer] = min(first_seen.get(peer, arrival), arrival)
+            heapq.heappush(queue, (arrival, next(order), copy))
+    return sent, max(first_seen.values()), len(first_seen)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--degree", type=int, default=4)
+    parser.add_argument("--pairs", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        rng = random.Random(args.seed)
+        names = [f"node-{idx}" for idx in range(size)]
+        pairs = [tuple(rng.sample(names, 2)) for _ in range(args.pairs)]
+        routers, latency = build_mesh(size, args.degree, args.seed, use_table=True)
+        started = time.perf_counter()
+        mean_ms, mean_hops, failed = unicast(routers, latency, pairs)
+        route_s = time.perf_counter() - started
+        tree_sent, tree_ms, tree_reached = broadcast(routers, latency, names[0])
+
+        flood_routers, _ = build_mesh(size, args.degree, args.seed, use_table=False)
+        flood_sent, flood_ms, flood_reached = broadcast(flood_routers, latency, names[0])
+        print(
+            f"n={size:5d} links={len(latency) // 2:5d} "
+            f"unicast={mean_ms:6.1f}ms/{mean_hops:4.1f} hops failed={failed} ({route_s * 1e3:7.1f}ms total) | "
+            f"tree: {tree_sent / max(1, tree_reached - 1):4.2f}x amp {tree_ms:6.1f}ms reach={tree_reached} | "
+            f"flood: {flood_sent / max(1, flood_reached - 1):4.2f}x amp {flood_ms:6.1f}ms reach={flood_reached}"
+        )
+
+
+if __name__ == "__main__":
+    main()
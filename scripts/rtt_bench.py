@@ -0,0 +1,114 @@
+"""Microbenchmark RttSession per-message cost for each backpressure policy."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT / "python") not in sys.path:
+    sys.path.insert(0, str(ROOT / "python"))
+
+from modules.web4_runtime.rtt import BackpressureError, RttConfig, RttSession  # noqa: E402
+
+POLICIES = ("dropoldest", "dropnewest", "block", "error")
+
+
+def _time(fn: Callable[[], None], messages: int) -> float:
+    started = time.perf_counter()
+    fn()
+    return (time.perf_counter() - started) / messages * 1e9
+
+
+def single_thread(policy: str, messages: int, max_queue: int, batch: int) -> dict[str, float]:
+    """Fill-and-drain cycles on one thread: ``send``/``receive`` versus the batch calls."""
+    config = RttConfig(max_queue=max_queue, backpressure_policy=policy, block_timeout_s=0.0)
+    payload = list(range(max_queue))
+    cycles = max(1, messages // max_queue)
+
+    def one_by_one() -> None:
+        session = RttSession[int](config=config)
+        send, receive = session.send, session.receive
+        for _ in range(cycles):
+            for item in payload:
+                send(item)
+            for _ in payload:
+                receive()
+
+    def batched() -> None:
+        session = RttSession[int](config=config)
+        chunks = [payload[idx : idx + batch] for idx in range(0, max_queue, batch)]
+        for _ in range(cycles):
+            for chunk in chunks:
+                session.send_batch(chunk)
+            session.receive_batch()
+
+    def overflow() -> None:
+        session = RttSession[int](config=config)
+        session.send_batch(payload)
+        for item in range(messages):
+            try:
+                session.send(item)
+            except BackpressureError:
+                pass
+
+    total = cycles * max_queue
+    return {
+        "send_recv_ns": _time(one_by_one, total),
+        "batch_ns": _time(batched, total),
+        "overflow_send_ns": _time(overflow, messages),
+    }
+
+
+def producer_consumer(policy: str, messages: int, max_queue: int, batch: int) -> float:
+    """Messages per second through one producer and one blocking consumer."""
+    session = RttSession[int](
+        config=RttConfig(max_queue=max_queue, backpressure_policy=policy, block_timeout_s=1.0)
+    )
+    done = threading.Event()
+    received = 0
+
+    def consume() -> None:
+        nonlocal received
+        while not done.is_set() or session.pending:
+            received += len(session.receive_batch(timeout=0.01))
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    chunk = list(range(batch))
+    started = time.perf_counter()
+    for _ in range(messages // batch):
+        try:
+            session.send_batch(chunk)
+        except BackpressureError:
+            pass
+    done.set()
+    consumer.join()
+    elapsed = time.perf_counter() - started
+    return received / elapsed if elapsed else 0.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=200_000)
+    parser.add_argument("--max-queue", type=int, default=1024)
+    parser.add_argument("--batch", type=int, default=64)
+    parser.add_argument("--policies", nargs="+", default=list(POLICIES), choices=POLICIES)
+    args = parser.parse_args()
+
+    for policy in args.policies:
+        row = single_thread(policy, args.messages, args.max_queue, args.batch)
+        throughput = producer_consumer(policy, args.messages, args.max_queue, args.batch)
+        print(
+            f"{policy:>10} send+recv={row['send_recv_ns']:7.0f}ns/msg "
+            f"batch={row['batch_ns']:6.0f}ns/msg overflow_send={row['overflow_send_ns']:7.0f}ns "
+            f"pipe={throughput / 1000:8.1f}k msg/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
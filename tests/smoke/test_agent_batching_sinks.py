@@ -0,0 +1,156 @@
+import json
+import os
+import socket
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT / "python") not in sys.path:
+    sys.path.insert(0, str(ROOT / "python"))
+
+from modules.agent.loop import AgentLoop
+from modules.agent.sinks import (
+    BatchingSink,
+    JsonlFileSink,
+    NullSink,
+    RingBufferSink,
+    UnixSocketSink,
+    build_event_sink,
+)
+
+
+class DummyLLM:
+    def generate_response(self, question: str, cancel_event=None):
+        return "ok"
+
+    def format_response(self, response: str) -> str:
+        return response
+
+
+class TestBatchingSinks(unittest.TestCase):
+    def test_ring_buffer_sink_receives_loop_events(self):
+        sink = RingBufferSink(capacity=100, flush_interval=0.01)
+        loop = AgentLoop(llm=DummyLLM(), event_sink=sink)
+        loop.handle_input("hi")
+
+        self.assertTrue(sink.flush())
+        types = {event["type"] for event in sink.snapshot()}
+        sink.close()
+
+        self.assertIn("input", types)
+        self.assertIn("output", types)
+        self.assertEqual(sink.stats()["dropped"], 0)
+
+    def test_loop_events_are_built_on_the_writer_thread(self):
+        sink = RingBufferSink(capacity=100, flush_interval=0.01)
+        loop = AgentLoop(llm=DummyLLM(), event_sink=sink)
+        builders = set()
+        build = loop._build_event
+
+        def record(raw):
+            builders.add(threading.current_thread().name)
+            return build(raw)
+
+        loop._build_event = record
+        loop.handle_input("hi")
+        self.assertTrue(sink.flush())
+        sink.close()
+
+        self.assertEqual(builders, {"RingBufferSink"})
+        events = sink.snapshot()
+        self.assertTrue(events)
+        self.assertTrue(all("presence" in event and event["timestamp"] > 0 for event in events))
+
+    def test_presence_is_captured_when_the_event_is_emitted(self):
+        sink = RingBufferSink(capacity=100, flush_interval=60)
+        loop = AgentLoop(llm=DummyLLM(), event_sink=sink)
+        phases = []
+        for phase in ("perceive", "plan", "reflect"):
+            loop.presence.phase = phase
+            phases.append(phase)
+            loop._emit_observability("input_received", {"text": phase})
+        self.assertTrue(sink.flush())
+        sink.close()
+
+        emitted = [event for event in sink.snapshot() if event["type"] == "input"]
+        self.assertEqual([event["presence"]["phase"] for event in emitted], phases)
+
+    def test_batching_sink_requires_write_batch(self):
+        with self.assertRaises(TypeError):
+            BatchingSink()
+
+    def test_bounded_queue_counts_drops(self):
+        sink = RingBufferSink(capacity=10, max_queue=5, batch_size=1_000, flush_interval=60)
+        for idx in range(8):
+            sink.emit({"n": idx})
+
+        self.assertEqual(sink.stats()["dropped"], 3)
+        self.assertTrue(sink.flush())
+        self.assertEqual([event["n"] for event in sink.snapshot()], [0, 1, 2, 3, 4])
+        sink.close()
+
+    def test_jsonl_sink_rotates_by_size(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "events.jsonl")
+            sink = JsonlFileSink(path, max_bytes=200, backup_count=2, batch_size=2, flush_interval=0.01)
+            for idx in range(20):
+                sink.emit({"type": "metrics", "n": idx, "pad": "x" * 20})
+            sink.flush()
+            sink.close()
+
+            self.assertGreater(sink.rotations, 0)
+            self.assertTrue(os.path.exists(path + ".1"))
+            self.assertFalse(os.path.exists(path + ".3"))
+            with open(path, encoding="utf-8") as handle:
+                last = [json.loads(line) for line in handle]
+            self.assertEqual(last[-1]["n"], 19)
+
+    @unittest.skipUnless(hasattr(socket, "AF_UNIX"), "UNIX sockets unavailable")
+    def test_unix_socket_sink_streams_batches(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "obs.sock")
+            server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            server.bind(path)
+            server.listen(1)
+            received = []
+
+            def collect():
+                conn, _ = server.accept()
+                with conn, conn.makefile("r", encoding="utf-8") as stream:
+                    for line in stream:
+                        received.append(json.loads(line))
+
+            collector = threading.Thread(target=collect, daemon=True)
+            collector.start()
+
+            sink = UnixSocketSink(path, flush_interval=0.01)
+            for idx in range(5):
+                sink.emit({"n": idx})
+            sink.flush()
+            sink.close()
+            collector.join(timeout=2)
+            server.close()
+
+        self.assertEqual([event["n"] for event in received], [0, 1, 2, 3, 4])
+
+    def test_unreachable_socket_drops_instead_of_raising(self):
+        sink = UnixSocketSink("/nonexistent/obs.sock", flush_interval=0.01)
+        sink.emit({"n": 1})
+        sink.flush()
+        sink.close()
+
+        self.assertEqual(sink.stats()["dropped"], 1)
+        self.assertEqual(sink.stats()["errors"], 1)
+
+    def test_build_event_sink_parses_targets(self):
+        self.assertIsInstance(build_event_sink("unknown"), NullSink)
+        ring = build_event_sink("ring")
+        self.assertIsInstance(ring, RingBufferSink)
+        ring.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+import os
+import socket
+import sys
+import tempfile
+import threading
+import unittest
+import urllib.request
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT / "python") not in sys.path:
+    sys.path.insert(0, str(ROOT / "python"))
+
+from modules.agent.loop import AgentLoop
+from modules.agent.metrics import Histogram, MetricsRegistry, MetricsServer
+
+
+class DummyLLM:
+    def generate_response(self, question: str, cancel_event=None):
+        return "ok"
+
+    def format_response(self, response: str) -> str:
+        return response
+
+
+class TestAgentMetricsRegistry(unittest.TestCase):
+    def test_histogram_quantiles_within_bucket_error(self):
+        histogram = Histogram()
+        for idx in range(1, 1001):
+            histogram.observe(idx / 1000.0)
+        summary = histogram.snapshot().summary()
+        self.assertEqual(summary["count"], 1000)
+        self.assertAlmostEqual(summary["mean"], 0.5005, places=6)
+        for key, expected in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99)):
+            self.assertGreaterEqual(summary[key], expected)
+            self.assertLessEqual(summary[key], expected * 1.07)
+
+    def test_threads_write_without_losing_observations(self):
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency_seconds")
+        counter = registry.counter("events_total")
+
+        def worker():
+            for _ in range(5000):
+                histogram.observe(0.001)
+                counter.inc()
+
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(histogram.snapshot().count, 30000)
+        self.assertEqual(counter.value(), 30000)
+
+    def test_snapshots_merge_across_registries(self):
+        left, right = MetricsRegistry(), MetricsRegistry()
+        left.counter("events_total", {"type": "a"}).inc(2)
+        right.counter("events_total", {"type": "a"}).inc(3)
+        left.histogram("latency_seconds").observe(0.1)
+        right.histogram("latency_seconds").observe(0.2)
+        merged = left.snapshot().merge(right.snapshot())
+        self.assertEqual(merged.counters[("events_total", (("type", "a"),))], 5)
+        self.assertEqual(merged.histograms[("latency_seconds", ())].count, 2)
+
+    def test_text_exposition(self):
+        registry = MetricsRegistry()
+        registry.counter("events_total", {"type": "output_ready"}, help="Events").inc()
+        registry.gauge("depth").set(4)
+        registry.histogram("latency_seconds").observe(0.25)
+        text = registry.render_text()
+        self.assertIn("# HELP events_total Events", text)
+        self.assertIn('events_total{type="output_ready"} 1', text)
+        self.assertIn("depth 4", text)
+        self.assertIn('latency_seconds_bucket{le="+Inf"} 1', text)
+        self.assertIn("latency_seconds_count 1", text)
+        self.assertIn('latency_seconds_quantile{quantile="0.99"}', text)
+
+        suffixes = {"counter": ("",), "gauge": ("",), "histogram": ("_bucket", "_sum", "_count")}
+        family = kind = None
+        for line in text.splitlines():
+            if line.startswith("# TYPE "):
+                _, _, family, kind = line.split()
+                continue
+            if line.startswith("#"):
+                continue
+            sample = line.split("{", 1)[0].split(" ", 1)[0]
+            self.assertIn(sample, [family + suffix for suffix in suffixes[kind]], line)
+
+    def test_http_server_serves_metrics(self):
+        registry = MetricsRegistry()
+        registry.counter("events_total").inc()
+        server = MetricsServer(registry).start()
+        try:
+            host, port = server.address
+            with urllib.request.urlopen(f"http://{host}:{port}/metrics", timeout=5) as response:
+                body = response.read().decode("utf-8")
+        finally:
+            server.stop()
+        self.assertIn("events_total 1", body)
+
+    @unittest.skipUnless(hasattr(socket, "AF_UNIX"), "requires UNIX sockets")
+    def test_unix_server_serves_metrics(self):
+        registry = MetricsRegistry()
+        registry.counter("events_total").inc(7)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "metrics.sock")
+            server = MetricsServer(registry, unix_path=path).start()
+            try:
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+                    client.settimeout(5)
+                    client.connect(path)
+                    chunks = []
+                    while True:
+                        chunk = client.recv(4096)
+                        if not chunk:
+                            break
+                        chunks.append(chunk)
+            finally:
+                server.stop()
+            self.assertFalse(os.path.exists(path))
+        self.assertIn("events_total 7", b"".join(chunks).decode("utf-8"))
+
+    def test_agent_loop_records_latency_histograms(self):
+        registry = MetricsRegistry()
+        events = []
+        loop = AgentLoop(llm=DummyLLM(), metrics_registry=registry, on_event=events.append)
+        loop.handle_item({"type": "question", "text": "hi", "timestamp": 0.0, "stt_duration": 0.2})
+
+        snapshot = registry.snapshot()
+        self.assertEqual(snapshot.histograms[("agent_llm_latency_seconds", ())].count, 1)
+        self.assertEqual(snapshot.histograms[("agent_task_latency_seconds", ())].count, 1)
+        self.assertEqual(snapshot.histograms[("agent_stt_latency_seconds", ())].count, 1)
+        self.assertEqual(snapshot.counters[("agent_events_total", (("type", "output_ready"),))], 1)
+
+        metrics = [event.payload for event in events if event.type == "metrics"]
+        self.assertEqual(metrics[-1]["latency"]["llm"]["count"], 1)
+        self.assertIn("p99", metrics[-1]["latency"]["task"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,212 @@
+import asyncio
+import queue
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT / "python") not in sys.path:
+    sys.path.insert(0, str(ROOT / "python"))
+
+from modules.agent.loop import AgentLoop
+from modules.agent.workers import CancellationToken, WorkerPool, WorkerPoolFull
+from modules.llm.qwen_handler import QwenHandler
+
+
+class EchoLLM:
+    def generate_response(self, question: str, cancel_event=None):
+        return f"ok:{question}"
+
+    def format_response(self, response: str) -> str:
+        return response
+
+
+class BlockingLLM:
+    def __init__(self):
+        self.release = threading.Event()
+
+    def generate_response(self, question: str, cancel_event=None):
+        cancel_event.add_callback(self.release.set)
+        self.release.wait(timeout=5)
+        return None if cancel_event.is_set() else f"ok:{question}"
+
+    def format_response(self, response: str) -> str:
+        return response
+
+
+class FakeStreamingResponse:
+    def __init__(self, lines):
+        self._lines = lines
+        self.closed = False
+
+    def raise_for_status(self):
+        return None
+
+    def iter_lines(self):
+        for line in self._lines:
+            if self.closed:
+                raise ConnectionError("closed")
+            yield line
+
+    def close(self):
+        self.closed = True
+
+
+class TestWorkerPool(unittest.TestCase):
+    def test_bounded_queue_rejects_when_full(self):
+        gate = threading.Event()
+        pool = WorkerPool(workers=1, max_pending=1)
+        running = pool.submit(gate.wait)
+        time.sleep(0.05)
+        queued = pool.submit(lambda: "queued")
+
+        with self.assertRaises(WorkerPoolFull):
+            pool.submit(lambda: "overflow", block=False)
+
+        gate.set()
+        self.assertTrue(running.result(timeout=2))
+        self.assertEqual(queued.result(timeout=2), "queued")
+        self.assertEqual(pool.stats["rejected"], 1)
+        pool.shutdown()
+
+    def test_cancellation_token_runs_callbacks_once(self):
+        token = CancellationToken()
+        calls = []
+        token.add_callback(lambda: calls.append("a"))
+        token.cancel("superseded")
+        token.set()
+        token.add_callback(lambda: calls.append("late"))
+
+        self.assertEqual(calls, ["a", "late"])
+        self.assertEqual(token.reason, "superseded")
+
+
+class TestAgentLoopPool(unittest.TestCase):
+    def test_run_wakes_immediately_and_stops_without_polling(self):
+        input_queue = queue.Queue()
+        output_queue = queue.Queue()
+        loop = AgentLoop(input_queue, output_queue, llm=EchoLLM())
+        thread = threading.Thread(target=loop.run, daemon=True)
+        thread.start()
+
+        loop.submit("hello")
+        payload = output_queue.get(timeout=2)
+        loop.stop()
+        thread.join(timeout=2)
+
+        self.assertEqual(payload["response"], "ok:hello")
+        self.assertFalse(thread.is_alive())
+
+    def test_stop_token_left_in_queue_does_not_end_the_next_run(self):
+        input_queue = queue.Queue()
+        output_queue = queue.Queue()
+        llm = BlockingLLM()
+        loop = AgentLoop(input_queue, output_queue, llm=llm, cancel_on_new_input=False)
+        first = threading.Thread(target=loop.run, daemon=True)
+        first.start()
+        loop.submit("first")
+        time.sleep(0.05)
+        # run() is waiting on the task, so it exits on ``running`` and leaves the token queued
+        loop.stop()
+        first.join(timeout=2)
+        self.assertFalse(first.is_alive())
+        self.assertEqual(input_queue.qsize(), 1)
+
+        second = threading.Thread(target=loop.run, daemon=True)
+        second.start()
+        loop.submit("second")
+        payload = output_queue.get(timeout=2)
+        self.assertEqual(payload["response"], "ok:second")
+        self.assertTrue(second.is_alive())
+        loop.close()
+        second.join(timeout=2)
+        self.assertFalse(second.is_alive())
+
+    def test_close_shuts_down_only_an_owned_pool(self):
+        loop = AgentLoop(llm=EchoLLM())
+        asyncio.run(loop.ask("q"))
+        workers = list(loop._worker_pool._threads)
+        self.assertEqual(len(workers), 2)
+        loop.close()
+        self.assertFalse(any(t.is_alive() for t in workers))
+
+        shared = WorkerPool(workers=1)
+        borrower = AgentLoop(llm=EchoLLM(), worker_pool=shared)
+        asyncio.run(borrower.ask("q"))
+        borrower.close()
+        self.assertEqual(shared.submit(lambda: "still up").result(timeout=2), "still up")
+        shared.shutdown()
+
+    def test_ask_serves_many_conversations_on_shared_pool(self):
+        pool = WorkerPool(workers=4, max_pending=128)
+        loops = [AgentLoop(llm=EchoLLM(), worker_pool=pool) for _ in range(20)]
+
+        async def main():
+            return await asyncio.gather(*(loop.ask(f"q{idx}") for idx, loop in enumerate(loops)))
+
+        results = asyncio.run(main())
+        pool.shutdown()
+
+        self.assertEqual([r["response"] for r in results], [f"ok:q{idx}" for idx in range(20)])
+
+    def test_ask_latest_wins_cancels_through_token(self):
+        llm = BlockingLLM()
+        loop = AgentLoop(llm=llm)
+
+        async def main():
+            first = asyncio.ensure_future(loop.ask("first"))
+            await asyncio.sleep(0.05)
+            second = await loop.ask("second")
+            return await first, second
+
+        first, second = asyncio.run(main())
+
+        self.assertIsNone(first)
+        self.assertEqual(second["response"], "ok:second")
+        self.assertEqual(loop.metrics["cancellations"], 1)
+
+    def test_ask_rejects_instead_of_blocking_on_full_pool(self):
+        gate = threading.Event()
+        pool = WorkerPool(workers=1, max_pending=1)
+        pool.submit(gate.wait)
+        time.sleep(0.05)
+        pool.submit(lambda: None)
+        loop = AgentLoop(llm=EchoLLM(), worker_pool=pool)
+
+        async def main():
+            with self.assertRaises(WorkerPoolFull):
+                await asyncio.wait_for(loop.ask("q"), timeout=1)
+
+        asyncio.run(main())
+        gate.set()
+        pool.shutdown()
+
+
+class TestQwenStreamingCancel(unittest.TestCase):
+    def test_cancel_closes_streaming_response(self):
+        token = CancellationToken()
+        response = FakeStreamingResponse([b'{"response": "par", "done": false}', b'{"response": "tial", "done": false}'])
+        handler = QwenHandler(raise_on_error=True)
+
+        class Session:
+            def post(self, *args, **kwargs):
+                token.cancel()
+                return response
+
+        handler.session = Session()
+
+        self.assertIsNone(handler.generate_response("prompt", cancel_event=token))
+        self.assertTrue(response.closed)
+
+    def test_streaming_collects_chunks(self):
+        response = FakeStreamingResponse([b'{"response": "he", "done": false}', b'{"response": "llo", "done": true}'])
+        handler = QwenHandler(raise_on_error=True)
+        handler.session = type("Session", (), {"post": lambda self, *a, **k: response})()
+
+        self.assertEqual(handler.generate_response("prompt", cancel_event=CancellationToken()), "hello")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,13 +5,10 @@ from pathlib import Path
 from unittest.mock import patch
 
 ROOT = Path(__file__).resolve().parents[2]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
-MODULES = ROOT / "python" / "modules"
-if str(MODULES) not in sys.path:
-    sys.path.insert(0, str(MODULES))
+if str(ROOT / "python") not in sys.path:
+    sys.path.insert(0, str(ROOT / "python"))
 
-from llm import llm_module
+from modules.llm import llm_module
 
 
 class DummyAdapter:
@@ -24,20 +21,20 @@ class DummyAdapter:
 
 
 class TestCOTCorePrompt(unittest.TestCase):
-    def test_compose_prompt_without_cotcore(self):
+    def test_turn_prompt_without_cotcore(self):
         model = llm_module.LanguageModel(queue.Queue(), queue.Queue(), use_cotcore=False)
-        prompt = model._compose_prompt("hello")
+        prompt = model._begin_turn("hello").prompt
 
         self.assertIsNone(model.cot_adapter)
         self.assertIn("hello", prompt)
 
-    def test_compose_prompt_with_cotcore(self):
+    def test_turn_prompt_with_cotcore(self):
         base_model = llm_module.LanguageModel(queue.Queue(), queue.Queue(), use_cotcore=False)
-        base_prompt = base_model._compose_prompt("hello")
+        base_prompt = base_model._begin_turn("hello").prompt
 
         with patch.object(llm_module, "COTAdapter", DummyAdapter):
             model = llm_module.LanguageModel(queue.Queue(), queue.Queue(), use_cotcore=True)
-            prompt = model._compose_prompt("hello")
+            prompt = model._begin_turn("hello").prompt
 
         self.assertEqual(prompt, f"wrapped::{base_prompt}")
         self.assertEqual(model.cot_adapter.calls[0][0], "hello")
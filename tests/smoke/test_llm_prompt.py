@@ -0,0 +1,211 @@
+import queue
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT / "python") not in sys.path:
+    sys.path.insert(0, str(ROOT / "python"))
+
+from modules.llm.llm_module import LanguageModel
+from modules.llm.prompt import PromptAssembler, PromptSession, PromptTurn, estimate_tokens, trim_to_tokens
+from modules.llm.qwen_handler import QwenHandler
+from modules.llm.response_cache import ResponseCache
+
+
+class ContextBackend:
+    """Fake Ollama: every answer extends the token context it was given."""
+
+    def __init__(self):
+        self.calls = []
+
+    def generate_response(self, prompt, cancel_event=None, context=None):
+        previous = list(context.context or []) if context is not None else []
+        self.calls.append((prompt, previous))
+        if context is not None:
+            context.returned_context = previous + [estimate_tokens(prompt), len(self.calls)]
+        return f"answer {len(self.calls)}"
+
+
+class TestPromptAssembler(unittest.TestCase):
+    def test_estimate_and_trim(self):
+        self.assertEqual(estimate_tokens(""), 0)
+        self.assertEqual(estimate_tokens("abcdefgh"), 2)
+        self.assertGreater(estimate_tokens("привет мир"), estimate_tokens("hello world"))
+        trimmed = trim_to_tokens("word " * 100 + "final question?", 10)
+        self.assertTrue(trimmed.endswith("final question?"))
+        self.assertLessEqual(estimate_tokens(trimmed), 10)
+
+    def test_prefix_is_rendered_once_per_version(self):
+        assembler = PromptAssembler("You are helpful.")
+        first = assembler.build("q1")
+        second = assembler.build("q2")
+        self.assertTrue(first.prompt.startswith("You are helpful.\n\n"))
+        self.assertEqual(first.prompt.split("Вопрос")[0], second.prompt.split("Вопрос")[0])
+        self.assertIs(assembler._rendered, assembler._rendered)
+
+        version = assembler.version
+        assembler.set_section("system", "You are helpful.")
+        self.assertEqual(assembler.version, version)
+        assembler.set_section("mission", "Interview for a backend role.")
+        self.assertIn("Interview for a backend role.", assembler.build("q3").prompt)
+        self.assertEqual(assembler.version, version + 1)
+
+    def test_long_question_is_trimmed_to_the_window(self):
+        assembler = PromptAssembler("system " * 50, context_window=300, reserve_tokens=100)
+        turn = assembler.build("context " * 500 + "what is a mutex?")
+        self.assertTrue(turn.truncated)
+        self.assertTrue(turn.prompt.endswith("what is a mutex?\nОтвет:"))
+        self.assertLessEqual(turn.estimated_tokens, assembler.budget)
+
+    def test_continuation_falls_back_to_full_prompt_when_full(self):
+        assembler = PromptAssembler("system", context_window=200, reserve_tokens=50)
+        small = assembler.build("next?", context=[1] * 50)
+        self.assertTrue(small.continued)
+        self.assertFalse(small.prompt.startswith("system"))
+        full = assembler.build("next?", context=[1] * 190)
+        self.assertFalse(full.continued)
+        self.assertTrue(full.prompt.startswith("system"))
+
+    def test_session_drops_context_when_prefix_changes(self):
+        assembler = PromptAssembler("system")
+        session = PromptSession(assembler)
+        turn = session.begin("q1")
+        turn.returned_context = [1, 2, 3]
+        session.complete(turn)
+        second = session.begin("q2")
+        self.assertTrue(second.continued)
+        session.release(second)
+        assembler.set_section("system", "new system")
+        self.assertFalse(session.begin("q3").continued)
+
+    def test_context_is_held_by_one_turn_at_a_time(self):
+        session = PromptSession(PromptAssembler("system"))
+        seed = session.begin("q0")
+        seed.returned_context = [1, 2]
+        session.complete(seed)
+        first = session.begin("q1")
+        overlapping = session.begin("q2")
+        self.assertTrue(first.continued)
+        self.assertFalse(overlapping.continued)
+        overlapping.returned_context = [9]
+        session.complete(overlapping)
+        self.assertEqual(session.context, [1, 2])
+        session.release(first)
+        self.assertTrue(session.begin("q3").continued)
+
+
+class TestLanguageModelContextReuse(unittest.TestCase):
+    def make_model(self):
+        lm = LanguageModel(queue.Queue(), queue.Queue(), response_cache=None, scheduler=None)
+        lm.session.reuse_context = True
+        lm.qwen_handler = ContextBackend()
+        return lm
+
+    def test_second_turn_sends_only_the_question(self):
+        lm = self.make_model()
+        lm.prompts.set_section("system", "SYSTEM PREFIX")
+        self.assertEqual(lm.generate_response_local("first?"), "answer 1")
+        self.assertEqual(lm.generate_response_local("second?"), "answer 2")
+        (first_prompt, first_ctx), (second_prompt, second_ctx) = lm.qwen_handler.calls
+        self.assertTrue(first_prompt.startswith("SYSTEM PREFIX"))
+        self.assertEqual(first_ctx, [])
+        self.assertNotIn("SYSTEM PREFIX", second_prompt)
+        self.assertIn("second?", second_prompt)
+        self.assertEqual(len(second_ctx), 2)
+
+    def test_backend_without_context_support_always_gets_full_prompt(self):
+        lm = self.make_model()
+        lm.prompts.set_section("system", "SYSTEM PREFIX")
+        prompts = []
+        lm.qwen_handler.generate_response = lambda prompt, cancel_event=None: prompts.append(prompt) or "ok"
+        lm.generate_response_local("a?")
+        lm.generate_response_local("b?")
+        self.assertTrue(all(prompt.startswith("SYSTEM PREFIX") for prompt in prompts))
+
+    def test_default_config_caches_repeated_questions_across_turns(self):
+        lm = LanguageModel(queue.Queue(), queue.Queue(), scheduler=None)
+        self.assertTrue(lm.session.reuse_context)
+        self.assertIsNotNone(lm.response_cache)
+        lm.qwen_handler = ContextBackend()
+        answers = [lm.generate_response_local("what is a mutex?") for _ in range(3)]
+        self.assertEqual(answers, ["answer 1"] * 3)
+        self.assertEqual(len(lm.qwen_handler.calls), 1)
+        self.assertEqual(lm.response_cache.stats.exact_hits, 2)
+
+    def test_conversation_scope_keys_continued_turns_on_the_context(self):
+        lm = self.make_model()
+        lm.response_cache = ResponseCache()
+        lm.cache_scope = "conversation"
+        self.assertEqual(lm.generate_response_local("what is a mutex?"), "answer 1")
+        lm.generate_response_local("and a semaphore?")
+        # same question, different conversation state: must not reuse "answer 1"
+        self.assertEqual(lm.generate_response_local("what is a mutex?"), "answer 3")
+        self.assertEqual(len(lm.response_cache), 3)
+
+    def test_concurrent_turns_run_in_parallel_and_one_continues(self):
+        lm = self.make_model()
+        lm.prompts.set_section("system", "SYSTEM PREFIX")
+        backend = lm.qwen_handler
+        lm.generate_response_local("warm up?")
+        active = []
+        overlaps = []
+
+        def generate_response(prompt, cancel_event=None, context=None):
+            active.append(prompt)
+            overlaps.append(len(active))
+            time.sleep(0.05)
+            try:
+                return ContextBackend.generate_response(backend, prompt, cancel_event, context)
+            finally:
+                active.remove(prompt)
+
+        lm.qwen_handler = MagicMock(generate_response=generate_response)
+        threads = [threading.Thread(target=lm.generate_response_local, args=(f"q{idx}?",)) for idx in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        self.assertGreater(max(overlaps), 1)
+        concurrent = backend.calls[1:]
+        continued = [prompt for prompt, previous in concurrent if previous]
+        self.assertEqual(len(continued), 1)
+        standalone = [prompt for prompt, previous in concurrent if not previous]
+        self.assertTrue(all(prompt.startswith("SYSTEM PREFIX") for prompt in standalone))
+        # the turn that held the context handed its answer on to the next turn
+        self.assertEqual(len(lm.session.context), 4)
+        self.assertTrue(lm.session.begin("next?").continued)
+
+    def test_type_error_inside_backend_is_not_retried(self):
+        lm = self.make_model()
+        calls = []
+
+        def generate_response(prompt, cancel_event=None, context=None):
+            calls.append(prompt)
+            raise TypeError("bug inside the backend")
+
+        lm.qwen_handler.generate_response = generate_response
+        self.assertIsNone(lm.generate_response_local("a?"))
+        self.assertEqual(len(calls), 1)
+
+
+class TestQwenHandlerContext(unittest.TestCase):
+    def test_context_is_sent_and_returned(self):
+        handler = QwenHandler(raise_on_error=True)
+        response = MagicMock()
+        response.json.return_value = {"response": "hi", "done": True, "context": [7, 8, 9]}
+        handler.session.post = MagicMock(return_value=response)
+
+        turn = PromptTurn(question="q", prompt="\n\nq", context=[1, 2])
+        self.assertEqual(handler.generate_response("\n\nq", context=turn), "hi")
+        payload = handler.session.post.call_args.kwargs["json"]
+        self.assertEqual(payload["context"], [1, 2])
+        self.assertIn("num_ctx", payload["options"])
+        self.assertEqual(turn.returned_context, [7, 8, 9])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+import queue
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT / "python") not in sys.path:
+    sys.path.insert(0, str(ROOT / "python"))
+
+from modules.llm import qwen_handler
+from modules.llm.llm_module import LanguageModel
+from modules.llm.response_cache import ResponseCache, normalize_prompt
+
+
+class FakeBackend:
+    """Stands in for QwenHandler: slow, deterministic, counts calls."""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.prompts = []
+
+    def generate_response(self, prompt, cancel_event=None):
+        self.prompts.append(prompt)
+        time.sleep(self.delay)
+        return f"answer #{len(self.prompts)}"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestResponseCache(unittest.TestCase):
+    def test_normalization(self):
+        self.assertEqual(normalize_prompt("  What is   REST?? "), "what is rest")
+        self.assertEqual(normalize_prompt("ＡＢＣ\tdef."), "abc def")
+
+    def test_exact_hit_lru_and_ttl(self):
+        clock = FakeClock()
+        cache = ResponseCache(max_entries=2, ttl_seconds=10, clock=clock)
+        cache.put("What is REST?", "rest", "ns")
+        cache.put("What is gRPC?", "grpc", "ns")
+        self.assertEqual(cache.get("what is rest", "ns"), "rest")
+        self.assertIsNone(cache.get("what is rest", "other-model"))
+
+        cache.put("What is SOAP?", "soap", "ns")  # evicts gRPC, the least recently used
+        self.assertIsNone(cache.get("What is gRPC?", "ns"))
+        self.assertEqual(cache.stats.evictions, 1)
+
+        clock.now += 11
+        self.assertIsNone(cache.get("What is REST?", "ns"))
+        self.assertEqual(cache.stats.expirations, 1)
+        self.assertEqual(cache.stats.exact_hits, 1)
+        self.assertEqual(cache.stats.misses, 3)
+
+    def test_near_duplicate_hit(self):
+        cache = ResponseCache(near_duplicates=True, similarity_threshold=0.5)
+        cache.put("What is the difference between a process and a thread in Linux?", "answer", "ns")
+        self.assertEqual(
+            cache.get("what's the difference between a process and a thread in linux", "ns"),
+            "answer",
+        )
+        self.assertIsNone(cache.get("How does garbage collection work in Java?", "ns"))
+        self.assertIsNone(cache.get("What is the difference between a process and a thread in Linux?", "other"))
+        self.assertEqual(cache.stats.near_hits, 1)
+
+    def test_disk_tier_survives_restart(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "responses.sqlite"
+            first = ResponseCache(path=path)
+            first.put("Explain CAP theorem", "cap", "ns")
+            first.close()
+
+            second = ResponseCache(path=path, max_entries=1)
+            self.assertEqual(second.get("explain cap theorem", "ns"), "cap")
+            second.put("Explain ACID", "acid", "ns")  # pushes the CAP entry out of memory
+            self.assertEqual(second.get("Explain CAP theorem", "ns"), "cap")
+            self.assertEqual(second.stats.disk_hits, 1)
+            second.close()
+
+
+class TestLanguageModelCache(unittest.TestCase):
+    def test_repeated_question_skips_backend(self):
+        lm = LanguageModel(queue.Queue(), queue.Queue(), response_cache=ResponseCache())
+        backend = FakeBackend()
+        lm.qwen_handler = backend
+
+        self.assertEqual(lm.generate_response_local("What is a closure?"), "answer #1")
+        start = time.perf_counter()
+        self.assertEqual(lm.generate_response_local("what is a closure"), "answer #1")
+        self.assertLess(time.perf_counter() - start, backend.delay)
+        self.assertEqual(len(backend.prompts), 1)
+        self.assertEqual(lm.response_cache.stats.exact_hits, 1)
+
+    def test_failures_are_not_cached(self):
+        lm = LanguageModel(queue.Queue(), queue.Queue(), response_cache=ResponseCache())
+        backend = FakeBackend(delay=0)
+        backend.generate_response = lambda prompt, cancel_event=None: ""
+        lm.qwen_handler = backend
+
+        self.assertIsNone(lm.generate_response_local("hi"))
+        self.assertEqual(len(lm.response_cache), 0)
+
+    def test_namespace_tracks_sampling_params_and_cot_mode(self):
+        plain = LanguageModel(queue.Queue(), queue.Queue(), use_cotcore=False, response_cache=None)
+        cot = LanguageModel(queue.Queue(), queue.Queue(), use_cotcore=True, response_cache=None)
+        self.assertNotEqual(plain._cache_namespace, cot._cache_namespace)
+
+        with patch.dict(qwen_handler.OLLAMA_OPTIONS, {"temperature": 0.9}):
+            hotter = LanguageModel(queue.Queue(), queue.Queue(), use_cotcore=False, response_cache=None)
+        self.assertNotEqual(plain._cache_namespace, hotter._cache_namespace)
+
+    def test_cache_can_be_disabled(self):
+        lm = LanguageModel(queue.Queue(), queue.Queue(), response_cache=None)
+        backend = FakeBackend(delay=0)
+        lm.qwen_handler = backend
+        lm.generate_response_local("hi")
+        lm.generate_response_local("hi")
+        self.assertEqual(len(backend.prompts), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
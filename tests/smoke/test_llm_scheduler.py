@@ -0,0 +1,313 @@
+import json
+import queue
+import sys
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT / "python") not in sys.path:
+    sys.path.insert(0, str(ROOT / "python"))
+
+from modules.agent.workers import CancellationToken
+from modules.llm import qwen_handler
+from modules.llm.breaker import CircuitBreaker, CircuitOpenError
+from modules.llm.llm_module import LanguageModel
+from modules.llm.qwen_handler import QwenHandler
+from modules.llm.scheduler import BACKGROUND, INTERACTIVE, AdaptiveLimit, RequestScheduler
+
+
+class FakeOllama:
+    """Local /api/generate server with ``capacity`` parallel slots.
+
+    Requests beyond the capacity wait for a slot, like a single Ollama
+    instance with OLLAMA_NUM_PARALLEL set.
+    """
+
+    def __init__(self, capacity: int = 2, delay: float = 0.05):
+        self.capacity = capacity
+        self.delay = delay
+        self.requests = 0
+        self.peak = 0
+        self._active = 0
+        self._slots = threading.Semaphore(capacity)
+        self._lock = threading.Lock()
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                with fake._slots:
+                    with fake._lock:
+                        fake.requests += 1
+                        fake._active += 1
+                        fake.peak = max(fake.peak, fake._active)
+                    time.sleep(fake.delay)
+                    with fake._lock:
+                        fake._active -= 1
+                body = json.dumps({"response": f"echo {payload['prompt'][-12:]}", "done": True}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class TestRequestScheduler(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = None
+
+    def tearDown(self):
+        if self.scheduler is not None:
+            self.scheduler.shutdown()
+
+    def test_identical_inflight_requests_are_coalesced(self):
+        self.scheduler = RequestScheduler(max_concurrency=2)
+        calls = []
+        release = threading.Event()
+
+        def call(cancel):
+            calls.append(1)
+            release.wait(1)
+            return "shared"
+
+        futures = [self.scheduler.submit(call, key="same") for _ in range(5)]
+        release.set()
+        self.assertEqual({future.result(timeout=2) for future in futures}, {"shared"})
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(self.scheduler.stats.coalesced, 4)
+
+    def test_interactive_lane_runs_before_background(self):
+        self.scheduler = RequestScheduler(max_concurrency=1)
+        order = []
+        gate = threading.Event()
+        blocker = self.scheduler.submit(lambda cancel: gate.wait(1))
+        time.sleep(0.02)
+        background = [
+            self.scheduler.submit(lambda cancel, idx=idx: order.append(f"bg{idx}"), lane=BACKGROUND)
+            for idx in range(2)
+        ]
+        interactive = self.scheduler.submit(lambda cancel: order.append("user"), lane=INTERACTIVE)
+        gate.set()
+        for future in [blocker, interactive, *background]:
+            future.result(timeout=2)
+        self.assertEqual(order[0], "user")
+
+    def test_interactive_duplicate_promotes_background_request(self):
+        self.scheduler = RequestScheduler(max_concurrency=1)
+        gate = threading.Event()
+        self.scheduler.submit(lambda cancel: gate.wait(1))
+        time.sleep(0.02)
+        first = self.scheduler.submit(lambda cancel: "summary", key="k", lane=BACKGROUND)
+        second = self.scheduler.submit(lambda cancel: "unused", key="k", lane=INTERACTIVE)
+        self.assertIs(first, second)
+        self.assertEqual(self.scheduler.queued(INTERACTIVE), 1)
+        gate.set()
+        self.assertEqual(first.result(timeout=2), "summary")
+        self.assertEqual(self.scheduler.stats.promoted, 1)
+
+    def test_open_breaker_rejects_and_resets_limit(self):
+        breaker = CircuitBreaker(failure_threshold=1, cooldown_seconds=0.05)
+        self.scheduler = RequestScheduler(max_concurrency=4, initial_concurrency=4, breaker=breaker)
+        breaker.after_failure(RuntimeError("boom"))
+        with self.assertRaises(CircuitOpenError):
+            self.scheduler.submit(lambda cancel: "never").result(timeout=2)
+        time.sleep(0.06)
+        self.assertEqual(self.scheduler.submit(lambda cancel: "ok").result(timeout=2), "ok")
+        self.assertLess(self.scheduler.limit, 4)
+        self.assertEqual(self.scheduler.stats.rejected, 1)
+
+    def test_coalesced_request_cancels_only_when_every_waiter_cancels(self):
+        self.scheduler = RequestScheduler(max_concurrency=1)
+        started = threading.Event()
+        seen = []
+
+        def call(cancel):
+            started.set()
+            while not cancel.is_set():
+                time.sleep(0.005)
+            seen.append("cancelled")
+            return None
+
+        first, second = threading.Event(), threading.Event()
+        future = self.scheduler.submit(call, key="k", cancel_event=first)
+        self.scheduler.submit(call, key="k", cancel_event=second)
+        started.wait(1)
+        first.set()
+        time.sleep(0.03)
+        self.assertFalse(future.done())
+        second.set()
+        self.assertIsNone(future.result(timeout=2))
+        self.assertEqual(seen, ["cancelled"])
+
+
+class SlowBackend:
+    """Answers after ``delays[question]`` seconds; counts calls."""
+
+    def __init__(self, delays=None, error=None):
+        self.delays = delays or {}
+        self.error = error
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def generate_response(self, prompt, cancel_event=None):
+        with self._lock:
+            self.calls += 1
+        question = prompt.rsplit(": ", 1)[-1].split("\n")[0]
+        time.sleep(self.delays.get(question, 0.05))
+        if self.error is not None:
+            raise self.error
+        return f"answer to {question}"
+
+
+class TestLanguageModelScheduling(unittest.TestCase):
+    def make_model(self, backend, **kwargs):
+        scheduler = RequestScheduler(max_concurrency=4, initial_concurrency=4)
+        self.addCleanup(scheduler.shutdown)
+        lm = LanguageModel(queue.Queue(), queue.Queue(), response_cache=None, scheduler=scheduler, **kwargs)
+        lm.session.reuse_context = False
+        lm.qwen_handler = backend
+        return lm
+
+    def test_coalesced_failure_is_recorded_once(self):
+        backend = SlowBackend(error=RuntimeError("backend down"))
+        lm = self.make_model(backend, use_breaker=True)
+        lm.breaker.failure_threshold = 10
+        threads = [threading.Thread(target=lm.generate_response_local, args=("same?",)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(backend.calls, 1)
+        self.assertEqual(lm.breaker._failure_count, 1)
+
+    def test_context_reuse_does_not_serialize_backend_calls(self):
+        backend = SlowBackend({f"q{idx}?": 0.2 for idx in range(4)})
+        lm = self.make_model(backend)
+        lm.session.reuse_context = True
+        threads = [threading.Thread(target=lm.generate_response_local, args=(f"q{idx}?",)) for idx in range(4)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        self.assertLess(time.perf_counter() - started, 0.6)
+
+        threads = [threading.Thread(target=lm.generate_response_local, args=("same?",)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(backend.calls, 5)
+
+    def test_cancelled_waiter_wakes_immediately(self):
+        lm = self.make_model(SlowBackend({"slow?": 0.5}))
+        token = CancellationToken()
+        result = []
+        waiter = threading.Thread(target=lambda: result.append(lm.generate_response_local("slow?", token)))
+        waiter.start()
+        time.sleep(0.05)
+        cancelled_at = time.perf_counter()
+        token.set()
+        waiter.join(1)
+        self.assertLess(time.perf_counter() - cancelled_at, 0.03)
+        self.assertEqual(result, [None])
+
+    def test_run_publishes_answers_in_question_order(self):
+        lm = self.make_model(SlowBackend({"first?": 0.15, "second?": 0.05, "third?": 0.01}))
+        for question in ("first?", "second?", "third?"):
+            lm.input_queue.put({"type": "question", "text": question, "timestamp": time.time()})
+        with patch.object(lm, "test_ollama_connection", return_value=True):
+            worker = threading.Thread(target=lm.run)
+            worker.start()
+            answers = [lm.output_queue.get(timeout=2)["question"] for _ in range(3)]
+            lm.stop()
+            worker.join(3)
+        self.assertEqual(answers, ["first?", "second?", "third?"])
+        self.assertFalse(worker.is_alive())
+
+
+class TestAdaptiveLimit(unittest.TestCase):
+    def test_grows_while_latency_flat_and_backs_off_on_queueing(self):
+        limit = AdaptiveLimit(1, max_limit=8)
+        for _ in range(60):
+            limit.on_sample(0.1)
+        self.assertEqual(limit.limit, 8)
+        for _ in range(30):
+            limit.on_sample(0.5)
+        self.assertLess(limit.limit, 4)
+        limit.on_sample(0.1, ok=False)
+        self.assertEqual(limit.limit, 1)
+
+
+class TestSchedulerAgainstFakeOllama(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeOllama(capacity=2, delay=0.05)
+        self._host = qwen_handler.OLLAMA_HOST
+        qwen_handler.OLLAMA_HOST = self.server.url
+
+    def tearDown(self):
+        qwen_handler.OLLAMA_HOST = self._host
+        self.server.close()
+
+    def test_sessions_share_backend_concurrently(self):
+        scheduler = RequestScheduler(max_concurrency=4, initial_concurrency=2)
+        self.addCleanup(scheduler.shutdown)
+        sessions = [
+            LanguageModel(queue.Queue(), queue.Queue(), response_cache=None, scheduler=scheduler)
+            for _ in range(3)
+        ]
+        for session in sessions:
+            session.qwen_handler = QwenHandler(raise_on_error=True)
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda s=session, i=idx: results.append(s.generate_response_local(f"q{i}")))
+            for idx, session in enumerate(sessions * 2)
+        ]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(len([r for r in results if r and r.startswith("echo")]), 6)
+        self.assertEqual(self.server.peak, 2)
+        # six requests, two backend slots: three rounds instead of six serial ones
+        self.assertLess(elapsed, 6 * self.server.delay)
+
+    def test_repeated_question_across_sessions_hits_backend_once(self):
+        scheduler = RequestScheduler(max_concurrency=4)
+        self.addCleanup(scheduler.shutdown)
+        sessions = [
+            LanguageModel(queue.Queue(), queue.Queue(), response_cache=None, scheduler=scheduler)
+            for _ in range(4)
+        ]
+        for session in sessions:
+            session.qwen_handler = QwenHandler(raise_on_error=True)
+        threads = [threading.Thread(target=session.generate_response_local, args=("same?",)) for session in sessions]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(self.server.requests, 1)
+        self.assertEqual(scheduler.stats.coalesced, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
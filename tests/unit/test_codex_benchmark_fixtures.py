@@ -0,0 +1,68 @@
+import wave
+
+import numpy as np
+import pytest
+
+from codex.benchmark.fixtures import (
+    SIGNAL_KINDS,
+    FixtureCache,
+    read_wav_segment,
+    synthesize,
+    wav_duration_seconds,
+    write_wav,
+)
+
+
+def test_synthesized_signals_are_bounded_float32():
+    for kind in SIGNAL_KINDS:
+        samples = synthesize(kind, 0.5, amplitude=0.3)
+        assert samples.dtype == np.float32
+        assert samples.shape == (8000,)
+        assert np.max(np.abs(samples)) == pytest.approx(0.3, rel=1e-4)
+    with pytest.raises(ValueError):
+        synthesize("square", 1.0)
+
+
+def test_speech_honours_an_explicit_440_hz_pitch():
+    default = synthesize("speech", 0.5)
+    explicit = synthesize("speech", 0.5, frequency=440.0)
+    np.testing.assert_array_equal(default, synthesize("speech", 0.5, frequency=140.0))
+    assert not np.array_equal(default, explicit)
+    np.testing.assert_array_equal(synthesize("sine", 0.5), synthesize("sine", 0.5, frequency=440.0))
+
+
+def test_segment_read_matches_written_window(tmp_path):
+    samples = synthesize("chirp", 3.0)
+    path = write_wav(tmp_path / "chirp.wav", samples)
+
+    segment = read_wav_segment(path, seconds=0.5, offset=1.0)
+
+    assert wav_duration_seconds(path) == pytest.approx(3.0)
+    assert segment.shape == (8000,)
+    np.testing.assert_allclose(segment, samples[16000:24000], atol=1 / 16384)
+    assert read_wav_segment(path, seconds=1.0, offset=5.0).size == 0
+
+
+def test_stereo_files_are_downmixed(tmp_path):
+    path = tmp_path / "stereo.wav"
+    left = np.full(160, 1000, dtype="<i2")
+    right = np.full(160, 3000, dtype="<i2")
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(2)
+        wf.setsampwidth(2)
+        wf.setframerate(16000)
+        wf.writeframes(np.column_stack((left, right)).tobytes())
+
+    segment = read_wav_segment(path)
+
+    np.testing.assert_allclose(segment, np.full(160, 2000 / 32768.0, dtype=np.float32))
+
+
+def test_fixture_cache_reuses_files_by_parameters(tmp_path):
+    cache = FixtureCache(tmp_path)
+    first = cache.get("speech", 1.0, seed=1)
+    mtime = first.stat().st_mtime_ns
+
+    assert cache.get("speech", 1.0, seed=1) == first
+    assert first.stat().st_mtime_ns == mtime
+    assert cache.get("speech", 1.0, seed=2) != first
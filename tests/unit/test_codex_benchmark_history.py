@@ -0,0 +1,139 @@
+import random
+import sqlite3
+
+import pytest
+
+from codex import cli
+from codex.benchmark.history import BenchmarkHistory, hardware_fingerprint
+from codex.benchmark.regression import detect_regression, mann_whitney_u
+from codex.benchmark.report import BenchmarkResult
+
+
+def _result(tps_samples, model="fast-model"):
+    return BenchmarkResult(
+        model=model,
+        model_type="llm",
+        metrics={"tokenspersecond": sum(tps_samples) / len(tps_samples)},
+        metadata={"samples": {"tokenspersecond": list(tps_samples)}},
+    )
+
+
+def _samples(center, seed, count=8):
+    rng = random.Random(seed)
+    return [center + rng.gauss(0, center * 0.02) for _ in range(count)]
+
+
+def test_mann_whitney_exact_small_samples():
+    _, p_value = mann_whitney_u([1, 2, 3, 4], [5, 6, 7, 8])
+    assert p_value == pytest.approx(2 / 70)
+    _, p_value = mann_whitney_u([1, 3, 5, 7], [2, 4, 6, 8])
+    assert p_value > 0.5
+
+
+def test_detect_regression_flags_fifteen_percent_tokens_drop():
+    check = detect_regression("tokenspersecond", _samples(100, 1), _samples(85, 2), higher_is_better=True)
+    assert check.regressed
+    assert check.change == pytest.approx(-0.15, abs=0.03)
+
+    noise = detect_regression("tokenspersecond", _samples(100, 1), _samples(100, 3), higher_is_better=True)
+    assert not noise.regressed
+
+
+def test_history_is_append_only_and_indexed_by_key(tmp_path):
+    history = BenchmarkHistory(tmp_path / "history.sqlite3")
+    first = history.record(_result(_samples(100, 1)), hardware="hw-a", revision="r1")
+    history.record(_result(_samples(100, 2)), hardware="hw-b", revision="r1")
+    history.record(_result(_samples(90, 3)), hardware="hw-a", revision="r2")
+
+    entries = history.history("fast-model", hardware="hw-a")
+    assert [entry.revision for entry in entries] == ["r2", "r1"]
+    assert history.history("fast-model", revision="r1", hardware="hw-b")[0].hardware == "hw-b"
+    assert history.get(first).samples["tokenspersecond"]
+    assert "samples" not in history.get(first).metadata
+
+    with pytest.raises(sqlite3.DatabaseError):
+        history._conn.execute("DELETE FROM runs")
+    history.close()
+
+
+def test_compare_latest_uses_current_hardware(tmp_path):
+    history = BenchmarkHistory(tmp_path / "history.sqlite3")
+    hardware = hardware_fingerprint()
+    history.record(_result(_samples(100, 1)), hardware=hardware, revision="r1")
+    history.record(_result(_samples(84, 2)), hardware=hardware, revision="r2")
+
+    checks = history.compare_latest("fast-model")
+
+    assert [check.metric for check in checks] == ["tokenspersecond"]
+    assert checks[0].regressed
+    history.close()
+
+
+def test_cli_compare_exits_nonzero_on_regression(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    history = BenchmarkHistory(tmp_path / cli.DEFAULT_RESULTS_DIR / cli.HISTORY_FILENAME)
+    hardware = hardware_fingerprint()
+    baseline = history.record(_result(_samples(100, 1)), hardware=hardware, revision="r1")
+    history.record(_result(_samples(100, 4)), hardware=hardware, revision="r2")
+    history.record(_result(_samples(84, 2)), hardware=hardware, revision="r3")
+    history.close()
+
+    assert cli.main(["benchmark", "compare", "fast-model", "--baseline", "r1", "--candidate", "r2"]) == 0
+    assert cli.main(["benchmark", "compare", "fast-model"]) == 1
+    capsys.readouterr()
+    assert cli.main(["benchmark", "history", "fast-model", "--metric", "tokenspersecond"]) == 0
+    output = capsys.readouterr().out
+    assert '"revision": "r3"' in output
+    assert str(baseline) in output
+
+
+def test_single_value_comparison_is_inconclusive():
+    check = detect_regression("tokenspersecond", [100.0], [50.0], higher_is_better=True)
+    assert check.inconclusive
+    assert not check.regressed and not check.improved
+    assert check.to_dict()["inconclusive"] is True
+
+
+def test_short_non_overlapping_runs_are_inconclusive_not_regressions():
+    # three runs a side never overlap here, yet MWU cannot reach p < 0.05
+    check = detect_regression("tokenspersecond", [100.0, 101.0, 102.0], [90.0, 91.0, 92.0], higher_is_better=True)
+    assert check.inconclusive
+    assert not check.regressed
+
+
+def test_regression_needs_both_tests_to_agree():
+    baseline = [101.7, 104.5, 96.3, 99.0]
+    candidate = [88.2, 96.6, 93.2, 94.7]
+    check = detect_regression("tokenspersecond", baseline, candidate, higher_is_better=True)
+    assert not check.inconclusive
+    assert check.ci[1] < 0  # the bootstrap alone would flag it
+    assert check.p_value >= 0.05
+    assert not check.regressed
+
+
+def test_summary_fallback_only_compares_performance_metrics(tmp_path):
+    history = BenchmarkHistory(tmp_path / "history.sqlite3")
+    metrics = {"tokenspersecond": 100.0, "latency_p50_ms": 20.0, "runs": 3, "warmup_runs": 1, "ci_relative": 0.02}
+    first = history.record(BenchmarkResult("m", "llm", metrics), hardware="hw", revision="r1")
+    changed = dict(metrics, runs=20, warmup_runs=5, ci_relative=0.2)
+    second = history.record(BenchmarkResult("m", "llm", changed), hardware="hw", revision="r2")
+
+    checks = history.compare(history.get(first), history.get(second))
+
+    assert [check.metric for check in checks] == ["latency_p50_ms", "tokenspersecond"]
+    assert all(check.inconclusive for check in checks)
+    history.close()
+
+
+def test_cli_resolves_numeric_revision_before_run_id(tmp_path):
+    history = BenchmarkHistory(tmp_path / "history.sqlite3")
+    hardware = hardware_fingerprint()
+    first = history.record(_result(_samples(100, 1)), hardware=hardware, revision="r1")
+    numeric = history.record(_result(_samples(100, 2)), hardware=hardware, revision=str(first))
+
+    assert cli._resolve_run(history, "fast-model", str(first), hardware).run_id == numeric
+    assert cli._resolve_run(history, "fast-model", f"#{first}", hardware).run_id == first
+    assert cli._resolve_run(history, "fast-model", f"run:{first}", hardware).run_id == first
+    with pytest.raises(KeyError):
+        cli._resolve_run(history, "fast-model", "#999", hardware)
+    history.close()
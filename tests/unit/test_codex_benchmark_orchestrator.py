@@ -0,0 +1,106 @@
+import time
+
+import pytest
+
+from codex.benchmark.orchestrator import BenchmarkOrchestrator, available_cpus
+from codex.registry.model_registry import ModelRegistry
+
+
+class FakeSTTModel:
+    def __init__(self, mode: str) -> None:
+        self.mode = mode
+        self.ballast = None
+
+    def transcribe(self, _path, beam_size=1):
+        if self.mode == "hang":
+            time.sleep(60)
+        if self.mode == "hog":
+            self.ballast = bytearray(96 * 1024 * 1024)
+            time.sleep(60)
+        return [], None
+
+
+class FakeLoader:
+    def load_stt(self, config):
+        return FakeSTTModel(config["path"])
+
+    def unload(self, _model) -> None:
+        pass
+
+
+def fake_registry() -> ModelRegistry:
+    registry = ModelRegistry(loader=FakeLoader())
+    registry.register("fast-a", {"type": "stt", "path": "fast"})
+    registry.register("fast-b", {"type": "stt", "path": "fast"})
+    registry.register("hang", {"type": "stt", "path": "hang"})
+    registry.register("hog", {"type": "stt", "path": "hog"})
+    return registry
+
+
+RUNNER_KWARGS = {"stability_runs": 1, "warmup_runs": 0, "max_runs": 1, "clip_seconds": 0.2}
+
+
+def test_models_run_in_isolated_pinned_workers(tmp_path):
+    orchestrator = BenchmarkOrchestrator(
+        fake_registry,
+        results_dir=tmp_path,
+        timeout=30,
+        runner_kwargs={**RUNNER_KWARGS, "results_dir": str(tmp_path / "child"), "fixtures_dir": str(tmp_path)},
+    )
+
+    results = orchestrator.run(["fast-a", "fast-b"])
+
+    assert [result.model for result in results] == ["fast-a", "fast-b"]
+    assert all(result.success for result in results)
+    for result in results:
+        assert result.metadata["isolated"] is True
+        assert set(result.metadata["cpus"]) <= set(available_cpus())
+        # the worker reports the affinity it ran under, which must be its slot
+        assert result.metadata["affinity"] == sorted(result.metadata["cpus"])
+    assert (tmp_path / "fast-a.json").exists()
+    assert orchestrator.stats.completed == 2
+
+
+def test_timeout_fails_only_the_offending_job(tmp_path):
+    orchestrator = BenchmarkOrchestrator(
+        fake_registry,
+        results_dir=tmp_path,
+        timeout=1.5,
+        poll_interval=0.01,
+        runner_kwargs={**RUNNER_KWARGS, "results_dir": str(tmp_path / "child"), "fixtures_dir": str(tmp_path)},
+    )
+
+    by_model = {result.model: result for result in orchestrator.run(["hang", "fast-a"], save=False)}
+
+    assert by_model["fast-a"].success
+    assert not by_model["hang"].success
+    assert "timeout" in by_model["hang"].metadata["error"]
+    assert orchestrator.stats.timed_out == 1
+
+
+def test_memory_limit_fails_only_the_offending_job(tmp_path):
+    orchestrator = BenchmarkOrchestrator(
+        fake_registry,
+        results_dir=tmp_path,
+        timeout=30,
+        memory_limit_mb=100,
+        poll_interval=0.01,
+        runner_kwargs={**RUNNER_KWARGS, "results_dir": str(tmp_path / "child"), "fixtures_dir": str(tmp_path)},
+    )
+
+    by_model = {result.model: result for result in orchestrator.run(["hog", "fast-a"], save=False)}
+
+    assert by_model["fast-a"].success
+    assert not by_model["hog"].success
+    assert "memory limit" in by_model["hog"].metadata["error"]
+    assert orchestrator.stats.memory_killed == 1
+
+
+def test_cpu_slots_are_disjoint(tmp_path):
+    cpus = available_cpus()
+    if len(cpus) < 2:
+        pytest.skip("needs at least two CPUs")
+    orchestrator = BenchmarkOrchestrator(fake_registry, results_dir=tmp_path, cpus_per_job=1)
+    slots = orchestrator._slots
+    flattened = [cpu for slot in slots for cpu in slot]
+    assert len(flattened) == len(set(flattened))
@@ -0,0 +1,145 @@
+import itertools
+
+import psutil
+
+from codex.benchmark.metrics import confidence_interval, percentile, relative_ci
+from codex.benchmark.runner import BenchmarkRunner
+from codex.registry.model_registry import ModelRegistry
+
+
+class FakeSTTModel:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def transcribe(self, _path, beam_size=1):
+        self.calls += 1
+        return [], None
+
+
+class FakeLoader:
+    def __init__(self) -> None:
+        self.loads = 0
+        self.unloads = 0
+        self.model = FakeSTTModel()
+
+    def load_stt(self, _config):
+        self.loads += 1
+        return self.model
+
+    def unload(self, _model) -> None:
+        self.unloads += 1
+
+
+def build_runner(tmp_path, **kwargs):
+    loader = FakeLoader()
+    registry = ModelRegistry(loader=loader)
+    registry.register("fake-stt", {"type": "stt", "path": "models/fake"})
+    runner = BenchmarkRunner(registry, results_dir=tmp_path / "results", **kwargs)
+    runner.sample_wav = tmp_path / "sample.wav"
+    runner._write_sine_wave(runner.sample_wav, seconds=0.5)
+    return runner, loader
+
+
+def test_percentile_interpolates():
+    samples = [1.0, 2.0, 3.0, 4.0]
+    assert percentile(samples, 50) == 2.5
+    assert percentile(samples, 0) == 1.0
+    assert percentile(samples, 100) == 4.0
+
+
+def test_confidence_interval_shrinks_with_stable_samples():
+    mean, half_width = confidence_interval([10.0, 10.1, 9.9, 10.0])
+    assert mean == 10.0
+    assert half_width < 0.2
+    assert relative_ci([5.0]) == float("inf")
+
+
+def test_measure_stops_once_ci_is_tight(tmp_path):
+    runner, _ = build_runner(tmp_path, stability_runs=3, warmup_runs=2, max_runs=10, target_ci=0.05)
+    counter = itertools.count()
+
+    stats = runner._measure(lambda: 100.0 + (next(counter) % 2) * 0.1)
+
+    assert stats.converged
+    assert stats.runs == 3
+    assert stats.warmup_runs == 2
+
+
+def test_measure_caps_noisy_runs(tmp_path):
+    runner, _ = build_runner(tmp_path, stability_runs=3, warmup_runs=0, max_runs=6, target_ci=0.01)
+    values = itertools.cycle([1.0, 10.0])
+
+    stats = runner._measure(lambda: next(values))
+
+    assert not stats.converged
+    assert stats.runs == 6
+
+
+def test_stt_run_reports_percentiles_and_run_stats(tmp_path):
+    runner, loader = build_runner(tmp_path, stability_runs=3, warmup_runs=1, max_runs=5)
+
+    result = runner.run("fake-stt", save=False)
+
+    metrics = result.metrics
+    for key in ("latency_p50_ms", "latency_p90_ms", "latency_p99_ms", "realtimefactor_p90", "peakrammb"):
+        assert key in metrics
+    assert 3 <= metrics["runs"] <= 5
+    assert metrics["warmup_runs"] == 1
+    assert loader.model.calls == metrics["runs"] + 1
+    assert len(result.metadata["samples"]["latency_ms"]) == metrics["runs"]
+    assert loader.unloads == 1
+
+
+def test_keep_loaded_reuses_resident_model(tmp_path):
+    runner, loader = build_runner(tmp_path, stability_runs=1, warmup_runs=0, max_runs=1, keep_loaded=True)
+
+    first = runner.run("fake-stt", save=False)
+    second = runner.run("fake-stt", save=False)
+
+    assert loader.loads == 1
+    assert loader.unloads == 0
+    assert second.metadata["resident"] is True
+    assert first.metadata["load"] == "cold" and "loadtimems" in first.metrics
+    assert second.metadata["load"] == "warm"
+    assert "loadtimems" not in second.metrics
+    assert "loadtimems_warm" in second.metrics
+    runner.close()
+    assert loader.unloads == 1
+
+
+def test_peak_ram_catches_spikes_between_samples(tmp_path):
+    runner, loader = build_runner(tmp_path, stability_runs=1, warmup_runs=0, max_runs=1)
+    spike_mb = 64
+
+    def transcribe(_path, beam_size=1):
+        loader.model.calls += 1
+        buffer = bytearray(spike_mb * 1024 * 1024)
+        buffer[::4096] = b"x" * len(buffer[::4096])
+        before = runner._ram_mb(psutil.Process())
+        del buffer
+        return [], before
+
+    loader.model.transcribe = transcribe
+    baseline = runner._ram_mb(psutil.Process())
+
+    result = runner.run("fake-stt", save=False)
+
+    assert result.metrics["peakrammb"] >= baseline + spike_mb * 0.9
+    assert result.metadata["peak_ram"] == "run"
+
+
+def test_unresettable_high_water_mark_is_reported_as_process_peak(tmp_path, monkeypatch):
+    monkeypatch.setattr("codex.benchmark.runner._reset_peak_rss", lambda: False)
+    runner, _loader = build_runner(tmp_path, stability_runs=1, warmup_runs=0, max_runs=1)
+    spike_mb = 64
+    # an earlier, larger "model" in the same process
+    buffer = bytearray(spike_mb * 1024 * 1024)
+    buffer[::4096] = b"x" * len(buffer[::4096])
+    del buffer
+    baseline = runner._ram_mb(psutil.Process())
+
+    result = runner.run("fake-stt", save=False)
+
+    assert result.metadata["peak_ram"] == "process"
+    assert result.metadata["process_peak_ram_mb"] >= baseline + spike_mb * 0.9
+    assert result.metrics["peakrammb"] < baseline + spike_mb / 2
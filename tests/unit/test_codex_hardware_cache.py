@@ -0,0 +1,96 @@
+import json
+
+from codex.hardware import profiler as profiler_module
+from codex.hardware.capabilities import CapabilityMatrix, HardwareCapabilities
+from codex.hardware.profiler import HardwareProfile, HardwareProfiler, TorchInfo
+from codex.registry.model_config import ModelConfig
+
+
+def test_static_facts_are_probed_once_and_reused_from_disk(tmp_path):
+    cache_path = tmp_path / "hardware_profile.json"
+    first = HardwareProfiler(cache_path=cache_path)
+    profile = first.collect()
+    first.collect()
+    assert first.static_probes == 1
+    assert json.loads(cache_path.read_text())["fingerprint"] == profiler_module.host_fingerprint()
+
+    second = HardwareProfiler(cache_path=cache_path)
+    again = second.collect()
+    assert second.static_probes == 0
+    assert again.cpu_cores == profile.cpu_cores
+    assert again.ram_total_mb == profile.ram_total_mb
+    assert again.isa_flags == profile.isa_flags
+
+
+def test_fingerprint_change_invalidates_disk_cache(tmp_path, monkeypatch):
+    cache_path = tmp_path / "hardware_profile.json"
+    HardwareProfiler(cache_path=cache_path).collect()
+
+    monkeypatch.setattr(profiler_module, "host_fingerprint", lambda: "another-boot")
+    profiler = HardwareProfiler(cache_path=cache_path)
+    profiler.collect()
+    assert profiler.static_probes == 1
+    assert json.loads(cache_path.read_text())["fingerprint"] == "another-boot"
+
+
+def test_refresh_forces_reprobe(tmp_path):
+    profiler = HardwareProfiler(cache_path=tmp_path / "hw.json")
+    profiler.collect()
+    profiler.refresh()
+    assert profiler.static_probes == 2
+
+
+def test_capability_matrix_matches_supports_model():
+    profile = HardwareProfile(
+        cpu_cores=4,
+        cpu_freq_ghz=None,
+        cpu_arch="x86_64",
+        ram_total_mb=16384,
+        ram_available_mb=6000,
+        ram_used_mb=0,
+        gpu=None,
+        torch=TorchInfo(cuda=False, mps=False, fp16=False, bf16=False),
+        libraries={},
+    )
+    models = [
+        ModelConfig.from_dict("small", {"type": "llm", "path": "a", "ram_required": "2GB"}),
+        ModelConfig.from_dict("big", {"type": "llm", "path": "b", "ram_required": "8GB"}),
+        ModelConfig.from_dict("gpu", {"type": "llm", "path": "c", "device": "gpu"}),
+        ModelConfig.from_dict("fp16", {"type": "llm", "path": "d", "quant": "fp16"}),
+        ModelConfig.from_dict("any", {"type": "stt", "path": "e"}),
+    ]
+    capabilities = HardwareCapabilities(profile)
+    matrix = CapabilityMatrix(models, capabilities)
+
+    expected = {model.name for model in models if capabilities.supports_model(model)}
+    assert matrix.supported(profile.ram_available_mb) == expected == {"small", "any"}
+    assert matrix.supports("big", 9000)
+    assert not matrix.supports("unknown", 9000)
+
+
+def test_host_fingerprint_is_computed_once_per_process(tmp_path, monkeypatch):
+    reads = []
+    read_text = profiler_module._read_text
+    monkeypatch.setattr(profiler_module, "_read_text", lambda path: reads.append(path) or read_text(path))
+    profiler_module.host_fingerprint.cache_clear()
+    profiler = HardwareProfiler(cache_path=tmp_path / "hw.json")
+    for _ in range(3):
+        profiler.collect()
+    profiler_module.host_fingerprint()
+    assert profiler_module.host_fingerprint.cache_info().misses == 1
+    assert reads.count("/proc/sys/kernel/random/boot_id") == 1
+
+
+def test_installing_a_package_invalidates_the_static_cache(tmp_path, monkeypatch):
+    cache_path = tmp_path / "hw.json"
+    monkeypatch.setattr(profiler_module, "_site_packages_state", lambda: ["/venv/site-packages:1"])
+    profiler_module.host_fingerprint.cache_clear()
+    HardwareProfiler(cache_path=cache_path).collect()
+
+    # e.g. ``pip install torch`` followed by a restart
+    monkeypatch.setattr(profiler_module, "_site_packages_state", lambda: ["/venv/site-packages:2"])
+    profiler_module.host_fingerprint.cache_clear()
+    profiler = HardwareProfiler(cache_path=cache_path)
+    profiler.collect()
+    assert profiler.static_probes == 1
+    profiler_module.host_fingerprint.cache_clear()
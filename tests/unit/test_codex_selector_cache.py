@@ -0,0 +1,128 @@
+import random
+import time
+
+from codex.benchmark.report import BenchmarkReport, BenchmarkResult
+from codex.hardware.profiler import HardwareProfile, TorchInfo
+from codex.registry.model_config import ModelConfig
+from codex.registry.model_registry import ModelRegistry
+from codex.selector.model_selector import AdaptiveModelSelector
+
+
+class CountingProfiler:
+    def __init__(self, ram_available_mb: float = 12000) -> None:
+        self.calls = 0
+        self.ram_available_mb = ram_available_mb
+
+    def collect(self) -> HardwareProfile:
+        self.calls += 1
+        return HardwareProfile(
+            cpu_cores=8,
+            cpu_freq_ghz=3.2,
+            cpu_arch="x86_64",
+            ram_total_mb=16384,
+            ram_available_mb=self.ram_available_mb,
+            ram_used_mb=4000,
+            gpu=None,
+            torch=TorchInfo(cuda=False, mps=False, fp16=False, bf16=False),
+            libraries={},
+        )
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _build(tmp_path, models=12, seed=0):
+    rng = random.Random(seed)
+    registry = ModelRegistry()
+    report = BenchmarkReport(tmp_path)
+    for idx in range(models):
+        name = f"model-{idx:02d}"
+        registry.register(name, {"type": "llm", "path": f"models/{idx}", "ram_required": f"{1 + idx % 8}GB"})
+        report.save(
+            BenchmarkResult(
+                model=name,
+                model_type="llm",
+                metrics={
+                    "firsttokenlatency_ms": rng.uniform(5, 80),
+                    "tokenspersecond": rng.uniform(50, 300),
+                    "loadtimems": rng.uniform(100, 900),
+                    "stability_score": rng.uniform(0, 1),
+                },
+            )
+        )
+    return registry, report
+
+
+def test_cached_pick_matches_uncached_scoring(tmp_path):
+    registry, report = _build(tmp_path)
+    profiler = CountingProfiler(ram_available_mb=6000)
+    selector = AdaptiveModelSelector(registry, profiler, benchmark_report=report)
+
+    for priority in ("latency", "quality", "memory"):
+        result = selector.pick("custom-task", priority=priority)
+        models = [ModelConfig.from_dict(name, registry.info(name)) for name in registry.list_models()]
+        supported = [model for model in models if model.name in result.candidates]
+        expected = selector._score_models(supported, selector._load_benchmarks(), priority)[0]
+        assert result.selected_model == expected.name
+        assert len(result.candidates) < len(models)
+
+
+def test_profiler_and_report_are_reprobed_only_after_ttl(tmp_path):
+    registry, report = _build(tmp_path)
+    profiler = CountingProfiler()
+    clock = FakeClock()
+    selector = AdaptiveModelSelector(registry, profiler, benchmark_report=report, profile_ttl=5.0, clock=clock)
+
+    for _ in range(100):
+        selector.pick("realtime_interview", priority="latency")
+    assert profiler.calls == 1
+    assert selector.table_version == 1
+
+    clock.now = 10.0
+    selector.pick("realtime_interview", priority="latency")
+    assert profiler.calls == 2
+    assert selector.table_version == 1
+
+
+def test_table_rebuilds_when_benchmarks_or_hardware_change(tmp_path):
+    registry, report = _build(tmp_path, models=3)
+    profiler = CountingProfiler()
+    clock = FakeClock()
+    selector = AdaptiveModelSelector(registry, profiler, benchmark_report=report, clock=clock)
+    before = selector.pick("any", priority="latency").selected_model
+
+    report.save(
+        BenchmarkResult(
+            model="model-02" if before != "model-02" else "model-01",
+            model_type="llm",
+            metrics={"firsttokenlatency_ms": 0.1, "tokenspersecond": 10_000.0, "loadtimems": 1.0},
+        )
+    )
+    clock.now = 10.0
+    after = selector.pick("any", priority="latency")
+    assert selector.table_version == 2
+    assert after.selected_model != before
+
+    profiler.ram_available_mb = 1500
+    clock.now = 20.0
+    constrained = selector.pick("any", priority="latency")
+    assert selector.table_version == 3
+    assert constrained.candidates == ["model-00"]
+
+
+def test_cached_pick_is_cheap(tmp_path):
+    registry, report = _build(tmp_path, models=40)
+    selector = AdaptiveModelSelector(registry, CountingProfiler(), benchmark_report=report, profile_ttl=60.0)
+    selector.pick("realtime_interview")
+
+    started = time.perf_counter()
+    for _ in range(2000):
+        selector.pick("realtime_interview")
+    per_pick = (time.perf_counter() - started) / 2000
+
+    assert per_pick < 100e-6
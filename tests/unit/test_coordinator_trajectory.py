@@ -37,6 +37,30 @@ class TestCoordinatorTrajectory(unittest.TestCase):
         self.assertIsNotNone(coord.last_trajectory_error)
         self.assertGreaterEqual(coord.last_trajectory_error, 0.0)
 
+    def test_decision_history_is_bounded(self):
+        coord = Coordinator(max_history=3)
+        for turn in range(5):
+            coord.decide(input_data=f"hello {turn}", context={})
+        self.assertEqual(len(coord.decision_history), 3)
+        self.assertIs(coord.decision_history[-1], coord.last_decision)
+
+    def test_field_is_read_once_per_decision(self):
+        class CountingAdapter:
+            def __init__(self):
+                self.pulls = 0
+
+            def pull_field_metrics(self):
+                self.pulls += 1
+                return {"orientation_coherence": 0.5, "confidence_alignment": 0.5, "trajectory_tension": 0.1}
+
+            def publish_from_ls(self, snapshot):
+                pass
+
+        coord = Coordinator()
+        coord.field_adapter = CountingAdapter()
+        coord.decide(input_data="hello", context={})
+        self.assertEqual(coord.field_adapter.pulls, 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,117 @@
+import random
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+MODULES = ROOT / "python" / "modules"
+if str(MODULES) not in sys.path:
+    sys.path.insert(0, str(MODULES))
+
+from field import FieldMetricsEngine, FieldNodeState, FieldRegistry, FieldResonance, FieldState
+
+
+def _node(node_id, orientation, timestamp=0.0, conf=0.5, err=0.1):
+    return FieldNodeState(
+        node_id=node_id,
+        timestamp=timestamp,
+        orientation=orientation,
+        confidence={"smoothed": conf},
+        trajectory={"error": err},
+    )
+
+
+def _pairwise_coherence(nodes):
+    distances = []
+    for i, a in enumerate(nodes):
+        for b in nodes[i + 1 :]:
+            keys = set(a.orientation) | set(b.orientation)
+            diffs = [abs(a.orientation.get(k, 0.0) - b.orientation.get(k, 0.0)) for k in keys]
+            distances.append(sum(diffs) / len(diffs) if diffs else 0.0)
+    return max(0.0, 1.0 - min(1.0, sum(distances) / len(distances)))
+
+
+class TestFieldMetricsEngine(unittest.TestCase):
+    def test_matches_pairwise_coherence_for_shared_keys(self):
+        rng = random.Random(3)
+        nodes = [
+            _node(f"n{idx}", {"x": rng.random(), "y": rng.random() * 0.5, "z": rng.random() * 0.2})
+            for idx in range(40)
+        ]
+        metrics = FieldMetricsEngine(nodes).metrics()
+        self.assertAlmostEqual(metrics["orientation_coherence"], _pairwise_coherence(nodes), places=9)
+
+    def test_matches_pairwise_coherence_for_mixed_and_empty_key_sets(self):
+        cases = [
+            [{"x": 1.0}, {}, {}],
+            [{"a": 1.0, "b": 0.0}, {"a": 0.0}, {"c": 1.0}],
+        ]
+        rng = random.Random(9)
+        key_sets = [(), ("x",), ("x", "y"), ("y", "z"), ("z",)]
+        cases.append(
+            [{key: rng.random() for key in rng.choice(key_sets)} for _ in range(30)]
+        )
+        for orientations in cases:
+            nodes = [_node(f"n{idx}", orientation) for idx, orientation in enumerate(orientations)]
+            with self.subTest(orientations=orientations[:3]):
+                self.assertAlmostEqual(
+                    FieldResonance().compute(FieldState(nodes={node.node_id: node for node in nodes}))[
+                        "orientation_coherence"
+                    ],
+                    _pairwise_coherence(nodes),
+                    places=9,
+                )
+
+        engine = FieldMetricsEngine()
+        live = {}
+        for step in range(400):
+            node_id = f"n{rng.randrange(20)}"
+            if node_id in live and rng.random() < 0.3:
+                engine.remove(live.pop(node_id))
+                continue
+            node = _node(node_id, {key: rng.random() for key in rng.choice(key_sets)})
+            engine.replace(live.get(node_id), node)
+            live[node_id] = node
+        self.assertAlmostEqual(
+            engine.metrics()["orientation_coherence"], _pairwise_coherence(list(live.values())), places=9
+        )
+
+    def test_incremental_updates_match_rebuild(self):
+        rng = random.Random(5)
+        engine = FieldMetricsEngine()
+        live = {}
+        for step in range(500):
+            node_id = f"n{rng.randrange(30)}"
+            if node_id in live and rng.random() < 0.3:
+                engine.remove(live.pop(node_id))
+                continue
+            node = _node(node_id, {"x": rng.random(), "y": rng.random()}, conf=rng.random(), err=rng.random())
+            engine.replace(live.get(node_id), node)
+            live[node_id] = node
+        fresh = FieldMetricsEngine(live.values()).metrics()
+        for key, value in engine.metrics().items():
+            self.assertAlmostEqual(value, fresh[key], places=9)
+
+    def test_registry_expires_through_heap_and_caches_metrics(self):
+        now = [0.0]
+        registry = FieldRegistry(ttl=1.0, clock=lambda: now[0], resonance=FieldResonance())
+        registry.update_node(_node("a", {"x": 0.0}, timestamp=0.0))
+        registry.update_node(_node("b", {"x": 1.0}, timestamp=0.0))
+        first = registry.get_state()
+        self.assertEqual(first.metrics["orientation_coherence"], 0.0)
+        self.assertIs(registry.get_state().nodes, first.nodes)
+
+        now[0] = 0.5
+        registry.update_node(_node("b", {"x": 0.0}, timestamp=0.5))
+        now[0] = 1.2
+        state = registry.get_state()
+        self.assertEqual(set(state.nodes), {"b"})
+        self.assertEqual(state.metrics["orientation_coherence"], 1.0)
+        now[0] = 2.0
+        self.assertEqual(registry.get_state().nodes, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
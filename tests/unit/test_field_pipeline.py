@@ -0,0 +1,104 @@
+import random
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+MODULES = ROOT / "python" / "modules"
+if str(MODULES) not in sys.path:
+    sys.path.insert(0, str(MODULES))
+
+from field import (
+    CognitiveMesh,
+    CognitiveTopology,
+    FieldDampening,
+    FieldEvolution,
+    FieldMorphogenesis,
+    FieldNodeState,
+    FieldPipeline,
+    FieldReflexivity,
+    FieldRegistry,
+    FieldResonance,
+)
+
+KEYS = ("orientation_coherence", "confidence_alignment", "trajectory_tension")
+
+
+def _stages():
+    mesh = CognitiveMesh(lr=0.2)
+    return {
+        "dampening": FieldDampening(alpha=0.4),
+        "evolution": FieldEvolution(lr=0.1),
+        "mesh": mesh,
+        "morphogenesis": FieldMorphogenesis(lr=0.1),
+        "topology": CognitiveTopology(lr=0.2),
+        "reflexivity": FieldReflexivity(lr=0.3),
+    }
+
+
+def _reference(stages, metrics):
+    """The dict-based stage sequence ``FieldRegistry.get_state`` used to run."""
+    metrics = stages["dampening"].apply(metrics)
+    metrics = FieldRegistry._apply_weights(metrics, stages["evolution"].update(metrics))
+    mesh_state = stages["mesh"].update(metrics)
+    metrics = FieldRegistry.applymesh(metrics, mesh_state)
+    morphology = stages["morphogenesis"].update(mesh_state, metrics)
+    metrics = FieldRegistry.applymorphology(metrics, morphology)
+    stages["topology"].update(metrics, mesh_state)
+    metrics = FieldRegistry.applytopology(metrics, stages["topology"])
+    return FieldRegistry.applyreflexivity(metrics, stages["reflexivity"].update(metrics))
+
+
+class TestFieldPipeline(unittest.TestCase):
+    def test_matches_dict_stages(self):
+        rng = random.Random(5)
+        reference = _stages()
+        compiled = _stages()
+        pipeline = FieldPipeline(KEYS, **compiled)
+        for _ in range(200):
+            metrics = {key: rng.random() for key in KEYS}
+            self.assertEqual(pipeline.run(dict(metrics)), _reference(reference, dict(metrics)))
+        self.assertEqual(compiled["topology"].edges, reference["topology"].edges)
+        self.assertEqual(compiled["reflexivity"].trend, reference["reflexivity"].trend)
+        self.assertEqual(compiled["morphogenesis"].morphology, reference["morphogenesis"].morphology)
+
+    def test_overridden_stage_uses_its_dict_method(self):
+        class Halving(FieldDampening):
+            def apply(self, metrics):
+                return {key: value / 2 for key, value in metrics.items()}
+
+        pipeline = FieldPipeline(KEYS, dampening=Halving())
+        self.assertEqual(pipeline.run(dict.fromkeys(KEYS, 0.8)), dict.fromkeys(KEYS, 0.4))
+
+    def test_registry_stage_timings(self):
+        registry = FieldRegistry(
+            ttl=5.0,
+            clock=lambda: 1.0,
+            resonance=FieldResonance(),
+            dampening=FieldDampening(),
+            mesh=CognitiveMesh(),
+            topology=CognitiveTopology(),
+        )
+        registry.update_node(
+            FieldNodeState(
+                node_id="node-a",
+                timestamp=1.0,
+                orientation={"o": 0.2},
+                confidence={"smoothed": 0.6},
+                trajectory={"error": 0.1},
+            )
+        )
+        self.assertEqual(registry.stage_timings(), {})
+        registry.profile_stages()
+        for _ in range(3):
+            registry.get_state()
+        timings = registry.stage_timings()
+        self.assertEqual(list(timings), ["dampening", "mesh", "topology"])
+        self.assertEqual(timings["mesh"]["runs"], 3)
+        self.assertGreaterEqual(timings["topology"]["total_us"], 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import random
+import statistics
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT / "python") not in sys.path:
+    sys.path.insert(0, str(ROOT / "python"))
+
+pytest.importorskip("numpy")
+
+from modules.nca.agent import NCAAgent
+from modules.nca.batched import BatchedNCAPopulation
+from modules.nca.experiments.ncastresstest import run_stress_test
+from modules.nca.orientation import OrientationCenter
+from modules.nca.world import GridWorld
+
+
+def _world(noise: float, **kwargs: object) -> GridWorld:
+    return GridWorld(size=14, start_position=0, goal_position=12, noise_level=noise, **kwargs)
+
+
+@pytest.mark.parametrize("noise, blocked", [(0.3, ()), (0.3, (13,)), (0.55, (13,))])
+def test_batched_backend_matches_object_backend_in_aggregate(noise: float, blocked: tuple[int, ...]) -> None:
+    finals: list[int] = []
+    for seed in range(12):
+        world = _world(noise, blocked_zone=blocked)
+        world._rng = random.Random(seed)
+        agent = NCAAgent(world=world, orientation=OrientationCenter(identity=f"obj-{seed}"))
+        for _ in range(30):
+            agent.step()
+        finals.append(world.agent_position)
+
+    batch = BatchedNCAPopulation(_world(noise, blocked_zone=blocked), OrientationCenter(identity="batch"), population=1_000, seed=5)
+    summary = batch.run(30)[-1]
+
+    assert abs(summary["mean_position"] - statistics.mean(finals)) < 0.5
+    object_reached = sum(1 for pos in finals if pos == 12) / len(finals)
+    assert abs(summary["goal_reached_rate"] - object_reached) < 0.25
+
+
+def test_batched_backend_is_reproducible_for_a_seed() -> None:
+    first = BatchedNCAPopulation(_world(0.5), OrientationCenter(identity="a"), population=64, seed=3)
+    second = BatchedNCAPopulation(_world(0.5), OrientationCenter(identity="a"), population=64, seed=3)
+    first.run(15)
+    second.run(15)
+
+    assert first.positions() == second.positions()
+
+
+def test_self_model_window_tracks_orientation_drift() -> None:
+    batch = BatchedNCAPopulation(_world(0.0), OrientationCenter(identity="a", impulsiveness=0.6), population=4, max_history=5)
+    batch.step()
+    assert batch.identity_drift.tolist() == [0.0] * 4
+
+    batch.impulsiveness[:] = 0.0
+    batch.step()
+    assert batch.predicted_consistency.tolist() == pytest.approx([0.4] * 4)
+    for _ in range(8):
+        batch.step()
+    assert batch._edge_count == 9
+
+
+def test_stress_test_selects_batched_backend() -> None:
+    log = run_stress_test(steps=3, backend="batched", population=500)
+
+    assert len(log) == 3
+    assert log[-1]["population"] == 500
+    with pytest.raises(ValueError):
+        run_stress_test(steps=1, backend="gpu")
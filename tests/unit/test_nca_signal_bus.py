@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT / "python") not in sys.path:
+    sys.path.insert(0, str(ROOT / "python"))
+
+from modules.nca.signals import CollectiveSignalBus, InternalSignal, SignalBus
+
+
+def test_recent_window_is_bounded_and_counts_drops() -> None:
+    bus = SignalBus(max_recent=3)
+    for idx in range(5):
+        bus.emit(InternalSignal(signal_type="tick", t=idx))
+
+    assert [s.t for s in bus.get_recent()] == [2, 3, 4]
+    metrics = bus.metrics()["tick"]
+    assert metrics["emitted"] == 5
+    assert metrics["dropped"] == 2
+
+
+def test_topic_subscriptions_only_receive_their_topics() -> None:
+    bus = SignalBus()
+    seen_all: list[str] = []
+    seen_drift: list[str] = []
+    bus.subscribe(lambda s: seen_all.append(s.signal_type))
+    bus.subscribe(lambda s: seen_drift.append(s.signal_type), topics=("causal_drift",))
+
+    bus.emit(InternalSignal(signal_type="low_confidence"))
+    bus.emit(InternalSignal(signal_type="causal_drift"))
+
+    assert seen_all == ["low_confidence", "causal_drift"]
+    assert seen_drift == ["causal_drift"]
+    assert bus.metrics()["causal_drift"]["delivered"] == 2
+
+
+def test_broadcast_reaches_only_interested_agents() -> None:
+    bus = CollectiveSignalBus()
+    received: dict[str, list[str]] = {"a": [], "b": [], "c": []}
+    bus.subscribe_agent("a", lambda s: received["a"].append(s.signal_type), topics=("causal_drift",))
+    bus.subscribe_agent("b", lambda s: received["b"].append(s.signal_type), topics=("multiagent_drift",))
+    bus.subscribe_agent("c", lambda s: received["c"].append(s.signal_type))
+
+    bus.emit_broadcast(InternalSignal(signal_type="causal_drift"))
+    bus.emit_broadcast(InternalSignal(signal_type="noise"))
+
+    assert received == {"a": ["causal_drift"], "b": [], "c": ["causal_drift", "noise"]}
+    assert bus.metrics()["noise"]["delivered"] == 1
+
+
+def test_queued_signals_are_delivered_in_batches() -> None:
+    bus = CollectiveSignalBus(max_pending=2)
+    received: list[int | None] = []
+    bus.subscribe_agent("a", lambda s: received.append(s.t))
+
+    for idx in range(3):
+        bus.queue_broadcast(InternalSignal(signal_type="step", t=idx))
+    assert received == []
+    assert bus.pending() == 2
+
+    assert bus.flush() == 2
+    assert received == [1, 2]
+    assert bus.metrics()["step"]["dropped"] == 1
+    assert bus.metrics()["step"]["emitted"] == 2
+
+
+def test_only_unread_evictions_count_as_drops() -> None:
+    bus = SignalBus(max_recent=2)
+    bus.emit(InternalSignal(signal_type="tick", t=0))
+    bus.emit(InternalSignal(signal_type="tick", t=1))
+    bus.get_recent()
+    bus.emit(InternalSignal(signal_type="tick", t=2))
+    bus.emit(InternalSignal(signal_type="tick", t=3))
+    assert bus.metrics()["tick"]["dropped"] == 0
+
+    bus.emit(InternalSignal(signal_type="tick", t=4))
+    assert bus.metrics()["tick"]["dropped"] == 1
+
+    bus.subscribe(lambda s: None, topics=("seen",))
+    for idx in range(4):
+        bus.emit(InternalSignal(signal_type="seen", t=idx))
+    assert bus.metrics()["seen"]["dropped"] == 0
+
+
+def test_feedback_to_broadcast_signals_is_distributed_the_same_step() -> None:
+    from types import SimpleNamespace
+
+    from modules.nca.multiagent import MultiAgentSystem
+
+    system = MultiAgentSystem()
+    first = SimpleNamespace(agent_id="a", signal_bus=SignalBus())
+    second = SimpleNamespace(agent_id="b", signal_bus=SignalBus())
+    system.agents.extend([first, second])
+    system.collective_signal_bus.subscribe_agent(
+        "b",
+        lambda s: second.signal_bus.emit(InternalSignal(signal_type="ack", t=s.t)),
+        topics=("coordination_required",),
+    )
+
+    first.signal_bus.emit(InternalSignal(signal_type="coordination_required", t=1))
+    distributed = system.broadcast_signals()
+
+    assert [(item["sourceagentid"], item["type"]) for item in distributed] == [
+        ("a", "coordination_required"),
+        ("b", "ack"),
+    ]
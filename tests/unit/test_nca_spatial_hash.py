@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import random
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT / "python") not in sys.path:
+    sys.path.insert(0, str(ROOT / "python"))
+
+from modules.nca.spatial import SpatialHash
+from modules.nca.world import GridWorld
+
+
+def _pairwise(positions: dict[str, int]) -> list[dict[str, object]]:
+    values = list(positions.items())
+    found: list[dict[str, object]] = []
+    for idx, (agent_a, pos_a) in enumerate(values):
+        for agent_b, pos_b in values[idx + 1 :]:
+            if pos_a == pos_b:
+                found.append({"agents": (agent_a, agent_b), "position": pos_a})
+    return found
+
+
+def test_multiagent_features_matches_pairwise_scan_across_moves() -> None:
+    rng = random.Random(3)
+    world = GridWorld(size=12, start_position=0, goal_position=11)
+    positions = {f"a{idx}": rng.randrange(12) for idx in range(25)}
+
+    for _ in range(10):
+        features = world.multiagent_features(positions)
+        assert features["collisions"] == _pairwise(positions)
+        for zone, members in features["shared_presence"].items():
+            assert members == [agent_id for agent_id, pos in positions.items() if pos == zone]
+        assert features["cooperative_progress"] == sum(1.0 for pos in positions.values() if pos in world.cooperative_tasks)
+        positions = {agent_id: max(0, min(11, pos + rng.choice((-1, 0, 1)))) for agent_id, pos in positions.items()}
+
+
+def test_spatial_hash_incremental_updates_and_removal() -> None:
+    index = SpatialHash()
+    index.sync({"a": 1, "b": 2, "c": 1})
+    assert list(index.collisions()) == [("a", "c", 1)]
+
+    assert index.sync({"a": 2, "b": 2, "c": 1}) == 1
+    assert list(index.collisions()) == [("a", "b", 2)]
+
+    index.sync({"b": 2, "c": 1})
+    assert "a" not in index
+    assert list(index.collisions()) == []
+
+
+def test_spatial_hash_2d_neighbors_are_rank_ordered() -> None:
+    index = SpatialHash(cell_size=4)
+    index.update("far", (20, 20))
+    index.update("z", (3, 4))
+    index.update("origin", (2, 2))
+    index.update("y", (1, 1))
+
+    assert index.neighbors("origin", radius=2) == ["z", "y"]
+    assert index.within((20, 19), radius=1) == ["far"]
+    assert index.occupants((1, 1)) == ["y"]
+
+
+def test_grid_world_nearby_agents() -> None:
+    world = GridWorld(size=10)
+    world.multiagent_features({"a": 0, "b": 1, "c": 5})
+
+    assert world.nearby_agents("a") == ["b"]
+    assert world.nearby_agents("c", radius=3) == []
@@ -36,6 +36,25 @@ class TestOrientationCenterFusion(unittest.TestCase):
         self.assertEqual(second.diversity_score, first.diversity_score)
         self.assertEqual(second.stability_score, first.stability_score)
 
+    def test_unchanged_inputs_reuse_organ_scores_and_keep_fusing(self):
+        calls = []
+
+        class CountingFusion(OrientationFusionLayer):
+            def fuse(self, signals):
+                calls.append(signals)
+                return super().fuse(signals)
+
+        center = OrientationCenter(fusion_layer=CountingFusion(smoothing=0.5))
+        stats = {"unique_paths": 1, "total_paths": 4}
+        center.evaluate(history_stats=stats)
+        first = center.evaluate(history_stats={"unique_paths": 1, "total_paths": 4})
+        self.assertIs(calls[0], calls[1])
+        self.assertEqual(len(calls), 2)
+
+        stats["unique_paths"] = 4
+        changed = center.evaluate(history_stats=stats)
+        self.assertGreater(changed.diversity_score, first.diversity_score)
+
 
 if __name__ == "__main__":
     unittest.main()
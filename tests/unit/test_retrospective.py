@@ -98,6 +98,43 @@ class TestRetrospective(unittest.TestCase):
         self.assertEqual(summary["total_snapshots"], 0)
         self.assertEqual(summary["cache"]["total"], 0)
 
+    def test_history_is_bounded_but_totals_are_kept(self):
+        retrospective = Retrospective(max_history=2)
+        for _ in range(5):
+            retrospective.snapshot(self._sample_stats())
+        self.assertEqual(len(retrospective.history), 2)
+        summary = retrospective.summarize()
+        self.assertEqual(summary["total_snapshots"], 5)
+        self.assertEqual(summary["cache"]["hits"], 5)
+        self.assertEqual(summary["input"]["buckets"]["0-4"], 5)
+
+    def test_windowed_summary_uses_rollups(self):
+        now = [0.0]
+        retrospective = Retrospective(clock=lambda: now[0])
+        retrospective.snapshot(self._sample_stats())
+        now[0] = 600.0
+        stats = self._sample_stats()
+        stats["cache_hits"] = 4
+        retrospective.snapshot(stats)
+        now[0] = 630.0
+
+        last_minutes = retrospective.summarize(window=5 * 60)
+        self.assertEqual(last_minutes["total_snapshots"], 1)
+        self.assertEqual(last_minutes["cache"]["hits"], 4)
+        last_hours = retrospective.summarize(window=3 * 3600)
+        self.assertEqual(last_hours["total_snapshots"], 2)
+        self.assertEqual(last_hours["cache"]["hits"], 5)
+        self.assertEqual(retrospective.summarize(window=60)["total_snapshots"], 1)
+
+    def test_minute_rollups_are_pruned(self):
+        now = [0.0]
+        retrospective = Retrospective(minute_retention=3, clock=lambda: now[0])
+        for minute in range(10):
+            now[0] = minute * 60.0
+            retrospective.snapshot(self._sample_stats())
+        self.assertEqual(retrospective.summarize(window=180)["total_snapshots"], 3)
+        self.assertEqual(retrospective.summarize()["total_snapshots"], 10)
+
 
 if __name__ == "__main__":
     unittest.main()
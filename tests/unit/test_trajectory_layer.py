@@ -33,6 +33,17 @@ class TestTrajectoryLayer(unittest.TestCase):
         layer.record_outcome({"success": True})
         self.assertAlmostEqual(layer.compute_trajectory_error(), 0.5, places=4)
 
+    def test_trajectory_error_follows_eviction_and_overwrite(self):
+        layer = TrajectoryLayer(max_history=2)
+        layer.record_decision("A", {})
+        layer.record_outcome({"success": False})
+        layer.record_decision("B", {})
+        layer.record_outcome({"success": False})
+        layer.record_outcome({"success": True})
+        self.assertAlmostEqual(layer.compute_trajectory_error(), 0.5, places=4)
+        layer.record_decision("C", {})
+        self.assertAlmostEqual(layer.compute_trajectory_error(), 0.0, places=4)
+
     def test_max_history(self):
         layer = TrajectoryLayer(max_history=1)
         layer.record_decision("A", {})